@@ -308,7 +308,7 @@ def main():
     
     # Initialize logger (with quiet mode if requested)
     quiet_mode = args.quiet or os.environ.get("WYZER_QUIET_MODE", "false").lower() in ("true", "1", "yes")
-    init_logger(args.log_level, quiet_mode=quiet_mode)
+    init_logger(args.log_level, quiet_mode=quiet_mode, async_sink=Config.LOG_ASYNC, json_path=Config.LOG_JSON_PATH or None)
     logger = get_logger()
 
     # Handle --no-ollama flag
@@ -379,7 +379,8 @@ def main():
             logger.error(f"Invalid TTS device index: {args.tts_device}")
             return 1
     
-    # Print startup banner
+    # Print startup banner (after any queued log lines)
+    logger.flush()
     print("\n" + "=" * 60)
     print("  Wyzer AI Assistant - Phase 11")
     print("=" * 60)
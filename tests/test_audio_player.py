@@ -0,0 +1,130 @@
+"""
+Unit tests for the persistent TTS output stream: stream reuse, gap-free
+segment handover and stop latency. sounddevice's OutputStream is replaced
+by a fake that drives the callback in real time.
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import numpy as np
+    from wyzer.tts import audio_player
+    from wyzer.tts.audio_player import AudioPlayer
+except (ImportError, OSError):  # numpy / sounddevice (or PortAudio) not installed
+    np = None
+
+
+class _FakeOutputStream:
+    """Calls the callback once per block on a thread, recording the output."""
+
+    instances = []
+
+    def __init__(self, samplerate, channels, dtype, blocksize, device, callback):
+        self.samplerate = samplerate
+        self.channels = channels
+        self.blocksize = blocksize
+        self.callback = callback
+        self.blocks = []
+        self.active = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        _FakeOutputStream.instances.append(self)
+
+    def start(self):
+        self.active = True
+        self._thread.start()
+
+    def _run(self):
+        period = self.blocksize / self.samplerate
+        while self.active:
+            out = np.zeros((self.blocksize, self.channels), dtype=np.float32)
+            self.callback(out, self.blocksize, None, None)
+            self.blocks.append(out[:, 0].copy())
+            time.sleep(period)
+
+    def stop(self):
+        self.active = False
+
+    def close(self):
+        self.active = False
+
+
+def _tone(samples):
+    return (np.full(samples, 8192, dtype=np.int16)).tobytes()
+
+
+@unittest.skipIf(np is None, "numpy/sounddevice not installed")
+class TestAudioPlayer(unittest.TestCase):
+    """Segments share one stream and play back to back."""
+
+    RATE = 8000
+
+    def setUp(self):
+        _FakeOutputStream.instances = []
+        patcher = mock.patch.object(audio_player.sd, "OutputStream", _FakeOutputStream, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.player = AudioPlayer(idle_close_sec=0)
+        self.addCleanup(self.player.close)
+
+    def _stream_audio(self):
+        audio = np.concatenate(_FakeOutputStream.instances[0].blocks)
+        nonzero = np.flatnonzero(audio)
+        return audio[nonzero[0]:nonzero[-1] + 1]
+
+    def test_consecutive_segments_are_gapless(self):
+        stop = threading.Event()
+        for _ in range(3):
+            self.assertTrue(self.player.play_pcm(_tone(800), self.RATE, stop))
+        time.sleep(0.1)
+        self.assertEqual(len(_FakeOutputStream.instances), 1)
+        audio = self._stream_audio()
+        self.assertEqual(len(audio), 2400)
+        self.assertTrue(np.all(audio > 0))
+
+    def test_stream_starts_before_segment_is_complete(self):
+        stop = threading.Event()
+        first_block_played = threading.Event()
+
+        def chunks():
+            yield _tone(160)
+            # Second chunk only arrives once the first is audible
+            deadline = time.time() + 2.0
+            while time.time() < deadline:
+                if any(b.any() for b in _FakeOutputStream.instances[0].blocks):
+                    first_block_played.set()
+                    break
+                time.sleep(0.005)
+            yield _tone(160)
+
+        self.assertTrue(self.player.play_pcm_stream(chunks(), self.RATE, stop))
+        self.assertTrue(first_block_played.is_set())
+
+    def test_stop_silences_within_one_block(self):
+        stop = threading.Event()
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(self.player.play_pcm(_tone(self.RATE * 5), self.RATE, stop))
+        )
+        thread.start()
+        time.sleep(0.1)
+        stream = _FakeOutputStream.instances[0]
+        stop.set()
+        blocks_at_stop = len(stream.blocks)
+        thread.join(timeout=1.0)
+        self.assertEqual(result, [False])
+        time.sleep(0.1)
+        # At most the block being rendered when stop was set is audible
+        self.assertTrue(stream.blocks[blocks_at_stop - 1].any())
+        self.assertFalse(any(b.any() for b in stream.blocks[blocks_at_stop + 1:]))
+        self.assertTrue(stream.active)
+
+
+if __name__ == '__main__':
+    unittest.main()
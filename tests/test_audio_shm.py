@@ -0,0 +1,91 @@
+"""
+Unit tests for the shared-memory audio ring used for core -> brain handoff.
+"""
+import multiprocessing as mp
+import unittest
+import sys
+import os
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import numpy as np
+    from wyzer.core.audio_shm import AudioRing
+except ImportError:
+    np = None
+
+
+def _child_read(name, capacity, offset, length, out_q):
+    ring = AudioRing.attach(name, capacity)
+    audio = ring.read(offset, length)
+    out_q.put(None if audio is None else audio.tolist())
+    ring.close()
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestAudioRing(unittest.TestCase):
+    """Writes land contiguously and stale reads are detected."""
+
+    def setUp(self):
+        self.ring = AudioRing.create(1000)
+
+    def tearDown(self):
+        self.ring.close()
+
+    def test_roundtrip(self):
+        audio = np.linspace(-1.0, 1.0, 300, dtype=np.float32)
+        offset, length = self.ring.write(audio)
+        self.assertEqual((offset, length), (0, 300))
+        np.testing.assert_array_equal(self.ring.read(offset, length), audio)
+
+    def test_chunk_never_wraps(self):
+        self.ring.write(np.zeros(700, dtype=np.float32))
+        audio = np.ones(400, dtype=np.float32)
+        offset, length = self.ring.write(audio)
+        # Tail of 300 samples is skipped so the chunk starts at the beginning
+        self.assertEqual(offset, 1000)
+        np.testing.assert_array_equal(self.ring.read(offset, length), audio)
+
+    def test_overwritten_chunk_is_rejected(self):
+        first = self.ring.write(np.full(600, 0.5, dtype=np.float32))
+        second = self.ring.write(np.full(600, 0.25, dtype=np.float32))
+        self.assertIsNotNone(self.ring.read(*second))
+        third = self.ring.write(np.full(600, 0.75, dtype=np.float32))
+        self.assertIsNone(self.ring.read(*first))
+        self.assertIsNone(self.ring.read(*second))
+        np.testing.assert_array_equal(self.ring.read(*third), np.full(600, 0.75, dtype=np.float32))
+
+    def test_oversized_write_falls_back(self):
+        self.assertIsNone(self.ring.write(np.zeros(1001, dtype=np.float32)))
+
+    def test_empty_audio(self):
+        offset, length = self.ring.write(np.array([], dtype=np.float32))
+        self.assertEqual(length, 0)
+        self.assertEqual(len(self.ring.read(offset, length)), 0)
+
+    def test_attach_by_name(self):
+        audio = np.arange(50, dtype=np.float32) / 50.0
+        slot = self.ring.write(audio)
+        other = AudioRing.attach(self.ring.name, self.ring.capacity)
+        try:
+            np.testing.assert_array_equal(other.read(*slot), audio)
+        finally:
+            other.close()
+
+    def test_read_from_spawned_process(self):
+        audio = np.arange(64, dtype=np.float32) / 64.0
+        offset, length = self.ring.write(audio)
+        ctx = mp.get_context("spawn")
+        out_q = ctx.Queue()
+        proc = ctx.Process(target=_child_read, args=(self.ring.name, self.ring.capacity, offset, length, out_q))
+        proc.start()
+        try:
+            result = out_q.get(timeout=30)
+        finally:
+            proc.join(timeout=10)
+        self.assertEqual(result, audio.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Unit tests for the brain worker scheduling primitives: interrupt-keyed
+cancellation, lane priorities, preemptible calls and background ticks.
+"""
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.core.brain_scheduler import (
+    InterruptGeneration,
+    JobLane,
+    Ticker,
+    acquire_preemptible,
+    run_preemptible,
+)
+
+
+class TestCancelToken(unittest.TestCase):
+    """An interrupt cancels every token taken before it, none after."""
+
+    def test_bump_cancels_older_tokens(self):
+        interrupts = InterruptGeneration()
+        old = interrupts.token()
+        self.assertFalse(old.cancelled)
+        interrupts.bump()
+        new = interrupts.token()
+        self.assertTrue(old.cancelled)
+        self.assertTrue(old())
+        self.assertFalse(new.cancelled)
+
+
+class TestJobLane(unittest.TestCase):
+    """Jobs run in order on one thread; urgent jobs go first."""
+
+    def setUp(self):
+        self.lane = JobLane("TestLane")
+        self.addCleanup(self.lane.shutdown)
+
+    def _block(self):
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocker():
+            started.set()
+            release.wait(2.0)
+
+        self.lane.submit(blocker)
+        started.wait(2.0)
+        return release
+
+    def test_urgent_jobs_jump_the_queue(self):
+        order = []
+        done = threading.Event()
+        release = self._block()
+        self.lane.submit(order.append, "a")
+        self.lane.submit(order.append, "b")
+        self.lane.submit(order.append, "confirm", urgent=True)
+        self.lane.submit(done.set)
+        release.set()
+        self.assertTrue(done.wait(2.0))
+        self.assertEqual(order, ["confirm", "a", "b"])
+
+    def test_failing_job_does_not_stop_lane(self):
+        done = threading.Event()
+        self.lane.submit(lambda: 1 / 0)
+        self.lane.submit(done.set)
+        self.assertTrue(done.wait(2.0))
+
+
+class TestRunPreemptible(unittest.TestCase):
+    """Callers get control back as soon as their token is cancelled."""
+
+    def test_completed_call_returns_result(self):
+        token = InterruptGeneration().token()
+        self.assertEqual(run_preemptible(lambda: "reply", token), (True, "reply"))
+
+    def test_exception_is_reraised(self):
+        token = InterruptGeneration().token()
+        with self.assertRaises(ValueError):
+            run_preemptible(lambda: int("x"), token)
+
+    def test_cancel_abandons_blocking_call(self):
+        interrupts = InterruptGeneration()
+        token = interrupts.token()
+        release = threading.Event()
+        self.addCleanup(release.set)
+        threading.Timer(0.1, interrupts.bump).start()
+
+        start = time.monotonic()
+        completed, result = run_preemptible(lambda: release.wait(5.0), token)
+        self.assertFalse(completed)
+        self.assertIsNone(result)
+        self.assertLess(time.monotonic() - start, 1.0)
+
+
+class TestAcquirePreemptible(unittest.TestCase):
+    """Waiting on a lock held by an abandoned call still honours interrupts."""
+
+    def test_acquires_once_released(self):
+        lock = threading.Lock()
+        lock.acquire()
+        threading.Timer(0.1, lock.release).start()
+        self.assertTrue(acquire_preemptible(lock, InterruptGeneration().token()))
+        self.assertTrue(lock.locked())
+        lock.release()
+
+    def test_cancel_gives_up(self):
+        interrupts = InterruptGeneration()
+        token = interrupts.token()
+        lock = threading.Lock()
+        lock.acquire()
+        self.addCleanup(lock.release)
+        threading.Timer(0.1, interrupts.bump).start()
+
+        start = time.monotonic()
+        self.assertFalse(acquire_preemptible(lock, token))
+        self.assertLess(time.monotonic() - start, 1.0)
+
+
+class TestTicker(unittest.TestCase):
+    """Ticks keep running in the background, even after one fails."""
+
+    def test_ticks_run_repeatedly(self):
+        ticks = []
+        ticker = Ticker(resolution_sec=0.01)
+        ticker.add(0.02, lambda: ticks.append(time.monotonic()))
+        ticker.add(0.02, lambda: 1 / 0)
+        ticker.start()
+        time.sleep(0.3)
+        ticker.stop()
+        self.assertGreaterEqual(len(ticks), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
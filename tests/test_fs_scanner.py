@@ -0,0 +1,168 @@
+"""
+Unit tests for the parallel, incremental LocalLibrary directory scanner.
+"""
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.local_library import indexer
+from wyzer.local_library.fs_scanner import ScanStats, group_by_parent, scan_tree
+
+
+def _pdf_record(entry, root):
+    if not entry.name.endswith(".pdf"):
+        return None
+    return {"path": entry.path, "root": root}
+
+
+class TestScanTree(unittest.TestCase):
+    """Walk order is free, but the set of records must match a plain walk."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        for rel in [
+            "a.pdf", "skip.txt",
+            "docs/b.pdf", "docs/deep/c.pdf", "docs/deep/deeper/d.pdf",
+            "node_modules/e.pdf", "My Cache Dir/f.pdf",
+        ]:
+            path = Path(self.root, rel)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _scan(self, **kwargs):
+        kwargs.setdefault("exclude_dirs", {"node_modules", "cache"})
+        kwargs.setdefault("max_workers", 4)
+        return sorted(os.path.relpath(r["path"], self.root) for r in scan_tree([self.root], _pdf_record, **kwargs))
+
+    def test_excludes_and_depth(self):
+        self.assertEqual(
+            self._scan(),
+            sorted(["a.pdf", os.path.join("docs", "b.pdf"), os.path.join("docs", "deep", "c.pdf"),
+                    os.path.join("docs", "deep", "deeper", "d.pdf")]),
+        )
+        self.assertEqual(self._scan(max_depth=2), sorted(["a.pdf", os.path.join("docs", "b.pdf")]))
+
+    def test_max_results(self):
+        stats = ScanStats()
+        self.assertEqual(len(self._scan(max_results=2, stats=stats)), 2)
+        self.assertTrue(stats.truncated)
+
+    def test_unchanged_directories_are_reused(self):
+        meta = {}
+        first = list(scan_tree([self.root], _pdf_record, dir_meta=meta, scan_kind="t"))
+        stats = ScanStats()
+        second = list(scan_tree([self.root], _pdf_record, dir_meta=meta, scan_kind="t",
+                                previous=group_by_parent(first, "path"), stats=stats))
+        self.assertEqual(sorted(r["path"] for r in first), sorted(r["path"] for r in second))
+        self.assertEqual(stats.dirs_listed, 0)
+        self.assertEqual(stats.dirs_reused, len(meta))
+
+    def test_changed_directory_is_relisted(self):
+        meta = {}
+        first = list(scan_tree([self.root], _pdf_record, dir_meta=meta, scan_kind="t"))
+        deep = os.path.join(self.root, "docs", "deep")
+        Path(deep, "new.pdf").write_text("x")
+        os.utime(deep, ns=(0, meta[deep]["mtime_ns"] + 1_000_000))
+        stats = ScanStats()
+        second = list(scan_tree([self.root], _pdf_record, dir_meta=meta, scan_kind="t",
+                                previous=group_by_parent(first, "path"), stats=stats))
+        self.assertEqual(len(second), len(first) + 1)
+        self.assertEqual(stats.dirs_listed, 1)
+
+    def test_truncated_scan_only_records_consumed_directories(self):
+        meta = {"/elsewhere": {"mtime_ns": 1, "subdirs": [], "scan": "t"}, self.root: 12.5}
+        records = list(scan_tree([self.root], _pdf_record, dir_meta=meta, scan_kind="t", max_results=1))
+        self.assertEqual(len(records), 1)
+        # Legacy float entry replaced; unrelated roots untouched
+        self.assertIn("/elsewhere", meta)
+        for path, entry in meta.items():
+            if path != "/elsewhere":
+                self.assertIsInstance(entry, dict)
+        recorded = [p for p in meta if p != "/elsewhere"]
+        # Every recorded directory's records were all yielded
+        for path in recorded:
+            expected = [str(p) for p in Path(path).glob("*.pdf")]
+            self.assertTrue(set(expected) <= {r["path"] for r in records})
+
+    def test_abandoned_scan_keeps_no_metadata(self):
+        meta = {}
+        for _ in scan_tree([self.root], _pdf_record, dir_meta=meta, scan_kind="t"):
+            break
+        self.assertEqual(meta, {})
+
+    def test_consumer_stop_at_max_results_keeps_metadata(self):
+        meta = {}
+        stats = ScanStats()
+        records = scan_tree([self.root], _pdf_record, dir_meta=meta, scan_kind="t", max_results=1, stats=stats)
+        for _ in records:
+            records.close()
+        self.assertTrue(stats.truncated)
+        self.assertIn(self.root, meta)
+
+    def test_tier3_scan_stops_at_max_results(self):
+        pulled = []
+
+        def _records(*args, **kwargs):
+            for n in range(100):
+                pulled.append(n)
+                yield {"path": str(n)}
+
+        with mock.patch.object(indexer, "scan_tree", _records):
+            files, _ = indexer._scan_tier3_tree(Path(self.root), 3)
+        self.assertEqual(len(files), 3)
+        self.assertEqual(len(pulled), 3)
+
+    def test_stop_event(self):
+        stop = threading.Event()
+        stop.set()
+        stats = ScanStats()
+        self.assertEqual(self._scan(stop_event=stop, stats=stats), [])
+        self.assertTrue(stats.truncated)
+
+
+class TestTier2Incremental(unittest.TestCase):
+    """_index_tier2_apps carries apps over from unchanged directories."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        for rel in ["Editor/editor.exe", "Editor/uninstall.exe", "Tools/bin/tool_app.exe", "Tools/readme.txt"]:
+            path = Path(self.root, rel)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+        self._orig = indexer._get_tier2_scan_locations
+        indexer._get_tier2_scan_locations = lambda: [{"path": Path(self.root), "source": "user_programs"}]
+
+    def tearDown(self):
+        indexer._get_tier2_scan_locations = self._orig
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_refresh_reuses_and_detects_new_exe(self):
+        scan_meta = {"last_refresh": "", "dirs": {self.root: 1.0}}
+        apps, errors = indexer._index_tier2_apps(scan_meta, [])
+        self.assertEqual(errors, [])
+        self.assertEqual(sorted(a["name"] for a in apps), ["Editor", "Tool"])
+        self.assertEqual({a["source"] for a in apps}, {"user_programs"})
+
+        again, _ = indexer._index_tier2_apps(scan_meta, apps)
+        self.assertEqual(again, apps)
+
+        editor_dir = os.path.join(self.root, "Editor")
+        Path(editor_dir, "viewer.exe").write_text("x")
+        os.utime(editor_dir, ns=(0, scan_meta["dirs"][editor_dir]["mtime_ns"] + 1_000_000))
+        updated, _ = indexer._index_tier2_apps(scan_meta, again)
+        self.assertEqual(sorted(a["name"] for a in updated), ["Editor", "Tool", "Viewer"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Unit tests for the hotword energy pre-gate: silent frames skip inference,
+buffered silence is replayed when sound starts, and trigger rules use the
+configs resolved at load time.
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import numpy as np
+    from wyzer.audio import hotword
+except ImportError:  # numpy not installed
+    np = None
+
+FRAME = 320
+RATE = 16000
+
+
+class _FakeWakeWordModel:
+    """Stands in for openWakeWord: records input sizes, plays back scores."""
+
+    def __init__(self, scores):
+        self.models = {"hey_Wyzer": None}
+        self.scores = list(scores)
+        self.inputs = []
+
+    def predict(self, audio_int16):
+        self.inputs.append(len(audio_int16))
+        return {"hey_Wyzer": self.scores.pop(0) if self.scores else 0.0}
+
+
+def _frame(rms):
+    return np.full(FRAME, rms, dtype=np.float32)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestHotwordGate(unittest.TestCase):
+    """Inference runs only on loud frames and their hangover."""
+
+    def _detector(self, scores=()):
+        model = _FakeWakeWordModel(scores)
+
+        def init_model(detector):
+            detector.model = model
+            detector._build_model_key_mapping()
+
+        with mock.patch.object(hotword, "OPENWAKEWORD_AVAILABLE", True), \
+                mock.patch.object(hotword.HotwordDetector, "_ensure_onnx_models"), \
+                mock.patch.object(hotword.HotwordDetector, "_init_model", init_model), \
+                mock.patch.object(hotword.Config, "HOTWORD_TRIGGER_STREAK", 2), \
+                mock.patch.object(hotword.Config, "HOTWORD_GATE_HANGOVER_SEC", 0.1):
+            detector = hotword.HotwordDetector(wakeword_configs=[
+                {"name": "hey wyzer", "model_path": "hey_Wyzer.onnx", "threshold": 0.5, "cooldown_ms": 1500},
+            ])
+        detector.gate_enabled = True
+        detector.gate_rms = 0.01
+        return detector, model
+
+    def test_silence_skips_inference(self):
+        detector, model = self._detector()
+        for _ in range(50):
+            self.assertEqual(detector.detect(_frame(0.0)), (None, 0.0))
+        self.assertEqual(model.inputs, [])
+        stats = detector.get_stats()
+        self.assertEqual((stats["frames"], stats["gated"], stats["scored"]), (50, 50, 0))
+
+    def test_preroll_replayed_then_hangover(self):
+        detector, model = self._detector()
+        for _ in range(10):
+            detector.detect(_frame(0.0))
+        detector.detect(_frame(0.1))
+        # 0.1 s hangover = 5 frames, then the gate closes again
+        for _ in range(8):
+            detector.detect(_frame(0.0))
+        self.assertEqual(model.inputs, [11 * FRAME] + [FRAME] * 5)
+
+    def test_preroll_is_bounded(self):
+        detector, model = self._detector()
+        for _ in range(300):
+            detector.detect(_frame(0.0))
+        detector.detect(_frame(0.1))
+        self.assertEqual(model.inputs, [int(hotword._GATE_PREROLL_SEC * RATE) + FRAME])
+
+    def test_streak_uses_resolved_config(self):
+        detector, _ = self._detector(scores=[0.6, 0.6, 0.6])
+        self.assertEqual(detector.detect(_frame(0.1))[0], None)
+        with mock.patch.object(hotword.Config, "HOTWORD_TRIGGER_STREAK", 1):
+            keyword, score = detector.detect(_frame(0.1))
+        self.assertEqual((keyword, score), ("hey wyzer", 0.6))
+        # Cooldown blocks an immediate re-trigger
+        self.assertIsNone(detector.detect(_frame(0.1))[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+"""
+Unit tests for the keep-alive HTTP connection pool used by the LLM clients.
+A local HTTP/1.1 stand-in server plays llama.cpp / Ollama.
+"""
+import json
+import threading
+import time
+import unittest
+import sys
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.brain import http_pool
+from wyzer.brain.http_pool import HTTPConnectionPool, build_opener
+from wyzer.brain.llamacpp_client import LlamaCppClient
+from wyzer.brain.ollama_client import OllamaClient
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _send_json(self, obj, close=False):
+        body = json.dumps(obj).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if close:
+            # Drop the connection without announcing it
+            self.close_connection = True
+
+    def _send_not_found(self):
+        # send_error() would also close the connection
+        body = b'{"error": "not found"}'
+        self.send_response(404)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_chunked(self, lines, delay=0.0):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for line in lines:
+            data = line.encode("utf-8")
+            self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+            self.wfile.flush()
+            if delay:
+                time.sleep(delay)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json({"status": "ok"}, close=self.server.close_after_response)
+        elif self.path == "/v1/models":
+            self._send_not_found()
+        elif self.path == "/api/tags":
+            self._send_json({"models": [{"name": "stand-in"}]})
+        else:
+            self._send_not_found()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if self.path == "/completion" and payload.get("stream"):
+            tokens = ["Hello", " there", "!"]
+            lines = [f"data: {json.dumps({'content': t, 'stop': False})}\n\n" for t in tokens]
+            lines.append(f"data: {json.dumps({'content': '', 'stop': True})}\n\n")
+            self._send_chunked(lines + ["data: [DONE]\n\n"] * self.server.trailing_events, delay=self.server.stream_delay)
+        elif self.path == "/completion":
+            self._send_json({"content": "Hello there!"})
+        elif self.path == "/api/generate":
+            lines = [json.dumps({"response": t, "done": t == "!"}) + "\n" for t in ["Hi", "!"]]
+            self._send_chunked(lines)
+        else:
+            self._send_not_found()
+
+
+class TestHTTPConnectionPool(unittest.TestCase):
+    """Connections are reused, health-checked and re-established."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.connections = 0
+        self.server.close_after_response = False
+        self.server.stream_delay = 0.0
+        self.server.trailing_events = 0
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self.thread.start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+        self.pool = HTTPConnectionPool(maxsize=2, idle_sec=30.0)
+        self._orig_pool = http_pool._pool
+        http_pool._pool = self.pool
+
+    def tearDown(self):
+        http_pool._pool = self._orig_pool
+        self.pool.close_all()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_requests_share_one_connection(self):
+        client = LlamaCppClient(base_url=self.base_url, timeout=5)
+        for _ in range(5):
+            self.assertTrue(client.ping())
+        self.assertEqual(client.generate("hi"), "Hello there!")
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(self.pool.stats()["created"], 1)
+
+    def test_streamed_response_returns_connection(self):
+        client = LlamaCppClient(base_url=self.base_url, timeout=5)
+        for _ in range(3):
+            self.assertEqual("".join(client.generate_stream("hi")), "Hello there!")
+        self.assertEqual(self.server.connections, 1)
+
+    def test_ollama_ndjson_stream(self):
+        client = OllamaClient(base_url=self.base_url, timeout=5)
+        self.assertTrue(client.ping())
+        self.assertEqual(list(client.generate_stream("hi", "stand-in")), ["Hi", "!"])
+        self.assertTrue(client.ping())
+        self.assertEqual(self.server.connections, 1)
+
+    def test_unread_stream_is_not_reused(self):
+        self.server.stream_delay = 0.2
+        self.server.trailing_events = 5
+        client = LlamaCppClient(base_url=self.base_url, timeout=5)
+        client._use_openai_compat = False
+        self.assertEqual("".join(client.generate_stream("hi")), "Hello there!")
+        # Server was still sending when the client stopped reading
+        self.assertTrue(client.ping())
+        self.assertEqual(self.server.connections, 2)
+
+    def test_connection_closed_by_server_is_replaced(self):
+        self.server.close_after_response = True
+        client = LlamaCppClient(base_url=self.base_url, timeout=5)
+        self.assertTrue(client.ping())
+        time.sleep(0.1)
+        self.assertTrue(client.ping())
+        self.assertEqual(self.server.connections, 2)
+        self.assertGreaterEqual(self.pool.stats()["discarded"], 1)
+
+    def test_reset_on_reused_connection_is_retried(self):
+        self.server.close_after_response = True
+        client = LlamaCppClient(base_url=self.base_url, timeout=5)
+        self.assertTrue(client.ping())
+        time.sleep(0.1)
+        # Defeat the health check so the dead socket is actually used
+        orig = HTTPConnectionPool._is_healthy
+        HTTPConnectionPool._is_healthy = staticmethod(lambda conn: conn.sock is not None)
+        try:
+            self.assertTrue(client.ping())
+        finally:
+            HTTPConnectionPool._is_healthy = staticmethod(orig)
+        self.assertEqual(self.pool.stats()["retried"], 1)
+
+    def test_idle_timeout(self):
+        self.pool.idle_sec = 0.0
+        client = LlamaCppClient(base_url=self.base_url, timeout=5)
+        self.assertTrue(client.ping())
+        time.sleep(0.01)
+        self.assertTrue(client.ping())
+        self.assertEqual(self.server.connections, 2)
+
+    def test_keepalive_disabled(self):
+        from wyzer.core.config import Config
+        orig = Config.LLM_HTTP_KEEPALIVE
+        Config.LLM_HTTP_KEEPALIVE = False
+        try:
+            opener = build_opener()
+            for _ in range(3):
+                with opener.open(f"{self.base_url}/health", timeout=5) as response:
+                    response.read()
+        finally:
+            Config.LLM_HTTP_KEEPALIVE = orig
+        self.assertEqual(self.server.connections, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Unit tests for the compiled single-clause dispatch in hybrid_router.
+The prefiltered dispatch must always pick the same decision as running
+every rule in priority order.
+"""
+import unittest
+import sys
+import os
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.core import hybrid_router
+from wyzer.core.hybrid_router import _Clause, _candidate_rules, _run_rules, _decide_single_clause
+
+
+PHRASES = [
+    "open spotify",
+    "Open Chrome.",
+    "launch notepad",
+    "open d drive",
+    "open https://example.com",
+    "close discord",
+    "minimize it",
+    "fullscreen chrome",
+    "full screen chrome",
+    "move chrome to monitor two",
+    "send spotify to the second screen",
+    "what time is it",
+    "what's the time?",
+    "google this: cats",
+    "search google for python tutorials",
+    "set a timer for 4 minutes and 20 seconds",
+    "cancel the timer",
+    "how much time is left",
+    "what's the weather in Paris?",
+    "do I need a jacket tomorrow",
+    "whats my cpu",
+    "how much ram do i have",
+    "where am i",
+    "what am I looking at",
+    "whats this window",
+    "what monitor is chrome on",
+    "how many monitors do i have",
+    "scan my files",
+    "rebuild library",
+    "scan devices",
+    "scan drive c",
+    "scandiskc",
+    "-scan devices",
+    "system scan",
+    "list drives",
+    "what does edrive have",
+    "go back",
+    "switch to the next app",
+    "switch to discord",
+    "list audio devices",
+    "switch audio to headphones",
+    "what's the spotify volume",
+    "turn spotify down by 10%",
+    "set volume to 35",
+    "mute discord",
+    "louder",
+    "what song is this",
+    "hit play",
+    "resume",
+    "skip",
+    "previous track",
+    "tell me a story",
+    "",
+    "   ",
+    "ſet a timer for 5 minutes",
+]
+
+
+class TestHybridRouterDispatch(unittest.TestCase):
+    """Prefiltered dispatch must match the full ordered rule chain."""
+
+    def _full_chain(self, text):
+        c = _Clause.from_text(text.strip())
+        return _run_rules(c, hybrid_router._ALL_RULE_INDICES)
+
+    def test_matches_full_chain(self):
+        for phrase in PHRASES:
+            if not phrase.strip():
+                continue
+            with self.subTest(phrase=phrase):
+                self.assertEqual(_decide_single_clause(phrase), self._full_chain(phrase))
+
+    def test_candidates_are_in_priority_order(self):
+        for phrase in PHRASES:
+            if not phrase.strip():
+                continue
+            candidates = _candidate_rules(_Clause.from_text(phrase.strip()))
+            self.assertEqual(list(candidates), sorted(set(candidates)))
+
+    def test_prefilter_skips_unrelated_rules(self):
+        candidates = _candidate_rules(_Clause.from_text("open spotify"))
+        names = {hybrid_router._RULES[i].name for i in candidates}
+        self.assertIn("open", names)
+        self.assertNotIn("timer_start", names)
+        self.assertNotIn("weather", names)
+
+    def test_non_ascii_uses_full_chain(self):
+        c = _Clause.from_text("ſet a timer for 5 minutes")
+        self.assertEqual(_candidate_rules(c), hybrid_router._ALL_RULE_INDICES)
+
+    def test_lead_word_ignores_leading_punctuation(self):
+        self.assertEqual(_Clause.from_text("-scan devices").lead, "scan")
+        self.assertEqual(_Clause.from_text("what's the time").lead, "what")
+        self.assertEqual(_Clause.from_text("42").lead, "")
+
+    def test_empty_clause(self):
+        decision = _decide_single_clause("   ")
+        self.assertEqual(decision.mode, "llm")
+        self.assertEqual(decision.confidence, 0.0)
+
+    def test_decisions(self):
+        d = _decide_single_clause("open spotify")
+        self.assertEqual(d.intents[0]["tool"], "open_target")
+        self.assertEqual(d.reply, "Opening spotify.")
+
+        d = _decide_single_clause("open d drive")
+        self.assertEqual(d.intents[0]["tool"], "system_storage_open")
+
+        d = _decide_single_clause("minimize play")
+        self.assertEqual(d.mode, "llm")
+        self.assertEqual(d.confidence, 0.3)
+
+        d = _decide_single_clause("turn spotify down by 10%")
+        self.assertEqual(d.intents[0]["args"], {"scope": "app", "action": "change", "delta": -10, "process": "spotify"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+"""
+Unit tests for concurrent LocalLibrary index sources: per-source timeouts,
+fingerprint caching, cached fallbacks and incremental game merging.
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.local_library import game_indexer
+from wyzer.local_library.index_sources import IndexSource, run_sources, stat_fingerprint
+
+
+def _game(name, source, confidence):
+    return {"name": name, "source": source, "confidence": confidence}
+
+
+class _Counter:
+    def __init__(self, value, delay=0.0):
+        self.value = value
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.value
+
+
+class TestRunSources(unittest.TestCase):
+    """Sources run side by side; each is bounded and cached on its own."""
+
+    def test_sources_run_concurrently(self):
+        sources = [IndexSource(name, _Counter([name], delay=0.3)) for name in ("a", "b", "c")]
+        start = time.monotonic()
+        results = run_sources(sources)
+        self.assertLess(time.monotonic() - start, 0.8)
+        self.assertEqual({name: r.value for name, r in results.items()}, {"a": ["a"], "b": ["b"], "c": ["c"]})
+
+    def test_unchanged_fingerprint_skips_source(self):
+        index = _Counter(["x"])
+        fingerprint = ["v1"]
+        source = IndexSource("steam", index, lambda: fingerprint[0])
+        cache = {}
+
+        run_sources([source], cache)
+        result = run_sources([source], cache)["steam"]
+        self.assertEqual(index.calls, 1)
+        self.assertTrue(result.ok and result.cached)
+        self.assertEqual(result.value, ["x"])
+
+        fingerprint[0] = "v2"
+        index.value = ["x", "y"]
+        result = run_sources([source], cache)["steam"]
+        self.assertEqual(index.calls, 2)
+        self.assertFalse(result.cached)
+        self.assertEqual(cache["steam"], {"fingerprint": "v2", "value": ["x", "y"]})
+
+        # No fingerprint: always queried, and not kept in the cache
+        run_sources([IndexSource("steam", index)], cache)
+        self.assertEqual(index.calls, 3)
+        self.assertNotIn("steam", cache)
+
+    def test_timeout_falls_back_to_cache(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        cache = {"xbox": {"fingerprint": "old", "value": ["cached"]}}
+        sources = [
+            IndexSource("xbox", lambda: release.wait(5.0), lambda: "new", timeout_sec=0.2),
+            IndexSource("epic", _Counter(["e"])),
+        ]
+        start = time.monotonic()
+        results = run_sources(sources, cache)
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertFalse(results["xbox"].ok)
+        self.assertIn("timed out", results["xbox"].error)
+        self.assertEqual(results["xbox"].value, ["cached"])
+        self.assertEqual(cache["xbox"]["fingerprint"], "old")
+        self.assertTrue(results["epic"].ok)
+
+    def test_failure_reports_error(self):
+        def boom():
+            raise RuntimeError("powershell failed")
+        result = run_sources([IndexSource("uwp", boom)])["uwp"]
+        self.assertFalse(result.ok)
+        self.assertIsNone(result.value)
+        self.assertEqual(result.error, "powershell failed")
+
+
+class TestStatFingerprint(unittest.TestCase):
+    """Adding or touching a manifest changes the fingerprint."""
+
+    def test_changes_with_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = Path(tmp) / "appmanifest_1.acf"
+            manifest.write_text("a")
+            before = stat_fingerprint([tmp, manifest])
+            self.assertEqual(stat_fingerprint([manifest, tmp]), before)
+            manifest.write_text("abc")
+            self.assertNotEqual(stat_fingerprint([tmp, manifest]), before)
+            self.assertNotEqual(stat_fingerprint([tmp, manifest, Path(tmp) / "missing"]), before)
+
+
+class TestRefreshGamesIndex(unittest.TestCase):
+    """Game sources are merged through deduplication as they finish."""
+
+    def _sources(self, timeout_sec):
+        return [
+            IndexSource("steam", _Counter([_game("Rocket League", "steam", 0.95)], delay=0.1), lambda: "s"),
+            IndexSource("shortcuts", _Counter([
+                _game("Rocket League", "shortcut", 0.80),
+                _game("Terraria", "shortcut", 0.80),
+            ])),
+            IndexSource("xbox", lambda: 1 / 0),
+        ]
+
+    def test_merges_and_reports_sources(self):
+        cache = {}
+        with mock.patch.object(game_indexer, "_game_index_sources", self._sources):
+            result = game_indexer.refresh_games_index(cache)
+            again = game_indexer.refresh_games_index(cache)
+
+        self.assertEqual([(g["name"], g["source"]) for g in result["games"]],
+                         [("Rocket League", "steam"), ("Terraria", "shortcut")])
+        self.assertEqual(result["counts"], {"steam": 1, "shortcuts": 2, "xbox": 0})
+        self.assertEqual(result["sources"]["xbox"], False)
+        self.assertEqual([e["source"] for e in result["errors"]], ["xbox"])
+        self.assertEqual(result["cached_sources"], [])
+        self.assertEqual(again["cached_sources"], ["steam"])
+        self.assertEqual(again["games"], result["games"])
+
+    def test_ties_go_to_earlier_source(self):
+        def sources(timeout_sec):
+            # The first declared source finishes last
+            return [
+                IndexSource("start_menu", _Counter([
+                    dict(_game("Celeste", "shortcut", 0.80), path="start_menu.lnk"),
+                    _game("Hades", "shortcut", 0.80),
+                ], delay=0.2)),
+                IndexSource("desktop", _Counter([
+                    dict(_game("Celeste", "shortcut", 0.80), path="desktop.lnk"),
+                    _game("Terraria", "shortcut", 0.80),
+                ])),
+            ]
+
+        with mock.patch.object(game_indexer, "_game_index_sources", sources):
+            result = game_indexer.refresh_games_index({})
+
+        self.assertEqual([g["name"] for g in result["games"]], ["Celeste", "Hades", "Terraria"])
+        self.assertEqual(result["games"][0]["path"], "start_menu.lnk")
+
+    def test_order_matches_deduplication(self):
+        records = {
+            "epic": [_game("Alpha", "epic", 0.7)],
+            "shortcuts": [_game("Beta", "shortcut", 0.8)],
+            "folder_scan": [_game("Alpha", "folder_scan", 0.9)],
+        }
+
+        def sources(timeout_sec):
+            return [IndexSource(name, _Counter(games)) for name, games in records.items()]
+
+        with mock.patch.object(game_indexer, "_game_index_sources", sources):
+            result = game_indexer.refresh_games_index({})
+
+        expected = game_indexer._deduplicate_games([g for games in records.values() for g in games])
+        self.assertEqual(result["games"], expected)
+        self.assertEqual([(g["name"], g["source"]) for g in result["games"]],
+                         [("Alpha", "folder_scan"), ("Beta", "shortcut")])
+
+    def test_merges_without_waiting_for_later_sources(self):
+        merged = []
+        slow_done = threading.Event()
+
+        def slow():
+            time.sleep(0.3)
+            slow_done.set()
+            return [_game("Hades", "xbox", 0.7)]
+
+        def sources(timeout_sec):
+            return [
+                IndexSource("steam", _Counter([_game("Celeste", "steam", 0.95)])),
+                IndexSource("xbox", slow),
+            ]
+
+        merge_game = game_indexer._merge_game
+
+        def _record(games_by_name, game):
+            merged.append((game["name"], slow_done.is_set()))
+            merge_game(games_by_name, game)
+
+        with mock.patch.object(game_indexer, "_game_index_sources", sources), \
+                mock.patch.object(game_indexer, "_merge_game", _record):
+            result = game_indexer.refresh_games_index({})
+
+        self.assertEqual(merged, [("Celeste", False), ("Hades", True)])
+        self.assertEqual(list(result["counts"]), ["steam", "xbox"])
+
+
+if __name__ == '__main__':
+    unittest.main()
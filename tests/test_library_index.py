@@ -0,0 +1,114 @@
+"""
+Unit tests for the in-memory LocalLibrary index used by resolve_target().
+"""
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import sys
+from pathlib import Path
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.local_library import indexer, library_index
+from wyzer.local_library.library_index import LibraryIndex, get_library_index
+from wyzer.local_library.resolver import _extract_keywords, resolve_target
+
+
+LIBRARY = {
+    "games": [
+        {"name": "Rocket League®", "aliases": ["rl"], "confidence": 0.95,
+         "launch": {"type": "steam", "target": "252950"}},
+        {"name": "Minecraft", "aliases": ["mc", "rl"], "confidence": 0.9,
+         "launch": {"type": "exe", "target": "C:\\Games\\Minecraft.exe"}},
+    ],
+    "uwp_apps": [
+        {"name": "Spotify", "app_id": "SpotifyAB.Spotify", "aliases": ["music player"]},
+    ],
+    "folders": {"downloads": "C:\\Users\\me\\Downloads"},
+    "apps": {"chrome": {"path": "C:\\Chrome\\chrome.exe"}},
+    "tier2_apps": [
+        {"name": "Chrome Beta", "exe_path": "C:\\Chrome\\beta.exe"},
+        {"name": "OBS Studio", "exe_path": "C:\\Program Files\\obs-studio\\bin\\64bit\\obs64.exe"},
+    ],
+    "tier3_files": [{"name": "notes.txt", "path": "C:\\notes.txt"}],
+}
+
+
+class TestLibraryIndex(unittest.TestCase):
+    """Exact and fuzzy lookups over a prebuilt index."""
+
+    def setUp(self):
+        self.index = LibraryIndex(LIBRARY)
+
+    def test_exact_lookups_prefer_first_record_and_name(self):
+        game, via_alias = self.index.exact_games["rl"]
+        self.assertEqual(game["name"], "Rocket League®")
+        self.assertTrue(via_alias)
+        self.assertEqual(self.index.exact_games["rocket league"], (LIBRARY["games"][0], False))
+        self.assertIn("chrome beta", self.index.exact_tier2)
+
+    def test_fuzzy_candidates_cover_substring_matches(self):
+        for query in ["rocket", "open chrome", "studio obs", "my downloads folder", "ra", "xyz", "play mine"]:
+            keywords = _extract_keywords(query)
+            expected = [
+                pos for pos, entry in enumerate(self.index.entries)
+                if any(kw in target for kw in keywords for target in entry.targets)
+            ]
+            with self.subTest(query=query):
+                self.assertEqual(self.index.fuzzy_candidates(keywords), expected)
+
+    def test_games_only(self):
+        positions = self.index.fuzzy_candidates(["r"], games_only=True)
+        self.assertTrue(all(self.index.entries[p].category == "game" for p in positions))
+
+
+class TestLibraryIndexReload(unittest.TestCase):
+    """The process-wide index follows library.json and aliases.json."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self._orig_paths = (indexer.LIBRARY_JSON_PATH, indexer.ALIASES_JSON_PATH)
+        indexer.LIBRARY_JSON_PATH = Path(self.tmpdir) / "library.json"
+        indexer.ALIASES_JSON_PATH = Path(self.tmpdir) / "aliases.json"
+        library_index.invalidate_library_index()
+        indexer.save_library(dict(LIBRARY))
+
+    def tearDown(self):
+        indexer.LIBRARY_JSON_PATH, indexer.ALIASES_JSON_PATH = self._orig_paths
+        library_index.invalidate_library_index()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_index_is_reused(self):
+        self.assertIs(get_library_index(), get_library_index())
+
+    def test_resolve_uses_index(self):
+        result = resolve_target("play rocket league")
+        self.assertEqual(result["type"], "game")
+        self.assertEqual(result["launch"]["target"], "252950")
+        self.assertEqual(resolve_target("Chrome.")["path"], "C:\\Chrome\\chrome.exe")
+        self.assertEqual(resolve_target("spotify")["type"], "uwp")
+
+    def test_reload_after_save_library(self):
+        first = get_library_index()
+        library = dict(LIBRARY)
+        library["folders"] = {"screenshots": "C:\\Shots"}
+        indexer.save_library(library)
+        self.assertIsNot(get_library_index(), first)
+        self.assertEqual(resolve_target("screenshots")["path"], "C:\\Shots")
+
+    def test_reload_after_external_alias_edit(self):
+        first = get_library_index()
+        time.sleep(0.01)
+        indexer.ALIASES_JSON_PATH.write_text(
+            json.dumps({"Work": {"type": "folder", "target": "D:\\Work"}}), encoding="utf-8"
+        )
+        self.assertIsNot(get_library_index(), first)
+        self.assertEqual(resolve_target("work")["path"], "D:\\Work")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit tests for the Wyzer logger: level gating, deferred formatting,
+the background sink and JSON-lines output.
+"""
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import sys
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.core.logger import Logger
+
+
+class _CaptureLogger(Logger):
+    """Logger that records emitted lines instead of printing them."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lines = []
+        self.emit_threads = []
+
+    def _emit(self, record):
+        level, created, message, thread_name = record
+        self.lines.append((level, message))
+        self.emit_threads.append(threading.current_thread())
+        if self.json_path:
+            self._write_json(level, created, message, thread_name)
+
+
+class TestLoggerGating(unittest.TestCase):
+    """Filtered calls never format their message."""
+
+    def test_filtered_level_skips_formatting(self):
+        logger = _CaptureLogger(level="INFO")
+        calls = []
+
+        class Expensive:
+            def __str__(self):
+                calls.append(1)
+                return "expensive"
+
+        logger.debug("value=%s", Expensive())
+        logger.debug(lambda: calls.append(1) or "lazy")
+        self.assertEqual(calls, [])
+        self.assertEqual(logger.lines, [])
+        self.assertFalse(logger.is_enabled("DEBUG"))
+        self.assertTrue(logger.is_enabled("WARNING"))
+
+    def test_template_and_callable_messages(self):
+        logger = _CaptureLogger(level="DEBUG")
+        logger.info("[TOOLS] Executing %s args=%s", "timer", {"seconds": 5})
+        logger.debug(lambda: "computed")
+        logger.info("100% literal")
+        logger.info("bad template %d", "x")
+        self.assertEqual(logger.lines, [
+            ("INFO", "[TOOLS] Executing timer args={'seconds': 5}"),
+            ("DEBUG", "computed"),
+            ("INFO", "100% literal"),
+            ("INFO", "bad template %d x"),
+        ])
+
+    def test_level_change_takes_effect(self):
+        logger = _CaptureLogger(level="WARNING")
+        logger.info("hidden")
+        logger.level = "INFO"
+        logger.info("shown")
+        self.assertEqual(logger.lines, [("INFO", "shown")])
+
+    def test_quiet_mode_filters_template_and_message(self):
+        logger = _CaptureLogger(level="DEBUG", quiet_mode=True)
+        logger.info("[TOOLS] Executing %s", "x")
+        logger.info("Drained %d frames from queue", 3)
+        logger.info("Hello %s", "world")
+        self.assertEqual(logger.lines, [("INFO", "Hello world")])
+
+
+class TestAsyncSink(unittest.TestCase):
+    """Background writer keeps order and errors are written synchronously."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_background_writer_preserves_order(self):
+        logger = _CaptureLogger(level="INFO", async_sink=True)
+        for i in range(200):
+            logger.info("line %d", i)
+        logger.flush()
+        self.assertEqual([m for _, m in logger.lines], [f"line {i}" for i in range(200)])
+        self.assertTrue(all(t is not threading.current_thread() for t in logger.emit_threads))
+
+    def test_errors_are_written_before_returning(self):
+        logger = _CaptureLogger(level="INFO", async_sink=True)
+        logger.info("first")
+        logger.error("boom")
+        self.assertEqual(logger.lines, [("INFO", "first"), ("ERROR", "boom")])
+
+    def test_json_lines_output(self):
+        path = os.path.join(self.tmpdir, "logs", "wyzer.jsonl")
+        logger = _CaptureLogger(level="INFO", async_sink=True, json_path=path)
+        logger.info("hello %s", "json")
+        logger.warning("careful")
+        logger.close()
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([(r["level"], r["msg"]) for r in records], [("INFO", "hello json"), ("WARNING", "careful")])
+        self.assertEqual(records[0]["pid"], os.getpid())
+        self.assertEqual(records[0]["thread"], threading.current_thread().name)
+        self.assertIn("T", records[0]["ts"])
+
+
+if __name__ == '__main__':
+    unittest.main()
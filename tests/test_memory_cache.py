@@ -0,0 +1,109 @@
+"""
+Unit tests for the MemoryManager long-term memory cache.
+The migrated record list is reused while memory.json is unchanged, and
+saves re-serialize only changed records without changing the file format.
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest import mock
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.memory import memory_manager
+from wyzer.memory.memory_manager import MemoryManager
+
+
+class TestMemoryCache(unittest.TestCase):
+    """Loads hit the cache until the file changes."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.mgr = MemoryManager()
+        self.mgr._memory_file = Path(self.tmpdir) / "memory.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _write_external(self, data):
+        with open(self.mgr._memory_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        # Make sure the stamp moves even on coarse-mtime filesystems
+        st = os.stat(self.mgr._memory_file)
+        os.utime(self.mgr._memory_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def test_unchanged_file_is_parsed_once(self):
+        self._write_external(["my name is Levi", "I like pizza"])
+        with mock.patch.object(memory_manager.json, "load", wraps=json.load) as load:
+            first = self.mgr._load_memories()
+            second = self.mgr._load_memories()
+            self.mgr.select_for_injection("what's my name")
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(first, second)
+        # Legacy entries keep the ids assigned on first migration
+        self.assertEqual([m["id"] for m in first], [m["id"] for m in second])
+
+    def test_external_edit_invalidates(self):
+        self._write_external(["my name is Levi"])
+        self.assertEqual(len(self.mgr.list_all()), 1)
+        self._write_external(["my name is Levi", "my dog is Bella"])
+        self.assertEqual([m["value"] for m in self.mgr.list_all()], ["my name is Levi", "my dog is Bella"])
+
+    def test_deleted_file_returns_empty(self):
+        self._write_external(["my name is Levi"])
+        self.assertTrue(self.mgr.has_memories())
+        os.remove(self.mgr._memory_file)
+        self.assertFalse(self.mgr.has_memories())
+
+    def test_returned_records_are_copies(self):
+        self.mgr.remember("my name is Levi")
+        records = self.mgr.list_all()
+        records[0]["aliases"].append("nickname")
+        records[0]["value"] = "changed"
+        fresh = self.mgr.list_all()[0]
+        self.assertEqual(fresh["aliases"], [])
+        self.assertEqual(fresh["value"], "my name is Levi")
+
+    def test_own_write_refreshes_cache_without_reparse(self):
+        self.mgr.remember("my name is Levi")
+        self.mgr.list_all()
+        with mock.patch.object(memory_manager.json, "load", wraps=json.load) as load:
+            self.mgr.remember("my dog is Bella")
+            self.mgr.set_pinned_by_query("dog", True)
+            records = self.mgr.list_all()
+        self.assertEqual(load.call_count, 0)
+        self.assertEqual([m["value"] for m in records], ["my name is Levi", "my dog is Bella"])
+        self.assertTrue(records[1]["pinned"])
+
+    def test_saved_file_matches_json_dump(self):
+        self.mgr.remember("my name is Levi")
+        self.mgr.remember("my favorite color is blue")
+        self.mgr.add_alias_by_query("name", "nickname")
+        on_disk = self.mgr._memory_file.read_text(encoding='utf-8')
+        records = json.loads(on_disk)
+        self.assertEqual(on_disk, json.dumps(records, indent=2, ensure_ascii=False))
+        self.assertEqual(records[0]["aliases"], ["nickname"])
+
+    def test_unchanged_records_are_not_reserialized(self):
+        for i in range(5):
+            self.mgr.remember(f"note number {i}")
+        # Rewrite once so every record is stored in migrated form
+        self.mgr._save_memories(self.mgr._load_memories())
+        with mock.patch.object(memory_manager, "_serialize_record", wraps=memory_manager._serialize_record) as ser:
+            self.mgr.set_pinned_by_query("note number 3", True)
+        self.assertEqual(ser.call_count, 1)
+
+    def test_empty_save(self):
+        self.mgr.remember("my name is Levi")
+        self.mgr.forget_last()
+        self.assertEqual(self.mgr._memory_file.read_text(encoding='utf-8'), "[]")
+        self.assertEqual(self.mgr.list_all(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
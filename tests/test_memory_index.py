@@ -0,0 +1,117 @@
+"""
+Unit tests for the MemoryManager token index.
+Candidate lookups must never miss a record that the full-scan predicates
+(_is_mentioned, _score_record, recall scoring) would select.
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.memory.memory_manager import MemoryManager, _normalize_for_matching
+
+
+RECORDS = [
+    {"id": "1", "key": "name", "value": "my name is Levi", "aliases": ["lev"], "created_at": "2024-01-01"},
+    {"id": "2", "key": "wife_name", "value": "my wife's name is Audrey", "pinned": True, "created_at": "2024-01-02"},
+    {"id": "3", "key": "dog_name", "value": "my dog is Bella", "aliases": ["my pup"], "created_at": "2024-01-03"},
+    {"id": "4", "value": "I drink coffee every morning", "tags": ["drinks"], "pinned": True, "created_at": "2024-01-04"},
+    {"id": "5", "key": "favorite_color", "value": "my favorite color is blue", "created_at": "2024-01-05"},
+    {"id": "6", "value": "the garage code is 4512", "aliases": [""], "created_at": "2024-01-06"},
+    {"id": "7", "key": "car", "value": "I drive a Tesla", "created_at": "2024-01-07"},
+]
+
+QUERIES = [
+    "what's my name",
+    "who is my wife",
+    "tell me about my pup",
+    "what do I drink",
+    "favorite color?",
+    "username",
+    "remind me of the garage code",
+    "what car do i have",
+    "is it levi or lev",
+    "ame",
+    "b",
+    "",
+]
+
+
+class TestMemoryIndex(unittest.TestCase):
+    """Index candidates are a superset of full-scan matches."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.mgr = MemoryManager()
+        self.mgr._memory_file = Path(self.tmpdir) / "memory.json"
+        self.mgr._memory_file.write_text(json.dumps(RECORDS), encoding='utf-8')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _index(self):
+        memories = self.mgr._cached_memories()
+        return memories, self.mgr._memory_index(memories)
+
+    def test_mention_candidates_cover_full_scan(self):
+        memories, index = self._index()
+        for query in QUERIES:
+            user_text = query.lower()
+            tokens = self.mgr._tokenize_for_matching(query)
+            expected = [i for i, m in enumerate(memories) if self.mgr._is_mentioned(m, user_text, tokens)]
+            candidates = index.mention_candidates(user_text, tokens)
+            with self.subTest(query=query):
+                self.assertEqual(candidates, sorted(candidates))
+                self.assertTrue(set(expected) <= set(candidates))
+                self.assertEqual([i for i in candidates if index.features[i].is_mentioned(user_text, tokens)], expected)
+
+    def test_token_candidates_cover_scoring(self):
+        memories, index = self._index()
+        for query in QUERIES:
+            tokens = self.mgr._tokenize_for_matching(query)
+            expected = [i for i, m in enumerate(memories) if self.mgr._score_record(m, tokens) > 0]
+            with self.subTest(query=query):
+                self.assertTrue(set(expected) <= set(index.token_candidates(tokens)))
+
+    def test_recall_candidates_cover_substring_and_overlap(self):
+        memories, index = self._index()
+        for query in QUERIES + ["levi", "name is le", "blue"]:
+            q = _normalize_for_matching(query)
+            if not q:
+                continue
+            words = set(q.split())
+            expected = [
+                i for i, text in enumerate(index.recall_texts)
+                if text and (q in text or words & set(text.split()))
+            ]
+            with self.subTest(query=query):
+                self.assertTrue(set(expected) <= set(index.recall_candidates(q, words)))
+
+    def test_empty_alias_always_mentioned(self):
+        memories, index = self._index()
+        self.assertIn(5, index.mention_candidates("hello", set()))
+
+    def test_index_reused_until_memories_change(self):
+        _, first = self._index()
+        _, second = self._index()
+        self.assertIs(first, second)
+        self.mgr.remember("my sister is Jane")
+        memories, third = self._index()
+        self.assertIsNot(first, third)
+        self.assertEqual(len(third.features), len(memories))
+
+    def test_selection_results(self):
+        block = self.mgr.select_for_injection("who is my wife")
+        self.assertIn("wife_name", block)
+        recalled = self.mgr.recall("garage code")
+        self.assertEqual([m["id"] for m in recalled], ["6"])
+
+
+if __name__ == '__main__':
+    unittest.main()
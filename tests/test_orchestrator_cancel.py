@@ -0,0 +1,95 @@
+"""
+Unit tests for cancelling an orchestrator call after a barge-in: an
+interrupted handle_user_text() call stops before running tools and never
+registers a pending confirmation whose prompt the user won't hear.
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.context.world_state import (
+    clear_pending_confirmation,
+    get_autonomy_mode,
+    get_pending_confirmation,
+    set_autonomy_mode,
+)
+from wyzer.core import orchestrator
+from wyzer.core.config import Config
+from wyzer.core.intent_plan import Intent
+
+ASK = {
+    "action": "ask",
+    "needs_confirmation": True,
+    "question": "Close all windows?",
+    "reason": "high risk",
+}
+
+
+class TestCancelledCall(unittest.TestCase):
+    """The call's cancel_check is consulted before acting or asking."""
+
+    def setUp(self):
+        self.cancelled = False
+        orchestrator._cancel_state.check = lambda: self.cancelled
+        self.addCleanup(setattr, orchestrator._cancel_state, "check", None)
+        clear_pending_confirmation()
+        self.addCleanup(clear_pending_confirmation)
+
+    def test_remaining_intents_skipped(self):
+        calls = []
+
+        def stub_execute_tool(registry, tool_name, args):
+            calls.append(tool_name)
+            self.cancelled = True  # interrupt arrives while the first tool runs
+            return {"status": "ok"}
+
+        intents = [Intent(tool="media_play_pause", args={}), Intent(tool="volume_up", args={})]
+        with mock.patch.object(orchestrator, "_execute_tool", stub_execute_tool), \
+                mock.patch.object(orchestrator, "_apply_world_state_update", lambda *a: None), \
+                mock.patch.object(Config, "TOOL_PARALLEL_INTENTS", False):
+            summary = orchestrator._execute_intents(intents, registry=None)
+
+        self.assertEqual(calls, ["media_play_pause"])
+        self.assertTrue(summary.stopped_early)
+        self.assertEqual([r.tool for r in summary.ran], ["media_play_pause"])
+
+    def test_no_pending_confirmation_after_cancel(self):
+        mode = get_autonomy_mode()
+        set_autonomy_mode("normal")
+        self.addCleanup(set_autonomy_mode, mode)
+        plan = [{"tool": "close_window", "args": {"title": "chrome"}}]
+
+        with mock.patch("wyzer.policy.autonomy_policy.assess", return_value=dict(ASK)):
+            self.cancelled = True
+            result = orchestrator.execute_tool_plan_with_autonomy(plan, None, 0.9, 0.0)
+            self.assertEqual(result["reply"], "")
+            self.assertTrue(result["meta"]["cancelled"])
+            self.assertIsNone(get_pending_confirmation())
+
+            self.cancelled = False
+            result = orchestrator.execute_tool_plan_with_autonomy(plan, None, 0.9, 0.0)
+            self.assertEqual(result["reply"], "Close all windows?")
+            self.assertIsNotNone(get_pending_confirmation())
+
+    def test_handle_user_text_installs_cancel_check(self):
+        seen = []
+
+        def body(text):
+            seen.append(orchestrator._is_cancelled())
+            return {"reply": text}
+
+        with mock.patch.object(orchestrator, "_handle_user_text", body):
+            self.assertEqual(orchestrator.handle_user_text("hi", cancel_check=lambda: True), {"reply": "hi"})
+            orchestrator.handle_user_text("hi")
+        self.assertEqual(seen, [True, False])
+        # The caller's own check is restored afterwards
+        self.cancelled = True
+        self.assertTrue(orchestrator._is_cancelled())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+"""
+Unit tests for dependency-aware multi-intent execution.
+Tests group_parallel_intents() and the grouped _execute_intents() executor.
+"""
+import threading
+import time
+import unittest
+import sys
+import os
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.core import orchestrator
+from wyzer.core.config import Config
+from wyzer.core.intent_plan import Intent, group_parallel_intents
+
+
+def _open(target, continue_on_error=False):
+    return Intent(tool="open_target", args={"query": target}, continue_on_error=continue_on_error)
+
+
+class TestGroupParallelIntents(unittest.TestCase):
+    """Test plan grouping."""
+
+    def test_independent_opens_share_a_group(self):
+        intents = [_open("spotify"), _open("chrome"), _open("notepad")]
+        self.assertEqual(group_parallel_intents(intents), [[0, 1, 2]])
+
+    def test_same_target_is_split(self):
+        intents = [_open("Spotify"), _open("spotify ")]
+        self.assertEqual(group_parallel_intents(intents), [[0], [1]])
+
+    def test_ordered_chain_stays_sequential(self):
+        intents = [
+            Intent(tool="focus_window", args={"title": "chrome"}),
+            Intent(tool="maximize_window", args={"title": "chrome"}),
+        ]
+        self.assertEqual(group_parallel_intents(intents), [[0], [1]])
+
+    def test_unsafe_tool_breaks_group(self):
+        intents = [
+            _open("spotify"),
+            _open("chrome"),
+            Intent(tool="media_play_pause", args={}),
+            _open("notepad"),
+            Intent(tool="get_time", args={}),
+        ]
+        self.assertEqual(group_parallel_intents(intents), [[0, 1], [2], [3, 4]])
+
+    def test_max_group_size(self):
+        intents = [_open(str(i)) for i in range(5)]
+        self.assertEqual(group_parallel_intents(intents, max_group_size=2), [[0, 1], [2, 3], [4]])
+
+
+class TestGroupedExecution(unittest.TestCase):
+    """Test _execute_intents with a stubbed tool runner."""
+
+    def setUp(self):
+        self._orig_execute_tool = orchestrator._execute_tool
+        self._orig_apply = orchestrator._apply_world_state_update
+        self._orig_flag = Config.TOOL_PARALLEL_INTENTS
+        Config.TOOL_PARALLEL_INTENTS = True
+        self.calls = []
+        self.world_updates = []
+        self.fail = set()
+        self.lock = threading.Lock()
+
+        def stub_execute_tool(registry, tool_name, args):
+            time.sleep(0.1)
+            target = args.get("query") or args.get("title") or ""
+            with self.lock:
+                self.calls.append((tool_name, target))
+            # Emulate the real tool path recording world state
+            result = {"error": {"type": "not_found", "message": target}} if target in self.fail else {"status": "ok", "target": target}
+            orchestrator._update_world_state_from_result(tool_name, args, result)
+            return result
+
+        orchestrator._execute_tool = stub_execute_tool
+        orchestrator._apply_world_state_update = lambda tool, args, result: self.world_updates.append(args.get("query"))
+
+    def tearDown(self):
+        orchestrator._execute_tool = self._orig_execute_tool
+        orchestrator._apply_world_state_update = self._orig_apply
+        Config.TOOL_PARALLEL_INTENTS = self._orig_flag
+
+    def test_independent_intents_run_concurrently(self):
+        intents = [_open("spotify"), _open("chrome"), _open("notepad")]
+        start = time.perf_counter()
+        summary = orchestrator._execute_intents(intents, registry=None)
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.25)
+        self.assertEqual([r.result["target"] for r in summary.ran], ["spotify", "chrome", "notepad"])
+        self.assertFalse(summary.stopped_early)
+        # World state replayed in plan order, not completion order
+        self.assertEqual(self.world_updates, ["spotify", "chrome", "notepad"])
+
+    def test_failure_in_group_stops_following_groups(self):
+        self.fail.add("chrome")
+        intents = [_open("spotify"), _open("chrome"), Intent(tool="media_play_pause", args={})]
+        summary = orchestrator._execute_intents(intents, registry=None)
+
+        self.assertTrue(summary.stopped_early)
+        self.assertEqual([r.ok for r in summary.ran], [True, False])
+        self.assertNotIn(("media_play_pause", ""), self.calls)
+
+    def test_focus_failure_keeps_chain_going(self):
+        self.fail.add("ghost")
+        intents = [
+            Intent(tool="focus_window", args={"title": "ghost"}),
+            Intent(tool="maximize_window", args={"title": "chrome"}),
+        ]
+
+        def stub(registry, tool_name, args):
+            if tool_name == "focus_window":
+                return {"error": {"type": "window_not_found", "message": "ghost"}}
+            return {"status": "ok"}
+
+        orchestrator._execute_tool = stub
+        summary = orchestrator._execute_intents(intents, registry=None)
+        self.assertFalse(summary.stopped_early)
+        self.assertEqual([r.ok for r in summary.ran], [False, True])
+
+    def test_disabled_flag_runs_sequentially(self):
+        Config.TOOL_PARALLEL_INTENTS = False
+        intents = [_open("spotify"), _open("chrome")]
+        start = time.perf_counter()
+        orchestrator._execute_intents(intents, registry=None)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.2)
+        self.assertEqual(self.calls, [("open_target", "spotify"), ("open_target", "chrome")])
+
+
+if __name__ == '__main__':
+    unittest.main()
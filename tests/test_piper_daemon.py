@@ -0,0 +1,110 @@
+"""
+Unit tests for the persistent Piper process (raw PCM streaming).
+
+A small Python script stands in for the Piper executable: it reads one
+sentence per line, writes 16-bit PCM to stdout in uneven chunks and logs
+Piper's "Real-time factor" line on stderr when the sentence is done.
+"""
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import unittest
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import numpy as np
+    from wyzer.tts.piper_engine import PiperTTSEngine
+except (ImportError, OSError):  # numpy / sounddevice (or PortAudio) not installed
+    np = None
+
+
+FAKE_PIPER = '''#!{python}
+import sys, time
+if "--output-raw" not in sys.argv:
+    sys.exit(1)  # per-call WAV fallback is not emulated
+out = sys.stdout.buffer
+for line in sys.stdin:
+    text = line.strip()
+    if text == "die":
+        sys.exit(3)
+    if text == "hang":
+        time.sleep(60)
+    # 2 bytes per character; odd-sized writes exercise sample alignment
+    pcm = bytes((i % 251 for i in range(2 * len(text))))
+    for start in range(0, len(pcm), 7):
+        out.write(pcm[start:start + 7])
+        out.flush()
+    sys.stderr.write("[piper] [info] Real-time factor: 0.1 (infer=0.1 sec, audio=1 sec)\\n")
+    sys.stderr.flush()
+'''
+
+
+def _expected_pcm(text):
+    return bytes(i % 251 for i in range(2 * len(text)))
+
+
+@unittest.skipIf(np is None, "numpy/sounddevice not installed")
+@unittest.skipIf(os.name == "nt", "fake Piper executable needs a POSIX shebang")
+class TestPiperDaemon(unittest.TestCase):
+    """Sentences are framed by Piper's stderr log line, one process for all of them."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.exe = os.path.join(self.tmpdir, "piper")
+        with open(self.exe, "w", encoding="utf-8") as f:
+            f.write(FAKE_PIPER.format(python=sys.executable))
+        os.chmod(self.exe, os.stat(self.exe).st_mode | stat.S_IXUSR)
+        self.model = os.path.join(self.tmpdir, "voice.onnx")
+        with open(self.model, "wb") as f:
+            f.write(b"model")
+        with open(self.model + ".json", "w", encoding="utf-8") as f:
+            json.dump({"audio": {"sample_rate": 22050}}, f)
+        self.engine = PiperTTSEngine(self.exe, self.model)
+
+    def tearDown(self):
+        self.engine.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_sentences_share_one_process(self):
+        self.assertTrue(self.engine.streaming_available)
+        self.assertEqual(self.engine.sample_rate, 22050)
+        first = self.engine.synthesize_pcm("Hello there.")
+        pid = self.engine._daemon._proc.pid
+        second = self.engine.synthesize_pcm("How are you\ntoday?")
+        self.assertEqual(first, _expected_pcm("Hello there."))
+        self.assertEqual(second, _expected_pcm("How are you today?"))
+        self.assertEqual(self.engine._daemon._proc.pid, pid)
+
+    def test_stream_yields_whole_samples(self):
+        chunks = list(self.engine.synthesize_stream("streamed sentence"))
+        self.assertTrue(chunks)
+        self.assertTrue(all(len(chunk) % 2 == 0 for chunk in chunks))
+        self.assertEqual(b"".join(chunks), _expected_pcm("streamed sentence"))
+
+    def test_abandoned_stream_frees_process(self):
+        stream = self.engine.synthesize_stream("interrupted " * 50)
+        next(stream)
+        stream.close()
+        self.assertEqual(self.engine.synthesize_pcm("next"), _expected_pcm("next"))
+
+    def test_crash_restarts_process(self):
+        self.assertEqual(self.engine.synthesize_pcm("die"), b"")
+        self.assertEqual(self.engine.synthesize_pcm("after"), _expected_pcm("after"))
+
+    def test_timeout_restarts_process(self):
+        self.assertEqual(b"".join(self.engine.synthesize_stream("hang", timeout=0.5)), b"")
+        self.assertEqual(self.engine.synthesize_pcm("recovered"), _expected_pcm("recovered"))
+
+    def test_missing_voice_config_disables_streaming(self):
+        os.unlink(self.model + ".json")
+        engine = PiperTTSEngine(self.exe, self.model)
+        self.assertFalse(engine.streaming_available)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+Unit tests for KV-cache-friendly prompting: prefix-stable prompt layout,
+cache_prompt / slot affinity in LlamaCppClient and cached-vs-evaluated
+token reporting. A local stand-in server plays llama-server.
+"""
+import json
+import os
+import threading
+import unittest
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.brain.llamacpp_client import LlamaCppClient
+from wyzer.brain.prompt_builder import NORMAL_SYSTEM_PROMPT, PromptBuilder
+from wyzer.core import orchestrator
+from wyzer.core.config import Config
+
+
+class _LlamaServerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send_json(self, obj):
+        body = json.dumps(obj).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/props":
+            self.server.props_requests += 1
+            self._send_json({"total_slots": self.server.total_slots})
+        else:
+            body = b'{"error": "not found"}'
+            self.send_response(404)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        self.server.payloads.append(payload)
+        self._send_json({
+            "content": "ok",
+            "id_slot": payload.get("id_slot", 0),
+            "tokens_evaluated": 1200,
+            "timings": {"prompt_n": 40, "prompt_ms": 55.5, "predicted_n": 3},
+        })
+
+
+class TestPromptLayout(unittest.TestCase):
+    """Per-request context never splits the static prefix."""
+
+    def _build(self, **context):
+        prompt, mode = PromptBuilder(user_text="open chrome", **context).build()
+        self.assertEqual(mode, "normal")
+        return prompt
+
+    def test_volatile_context_follows_static_prefix(self):
+        bare = self._build()
+        with_context = self._build(
+            session_context="User: hi\nWyzer: hello",
+            promoted_context="[PROMOTED] likes jazz",
+            visual_context="[SCREEN] Focused: Notepad",
+        )
+        shared = os.path.commonprefix([bare, with_context])
+        self.assertTrue(shared.startswith(NORMAL_SYSTEM_PROMPT))
+        self.assertIn("Examples:", shared)
+        self.assertTrue(with_context.rstrip().endswith("Your response (JSON only):"))
+        self.assertLess(with_context.index("likes jazz"), with_context.index("User: hi"))
+
+    def test_tool_result_prompt_keeps_static_prefix(self):
+        prompts = []
+        blocks = {"promoted": "", "redaction": "", "memories": "", "session": ""}
+
+        def _prompt(**context):
+            with mock.patch.object(orchestrator, "_gather_context_blocks", return_value=dict(blocks, **context)), \
+                    mock.patch.object(orchestrator, "_ollama_request", side_effect=lambda p, **kw: prompts.append((p, kw))):
+                orchestrator._call_llm_with_tool_result("volume up", "volume_up", {}, {"ok": True}, None)
+            return prompts[-1][0]
+
+        bare = _prompt()
+        with_context = _prompt(session="\n--- Recent ---\nUser: hi\n---\n", memories="\n[MEMORY] likes jazz\n")
+        shared = os.path.commonprefix([bare, with_context])
+        self.assertIn('JSON: {"reply": "your response"}', shared)
+        self.assertEqual({kw["cache_key"] for _, kw in prompts}, {"tool_result"})
+        self.assertLess(with_context.index("likes jazz"), with_context.index("User: hi"))
+
+
+class TestLlamaCppPromptCache(unittest.TestCase):
+    """Requests ask for prefix reuse and report cached vs evaluated tokens."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _LlamaServerHandler)
+        self.server.daemon_threads = True
+        self.server.payloads = []
+        self.server.total_slots = 2
+        self.server.props_requests = 0
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True).start()
+        self.client = LlamaCppClient(f"http://127.0.0.1:{self.server.server_address[1]}",
+                                     cache_prompt=True, slot_affinity=True)
+        self.client._use_openai_compat = False
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_cache_prompt_and_slot_affinity(self):
+        normal = NORMAL_SYSTEM_PROMPT + "\nUser: {}"
+        self.client.generate(normal.format("one"), cache_key="normal")
+        self.client.generate("You are Wyzer. Answer in one short sentence.\nUser: hi", cache_key="fastlane")
+        self.client.generate(normal.format("two"), cache_key="normal")
+        slots = [p["id_slot"] for p in self.server.payloads]
+        self.assertTrue(all(p["cache_prompt"] for p in self.server.payloads))
+        self.assertEqual(slots[0], slots[2])
+        self.assertNotEqual(slots[0], slots[1])
+
+    def test_per_turn_text_keeps_slot(self):
+        # Memories/session context change every turn; the template key doesn't
+        for turn in range(4):
+            self.client.generate(f"You are Wyzer.\n[MEMORY] turn {turn}\nUser: hi {turn}", cache_key="reply_only")
+        self.assertEqual(len({p["id_slot"] for p in self.server.payloads}), 1)
+        self.assertEqual(list(self.client._prefix_slots), ["reply_only"])
+
+    def test_unknown_key_leaves_slot_to_server(self):
+        self.client.generate("hello")
+        with mock.patch("wyzer.brain.llamacpp_client._MAX_SLOT_KEYS", 1):
+            self.client.generate("hello", cache_key="normal")
+            self.client.generate("hello", cache_key="fastlane")
+        self.assertNotIn("id_slot", self.server.payloads[0])
+        self.assertIn("id_slot", self.server.payloads[1])
+        self.assertNotIn("id_slot", self.server.payloads[2])
+        self.assertEqual(list(self.client._prefix_slots), ["normal"])
+
+    def test_orchestrator_reuses_client_slot_map(self):
+        url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        with mock.patch.object(Config, "LLM_MODE", "llamacpp"), \
+                mock.patch.object(Config, "NO_OLLAMA", False), \
+                mock.patch.object(Config, "LLAMACPP_BASE_URL", url, create=True), \
+                mock.patch.dict(orchestrator._llm_clients, clear=True):
+            first = orchestrator._get_llm_client()
+            first._use_openai_compat = False
+            first.generate(NORMAL_SYSTEM_PROMPT + "\nUser: one", cache_key="normal")
+            second = orchestrator._get_llm_client()
+            second.generate("You are Wyzer. Answer in one short sentence.\nUser: hi", cache_key="fastlane")
+
+        self.assertIs(first, second)
+        slots = [p["id_slot"] for p in self.server.payloads]
+        self.assertNotEqual(slots[0], slots[1])
+        self.assertEqual(self.server.props_requests, 1)
+
+    def test_single_slot_server_gets_no_slot_id(self):
+        self.server.total_slots = 1
+        self.client.generate("hello", cache_key="normal")
+        self.assertNotIn("id_slot", self.server.payloads[0])
+        self.assertTrue(self.server.payloads[0]["cache_prompt"])
+
+    def test_usage_is_reported(self):
+        self.client.generate("hello")
+        usage = self.client.last_usage
+        self.assertEqual(
+            (usage["prompt_tokens"], usage["cached_tokens"], usage["evaluated_tokens"], usage["prompt_ms"]),
+            (1200, 1160, 40, 55),
+        )
+
+    def test_parse_openai_usage(self):
+        usage = LlamaCppClient._parse_usage({
+            "usage": {"prompt_tokens": 900, "completion_tokens": 12,
+                      "prompt_tokens_details": {"cached_tokens": 850}},
+        })
+        self.assertEqual((usage["cached_tokens"], usage["evaluated_tokens"], usage["predicted_tokens"]), (850, 50, 12))
+        self.assertIsNone(LlamaCppClient._parse_usage({"content": "x"}))
+
+
+if __name__ == '__main__':
+    unittest.main()
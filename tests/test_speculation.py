@@ -0,0 +1,105 @@
+"""
+Unit tests for speculative routing on partial transcripts: work is keyed
+by the normalized text, reused only when the final transcript matches,
+and dropped on reset.
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.core import orchestrator
+from wyzer.core.speculation import Speculator
+
+_RESOLVED = {"type": "app", "path": "C:/Spotify/Spotify.exe", "confidence": 0.95, "candidates": []}
+
+
+class _FakeOpenTarget:
+    args_schema = {"type": "object", "properties": {"query": {"type": "string"}}}
+
+    def __init__(self):
+        self.calls = []
+
+    def run(self, **kwargs):
+        self.calls.append(kwargs)
+        return {"status": "opened", "resolved": kwargs.get("_resolved")}
+
+
+class _FakeRegistry:
+    def __init__(self, tool):
+        self.tool = tool
+
+    def get(self, name):
+        return self.tool if name == "open_target" else None
+
+
+class TestSpeculator(unittest.TestCase):
+    """Partial transcripts prepare the likely path."""
+
+    def setUp(self):
+        self.spec = Speculator()
+        self.index = object()
+        patches = [
+            mock.patch("wyzer.local_library.resolve_target", return_value=_RESOLVED),
+            mock.patch("wyzer.local_library.library_index.get_library_index", side_effect=lambda: self.index),
+            mock.patch.object(orchestrator, "get_speculator", return_value=self.spec),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_open_target_resolved_from_partial(self):
+        self.spec.submit("Open spotify")
+        self.assertTrue(self.spec.settle("open Spotify."))
+        self.assertEqual(self.spec.lookup("open_target", "Spotify"), _RESOLVED)
+
+        tool = _FakeOpenTarget()
+        with mock.patch.object(orchestrator, "_update_world_state_from_result") as update_world:
+            orchestrator._execute_tool(_FakeRegistry(tool), "open_target", {"query": "spotify"})
+        self.assertEqual(tool.calls[0]["_resolved"], _RESOLVED)
+        # World-state replay keeps the plain args, not the speculative resolution
+        self.assertNotIn("_resolved", update_world.call_args.args[1])
+
+    def test_library_change_invalidates_resolution(self):
+        self.spec.submit("open spotify")
+        self.spec.settle("open spotify")
+        self.index = object()
+        self.assertIsNone(self.spec.lookup("open_target", "spotify"))
+
+    def test_different_final_transcript_is_a_miss(self):
+        self.spec.submit("open spot")
+        self.assertFalse(self.spec.settle("open spotify"))
+        self.assertEqual((self.spec.hits, self.spec.misses), (0, 1))
+
+    def test_reset_drops_results(self):
+        self.spec.submit("open spotify")
+        self.spec.settle("open spotify")
+        self.spec.reset()
+        self.assertIsNone(self.spec.lookup("open_target", "spotify"))
+
+    def test_llm_route_gathers_context_and_pings(self):
+        client = mock.Mock()
+        context = {"session_context": "", "promoted_context": "", "redaction_context": "",
+                   "memories_context": "[MEMORY] likes space", "visual_context": ""}
+        with mock.patch.object(orchestrator, "should_use_streaming_tts", return_value=False), \
+                mock.patch.object(orchestrator, "_gather_llm_prompt_context", return_value=context) as gather, \
+                mock.patch.object(orchestrator, "_get_llm_client", return_value=client), \
+                mock.patch.object(orchestrator, "_ollama_request", return_value={"reply": "ok"}) as request:
+            self.spec.submit("tell me about black holes")
+            self.assertTrue(self.spec.settle("Tell me about black holes?"))
+            orchestrator._call_llm("Tell me about black holes?", registry=None)
+
+        gather.assert_called_once_with("tell me about black holes")
+        prompt = request.call_args.args[0]
+        # Speculative context, final transcript
+        self.assertIn("likes space", prompt)
+        self.assertIn("Tell me about black holes?", prompt)
+        self.assertNotIn("tell me about black holes", prompt)
+        client.ping.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Unit tests for incremental (streaming) transcription: stable-prefix
+commits, tail-only final decode and fallback to a full decode.
+A fake engine "recognizes" words encoded as constant-valued audio runs.
+"""
+import os
+import sys
+import unittest
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import numpy as np
+    from wyzer.stt.streaming_stt import StreamingTranscriber
+except ImportError:  # numpy not installed
+    np = None
+
+
+RATE = 1000
+WORD_SAMPLES = 400
+WORDS = ["", " open", " the", " browser", " please"]
+
+
+def _speech(*indices):
+    return np.concatenate([np.full(WORD_SAMPLES, i / 10.0, dtype=np.float32) for i in indices])
+
+
+class _FakeEngine:
+    """Each full run of value i/10 is WORDS[i]; a cut-off run is a guess."""
+
+    def __init__(self):
+        self.decoded = []  # (samples, beam_size) per call
+
+    def transcribe_words(self, audio, language="en", beam_size=5, initial_prompt=None):
+        self.decoded.append((len(audio), beam_size))
+        words = []
+        start = 0
+        while start < len(audio):
+            value = audio[start]
+            end = start
+            while end < len(audio) and audio[end] == value:
+                end += 1
+            index = int(round(value * 10))
+            text = WORDS[index] if end - start >= WORD_SAMPLES else " uh"
+            words.append((start / RATE, end / RATE, text))
+            start = end
+        return words
+
+    def filter_transcript(self, text):
+        return text.strip()
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestStreamingTranscriber(unittest.TestCase):
+    """Only the uncommitted tail is decoded after end of speech."""
+
+    def setUp(self):
+        self.engine = _FakeEngine()
+        self.partials = []
+        self.stt = StreamingTranscriber(
+            self.engine, sample_rate=RATE, step_sec=0.2, on_partial=self.partials.append
+        )
+        self.audio = _speech(1, 2, 3, 4)
+
+    def _feed_and_step(self, chunk=200):
+        for offset in range(0, len(self.audio), chunk):
+            self.stt.feed(self.audio[offset:offset + chunk], offset=offset)
+            self.stt.step()
+
+    def test_commits_stable_prefix_and_decodes_tail(self):
+        self._feed_and_step()
+        self.assertEqual(self.stt.committed_text, "open the browser")
+        self.assertEqual(self.partials[-1], "open the browser please")
+
+        self.assertEqual(self.stt.finish(self.audio), "open the browser please")
+        tail_samples, beam_size = self.engine.decoded[-1]
+        self.assertEqual((tail_samples, beam_size), (WORD_SAMPLES, 5))
+        self.assertTrue(all(beam == 1 for _, beam in self.engine.decoded[:-1]))
+
+    def test_changed_prefix_decodes_everything(self):
+        self._feed_and_step()
+        other = _speech(1, 4, 3, 4)
+        self.assertEqual(self.stt.finish(other), "open please browser please")
+        self.assertEqual(self.engine.decoded[-1][0], len(other))
+
+    def test_gap_disables_partials(self):
+        self.stt.feed(self.audio[:200], offset=0)
+        self.stt.feed(self.audio[400:600], offset=400)
+        self.assertFalse(self.stt.step())
+        self.assertEqual(self.stt.finish(self.audio), "open the browser please")
+        self.assertEqual(self.engine.decoded, [(len(self.audio), 5)])
+
+    def test_background_thread(self):
+        self.stt.start()
+        for offset in range(0, len(self.audio), 200):
+            self.stt.feed(self.audio[offset:offset + 200], offset=offset)
+        self.assertEqual(self.stt.finish(self.audio), "open the browser please")
+        self.assertLessEqual(self.engine.decoded[-1][0], len(self.audio))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Unit tests for the timer scheduler: alarms fire at the deadline from the
+heap, named timers are independent, and the JSON journal is written behind
+changes and restored on startup.
+"""
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.tools import timer_tool
+from wyzer.tools.timer_tool import TimerScheduler, TimerTool
+
+
+class _Alarms:
+    def __init__(self):
+        self.fired = []
+        self.event = threading.Event()
+
+    def __call__(self, name):
+        self.fired.append((name, time.time()))
+        self.event.set()
+
+
+class TestTimerScheduler(unittest.TestCase):
+    """Deadlines fire once, in order, without polling."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.journal = Path(tmp.name) / "timer_state.json"
+
+    def _scheduler(self):
+        scheduler = TimerScheduler(journal_path=self.journal)
+        self.addCleanup(scheduler.shutdown)
+        return scheduler
+
+    def _wait_for_journal(self, predicate):
+        deadline = time.time() + 2.0
+        while time.time() < deadline:
+            try:
+                state = json.loads(self.journal.read_text())
+                if predicate(state["timers"]):
+                    return state["timers"]
+            except (OSError, ValueError, KeyError):
+                pass
+            time.sleep(0.01)
+        self.fail("journal not written")
+
+    def test_fires_at_deadline(self):
+        scheduler = self._scheduler()
+        alarms = _Alarms()
+        scheduler.set_on_fire(alarms)
+        timer = scheduler.start("tea", 0)
+        self.assertTrue(alarms.event.wait(2.0))
+        (name, fired_at), = alarms.fired
+        self.assertEqual(name, "tea")
+        self.assertLess(fired_at - timer["end_time"], 0.1)
+        self.assertEqual(scheduler.status(), [])
+
+    def test_named_timers_fire_in_order(self):
+        scheduler = self._scheduler()
+        alarms = _Alarms()
+        scheduler.set_on_fire(alarms)
+        scheduler.start("pasta", 1)
+        scheduler.start("eggs", 1)
+        scheduler.start("bread", 2)
+        self.assertEqual([t["name"] for t in scheduler.status()], ["pasta", "eggs", "bread"])
+        self.assertEqual(scheduler.cancel("eggs"), ["eggs"])
+
+        deadline = time.time() + 3.0
+        while len(alarms.fired) < 2 and time.time() < deadline:
+            time.sleep(0.02)
+        self.assertEqual([name for name, _ in alarms.fired], ["pasta", "bread"])
+
+    def test_restart_replaces_deadline(self):
+        scheduler = self._scheduler()
+        alarms = _Alarms()
+        scheduler.set_on_fire(alarms)
+        scheduler.start("timer", 0)
+        scheduler.start("timer", 60)
+        time.sleep(0.2)
+        self.assertEqual(alarms.fired, [])
+        self.assertEqual(scheduler.cancel(), ["timer"])
+
+    def test_journal_written_behind_and_restored(self):
+        scheduler = self._scheduler()
+        scheduler.start("pasta", 300)
+        timers = self._wait_for_journal(lambda t: "pasta" in t)
+        self.assertEqual(timers["pasta"]["duration"], 300)
+        scheduler.shutdown()
+
+        restored = self._scheduler()
+        self.assertEqual([t["name"] for t in restored.status()], ["pasta"])
+        restored.cancel("pasta")
+        self._wait_for_journal(lambda t: t == {})
+
+    def test_expired_while_down_fires_once_alarm_is_set(self):
+        self.journal.write_text(json.dumps({
+            "running": True, "start_time": 0.0, "duration": 5, "end_time": time.time() - 1,
+        }))
+        scheduler = self._scheduler()
+        time.sleep(0.1)
+        self.assertEqual(len(scheduler.status()), 1)  # held until someone can announce it
+        alarms = _Alarms()
+        scheduler.set_on_fire(alarms)
+        self.assertTrue(alarms.event.wait(2.0))
+        self.assertEqual(alarms.fired[0][0], timer_tool.DEFAULT_TIMER_NAME)
+
+    def test_shutdown_flushes_journal(self):
+        scheduler = TimerScheduler(journal_path=self.journal)
+        with scheduler._cond:
+            # Start while the waiter thread can't run, then stop it
+            scheduler._running = False
+            scheduler._push("pasta", {"start_time": 0.0, "duration": 300, "end_time": time.time() + 300})
+            scheduler._journal_dirty = True
+        scheduler.shutdown()
+        self.assertIn("pasta", json.loads(self.journal.read_text())["timers"])
+
+    def test_journal_replaced_atomically(self):
+        self.journal.write_text(json.dumps({"timers": {"old": {"start_time": 0.0, "duration": 1, "end_time": 1.0}}}))
+        with mock.patch.object(timer_tool.json, "dump", side_effect=OSError("disk full")):
+            timer_tool._save_journal(self.journal, {})
+        self.assertIn("old", json.loads(self.journal.read_text())["timers"])
+        self.assertEqual(list(self.journal.parent.glob("*.tmp")), [])
+
+    def test_corrupt_journal_warns(self):
+        self.journal.write_text("")
+        with mock.patch.object(timer_tool, "_log_warning") as warn:
+            self.assertEqual(timer_tool._load_journal(self.journal), {})
+        warn.assert_called_once()
+
+
+class TestTimerToolNamed(unittest.TestCase):
+    """The tool drives the process scheduler; names keep timers apart."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        scheduler = TimerScheduler(journal_path=Path(tmp.name) / "timer_state.json")
+        self.addCleanup(scheduler.shutdown)
+        patcher = mock.patch.object(timer_tool, "_scheduler", scheduler)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tool = TimerTool()
+
+    def test_named_start_status_cancel(self):
+        self.assertTrue(TimerTool.run_in_process)
+        self.assertEqual(self.tool.run(action="start", duration_seconds=60, name="Pasta")["name"], "pasta")
+        self.tool.run(action="start", duration_seconds=30)
+
+        status = self.tool.run(action="status")
+        self.assertEqual(status["name"], "timer")
+        self.assertEqual([t["name"] for t in status["timers"]], ["timer", "pasta"])
+        self.assertEqual(self.tool.run(action="status", name="pasta")["duration"], 60)
+
+        self.assertEqual(self.tool.run(action="cancel", name="pasta")["cancelled"], ["pasta"])
+        self.assertEqual(self.tool.run(action="cancel", name="pasta")["error"]["type"], "no_timer")
+        self.assertEqual(self.tool.run(action="cancel")["cancelled"], ["timer"])
+        self.assertEqual(self.tool.run(action="status"), {"status": "idle"})
+
+
+if __name__ == '__main__':
+    unittest.main()
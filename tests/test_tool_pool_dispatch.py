@@ -0,0 +1,156 @@
+"""
+Unit tests for ToolWorkerPool result routing.
+Workers are simulated with a thread that answers jobs out of order, so the
+collector/dispatch path is exercised without spawning processes.
+"""
+import threading
+import time
+import unittest
+import sys
+import os
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.core.tool_worker_pool import ToolWorkerPool, ToolResult
+
+
+def _result_for(job, value=None):
+    return ToolResult(
+        job_id=job.job_id,
+        request_id=job.request_id,
+        tool_name=job.tool_name,
+        result={"value": value if value is not None else job.tool_args.get("n")},
+        timestamp=time.time(),
+        execution_time_ms=0.1,
+    )
+
+
+class TestToolPoolDispatch(unittest.TestCase):
+    """Results are routed to the caller waiting on that job only."""
+
+    def setUp(self):
+        self.pool = ToolWorkerPool(num_workers=1)
+        # Pretend workers are up; only the collector thread runs.
+        self.pool._running = True
+        self.pool._start_result_collector()
+
+    def tearDown(self):
+        self.pool.shutdown(timeout=0.5)
+
+    def _drain_jobs(self, count):
+        jobs = []
+        while len(jobs) < count:
+            jobs.append(self.pool.task_q.get(timeout=2.0))
+        return jobs
+
+    def test_concurrent_waiters_get_their_own_result(self):
+        n = 8
+        for i in range(n):
+            self.assertTrue(self.pool.submit_job(f"job-{i}", f"req-{i}", "echo", {"n": i}))
+
+        results = {}
+
+        def waiter(i):
+            results[i] = self.pool.wait_for_result(f"job-{i}", timeout=5.0)
+
+        threads = [threading.Thread(target=waiter, args=(i,)) for i in range(n)]
+        for t in threads:
+            t.start()
+
+        # Answer in reverse order to force cross-delivery under the old design.
+        for job in reversed(self._drain_jobs(n)):
+            self.pool.result_q.put(_result_for(job))
+
+        for t in threads:
+            t.join(timeout=5.0)
+
+        for i in range(n):
+            self.assertIsNotNone(results[i])
+            self.assertEqual(results[i].job_id, f"job-{i}")
+            self.assertEqual(results[i].result, {"value": i})
+        self.assertEqual(self.pool.result_q.qsize(), 0)
+
+    def test_result_before_wait_is_kept(self):
+        self.pool.submit_job("early", "req", "echo", {"n": 7})
+        job = self._drain_jobs(1)[0]
+        self.pool.result_q.put(_result_for(job))
+        time.sleep(0.1)
+
+        result = self.pool.wait_for_result("early", timeout=1.0)
+        self.assertIsNotNone(result)
+        self.assertEqual(result.result, {"value": 7})
+
+    def test_wakeup_is_prompt(self):
+        self.pool.submit_job("fast", "req", "echo", {"n": 1})
+        job = self._drain_jobs(1)[0]
+        threading.Timer(0.05, lambda: self.pool.result_q.put(_result_for(job))).start()
+
+        start = time.perf_counter()
+        result = self.pool.wait_for_result("fast", timeout=5.0)
+        elapsed = time.perf_counter() - start
+        self.assertIsNotNone(result)
+        self.assertLess(elapsed, 0.4)
+
+    def test_timeout_then_late_result_is_dropped(self):
+        self.pool.submit_job("slow", "req", "echo", {"n": 3})
+        job = self._drain_jobs(1)[0]
+        self.assertIsNone(self.pool.wait_for_result("slow", timeout=0.05))
+
+        self.pool.result_q.put(_result_for(job))
+        time.sleep(0.1)
+        self.assertIsNone(self.pool.poll_results())
+        self.assertNotIn("slow", self.pool._result_slots)
+
+    def test_poll_results_returns_unclaimed(self):
+        self.pool.submit_job("a", "req", "echo", {"n": 1})
+        self.pool.submit_job("b", "req", "echo", {"n": 2})
+        for job in self._drain_jobs(2):
+            self.pool.result_q.put(_result_for(job))
+        time.sleep(0.1)
+
+        first = self.pool.poll_results()
+        second = self.pool.poll_results()
+        self.assertEqual([first.job_id, second.job_id], ["a", "b"])
+        self.assertIsNone(self.pool.poll_results())
+
+    def test_unclaimed_slots_expire(self):
+        pool = ToolWorkerPool(num_workers=1, result_ttl_sec=0.2)
+        pool._running = True
+        pool._start_result_collector()
+        self.addCleanup(pool.shutdown, 0.5)
+
+        pool.submit_job("abandoned", "req", "echo", {"n": 1})  # nobody ever waits
+        pool.submit_job("unclaimed", "req", "echo", {"n": 2})  # completes, never collected
+        for job in [pool.task_q.get(timeout=2.0) for _ in range(2)]:
+            if job.job_id == "unclaimed":
+                pool.result_q.put(_result_for(job))
+        pool.submit_job("waited", "req", "echo", {"n": 3})
+        job = pool.task_q.get(timeout=2.0)
+        threading.Timer(0.6, lambda: pool.result_q.put(_result_for(job))).start()
+
+        # A slot with a waiter survives past the TTL
+        result = pool.wait_for_result("waited", timeout=2.0)
+        self.assertEqual(result.result, {"value": 3})
+        self.assertEqual(pool._result_slots, {})
+        self.assertEqual(pool._completed_order, [])
+        self.assertEqual(pool._pending_jobs, {})
+        self.assertIsNone(pool.poll_results())
+
+    def test_unknown_job_returns_none(self):
+        self.assertIsNone(self.pool.wait_for_result("never-submitted", timeout=0.01))
+
+    def test_shutdown_releases_waiters(self):
+        self.pool.submit_job("stuck", "req", "echo", {})
+        out = []
+        t = threading.Thread(target=lambda: out.append(self.pool.wait_for_result("stuck", timeout=10.0)))
+        t.start()
+        time.sleep(0.05)
+        self.pool.shutdown(timeout=0.5)
+        t.join(timeout=2.0)
+        self.assertFalse(t.is_alive())
+        self.assertEqual(out, [None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Unit tests for the synthesized-speech cache (RAM + disk LRU by bytes)
+and its use by TTSRouter.
+"""
+import json
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import unittest
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import numpy as np
+    from wyzer.core.config import Config
+    from wyzer.tts.tts_cache import TTSCache
+    from wyzer.tts.tts_router import TTSRouter
+    from tests.test_piper_daemon import FAKE_PIPER
+except (ImportError, OSError):  # numpy / sounddevice (or PortAudio) not installed
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy/sounddevice not installed")
+class TestTTSCache(unittest.TestCase):
+    """Keys, byte budgets and persistence."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_key_normalizes_whitespace_and_separates_voices(self):
+        cache = TTSCache(None, max_chars=20)
+        self.assertEqual(cache.key(" Done. ", "v1"), cache.key("Done.", "v1"))
+        self.assertNotEqual(cache.key("Done.", "v1"), cache.key("Done.", "v2"))
+        self.assertIsNone(cache.key("x" * 21, "v1"))
+        self.assertIsNone(cache.key("   ", "v1"))
+
+    def test_ram_lru_is_bounded_by_bytes(self):
+        cache = TTSCache(None, ram_max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        self.assertEqual(cache.get("a"), b"1234")  # a is now most recent
+        cache.put("c", b"1234")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), b"1234")
+        self.assertEqual(cache.stats()["ram_bytes"], 8)
+
+    def test_disk_survives_restart_and_evicts_oldest(self):
+        cache = TTSCache(self.tmpdir, ram_max_bytes=100, disk_max_bytes=10)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+
+        reopened = TTSCache(self.tmpdir, ram_max_bytes=100, disk_max_bytes=10)
+        self.assertEqual(reopened.get("a"), b"aaaa")  # read from disk, bumps a
+        reopened.put("c", b"cccc")
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), ["a.pcm", "c.pcm"])
+        self.assertEqual(reopened.stats()["disk_bytes"], 8)
+
+    def test_missing_file_is_a_miss(self):
+        cache = TTSCache(self.tmpdir, ram_max_bytes=0)
+        cache.put("a", b"aaaa")
+        os.unlink(os.path.join(self.tmpdir, "a.pcm"))
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["disk_items"], 0)
+
+
+@unittest.skipIf(np is None, "numpy/sounddevice not installed")
+@unittest.skipIf(os.name == "nt", "fake Piper executable needs a POSIX shebang")
+class TestRouterCache(unittest.TestCase):
+    """Repeated texts skip synthesis; incomplete audio is never stored."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.exe = os.path.join(self.tmpdir, "piper")
+        with open(self.exe, "w", encoding="utf-8") as f:
+            f.write(FAKE_PIPER.format(python=sys.executable))
+        os.chmod(self.exe, os.stat(self.exe).st_mode | stat.S_IXUSR)
+        model = os.path.join(self.tmpdir, "voice.onnx")
+        with open(model, "wb") as f:
+            f.write(b"model")
+        with open(model + ".json", "w", encoding="utf-8") as f:
+            json.dump({"audio": {"sample_rate": 22050}}, f)
+
+        self._orig_dir = Config.TTS_CACHE_DIR
+        Config.TTS_CACHE_DIR = os.path.join(self.tmpdir, "cache")
+        self.router = TTSRouter(piper_exe_path=self.exe, piper_model_path=model)
+        self.calls = []
+        synthesize_stream = self.router.engine.synthesize_stream
+
+        def counting_stream(text, *args, **kwargs):
+            self.calls.append(text)
+            return synthesize_stream(text, *args, **kwargs)
+
+        self.router.engine.synthesize_stream = counting_stream
+
+    def tearDown(self):
+        Config.TTS_CACHE_DIR = self._orig_dir
+        self.router.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_repeat_skips_synthesis(self):
+        first = self.router.synthesize_pcm("Done.")
+        second = self.router.synthesize_pcm(" Done.  ")
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, ["Done."])
+
+    def test_prewarm(self):
+        self.router.prewarm(["OK.", "Opening."]).join(timeout=10)
+        self.assertEqual(self.router.cache.stats()["ram_items"], 2)
+        self.router.synthesize_pcm("OK.")
+        self.assertEqual(self.calls, ["OK.", "Opening."])
+
+    def test_failed_synthesis_is_not_cached(self):
+        self.router.synthesize_pcm("die")
+        self.assertEqual(self.router.cache.stats()["ram_items"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Unit tests for VAD backlog scoring: primed decisions match frame-by-frame
+scoring, Silero chunks of a backlog run in one pass, and the energy
+fallback adapts to the noise floor.
+"""
+import os
+import sys
+import unittest
+from unittest import mock
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import numpy as np
+    from wyzer.audio.vad import EnergyVad, VadDetector
+except ImportError:  # numpy not installed
+    np = None
+
+
+def _frames(rms_values, samples=320, seed=0):
+    """Noise-like frames; rms 0.3+ frames are a low-frequency tone (voiced)."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(samples) / 16000.0
+    frames = []
+    for rms in rms_values:
+        if rms >= 0.3:
+            frame = np.sin(2 * np.pi * 200 * t) * rms * np.sqrt(2)
+        else:
+            frame = rng.standard_normal(samples) * rms
+        frames.append(frame.astype(np.float32))
+    return frames
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestEnergyVad(unittest.TestCase):
+    """Speech is judged against the adaptive noise floor."""
+
+    def test_speech_above_noise_floor(self):
+        vad = EnergyVad(max_rms=0.5)
+        decisions = vad.score(_frames([0.01] * 20 + [0.3] * 3 + [0.01] * 3))
+        self.assertEqual(decisions, [False] * 20 + [True] * 3 + [False] * 3)
+
+    def test_noise_floor_follows_louder_room(self):
+        vad = EnergyVad(max_rms=0.5)
+        vad.score(_frames([0.01] * 5))
+        # Room gets permanently louder: it sticks out at first, then the floor catches up
+        decisions = vad.score(_frames([0.1] * 300, seed=1))
+        self.assertTrue(decisions[0])
+        self.assertFalse(any(decisions[-50:]))
+
+    def test_legacy_threshold_always_speech(self):
+        vad = EnergyVad(max_rms=0.05)
+        vad.noise_floor = 0.1
+        self.assertEqual(vad.score(_frames([0.3])), [True])
+
+    def test_loud_fricative_over_legacy_threshold(self):
+        # Noise-like (high ZCR) frame between max_rms and 2 * max_rms, e.g. an "s" onset
+        vad = EnergyVad(max_rms=0.05)
+        vad.noise_floor = 0.02
+        self.assertEqual(vad.score(_frames([0.08])), [True])
+
+    def test_batch_matches_frame_by_frame(self):
+        frames = _frames([0.01] * 10 + [0.3, 0.2, 0.01, 0.3] * 3)
+        batched = EnergyVad(max_rms=0.5, max_batch=8).score(frames)
+        single = EnergyVad(max_rms=0.5, max_batch=1)
+        self.assertEqual(batched, [single.score([f])[0] for f in frames])
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestVadBacklog(unittest.TestCase):
+    """A primed backlog is scored once and consumed in order."""
+
+    def setUp(self):
+        self.vad = VadDetector()
+        self.vad.use_silero = False
+
+    def test_primed_decisions_are_reused(self):
+        frames = _frames([0.01] * 4 + [0.3] * 2)
+        self.vad.prime(frames)
+        with mock.patch.object(self.vad, "score_frames") as score:
+            results = [self.vad.is_speech(f) for f in frames]
+        score.assert_not_called()
+        self.assertEqual(results, [False] * 4 + [True] * 2)
+
+    def test_skipped_and_unknown_frames(self):
+        frames = _frames([0.01] * 4)
+        self.vad.prime(frames)
+        self.assertFalse(self.vad.is_speech(frames[2]))
+        with mock.patch.object(self.vad, "score_frames", return_value=[True]) as score:
+            self.assertTrue(self.vad.is_speech(frames[1]))
+        score.assert_called_once()
+
+    def test_silero_backlog_runs_in_one_pass(self):
+        self.vad.use_silero = True
+        self.vad.model = object()
+        frames = _frames([0.3] * 8)
+        with mock.patch.object(self.vad, "_run_silero", side_effect=lambda n: [True] * n) as run:
+            self.vad.prime(frames)
+            results = [self.vad.is_speech(f) for f in frames]
+        run.assert_called_once_with(5)  # 8 * 320 samples = 5 complete chunks
+        self.assertEqual(self.vad._silero_fill, 8 * 320 - 5 * 512)
+        self.assertTrue(all(results[1:]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Unit tests for Whisper decoding presets, warm-up, RTF metrics and batched
+decoding of queued utterances. A fake model stands in for faster-whisper.
+"""
+import os
+import queue
+import sys
+import unittest
+from collections import deque
+from types import SimpleNamespace
+from unittest import mock
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    import numpy as np
+    from wyzer.stt import whisper_engine
+except ImportError:  # numpy not installed
+    np = None
+
+try:
+    from wyzer.core.brain_worker import _take_queued_audio
+except (ImportError, OSError):  # numpy / audio dependencies (or PortAudio) not installed
+    _take_queued_audio = None
+
+RATE = 16000
+
+
+class _FakeWhisperModel:
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, **options):
+        self.calls.append((len(audio), options))
+        return iter([SimpleNamespace(text=" open the browser")]), None
+
+
+class _FakeBatchedPipeline:
+    """faster-whisper 1.1: clip bounds are sample indices, one chunk per clip."""
+    instances = []
+    merge_sec = 0
+
+    def __init__(self, model):
+        self.calls = []
+        self.clip_timestamps = None
+        type(self).instances.append(self)
+
+    def _to_samples(self, clip):
+        return clip
+
+    def transcribe(self, audio, clip_timestamps, batch_size, **options):
+        self.calls.append((len(audio), batch_size, options))
+        self.clip_timestamps = clip_timestamps
+        # Each chunk decodes to one segment timed in seconds
+        chunks, current, duration = [], [], 0
+        for clip in clip_timestamps:
+            assert isinstance(clip["start"], int) and isinstance(clip["end"], int), clip
+            clip = self._to_samples(clip)
+            if current and duration + clip["end"] - clip["start"] > self.merge_sec * RATE:
+                chunks.append(current)
+                current, duration = [], 0
+            current.append(clip)
+            duration += clip["end"] - clip["start"]
+        chunks.append(current)
+
+        texts = iter([" turn it up", " yes", " set a timer"])
+        return iter([
+            SimpleNamespace(
+                start=chunk[0]["start"] / RATE,
+                text="".join(next(texts) for clip in chunk if audio[clip["start"]:clip["end"]].any()),
+            )
+            for chunk in chunks
+        ]), None
+
+
+class _FakeBatchedPipeline12(_FakeBatchedPipeline):
+    """faster-whisper 1.2: clip bounds are seconds, adjacent clips merged into chunks of up to 30s."""
+    instances = []
+    merge_sec = 30
+
+    def _to_samples(self, clip):
+        return {k: v * RATE for k, v in clip.items()}
+
+
+def _seconds(sec):
+    return np.full(int(sec * RATE), 0.1, dtype=np.float32)
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class TestWhisperPresets(unittest.TestCase):
+    """Short commands decode greedily; every decode records its RTF."""
+
+    def setUp(self):
+        with mock.patch.object(whisper_engine, "FASTER_WHISPER_AVAILABLE", True), \
+                mock.patch.object(whisper_engine.WhisperEngine, "_load_model"):
+            self.engine = whisper_engine.WhisperEngine()
+        self.engine.model = _FakeWhisperModel()
+
+    def test_preset_by_length(self):
+        self.assertEqual(self.engine.transcribe(_seconds(1.5)), "open the browser")
+        self.engine.transcribe(_seconds(8.0))
+        beams = [options["beam_size"] for _, options in self.engine.model.calls]
+        self.assertEqual(beams, [1, whisper_engine.Config.STT_BEAM_SIZE])
+
+        stats = self.engine.get_stats()
+        self.assertEqual(stats["calls"], 2)
+        self.assertAlmostEqual(stats["audio_sec"], 9.5)
+        self.assertIsNotNone(stats["last_rtf"])
+
+    def test_warm_up_decodes_each_preset(self):
+        self.engine.warm_up()
+        self.assertEqual(len(self.engine.model.calls), len(whisper_engine.DECODE_PRESETS))
+        self.assertEqual(self.engine.get_stats()["calls"], 0)
+
+    def test_batch_decode_maps_segments_to_clips(self):
+        _FakeBatchedPipeline.instances = []
+        with mock.patch.object(whisper_engine, "BatchedInferencePipeline", _FakeBatchedPipeline):
+            texts = self.engine.transcribe_batch([_seconds(1.0), np.zeros(0, dtype=np.float32), _seconds(2.0)])
+        self.assertEqual(texts, ["turn it up", "", "yes"])
+        (pipeline,) = _FakeBatchedPipeline.instances
+        self.assertEqual(pipeline.calls, [(2 * 30 * RATE, 2, {"language": "en", "beam_size": 1, "best_of": 1})])
+        self.assertEqual(pipeline.clip_timestamps[1], {"start": 30 * RATE, "end": 60 * RATE})
+        self.assertEqual(self.engine.model.calls, [])
+
+    def test_batch_decode_with_second_timestamps(self):
+        _FakeBatchedPipeline12.instances = []
+        with mock.patch.object(whisper_engine, "BatchedInferencePipeline", _FakeBatchedPipeline12), \
+                mock.patch.object(whisper_engine, "CLIP_TIMESTAMPS_IN_SECONDS", True):
+            texts = self.engine.transcribe_batch([_seconds(1.0), _seconds(2.0), _seconds(0.5)])
+        self.assertEqual(texts, ["turn it up", "yes", "set a timer"])
+        (pipeline,) = _FakeBatchedPipeline12.instances
+        self.assertEqual(pipeline.clip_timestamps[1], {"start": 30, "end": 60})
+
+    def test_clip_timestamp_unit_by_version(self):
+        self.assertFalse(whisper_engine._clip_timestamps_in_seconds("1.1.1"))
+        self.assertTrue(whisper_engine._clip_timestamps_in_seconds("1.2.0"))
+        self.assertFalse(whisper_engine._clip_timestamps_in_seconds(""))
+
+    def test_batch_with_long_clip_decodes_one_by_one(self):
+        with mock.patch.object(whisper_engine, "BatchedInferencePipeline", _FakeBatchedPipeline):
+            texts = self.engine.transcribe_batch([_seconds(1.0), _seconds(31.0)])
+        self.assertEqual(texts, ["open the browser"] * 2)
+        self.assertEqual(len(self.engine.model.calls), 2)
+
+    def test_batch_without_pipeline_decodes_one_by_one(self):
+        with mock.patch.object(whisper_engine, "BatchedInferencePipeline", None):
+            texts = self.engine.transcribe_batch([_seconds(1.0), _seconds(1.0)])
+        self.assertEqual(texts, ["open the browser"] * 2)
+        self.assertEqual(len(self.engine.model.calls), 2)
+
+
+@unittest.skipIf(_take_queued_audio is None, "brain worker dependencies not installed")
+class TestTakeQueuedAudio(unittest.TestCase):
+    """Only plain AUDIO requests directly behind the current one are batched."""
+
+    def test_stops_at_first_other_message(self):
+        q = queue.Queue()
+        messages = [
+            {"type": "AUDIO", "id": "a", "meta": {}},
+            {"type": "AUDIO", "id": "b", "meta": {"is_followup": True}},
+            {"type": "INTERRUPT"},
+            {"type": "AUDIO", "id": "c", "meta": {}},
+        ]
+        for msg in messages:
+            q.put(msg)
+        pending = deque()
+        batch = _take_queued_audio(q, pending, limit=3)
+        self.assertEqual([m["id"] for m in batch], ["a", "b"])
+        self.assertEqual(list(pending), messages[:3])
+        self.assertEqual(q.get_nowait(), messages[3])
+
+    def test_streamed_audio_not_batched(self):
+        q = queue.Queue()
+        q.put({"type": "AUDIO", "id": "a", "meta": {"stt_stream_id": "s1"}})
+        pending = deque()
+        self.assertEqual(_take_queued_audio(q, pending, limit=3), [])
+        self.assertEqual(len(pending), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
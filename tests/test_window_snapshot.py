@@ -0,0 +1,129 @@
+"""
+Unit tests for the window snapshot shared with tool workers: target matching,
+the shared-memory publish/read round trip, and staleness of the pluggable
+snapshot source (synthetic window lists, no OS calls).
+"""
+import multiprocessing as mp
+import os
+import sys
+import time
+import unittest
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.world import window_snapshot
+from wyzer.world.window_snapshot import (
+    SharedWindowSnapshotReader,
+    WindowSnapshot,
+    WindowSnapshotPublisher,
+    fresh_snapshot,
+    match_window,
+)
+
+WINDOWS = [
+    {"hwnd": 101, "title": "Daft Punk - Around the World", "process": "spotify.exe", "pid": 10,
+     "rect": [0, 0, 800, 600], "monitor": 1},
+    {"hwnd": 202, "title": "notes.txt - Notepad", "process": "notepad.exe", "pid": 20,
+     "rect": [1920, 0, 2720, 600], "monitor": 2},
+    {"hwnd": 303, "title": "Visual Studio Code", "process": "Code.exe", "pid": 30,
+     "rect": [0, 0, 1920, 1080], "monitor": 1, "is_visible": True},
+]
+
+
+def _child_read(name, out_q):
+    reader = SharedWindowSnapshotReader.attach(name)
+    snapshot = reader.read()
+    out_q.put((snapshot.version, snapshot.focus_hwnd, [w["hwnd"] for w in snapshot.windows]))
+    reader.close()
+
+
+class _StaticSource:
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        self.reads = 0
+
+    def read(self):
+        self.reads += 1
+        return self.snapshot
+
+
+class TestMatchWindow(unittest.TestCase):
+    """Title beats process; a bare title also matches as a process hint."""
+
+    def test_title_process_and_hint(self):
+        self.assertEqual(match_window(WINDOWS, title="notepad"), 202)
+        self.assertEqual(match_window(WINDOWS, process="code"), 303)
+        # Dynamic title (song name) without the app name: process hint
+        self.assertEqual(match_window(WINDOWS, title="Spotify"), 101)
+        self.assertEqual(match_window(WINDOWS, title="visual studio"), 303)
+        self.assertIsNone(match_window(WINDOWS, title="discord"))
+        self.assertIsNone(match_window([], title="notepad"))
+
+
+class TestSharedSnapshot(unittest.TestCase):
+    """The brain publishes, readers in other processes see the latest version."""
+
+    def setUp(self):
+        self.publisher = WindowSnapshotPublisher.create(capacity_bytes=4096)
+        self.addCleanup(self.publisher.close)
+        self.reader = SharedWindowSnapshotReader.attach(self.publisher.name)
+        self.addCleanup(self.reader.close)
+
+    def test_round_trip(self):
+        self.assertIsNone(self.reader.read())
+        self.assertTrue(self.publisher.publish(WINDOWS, focus_hwnd=202, ts=123.0))
+        snapshot = self.reader.read()
+        self.assertEqual(snapshot.version, 1)
+        self.assertEqual(snapshot.ts, 123.0)
+        self.assertEqual(snapshot.focus_hwnd, 202)
+        self.assertEqual(snapshot.get(303)["process"], "code.exe")
+        self.assertNotIn("is_visible", snapshot.get(303))
+        # Unchanged segment: same decoded object
+        self.assertIs(self.reader.read(), snapshot)
+
+        self.publisher.publish(WINDOWS[:1])
+        self.assertEqual(self.reader.read().version, 2)
+        self.assertEqual([w["hwnd"] for w in self.reader.read().windows], [101])
+
+    def test_oversized_publish_clears_snapshot(self):
+        self.publisher.publish(WINDOWS)
+        self.assertIsNotNone(self.reader.read())
+        huge = [dict(WINDOWS[0], hwnd=i, title="x" * 200) for i in range(50)]
+        self.assertFalse(self.publisher.publish(huge))
+        self.assertIsNone(self.reader.read())
+
+    def test_read_from_other_process(self):
+        self.publisher.publish(WINDOWS, focus_hwnd=101)
+        ctx = mp.get_context("spawn")
+        out_q = ctx.Queue()
+        proc = ctx.Process(target=_child_read, args=(self.publisher.name, out_q))
+        proc.start()
+        result = out_q.get(timeout=20)
+        proc.join(timeout=10)
+        self.assertEqual(result, (1, 101, [101, 202, 303]))
+
+
+class TestFreshSnapshot(unittest.TestCase):
+    """Tools only use a snapshot that is recent enough."""
+
+    def setUp(self):
+        self.addCleanup(window_snapshot.set_snapshot_source, None)
+
+    def test_stale_snapshot_is_ignored(self):
+        source = _StaticSource(WindowSnapshot(version=1, ts=time.time(), focus_hwnd=None, windows=WINDOWS))
+        window_snapshot.set_snapshot_source(source)
+        self.assertIs(fresh_snapshot(max_age_ms=1000), source.snapshot)
+
+        source.snapshot = WindowSnapshot(version=2, ts=time.time() - 5.0, focus_hwnd=None, windows=WINDOWS)
+        self.assertIsNone(fresh_snapshot(max_age_ms=1000))
+
+    def test_no_source(self):
+        window_snapshot.set_snapshot_source(None)
+        self.assertIsNone(fresh_snapshot())
+        window_snapshot.set_snapshot_source(_StaticSource(None))
+        self.assertIsNone(fresh_snapshot())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Unit tests for the copy-on-write window state in WorldState: each watcher
+poll swaps in an immutable, version-stamped snapshot that readers can keep
+without copying or locking.
+"""
+import dataclasses
+import os
+import sys
+import unittest
+
+# Add wyzer to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from wyzer.context.world_state import (
+    clear_world_state,
+    get_all_open_windows,
+    get_recent_window_events,
+    get_window_state,
+    get_windows_on_monitor,
+    get_world_state,
+    update_window_watcher_state,
+)
+
+CHROME = {"hwnd": 1, "title": "Chrome", "process": "chrome.exe", "monitor": 1}
+SLACK = {"hwnd": 2, "title": "Slack", "process": "slack.exe", "monitor": 2}
+
+
+def _publish(windows, focused=None, events=()):
+    by_monitor = {}
+    for w in windows:
+        by_monitor.setdefault(w["monitor"], []).append(w)
+    update_window_watcher_state(
+        open_windows=windows,
+        windows_by_monitor=by_monitor,
+        focused_window=focused,
+        recent_events=list(events),
+        detected_monitor_count=2,
+    )
+
+
+class TestWindowStateSnapshot(unittest.TestCase):
+    """Snapshots are immutable, versioned and replaced as a whole."""
+
+    def setUp(self):
+        clear_world_state()
+        self.addCleanup(clear_world_state)
+
+    def test_poll_swaps_in_new_version(self):
+        _publish([CHROME, SLACK], focused=CHROME)
+        first = get_window_state()
+        _publish([SLACK], focused=SLACK)
+        second = get_window_state()
+
+        self.assertGreater(second.version, first.version)
+        # A held snapshot keeps describing its own poll
+        self.assertEqual(first.open_windows, (CHROME, SLACK))
+        self.assertIs(first.focused_window, CHROME)
+        self.assertEqual(second.windows_by_monitor[2], (SLACK,))
+        self.assertNotIn(1, second.windows_by_monitor)
+        self.assertEqual(get_world_state().active_app, "slack.exe")
+
+    def test_snapshot_is_read_only(self):
+        windows = [CHROME]
+        _publish(windows)
+        snapshot = get_window_state()
+        windows.append(SLACK)  # the watcher's list is not aliased
+        self.assertEqual(snapshot.open_windows, (CHROME,))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            snapshot.version = 0
+        with self.assertRaises(TypeError):
+            snapshot.windows_by_monitor[3] = ()
+
+    def test_unchanged_version_means_no_change(self):
+        _publish([CHROME])
+        version = get_window_state().version
+        self.assertEqual(get_window_state().version, version)
+        clear_world_state()
+        self.assertGreater(get_window_state().version, version)
+        self.assertEqual(get_window_state().open_windows, ())
+
+    def test_legacy_attributes_read_and_replace(self):
+        _publish([CHROME], focused=CHROME)
+        ws = get_world_state()
+        before = ws.window_state
+        self.assertIs(ws.focused_window, CHROME)
+        self.assertEqual(ws.detected_monitor_count, 2)
+
+        ws.focused_window = None
+        self.assertIsNone(get_window_state().focused_window)
+        self.assertGreater(get_window_state().version, before.version)
+        self.assertEqual(get_window_state().open_windows, (CHROME,))
+        self.assertIs(before.focused_window, CHROME)
+
+    def test_getters_return_lists(self):
+        events = [
+            {"type": "opened", "hwnd": 1},
+            {"type": "focus_changed", "hwnd": 2},
+            {"type": "opened", "hwnd": 2},
+        ]
+        _publish([CHROME, SLACK], events=events)
+        self.assertEqual(get_all_open_windows(), [CHROME, SLACK])
+        self.assertEqual(get_windows_on_monitor(2), [SLACK])
+        self.assertEqual(get_windows_on_monitor(9), [])
+        self.assertEqual(get_recent_window_events("opened"), [events[0], events[2]])
+        self.assertEqual(get_recent_window_events(limit=1), [events[2]])
+
+
+if __name__ == '__main__':
+    unittest.main()
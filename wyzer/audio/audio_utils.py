@@ -97,7 +97,9 @@ def get_rms_energy(audio: np.ndarray) -> float:
     if len(audio) == 0:
         return 0.0
     
-    return float(np.sqrt(np.mean(audio ** 2)))
+    # dot() avoids allocating a squared copy of the frame
+    flat = audio.reshape(-1)
+    return float(np.sqrt(np.dot(flat, flat) / len(flat)))
 
 
 def is_silence_energy_based(audio: np.ndarray, threshold: float = 0.01) -> bool:
@@ -151,3 +153,43 @@ def audio_to_int16(audio: np.ndarray) -> np.ndarray:
     """
     audio = np.clip(audio, -1.0, 1.0)
     return (audio * 32767).astype(np.int16)
+
+
+class CaptureRing:
+    """
+    Fixed-capacity ring of float32 capture frames.
+    
+    Mic capture writes each callback block into the next slot and hands the
+    slot (a view) to VAD, hotword and utterance buffers, so the always-on
+    path never allocates audio memory. Slots are reused after
+    capacity_frames frames, so consumers must not hold a frame longer than
+    that (size the ring for the longest recording plus queue backlog).
+    """
+    
+    def __init__(self, frame_samples: int, capacity_frames: int):
+        """
+        Args:
+            frame_samples: Samples per frame (the capture block size)
+            capacity_frames: Number of frames before slots are reused
+        """
+        self.frame_samples = int(frame_samples)
+        self.capacity_frames = max(1, int(capacity_frames))
+        self._buffer = np.zeros((self.capacity_frames, self.frame_samples), dtype=np.float32)
+        # Views are created once; handing out a slot allocates nothing
+        self._slots = [self._buffer[i] for i in range(self.capacity_frames)]
+        self._next = 0
+        self.frames_written = 0
+    
+    def claim(self) -> np.ndarray:
+        """Slot for the next frame (not handed out until commit())."""
+        return self._slots[self._next]
+    
+    def commit(self) -> np.ndarray:
+        """Publish the claimed slot and advance; returns the frame view."""
+        frame = self._slots[self._next]
+        self._next += 1
+        if self._next == self.capacity_frames:
+            self._next = 0
+        self.frames_written += 1
+        return frame
+
@@ -2,6 +2,10 @@
 Hotword detection module using openWakeWord.
 Detects wake phrases like "hey wyzer" and "wyzer".
 Supports multiple wakeword models with per-model thresholds and cooldowns.
+
+An energy pre-gate skips openWakeWord inference on silent frames. Skipped
+audio is kept in a short pre-roll and fed in front of the first loud frame,
+so the feature windows the wakeword models look at stay continuous.
 """
 import numpy as np
 import os
@@ -9,9 +13,10 @@ import time
 import urllib.request
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from wyzer.core.config import Config
 from wyzer.core.logger import get_logger
+from wyzer.audio.audio_utils import get_rms_energy
 
 try:
     from openwakeword.model import Model as WakeWordModel
@@ -20,6 +25,10 @@ except ImportError:
     OPENWAKEWORD_AVAILABLE = False
     WakeWordModel = None
 
+# Silence fed to openWakeWord when the gate opens: covers the melspectrogram,
+# embedding and wakeword-model windows behind the first loud frame
+_GATE_PREROLL_SEC = 2.0
+
 
 @dataclass
 class HotwordEvent:
@@ -121,6 +130,29 @@ class HotwordDetector:
         # Per-model cooldown tracking (last trigger time)
         self._last_trigger_time: Dict[str, float] = {}
         
+        # Reused int16 conversion buffers (resized only if the frame size changes)
+        self._scaled = np.zeros(0, dtype=np.float32)
+        self._int16 = np.zeros(0, dtype=np.int16)
+        
+        # Resolved once: per-model config and the trigger streak
+        self._model_configs: Dict[str, WakewordConfig] = {}
+        self._required_streak = max(1, int(getattr(Config, "HOTWORD_TRIGGER_STREAK", 1)))
+        
+        # Energy pre-gate (frames below gate_rms skip inference once the hangover ends)
+        self.gate_enabled = Config.HOTWORD_ENERGY_GATE
+        self.gate_rms = Config.HOTWORD_GATE_RMS
+        self._gate_hangover_samples = int(Config.HOTWORD_GATE_HANGOVER_SEC * sample_rate)
+        self._gate_open_samples = 0
+        self._preroll = np.zeros(int(_GATE_PREROLL_SEC * sample_rate), dtype=np.int16)
+        self._preroll_pos = 0
+        self._preroll_fill = 0
+        
+        # Per-frame cost metrics
+        self.frames_total = 0
+        self.frames_gated = 0
+        self._predict_sec_total = 0.0
+        self._predict_sec_max = 0.0
+        
         if not OPENWAKEWORD_AVAILABLE:
             raise RuntimeError(
                 "openWakeWord not available. Install with: pip install openwakeword"
@@ -265,6 +297,9 @@ class HotwordDetector:
             if model_key:
                 self._model_key_to_config[model_key] = cfg
                 self.logger.debug(f"Mapped model key '{model_key}' -> config '{cfg.name}'")
+        
+        for model_key in available_keys:
+            self._model_configs[model_key] = self._resolve_config(model_key)
     
     def _find_model_key_for_config(self, cfg: WakewordConfig, available_keys: List[str]) -> Optional[str]:
         """Find the openWakeWord model key that matches a config"""
@@ -302,18 +337,173 @@ class HotwordDetector:
             return self.wakeword_configs[0]
         return None
     
+    def _resolve_config(self, model_key: str) -> WakewordConfig:
+        """Config for a model key, or one built from the legacy threshold"""
+        cfg = self._get_config_for_model_key(model_key)
+        if cfg is None:
+            # No config for this model, use legacy threshold
+            cfg = WakewordConfig(
+                name=model_key,
+                model_path="",
+                threshold=self.threshold,
+                cooldown_ms=int(Config.HOTWORD_COOLDOWN_SEC * 1000)
+            )
+        return cfg
+    
     def _is_in_cooldown(self, model_key: str, cfg: WakewordConfig) -> bool:
         """Check if a wakeword is in cooldown period"""
         last_trigger = self._last_trigger_time.get(model_key, 0.0)
         cooldown_sec = cfg.cooldown_ms / 1000.0
         return (time.time() - last_trigger) < cooldown_sec
     
+    def _to_int16(self, audio_frame: np.ndarray) -> np.ndarray:
+        """
+        Convert a float32 frame to int16 in reused buffers (no per-frame allocation).
+        
+        The result is overwritten by the next call; openWakeWord copies it
+        into its own buffer during predict().
+        """
+        n = len(audio_frame)
+        if len(self._int16) != n:
+            self._scaled = np.zeros(n, dtype=np.float32)
+            self._int16 = np.zeros(n, dtype=np.int16)
+        np.multiply(audio_frame, 32767, out=self._scaled)
+        np.copyto(self._int16, self._scaled, casting="unsafe")
+        return self._int16
+    
+    def _gate(self, audio_frame: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Energy pre-gate.
+        
+        Returns:
+            int16 audio to score (with the buffered pre-roll in front when
+            the gate just opened), or None if the frame was only buffered
+        """
+        audio_int16 = self._to_int16(audio_frame)
+        if not self.gate_enabled:
+            return audio_int16
+        
+        if get_rms_energy(audio_frame) >= self.gate_rms:
+            was_open = self._gate_open_samples > 0
+            self._gate_open_samples = self._gate_hangover_samples
+            if was_open or self._preroll_fill == 0:
+                return audio_int16
+            # Gate opens: replay the buffered silence so openWakeWord's feature
+            # buffer is continuous over the windows it is about to score
+            start = (self._preroll_pos - self._preroll_fill) % len(self._preroll)
+            if start + self._preroll_fill <= len(self._preroll):
+                preroll = self._preroll[start:start + self._preroll_fill]
+                audio = np.concatenate((preroll, audio_int16))
+            else:
+                audio = np.concatenate((self._preroll[start:], self._preroll[:self._preroll_pos], audio_int16))
+            self._preroll_fill = 0
+            return audio
+        
+        if self._gate_open_samples > 0:
+            # Hangover: keep scoring the tail of a sound
+            self._gate_open_samples -= len(audio_int16)
+            return audio_int16
+        
+        # Closed: buffer the frame in the pre-roll ring
+        size = len(self._preroll)
+        n = min(len(audio_int16), size)
+        end = self._preroll_pos + n
+        if end <= size:
+            self._preroll[self._preroll_pos:end] = audio_int16[-n:]
+        else:
+            split = size - self._preroll_pos
+            self._preroll[self._preroll_pos:] = audio_int16[-n:][:split]
+            self._preroll[:end - size] = audio_int16[-n:][split:]
+        self._preroll_pos = end % size
+        self._preroll_fill = min(size, self._preroll_fill + n)
+        self.frames_gated += 1
+        return None
+    
+    def _score(self, audio_frame: np.ndarray) -> Tuple[Optional[Tuple[str, WakewordConfig, float]], float]:
+        """
+        Score a frame with all loaded models and apply trigger rules.
+        
+        Returns:
+            Tuple of ((model_key, config, score) of the triggered wakeword or
+            None, max score)
+        """
+        self.frames_total += 1
+        audio_int16 = self._gate(audio_frame)
+        if audio_int16 is None:
+            return None, 0.0
+        
+        # Run prediction once for all models
+        start = time.perf_counter()
+        prediction = self.model.predict(audio_int16)
+        elapsed = time.perf_counter() - start
+        self._predict_sec_total += elapsed
+        if elapsed > self._predict_sec_max:
+            self._predict_sec_max = elapsed
+        
+        # Track candidates: (model_key, config, score)
+        candidates: List[tuple] = []
+        max_score = 0.0
+        required_streak = self._required_streak
+        
+        # Process all model predictions
+        for model_key, score in prediction.items():
+            max_score = max(max_score, score)
+            
+            cfg = self._model_configs.get(model_key)
+            if cfg is None:
+                cfg = self._model_configs[model_key] = self._resolve_config(model_key)
+            
+            # Get previous score for this model
+            prev_score = self.prev_scores.get(model_key, 0.0)
+            
+            # Update streak count using per-model threshold
+            prev_streak = self.streak_counts.get(model_key, 0)
+            if score >= cfg.threshold:
+                streak = prev_streak + 1
+            else:
+                streak = 0
+            self.streak_counts[model_key] = streak
+            
+            # Check if this model should trigger
+            should_trigger = False
+            if required_streak == 1:
+                # Rising-edge: trigger when crossing threshold upward
+                if prev_score < cfg.threshold and score >= cfg.threshold:
+                    should_trigger = True
+            else:
+                # Streak-based: trigger when reaching required streak
+                if prev_streak < required_streak and streak >= required_streak:
+                    should_trigger = True
+            
+            # Update previous score
+            self.prev_scores[model_key] = score
+            
+            # Check cooldown before adding to candidates
+            if should_trigger and not self._is_in_cooldown(model_key, cfg):
+                candidates.append((model_key, cfg, score))
+        
+        if not candidates:
+            return None, max_score
+        
+        # Select highest-confidence candidate
+        candidates.sort(key=lambda x: x[2], reverse=True)
+        best_model_key, best_cfg, best_score = candidates[0]
+        
+        # Record trigger time for cooldown
+        self._last_trigger_time[best_model_key] = time.time()
+        
+        self.logger.info(
+            f"[HOTWORD] Triggered \"{best_cfg.name}\" confidence={best_score:.3f}"
+        )
+        return candidates[0], best_score
+    
     def detect(self, audio_frame: np.ndarray) -> tuple[Optional[str], float]:
         """
         Detect hotword in audio frame with rising-edge detection.
         
-        Scores all loaded models once per frame. Selects the highest-confidence
-        wakeword above its per-model threshold, respecting per-model cooldowns.
+        Scores all loaded models once per frame (silent frames are skipped
+        by the energy gate). Selects the highest-confidence wakeword above
+        its per-model threshold, respecting per-model cooldowns.
         
         Args:
             audio_frame: Audio data as float32 mono at sample_rate
@@ -328,88 +518,9 @@ class HotwordDetector:
             return None, 0.0
         
         try:
-            # openWakeWord expects int16
-            # Convert float32 [-1.0, 1.0] to int16
-            audio_int16 = (audio_frame * 32767).astype(np.int16)
-            
-            # Run prediction once for all models
-            prediction = self.model.predict(audio_int16)
-            
-            # Track candidates: (model_key, config, score, streak)
-            candidates: List[tuple] = []
-            max_score = 0.0
-            
-            # Process all model predictions
-            for model_key, score in prediction.items():
-                max_score = max(max_score, score)
-                
-                # Get config for this model
-                cfg = self._get_config_for_model_key(model_key)
-                if cfg is None:
-                    # No config for this model, use legacy threshold
-                    cfg = WakewordConfig(
-                        name=model_key,
-                        model_path="",
-                        threshold=self.threshold,
-                        cooldown_ms=int(Config.HOTWORD_COOLDOWN_SEC * 1000)
-                    )
-                
-                # Get previous score for this model
-                prev_score = self.prev_scores.get(model_key, 0.0)
-                
-                # Update streak count using per-model threshold
-                prev_streak = self.streak_counts.get(model_key, 0)
-                if score >= cfg.threshold:
-                    streak = prev_streak + 1
-                else:
-                    streak = 0
-                self.streak_counts[model_key] = streak
-                
-                # Check if this model should trigger
-                required_streak = max(1, int(getattr(Config, "HOTWORD_TRIGGER_STREAK", 1)))
-                should_trigger = False
-                
-                if required_streak == 1:
-                    # Rising-edge: trigger when crossing threshold upward
-                    if prev_score < cfg.threshold and score >= cfg.threshold:
-                        should_trigger = True
-                else:
-                    # Streak-based: trigger when reaching required streak
-                    if prev_streak < required_streak and streak >= required_streak:
-                        should_trigger = True
-                
-                # Update previous score
-                self.prev_scores[model_key] = score
-                
-                # Check cooldown before adding to candidates
-                if should_trigger and not self._is_in_cooldown(model_key, cfg):
-                    candidates.append((model_key, cfg, score, streak))
-            
-            # Select highest-confidence candidate
-            if candidates:
-                # Sort by score descending
-                candidates.sort(key=lambda x: x[2], reverse=True)
-                best_model_key, best_cfg, best_score, best_streak = candidates[0]
-                
-                # Record trigger time for cooldown
-                self._last_trigger_time[best_model_key] = time.time()
-                
-                # Create structured event
-                event = HotwordEvent(
-                    wakeword=best_cfg.name,
-                    confidence=best_score,
-                    timestamp=time.time()
-                )
-                
-                self.logger.info(
-                    f"[HOTWORD] Triggered \"{best_cfg.name}\" confidence={best_score:.3f}"
-                )
-                
-                # Return the wakeword name (for backward compat with state machine)
-                return best_cfg.name, best_score
-            
-            return None, max_score
-            
+            triggered, score = self._score(audio_frame)
+            # Return the wakeword name (for backward compat with state machine)
+            return (triggered[1].name if triggered else None), score
         except Exception as e:
             self.logger.error(f"Error in hotword detection: {e}")
             return None, 0.0
@@ -431,72 +542,36 @@ class HotwordDetector:
             return None, 0.0
         
         try:
-            audio_int16 = (audio_frame * 32767).astype(np.int16)
-            prediction = self.model.predict(audio_int16)
-            
-            candidates: List[tuple] = []
-            max_score = 0.0
-            
-            for model_key, score in prediction.items():
-                max_score = max(max_score, score)
-                
-                cfg = self._get_config_for_model_key(model_key)
-                if cfg is None:
-                    cfg = WakewordConfig(
-                        name=model_key,
-                        model_path="",
-                        threshold=self.threshold,
-                        cooldown_ms=int(Config.HOTWORD_COOLDOWN_SEC * 1000)
-                    )
-                
-                prev_score = self.prev_scores.get(model_key, 0.0)
-                prev_streak = self.streak_counts.get(model_key, 0)
-                
-                if score >= cfg.threshold:
-                    streak = prev_streak + 1
-                else:
-                    streak = 0
-                self.streak_counts[model_key] = streak
-                
-                required_streak = max(1, int(getattr(Config, "HOTWORD_TRIGGER_STREAK", 1)))
-                should_trigger = False
-                
-                if required_streak == 1:
-                    if prev_score < cfg.threshold and score >= cfg.threshold:
-                        should_trigger = True
-                else:
-                    if prev_streak < required_streak and streak >= required_streak:
-                        should_trigger = True
-                
-                self.prev_scores[model_key] = score
-                
-                if should_trigger and not self._is_in_cooldown(model_key, cfg):
-                    candidates.append((model_key, cfg, score))
-            
-            if candidates:
-                candidates.sort(key=lambda x: x[2], reverse=True)
-                best_model_key, best_cfg, best_score = candidates[0]
-                
-                self._last_trigger_time[best_model_key] = time.time()
-                
-                event = HotwordEvent(
-                    wakeword=best_cfg.name,
-                    confidence=best_score,
-                    timestamp=time.time()
-                )
-                
-                self.logger.info(
-                    f"[HOTWORD] Triggered \"{best_cfg.name}\" confidence={best_score:.3f}"
-                )
-                
-                return event, best_score
-            
-            return None, max_score
-            
+            triggered, score = self._score(audio_frame)
+            if triggered is None:
+                return None, score
+            event = HotwordEvent(
+                wakeword=triggered[1].name,
+                confidence=triggered[2],
+                timestamp=time.time()
+            )
+            return event, score
         except Exception as e:
             self.logger.error(f"Error in hotword detection: {e}")
             return None, 0.0
     
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Per-frame cost of hotword scoring since startup.
+        
+        Returns:
+            Dict with frames, gated (skipped by the energy gate), scored,
+            avg_predict_ms and max_predict_ms
+        """
+        scored = self.frames_total - self.frames_gated
+        return {
+            "frames": self.frames_total,
+            "gated": self.frames_gated,
+            "scored": scored,
+            "avg_predict_ms": (self._predict_sec_total / scored * 1000) if scored else 0.0,
+            "max_predict_ms": self._predict_sec_max * 1000,
+        }
+    
     def _find_model_key(self, keyword: str) -> Optional[str]:
         """
         Find the model key that matches the keyword (legacy compatibility).
@@ -553,6 +628,8 @@ class HotwordDetector:
         self.prev_scores = {}
         self.streak_counts = {}
         self._last_trigger_time = {}
+        self._gate_open_samples = 0
+        self._preroll_fill = 0
         if self.model:
             # openWakeWord model doesn't need explicit reset for frame-by-frame
             pass
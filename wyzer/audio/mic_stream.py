@@ -1,6 +1,9 @@
 """
 Microphone stream module using sounddevice.
 Captures audio in float32 mono at 16kHz and pushes to queue.
+
+Frames are written into a pre-allocated CaptureRing and queued as views of
+their ring slot, so the capture callback does not allocate per frame.
 """
 import sounddevice as sd
 import numpy as np
@@ -8,6 +11,7 @@ from queue import Queue, Full
 from typing import Optional, Callable
 from wyzer.core.config import Config
 from wyzer.core.logger import get_logger
+from wyzer.audio.audio_utils import CaptureRing
 
 
 class MicStream:
@@ -39,11 +43,26 @@ class MicStream:
         self.audio_queue = audio_queue or Queue(maxsize=Config.AUDIO_QUEUE_MAX_SIZE)
         self.stream: Optional[sd.InputStream] = None
         self.is_running = False
+        self.ring = CaptureRing(chunk_samples, self._ring_capacity_frames())
         
         # Verify device supports requested sample rate
         if device is not None:
             self._verify_device()
     
+    def _ring_capacity_frames(self) -> int:
+        """
+        Ring slots needed so a frame is not overwritten while still in use.
+        
+        Consumers hold frames for at most one recording (plus whatever is
+        waiting in the queue), so the ring covers that with a margin even if
+        WYZER_CAPTURE_RING_SECONDS is set lower.
+        """
+        frame_sec = self.chunk_samples / self.sample_rate
+        configured = int(np.ceil(Config.CAPTURE_RING_SECONDS / frame_sec))
+        queue_frames = self.audio_queue.maxsize if self.audio_queue.maxsize > 0 else Config.AUDIO_QUEUE_MAX_SIZE
+        required = int(np.ceil((Config.MAX_RECORD_SECONDS + 2.0) / frame_sec)) + queue_frames
+        return max(configured, required)
+    
     def _verify_device(self) -> None:
         """Verify device capabilities"""
         try:
@@ -86,20 +105,29 @@ class MicStream:
         if status:
             self.logger.warning(f"Audio callback status: {status}")
         
-        # Convert to mono if needed
+        if indata.shape[0] != self.chunk_samples:
+            # Unexpected block size: can't use a ring slot, copy instead
+            audio_data = np.mean(indata, axis=1) if indata.shape[1] > 1 else indata[:, 0]
+            try:
+                self.audio_queue.put_nowait(audio_data.astype(np.float32))
+            except Full:
+                self.logger.warning("Audio queue full, dropping frame")
+            return
+        
+        # Convert to mono directly into the next ring slot
+        slot = self.ring.claim()
         if indata.shape[1] > 1:
-            audio_data = np.mean(indata, axis=1)
+            np.mean(indata, axis=1, out=slot)
         else:
-            audio_data = indata[:, 0]
+            np.copyto(slot, indata[:, 0])
         
-        # Ensure float32
-        audio_data = audio_data.astype(np.float32)
-        
-        # Push to queue (non-blocking, drop if full)
+        # Push to queue (non-blocking, drop if full; the uncommitted slot is reused)
         try:
-            self.audio_queue.put_nowait(audio_data.copy())
+            self.audio_queue.put_nowait(slot)
         except Full:
             self.logger.warning("Audio queue full, dropping frame")
+            return
+        self.ring.commit()
     
     def start(self) -> None:
         """Start the audio stream"""
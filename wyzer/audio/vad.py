@@ -1,10 +1,17 @@
 """
 Voice Activity Detection (VAD) module.
 Primary: silero-vad (if available)
-Fallback: Energy-based VAD
+Fallback: Energy-based VAD (vectorized RMS + zero-crossing rate with an
+adaptive noise floor)
+
+Frames can be scored one at a time (is_speech) or as a backlog in one pass
+(prime / score_frames); the realtime core primes queued frames so the
+model is entered once per backlog instead of once per frame.
 """
+from collections import deque
+from typing import List, Optional
+
 import numpy as np
-from typing import Optional
 from wyzer.core.config import Config
 from wyzer.core.logger import get_logger
 from wyzer.audio.audio_utils import get_rms_energy
@@ -19,6 +26,107 @@ except ImportError:
     pass
 
 
+class EnergyVad:
+    """
+    Energy/zero-crossing speech detector with an adaptive noise floor.
+    
+    A frame is speech when its RMS clears the gate, which is the noise floor
+    times snr_ratio (never below min_rms, never above max_rms). Frames that
+    only barely clear the gate are rejected if their zero-crossing rate
+    looks like broadband noise. The floor follows quieter frames down
+    immediately and rises towards louder ones: slowly on non-speech frames,
+    very slowly on speech frames (so a room that gets permanently louder is
+    absorbed after a few seconds, while pauses between words pull the floor
+    back down during real speech).
+    """
+    
+    def __init__(
+        self,
+        max_rms: float,
+        snr_ratio: float = Config.VAD_ENERGY_SNR_RATIO,
+        min_rms: float = 0.005,
+        max_zcr: float = 0.4,
+        floor_rise: float = 0.05,
+        speech_floor_rise: float = 0.002,
+        max_batch: int = Config.VAD_BATCH_MAX_FRAMES,
+    ):
+        """
+        Args:
+            max_rms: RMS that always counts as speech (the legacy fixed threshold)
+            snr_ratio: Gate as a multiple of the noise floor
+            min_rms: Lower bound of the gate
+            max_zcr: Zero crossings per sample above which a near-gate frame is noise
+            floor_rise: Rate at which the floor follows louder non-speech frames
+            speech_floor_rise: Rate at which the floor follows speech frames
+            max_batch: Frames per call scored in the pre-allocated work buffers
+        """
+        self.max_rms = max_rms
+        self.snr_ratio = snr_ratio
+        self.min_rms = min_rms
+        self.max_zcr = max_zcr
+        self.floor_rise = floor_rise
+        self.speech_floor_rise = speech_floor_rise
+        self.noise_floor: Optional[float] = None
+        self._max_batch = max(1, max_batch)
+        self._frame_samples = 0
+    
+    def _ensure_buffers(self, frame_samples: int) -> None:
+        if frame_samples == self._frame_samples:
+            return
+        self._frame_samples = frame_samples
+        self._frames = np.zeros((self._max_batch, frame_samples), dtype=np.float32)
+        self._signs = np.zeros((self._max_batch, frame_samples), dtype=bool)
+        self._crossings = np.zeros((self._max_batch, max(frame_samples - 1, 0)), dtype=bool)
+    
+    def score(self, frames: List[np.ndarray]) -> List[bool]:
+        """
+        Score consecutive frames (updates the noise floor in order).
+        
+        Args:
+            frames: Equal-length float32 mono frames
+        
+        Returns:
+            Speech decision per frame
+        """
+        decisions: List[bool] = []
+        for start in range(0, len(frames), self._max_batch):
+            decisions.extend(self._score_batch(frames[start:start + self._max_batch]))
+        return decisions
+    
+    def _score_batch(self, frames: List[np.ndarray]) -> List[bool]:
+        n = len(frames)
+        samples = len(frames[0])
+        if samples < 2 or any(len(f) != samples for f in frames):
+            # Ragged batch: score frame by frame
+            return [self._decide(get_rms_energy(f), 0.0) for f in frames]
+        self._ensure_buffers(samples)
+        
+        block = self._frames[:n]
+        np.stack(frames, out=block)
+        energy = np.sqrt(np.einsum("ij,ij->i", block, block) / samples)
+        signs = self._signs[:n]
+        np.signbit(block, out=signs)
+        crossings = self._crossings[:n]
+        np.not_equal(signs[:, 1:], signs[:, :-1], out=crossings)
+        zcr = np.count_nonzero(crossings, axis=1) / samples
+        
+        # The floor adapts frame by frame, so decisions are sequential scalars
+        return [self._decide(float(e), float(z)) for e, z in zip(energy, zcr)]
+    
+    def _decide(self, energy: float, zcr: float) -> bool:
+        if self.noise_floor is None:
+            self.noise_floor = energy
+        gate = min(self.max_rms, max(self.min_rms, self.noise_floor * self.snr_ratio))
+        # Above the fixed threshold is speech, as before (fricatives have a high ZCR)
+        speech = energy > self.max_rms or (energy > gate and (zcr <= self.max_zcr or energy > 2.0 * gate))
+        if energy < self.noise_floor:
+            self.noise_floor = energy
+        else:
+            rise = self.speech_floor_rise if speech else self.floor_rise
+            self.noise_floor += rise * (energy - self.noise_floor)
+        return speech
+
+
 class VadDetector:
     """Voice Activity Detection"""
     
@@ -45,7 +153,19 @@ class VadDetector:
         
         # Silero requires minimum 512 samples (32ms at 16kHz)
         self.silero_min_samples = 512
-        self.frame_buffer = []
+        # Pre-allocated accumulator (grown only for unusually large backlogs)
+        self._silero_buffer = np.zeros(
+            self.silero_min_samples + Config.VAD_BATCH_MAX_FRAMES * Config.CHUNK_SAMPLES, dtype=np.float32
+        )
+        self._silero_tensor = None  # torch view of _silero_buffer
+        self._silero_fill = 0
+        self._last_silero_speech: Optional[bool] = None
+        
+        # Higher aggressiveness = higher threshold = less sensitive
+        self.energy_vad = EnergyVad(max_rms=self.threshold * (self.aggressiveness / 3.0))
+        
+        # Decisions scored ahead by prime(), consumed in order by is_speech()
+        self._primed: deque = deque()
         
         # Try to load Silero VAD
         if SILERO_AVAILABLE:
@@ -76,77 +196,134 @@ class VadDetector:
         
         Args:
             audio_frame: Audio data as float32 mono at sample_rate
-            
+        
         Returns:
             True if speech detected
         """
         if len(audio_frame) == 0:
             return False
         
-        if self.use_silero and self.model is not None:
-            # Buffer frames until we have enough for Silero (exactly 512 samples)
-            self.frame_buffer.append(audio_frame)
-            buffered = np.concatenate(self.frame_buffer)
-            
-            if len(buffered) >= self.silero_min_samples:
-                # Use exactly 512 samples for Silero
-                chunk = buffered[:self.silero_min_samples]
-                result = self._is_speech_silero(chunk)
-                # Keep remaining samples for next iteration
-                self.frame_buffer = [buffered[self.silero_min_samples:]] if len(buffered) > self.silero_min_samples else []
+        # Primed frames the caller skipped (no VAD in its state) are dropped
+        while self._primed:
+            frame, result = self._primed.popleft()
+            if frame is audio_frame:
                 return result
-            else:
-                # Not enough buffered yet, use energy fallback
-                return self._is_speech_energy(audio_frame)
-        else:
-            return self._is_speech_energy(audio_frame)
+        
+        return self.score_frames([audio_frame])[0]
     
-    def _is_speech_silero(self, audio_frame: np.ndarray) -> bool:
+    def prime(self, frames: List[np.ndarray]) -> None:
         """
-        Speech detection using Silero VAD
+        Score a backlog of frames in one pass ahead of is_speech().
+        
+        is_speech() then returns the stored decision when called with the
+        same frame objects in the same order (frames may be skipped).
         
         Args:
-            audio_frame: Audio frame as float32
-            
+            frames: Consecutive float32 mono frames (in queue order)
+        """
+        frames = [f for f in frames if len(f)]
+        if frames:
+            self._primed = deque(zip(frames, self.score_frames(frames)))
+    
+    def score_frames(self, frames: List[np.ndarray]) -> List[bool]:
+        """
+        Score consecutive frames in order.
+        
+        With Silero, frames are regrouped into 512-sample chunks and all
+        complete chunks are run in one inference context; the model's
+        recurrent state carries over between calls. A frame takes the
+        decision of the chunk it completes; a frame that completes none
+        holds the previous Silero decision.
+        
+        Args:
+            frames: Consecutive float32 mono frames
+        
         Returns:
-            True if speech detected
+            Speech decision per frame
         """
+        if not (self.use_silero and self.model is not None):
+            return self.energy_vad.score(frames)
+        
+        # Append the frames to the accumulator, remembering where each one ends
+        ends = []
+        total = self._silero_fill + sum(len(f) for f in frames)
+        if total > len(self._silero_buffer):
+            grown = np.zeros(total, dtype=np.float32)
+            grown[:self._silero_fill] = self._silero_buffer[:self._silero_fill]
+            self._silero_buffer = grown
+            self._silero_tensor = None
+        for frame in frames:
+            frame = frame.reshape(-1)
+            end = self._silero_fill + len(frame)
+            self._silero_buffer[self._silero_fill:end] = frame
+            self._silero_fill = end
+            ends.append(end)
+        
+        chunks = self._silero_fill // self.silero_min_samples
+        chunk_speech = self._run_silero(chunks) if chunks else []
+        
+        decisions: List[bool] = []
+        done = 0  # chunks already assigned to a frame
+        for frame, end in zip(frames, ends):
+            completed = min(end // self.silero_min_samples, len(chunk_speech))
+            if completed > done:
+                self._last_silero_speech = any(chunk_speech[done:completed])
+                done = completed
+                decisions.append(self._last_silero_speech)
+            elif self._last_silero_speech is not None:
+                decisions.append(self._last_silero_speech)
+            else:
+                # No Silero decision yet, use energy fallback
+                decisions.append(self._is_speech_energy(frame))
+        
+        # Keep remaining samples for next iteration
+        used = chunks * self.silero_min_samples
+        remaining = self._silero_fill - used
+        self._silero_buffer[:remaining] = self._silero_buffer[used:self._silero_fill]
+        self._silero_fill = remaining
+        return decisions
+    
+    def _run_silero(self, chunks: int) -> List[bool]:
+        """
+        Run Silero over the first `chunks` 512-sample chunks of the accumulator.
+        
+        Silero's batch dimension holds independent streams, so consecutive
+        chunks of one stream are still fed one after another (carrying the
+        recurrent state); the batching happens around the model: one
+        inference context, tensor views of the pre-allocated accumulator
+        and a single conversion of all probabilities.
+        """
+        n = self.silero_min_samples
         try:
-            # Silero expects torch tensor
-            audio_tensor = torch.from_numpy(audio_frame)
-            
-            # Get speech probability
-            speech_prob = self.model(audio_tensor, self.sample_rate).item()
-            
-            return speech_prob > self.threshold
-            
+            if self._silero_tensor is None:
+                self._silero_tensor = torch.from_numpy(self._silero_buffer)
+            with torch.inference_mode():
+                probs = [self.model(self._silero_tensor[i * n:(i + 1) * n], self.sample_rate) for i in range(chunks)]
+                values = torch.cat([p.reshape(-1) for p in probs]).tolist()
+            return [p > self.threshold for p in values]
         except Exception as e:
             self.logger.warning(f"Silero VAD error: {e}, falling back to energy")
-            return self._is_speech_energy(audio_frame)
+            return [
+                self._is_speech_energy(self._silero_buffer[i * n:(i + 1) * n]) for i in range(chunks)
+            ]
     
     def _is_speech_energy(self, audio_frame: np.ndarray) -> bool:
         """
-        Simple energy-based speech detection (fallback)
+        Energy-based speech detection (fallback)
         
         Args:
             audio_frame: Audio frame as float32
-            
+        
         Returns:
             True if speech detected
         """
-        # TODO: This is a simple fallback. Consider implementing a more
-        # sophisticated energy-based VAD with adaptive thresholding and
-        # spectral features for better performance when Silero is unavailable.
-        
-        energy = get_rms_energy(audio_frame)
-        
-        # Adjust threshold based on aggressiveness
-        # Higher aggressiveness = higher threshold = less sensitive
-        adjusted_threshold = self.threshold * (self.aggressiveness / 3.0)
-        
-        return energy > adjusted_threshold
+        return self.energy_vad.score([audio_frame.reshape(-1)])[0]
     
     def reset(self) -> None:
         """Reset VAD state"""
         # Clear frame buffer
-        self.frame_buffer = []
+        self._silero_fill = 0
+        self._last_silero_speech = None
+        self._primed.clear()
+        if self.model is not None and hasattr(self.model, "reset_states"):
+            self.model.reset_states()
@@ -0,0 +1,279 @@
+"""
+Keep-alive HTTP connection pool for LLM clients.
+
+urllib's default handlers force "Connection: close", so every generate,
+stream or ping paid for a fresh TCP connection. This module provides urllib
+handlers backed by a process-wide pool of http.client connections:
+
+- Idle connections are reused per (scheme, host:port)
+- Idle connections are health-checked before reuse (closed by the server,
+  stray data, or idle too long -> discarded)
+- If a reused connection turns out to be closed or reset by the server
+  before any response arrives (sending the request or reading the status
+  line fails with a reset/disconnect error), the request is sent again on
+  the next idle or a new connection. Errors on a new connection, other
+  errors, and failures after the response has started are raised
+- Responses (including streamed SSE/NDJSON bodies) return their connection
+  to the pool when closed, if the body was fully consumed
+
+Clients keep using urllib (Request, opener.open, HTTPError, URLError).
+"""
+import http.client
+import select
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Callable, Dict, List, Optional, Tuple
+
+from wyzer.core.config import Config
+from wyzer.core.logger import get_logger
+
+
+# How long closing a partially read response may spend draining the rest
+# of the body so its connection can be reused
+_DRAIN_TIMEOUT_SEC = 0.05
+
+# Errors that mean a reused connection was closed/reset by the server
+_RESET_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+def _request_quick_ack(conn: http.client.HTTPConnection) -> None:
+    """
+    Ask the kernel to ACK the response immediately (Linux only).
+    
+    On a long-lived connection the receiver falls back to delayed ACKs, and
+    servers that write headers and body separately without TCP_NODELAY then
+    stall ~40ms per response (Nagle + delayed ACK). Fresh connections never
+    hit this, so without it keep-alive could be slower than reconnecting.
+    """
+    sock = conn.sock
+    if sock is None or not hasattr(socket, "TCP_QUICKACK"):
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    except OSError:
+        pass
+
+
+class _PooledResponse(http.client.HTTPResponse):
+    """HTTPResponse that hands its connection back to the pool on close()."""
+
+    _release: Optional[Callable[[bool], None]] = None
+    _sock: Optional[socket.socket] = None
+
+    def close(self) -> None:
+        release, self._release = self._release, None
+        reusable = release is not None and not self.will_close and self._drain()
+        super().close()
+        if release is not None:
+            release(reusable)
+
+    def _drain(self) -> bool:
+        """Consume what's left of the body within a short deadline."""
+        if self.fp is None:
+            return True
+        if self._sock is None:
+            return False
+        deadline = time.monotonic() + _DRAIN_TIMEOUT_SEC
+        try:
+            self._sock.settimeout(_DRAIN_TIMEOUT_SEC)
+            while self.fp is not None:
+                if time.monotonic() > deadline or not self.read(65536):
+                    break
+        except (OSError, http.client.HTTPException, ValueError):
+            return False
+        return self.fp is None
+
+
+class HTTPConnectionPool:
+    """Process-wide pool of idle keep-alive connections, keyed by scheme and host."""
+
+    def __init__(self, maxsize: int = 4, idle_sec: float = 30.0):
+        """
+        Args:
+            maxsize: Maximum idle connections kept per host
+            idle_sec: Idle connections older than this are closed instead of reused
+        """
+        self.maxsize = maxsize
+        self.idle_sec = idle_sec
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str], List[Tuple[http.client.HTTPConnection, float]]] = {}
+        self._stats = {"created": 0, "reused": 0, "discarded": 0, "retried": 0}
+
+    def stats(self) -> Dict[str, int]:
+        """Connection counters (created/reused/discarded/retried)."""
+        with self._lock:
+            return dict(self._stats)
+
+    def close_all(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn, _ in conns:
+                conn.close()
+
+    def open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        """Send a urllib Request over a pooled connection (urllib do_open equivalent)."""
+        host = req.host
+        if not host:
+            raise urllib.error.URLError("no host given")
+
+        headers = dict(req.unredirected_hdrs)
+        headers.update({k: v for k, v in req.headers.items() if k not in headers})
+        headers["Connection"] = "keep-alive"
+        headers = {name.title(): val for name, val in headers.items()}
+
+        key = (req.type, host)
+        while True:
+            conn, reused = self._acquire(key, req.timeout)
+            try:
+                try:
+                    conn.request(
+                        req.get_method(), req.selector, req.data, headers,
+                        encode_chunked=req.has_header("Transfer-encoding"),
+                    )
+                except OSError as err:
+                    if reused and isinstance(err, _RESET_ERRORS):
+                        raise
+                    raise urllib.error.URLError(err)
+                _request_quick_ack(conn)
+                response = conn.getresponse()
+            except _RESET_ERRORS as err:
+                conn.close()
+                self._count("discarded")
+                if reused:
+                    # Server dropped the idle connection; retry on a fresh one
+                    get_logger().debug(f"[HTTP_POOL] Reused connection to {host} was reset ({err}), reconnecting")
+                    self._count("retried")
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                self._count("discarded")
+                raise
+            break
+
+        response._release = lambda reusable: self._release(key, conn, reusable)
+        response._sock = conn.sock
+        response.url = req.get_full_url()
+        response.msg = response.reason
+        return response
+
+    def _acquire(self, key: Tuple[str, str], timeout) -> Tuple[http.client.HTTPConnection, bool]:
+        """Get a healthy idle connection for key, or a new one. Returns (conn, reused)."""
+        now = time.monotonic()
+        conn = None
+        stale = []
+        with self._lock:
+            idle = self._idle.get(key, [])
+            while idle:
+                candidate, idle_since = idle.pop()
+                if now - idle_since <= self.idle_sec and self._is_healthy(candidate):
+                    conn = candidate
+                    self._stats["reused"] += 1
+                    break
+                stale.append(candidate)
+                self._stats["discarded"] += 1
+            if conn is None:
+                self._stats["created"] += 1
+        for candidate in stale:
+            candidate.close()
+
+        if conn is None:
+            scheme, host = key
+            conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            conn = conn_class(host, timeout=timeout)
+            conn.response_class = _PooledResponse
+            return conn, False
+
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(None if timeout is socket._GLOBAL_DEFAULT_TIMEOUT else timeout)
+        return conn, True
+
+    @staticmethod
+    def _is_healthy(conn: http.client.HTTPConnection) -> bool:
+        """An idle keep-alive socket must be open and have nothing to read."""
+        sock = conn.sock
+        if sock is None:
+            return False
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        # Readable while idle means EOF/reset from the server, or stray bytes
+        return not readable
+
+    def _release(self, key: Tuple[str, str], conn: http.client.HTTPConnection, reusable: bool) -> None:
+        if reusable and conn.sock is not None:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.maxsize:
+                    idle.append((conn, time.monotonic()))
+                    return
+        conn.close()
+        self._count("discarded")
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+
+class KeepAliveHTTPHandler(urllib.request.HTTPHandler):
+    """urllib handler that sends http:// requests through an HTTPConnectionPool."""
+
+    def __init__(self, pool: Optional[HTTPConnectionPool] = None):
+        super().__init__()
+        self._pool = pool
+
+    def http_open(self, req):
+        return (self._pool or get_http_pool()).open(req)
+
+
+class KeepAliveHTTPSHandler(urllib.request.HTTPSHandler):
+    """urllib handler that sends https:// requests through an HTTPConnectionPool."""
+
+    def __init__(self, pool: Optional[HTTPConnectionPool] = None):
+        super().__init__()
+        self._pool = pool
+
+    def https_open(self, req):
+        return (self._pool or get_http_pool()).open(req)
+
+
+_pool: Optional[HTTPConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HTTPConnectionPool:
+    """Get or create the process-wide connection pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HTTPConnectionPool(
+                maxsize=getattr(Config, "LLM_HTTP_POOL_MAXSIZE", 4),
+                idle_sec=getattr(Config, "LLM_HTTP_IDLE_SEC", 30.0),
+            )
+        return _pool
+
+
+def build_opener(pool: Optional[HTTPConnectionPool] = None) -> urllib.request.OpenerDirector:
+    """
+    Build the urllib opener used by LLM clients.
+
+    Uses the shared keep-alive pool unless Config.LLM_HTTP_KEEPALIVE is off.
+    """
+    if not getattr(Config, "LLM_HTTP_KEEPALIVE", True):
+        return urllib.request.build_opener(
+            urllib.request.HTTPHandler(debuglevel=0),
+            urllib.request.HTTPSHandler(debuglevel=0)
+        )
+    return urllib.request.build_opener(KeepAliveHTTPHandler(pool), KeepAliveHTTPSHandler(pool))
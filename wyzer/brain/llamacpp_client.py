@@ -4,16 +4,35 @@ HTTP client for llama.cpp server API.
 Provides a similar interface to OllamaClient for llama.cpp server,
 supporting both the native /completion endpoint and OpenAI-compatible
 /v1/chat/completions endpoint.
+
+Prompt caching: every request sets cache_prompt so llama-server reuses the
+KV cache for the prefix shared with the slot's previous prompt, and (when
+the server has several slots) requests passing the same cache_key - one per
+static prompt template, e.g. "normal" or "fastlane" - are pinned to the same
+slot via id_slot, so templates don't keep evicting each other's cached
+prefix. Requests without a cache_key leave slot choice to the server. Cached vs evaluated prompt tokens are
+logged per request and kept in last_usage.
+
+The slot map lives on the client, so callers should keep one client per
+server (the orchestrator does, see _get_llm_client) rather than building one
+per request. A client may be shared across threads.
 """
 import json
+import threading
 import time
 import urllib.request
 import urllib.error
 from typing import Dict, Iterator, Any, Optional, List
 
+from wyzer.brain.http_pool import build_opener
+from wyzer.core.config import Config
 from wyzer.core.logger import get_logger
 
 
+# Distinct cache keys that get a pinned slot; later keys go to the server's choice
+_MAX_SLOT_KEYS = 16
+
+
 class LlamaCppClient:
     """
     Client for llama.cpp server HTTP API.
@@ -27,7 +46,9 @@ class LlamaCppClient:
     def __init__(
         self,
         base_url: str = "http://127.0.0.1:8081",
-        timeout: int = 30
+        timeout: int = 30,
+        cache_prompt: Optional[bool] = None,
+        slot_affinity: Optional[bool] = None
     ):
         """
         Initialize llama.cpp HTTP client.
@@ -35,19 +56,39 @@ class LlamaCppClient:
         Args:
             base_url: Server base URL (e.g., http://127.0.0.1:8081)
             timeout: Default timeout for requests in seconds
+            cache_prompt: Ask the server to reuse cached prompt prefixes (default: Config)
+            slot_affinity: Pin requests with the same cache_key to one slot (default: Config)
         """
         self.logger = get_logger()
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         
-        # Build a reusable opener with connection pooling support
-        self.opener = urllib.request.build_opener(
-            urllib.request.HTTPHandler(debuglevel=0),
-            urllib.request.HTTPSHandler(debuglevel=0)
-        )
+        # Opener backed by the brain-wide keep-alive connection pool, so
+        # generate/stream/ping reuse TCP connections across requests
+        self.opener = build_opener()
         
         # Track which endpoint style is supported (auto-detected on first call)
         self._use_openai_compat: Optional[bool] = None
+        
+        # KV-cache reuse
+        self.cache_prompt = getattr(Config, "LLAMACPP_CACHE_PROMPT", True) if cache_prompt is None else cache_prompt
+        self.slot_affinity = getattr(Config, "LLAMACPP_SLOT_AFFINITY", True) if slot_affinity is None else slot_affinity
+        self._total_slots: Optional[int] = None
+        self._prefix_slots: Dict[str, int] = {}
+        self._slots_lock = threading.Lock()
+        
+        # Token accounting for the most recent request (see _record_usage),
+        # per thread since a client is shared by concurrent callers
+        self._local = threading.local()
+    
+    @property
+    def last_usage(self) -> Optional[Dict[str, Any]]:
+        """Token accounting of this thread's most recent request."""
+        return getattr(self._local, "usage", None)
+    
+    @last_usage.setter
+    def last_usage(self, usage: Optional[Dict[str, Any]]) -> None:
+        self._local.usage = usage
     
     def ping(self) -> bool:
         """
@@ -83,6 +124,100 @@ class LlamaCppClient:
             self.logger.debug(f"llama.cpp ping failed: {e}")
             return False
     
+    def _get_total_slots(self) -> int:
+        """Number of server slots (from /props), 1 if unknown."""
+        if self._total_slots is None:
+            self._total_slots = 1
+            try:
+                req = urllib.request.Request(f"{self.base_url}/props", method="GET")
+                with self.opener.open(req, timeout=5) as response:
+                    data = json.loads(response.read().decode('utf-8'))
+                self._total_slots = max(1, int(data.get("total_slots", 1)))
+            except Exception:
+                pass
+        return self._total_slots
+    
+    def _slot_for(self, cache_key: Optional[str]) -> Optional[int]:
+        """Slot for this prompt template, or None to let the server pick."""
+        if not self.slot_affinity or not cache_key:
+            return None
+        total = self._get_total_slots()
+        if total <= 1:
+            return None
+        with self._slots_lock:
+            slot = self._prefix_slots.get(cache_key)
+            if slot is None:
+                if len(self._prefix_slots) >= _MAX_SLOT_KEYS:
+                    return None
+                slot = len(self._prefix_slots) % total
+                self._prefix_slots[cache_key] = slot
+        return slot
+    
+    def _cache_params(self, cache_key: Optional[str]) -> Dict[str, Any]:
+        """cache_prompt / id_slot fields for a request payload."""
+        params: Dict[str, Any] = {}
+        if self.cache_prompt:
+            params["cache_prompt"] = True
+            slot = self._slot_for(cache_key)
+            if slot is not None:
+                params["id_slot"] = slot
+        return params
+    
+    @staticmethod
+    def _parse_usage(data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Extract prompt token accounting from a llama-server response.
+        
+        Native responses carry tokens_evaluated (prompt length) and timings;
+        OpenAI-compat responses carry usage (+ timings on llama-server).
+        timings.prompt_n is the number of prompt tokens actually evaluated,
+        timings.cache_n (newer servers) the number reused from the cache.
+        
+        Returns:
+            Dict with prompt_tokens, cached_tokens, evaluated_tokens,
+            predicted_tokens, prompt_ms; or None if the response has no counts
+        """
+        if not isinstance(data, dict):
+            return None
+        timings = data.get("timings") or {}
+        usage = data.get("usage") or {}
+        
+        prompt_tokens = usage.get("prompt_tokens", data.get("tokens_evaluated"))
+        evaluated = timings.get("prompt_n")
+        cached = timings.get("cache_n")
+        if cached is None:
+            cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+        
+        if prompt_tokens is None and evaluated is not None and cached is not None:
+            prompt_tokens = evaluated + cached
+        if cached is None and prompt_tokens is not None and evaluated is not None:
+            cached = max(0, prompt_tokens - evaluated)
+        if evaluated is None and prompt_tokens is not None and cached is not None:
+            evaluated = max(0, prompt_tokens - cached)
+        if prompt_tokens is None and evaluated is None:
+            return None
+        
+        return {
+            "prompt_tokens": prompt_tokens,
+            "cached_tokens": cached,
+            "evaluated_tokens": evaluated,
+            "predicted_tokens": timings.get("predicted_n", usage.get("completion_tokens")),
+            "prompt_ms": int(timings.get("prompt_ms", 0) or 0),
+        }
+    
+    def _record_usage(self, data: Dict[str, Any], slot: Optional[int] = None) -> None:
+        """Log and keep cached-vs-evaluated prompt tokens for this request."""
+        usage = self._parse_usage(data)
+        if usage is None:
+            return
+        usage["slot"] = data.get("id_slot", slot)
+        self.last_usage = usage
+        self.logger.info(
+            "[LLAMACPP] prompt_tokens=%s cached=%s evaluated=%s prompt_ms=%s slot=%s",
+            usage["prompt_tokens"], usage["cached_tokens"], usage["evaluated_tokens"],
+            usage["prompt_ms"], usage["slot"],
+        )
+    
     def _detect_endpoint_style(self) -> bool:
         """
         Auto-detect whether the server supports OpenAI-compatible endpoints.
@@ -111,7 +246,8 @@ class LlamaCppClient:
         prompt: str,
         model: Optional[str] = None,
         options: Optional[Dict[str, Any]] = None,
-        stream: bool = False
+        stream: bool = False,
+        cache_key: Optional[str] = None
     ) -> str:
         """
         Generate text from llama.cpp server (non-streaming).
@@ -121,6 +257,7 @@ class LlamaCppClient:
             model: Model name (ignored for llama.cpp, uses loaded model)
             options: Generation options (temperature, top_p, n_ctx, n_predict)
             stream: If True, use streaming internally but return final string
+            cache_key: Name of the static prompt template, for slot affinity
             
         Returns:
             Generated text response
@@ -135,7 +272,7 @@ class LlamaCppClient:
         if stream:
             # Use streaming but accumulate into final string
             result = ""
-            for chunk in self.generate_stream(prompt, model, options):
+            for chunk in self.generate_stream(prompt, model, options, cache_key=cache_key):
                 result += chunk
             return result
         
@@ -146,15 +283,16 @@ class LlamaCppClient:
         start_time = time.time()
         
         if self._use_openai_compat:
-            return self._generate_openai_compat(prompt, options, start_time)
+            return self._generate_openai_compat(prompt, options, start_time, cache_key)
         else:
-            return self._generate_native(prompt, options, start_time)
+            return self._generate_native(prompt, options, start_time, cache_key)
     
     def _generate_native(
         self,
         prompt: str,
         options: Dict[str, Any],
-        start_time: float
+        start_time: float,
+        cache_key: Optional[str] = None
     ) -> str:
         """Generate using native /completion endpoint."""
         try:
@@ -165,6 +303,7 @@ class LlamaCppClient:
                 "top_p": options.get("top_p", 0.9),
                 "n_predict": options.get("num_predict", options.get("n_predict", 128)),
             }
+            payload.update(self._cache_params(cache_key))
             
             # Add optional parameters
             if "num_ctx" in options or "n_ctx" in options:
@@ -187,6 +326,7 @@ class LlamaCppClient:
             
             elapsed_ms = int((time.time() - start_time) * 1000)
             self.logger.debug(f"[LLAMACPP] Generation completed in {elapsed_ms}ms")
+            self._record_usage(response_data, payload.get("id_slot"))
             
             return response_data.get("content", "").strip()
             
@@ -214,7 +354,8 @@ class LlamaCppClient:
         self,
         prompt: str,
         options: Dict[str, Any],
-        start_time: float
+        start_time: float,
+        cache_key: Optional[str] = None
     ) -> str:
         """Generate using OpenAI-compatible /v1/chat/completions endpoint."""
         try:
@@ -228,6 +369,7 @@ class LlamaCppClient:
                 "top_p": options.get("top_p", 0.9),
                 "max_tokens": options.get("num_predict", options.get("n_predict", 128)),
             }
+            payload.update(self._cache_params(cache_key))
             
             req = urllib.request.Request(
                 f"{self.base_url}/v1/chat/completions",
@@ -246,6 +388,7 @@ class LlamaCppClient:
             
             elapsed_ms = int((time.time() - start_time) * 1000)
             self.logger.debug(f"[LLAMACPP] Generation completed in {elapsed_ms}ms")
+            self._record_usage(response_data, payload.get("id_slot"))
             
             # Extract content from OpenAI-format response
             choices = response_data.get("choices", [])
@@ -260,7 +403,7 @@ class LlamaCppClient:
             if e.code == 404:
                 self.logger.warning("[LLAMACPP] OpenAI endpoint not found, falling back to native")
                 self._use_openai_compat = False
-                return self._generate_native(prompt, options, start_time)
+                return self._generate_native(prompt, options, start_time, cache_key)
             
             elapsed_ms = int((time.time() - start_time) * 1000)
             error_body = ""
@@ -285,7 +428,8 @@ class LlamaCppClient:
         self,
         prompt: str,
         model: Optional[str] = None,
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Dict[str, Any]] = None,
+        cache_key: Optional[str] = None
     ) -> Iterator[str]:
         """
         Generate text with streaming.
@@ -295,6 +439,7 @@ class LlamaCppClient:
             prompt: Input prompt text
             model: Model name (ignored, uses loaded model)
             options: Generation options
+            cache_key: Name of the static prompt template, for slot affinity
             
         Yields:
             Text chunks/tokens as they arrive from the model
@@ -314,15 +459,16 @@ class LlamaCppClient:
         first_token_time = None
         
         if self._use_openai_compat:
-            yield from self._generate_stream_openai_compat(prompt, options, start_time)
+            yield from self._generate_stream_openai_compat(prompt, options, start_time, cache_key)
         else:
-            yield from self._generate_stream_native(prompt, options, start_time)
+            yield from self._generate_stream_native(prompt, options, start_time, cache_key)
     
     def _generate_stream_native(
         self,
         prompt: str,
         options: Dict[str, Any],
-        start_time: float
+        start_time: float,
+        cache_key: Optional[str] = None
     ) -> Iterator[str]:
         """Stream using native /completion endpoint."""
         first_token_time = None
@@ -335,6 +481,7 @@ class LlamaCppClient:
                 "top_p": options.get("top_p", 0.9),
                 "n_predict": options.get("num_predict", options.get("n_predict", 128)),
             }
+            payload.update(self._cache_params(cache_key))
             
             req = urllib.request.Request(
                 f"{self.base_url}/completion",
@@ -377,6 +524,8 @@ class LlamaCppClient:
                         yield content
                     
                     if data.get("stop", False):
+                        # Final chunk carries timings / token counts
+                        self._record_usage(data, payload.get("id_slot"))
                         break
             
             elapsed_ms = int((time.time() - start_time) * 1000)
@@ -400,7 +549,8 @@ class LlamaCppClient:
         self,
         prompt: str,
         options: Dict[str, Any],
-        start_time: float
+        start_time: float,
+        cache_key: Optional[str] = None
     ) -> Iterator[str]:
         """Stream using OpenAI-compatible /v1/chat/completions endpoint."""
         first_token_time = None
@@ -415,6 +565,7 @@ class LlamaCppClient:
                 "top_p": options.get("top_p", 0.9),
                 "max_tokens": options.get("num_predict", options.get("n_predict", 128)),
             }
+            payload.update(self._cache_params(cache_key))
             
             req = urllib.request.Request(
                 f"{self.base_url}/v1/chat/completions",
@@ -460,8 +611,9 @@ class LlamaCppClient:
                         if content:
                             yield content
                         
-                        # Check for stop
+                        # Check for stop (llama-server attaches timings to the final chunk)
                         if choices[0].get("finish_reason"):
+                            self._record_usage(data, payload.get("id_slot"))
                             break
             
             elapsed_ms = int((time.time() - start_time) * 1000)
@@ -472,7 +624,7 @@ class LlamaCppClient:
             if e.code == 404:
                 self.logger.warning("[LLAMACPP] OpenAI stream endpoint not found, falling back to native")
                 self._use_openai_compat = False
-                yield from self._generate_stream_native(prompt, options, start_time)
+                yield from self._generate_stream_native(prompt, options, start_time, cache_key)
                 return
             
             elapsed_ms = int((time.time() - start_time) * 1000)
@@ -492,7 +644,8 @@ class LlamaCppClient:
         self,
         messages: List[Dict[str, str]],
         options: Optional[Dict[str, Any]] = None,
-        stream: bool = False
+        stream: bool = False,
+        cache_key: Optional[str] = None
     ) -> str:
         """
         Generate text from a chat messages array.
@@ -501,6 +654,7 @@ class LlamaCppClient:
             messages: List of message dicts with 'role' and 'content'
             options: Generation options
             stream: Whether to use streaming internally
+            cache_key: Name of the static prompt template, for slot affinity
             
         Returns:
             Generated text response
@@ -514,11 +668,11 @@ class LlamaCppClient:
             self._use_openai_compat = self._detect_endpoint_style()
         
         if self._use_openai_compat:
-            return self._generate_chat_openai(messages, options, stream)
+            return self._generate_chat_openai(messages, options, stream, cache_key)
         else:
             # Flatten to prompt for native endpoint
             prompt = self._flatten_messages_to_prompt(messages)
-            return self.generate(prompt, options=options, stream=stream)
+            return self.generate(prompt, options=options, stream=stream, cache_key=cache_key)
     
     def _flatten_messages_to_prompt(self, messages: List[Dict[str, str]]) -> str:
         """Convert chat messages to a flat prompt string."""
@@ -541,7 +695,8 @@ class LlamaCppClient:
         self,
         messages: List[Dict[str, str]],
         options: Dict[str, Any],
-        stream: bool
+        stream: bool,
+        cache_key: Optional[str] = None
     ) -> str:
         """Generate using OpenAI chat format directly."""
         start_time = time.time()
@@ -554,6 +709,7 @@ class LlamaCppClient:
                 "top_p": options.get("top_p", 0.9),
                 "max_tokens": options.get("num_predict", options.get("n_predict", 128)),
             }
+            payload.update(self._cache_params(cache_key))
             
             req = urllib.request.Request(
                 f"{self.base_url}/v1/chat/completions",
@@ -580,12 +736,15 @@ class LlamaCppClient:
                             if choices:
                                 delta = choices[0].get("delta", {})
                                 result += delta.get("content", "")
+                                if choices[0].get("finish_reason"):
+                                    self._record_usage(data, payload.get("id_slot"))
                         except json.JSONDecodeError:
                             continue
                 return result.strip()
             else:
                 with self.opener.open(req, timeout=self.timeout) as response:
                     response_data = json.loads(response.read().decode('utf-8'))
+                self._record_usage(response_data, payload.get("id_slot"))
                 
                 choices = response_data.get("choices", [])
                 if choices:
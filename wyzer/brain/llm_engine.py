@@ -446,7 +446,8 @@ class LLMEngine:
                     prompt=compacted_prompt,
                     model=self.model,
                     options=options,
-                    stream=use_stream
+                    stream=use_stream,
+                    cache_key="fastlane" if prompt_path_used == "FAST_LANE" else "chat"
                 ).strip()
             except ValueError as e:
                 # Model not found or invalid response
@@ -510,12 +511,14 @@ class LLMEngine:
         """
         Build internal messages[] representation for the prompt.
         
-        This assembles the conversation context in a structured way:
+        This assembles the conversation context in a structured way,
+        static first and most volatile last so consecutive prompts share a
+        reusable KV-cache prefix:
         1. System prompt (persona, instructions)
-        2. Session context (if available)
-        3. Promoted memory (if enabled)
-        4. Redaction block (if any facts forgotten)
-        5. All memories (if use_memories flag is on)
+        2. Promoted memory (if enabled)
+        3. Redaction block (if any facts forgotten)
+        4. All memories (if use_memories flag is on)
+        5. Session context (if available; changes every turn)
         6. User message
         
         NOTE: This is internal only; Ollama receives a flattened string.
@@ -539,26 +542,26 @@ class LLMEngine:
         # 1. Core system prompt (always included)
         builder.system(SYSTEM_PROMPT)
         
-        # 2. Session context (conversation history from RAM)
-        session_block = get_session_context_block()
-        if session_block:
-            builder.system(session_block)
-        
-        # 3. Promoted memory context (user-approved long-term memory)
+        # 2. Promoted memory context (user-approved long-term memory)
         promoted_block = get_promoted_memory_block()
         if promoted_block:
             builder.system(promoted_block)
         
-        # 4. Redaction block (forgotten facts LLM should not use)
+        # 3. Redaction block (forgotten facts LLM should not use)
         redaction_block = get_redaction_block()
         if redaction_block:
             builder.system(redaction_block)
         
-        # 5. All memories block (when use_memories flag is enabled)
+        # 4. All memories block (when use_memories flag is enabled)
         all_memories_block = get_all_memories_block()
         if all_memories_block:
             builder.system(all_memories_block)
         
+        # 5. Session context (conversation history from RAM)
+        session_block = get_session_context_block()
+        if session_block:
+            builder.system(session_block)
+        
         # 6. User message (the actual user input)
         builder.user(user_text)
         
@@ -741,7 +744,8 @@ class LLMEngine:
             token_stream = self.client.generate_stream(
                 prompt=compacted_prompt,
                 model=self.model,
-                options=options
+                options=options,
+                cache_key="chat"
             )
             
             # Process stream: emit TTS segments, accumulate full reply
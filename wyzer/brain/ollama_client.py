@@ -7,6 +7,7 @@ import time
 import urllib.request
 import urllib.error
 from typing import Dict, Iterator, Any, Optional
+from wyzer.brain.http_pool import build_opener
 from wyzer.core.logger import get_logger
 
 
@@ -29,12 +30,9 @@ class OllamaClient:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         
-        # Build a reusable opener with connection pooling support
-        # This helps with keep-alive and connection reuse across requests
-        self.opener = urllib.request.build_opener(
-            urllib.request.HTTPHandler(debuglevel=0),
-            urllib.request.HTTPSHandler(debuglevel=0)
-        )
+        # Opener backed by the brain-wide keep-alive connection pool, so
+        # generate/stream/ping reuse TCP connections across requests
+        self.opener = build_opener()
     
     def ping(self) -> bool:
         """
@@ -64,7 +62,8 @@ class OllamaClient:
         prompt: str,
         model: str,
         options: Optional[Dict[str, Any]] = None,
-        stream: bool = False
+        stream: bool = False,
+        cache_key: Optional[str] = None
     ) -> str:
         """
         Generate text from Ollama (non-streaming).
@@ -74,6 +73,7 @@ class OllamaClient:
             model: Model name to use
             options: Generation options (temperature, top_p, num_ctx, num_predict, etc.)
             stream: If True, use streaming endpoint (but still returns final string)
+            cache_key: Prompt template name (llama.cpp slot affinity; unused by Ollama)
         
         Returns:
             Generated text response
@@ -154,7 +154,8 @@ class OllamaClient:
         self,
         prompt: str,
         model: str,
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Dict[str, Any]] = None,
+        cache_key: Optional[str] = None
     ) -> Iterator[str]:
         """
         Generate text from Ollama with streaming.
@@ -164,6 +165,7 @@ class OllamaClient:
             prompt: Input prompt text
             model: Model name to use
             options: Generation options
+            cache_key: Prompt template name (llama.cpp slot affinity; unused by Ollama)
             
         Yields:
             Text chunks/tokens as they arrive from the model
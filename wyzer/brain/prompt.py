@@ -243,37 +243,40 @@ def build_prompt_messages(
     # 1. Core system prompt (always included)
     builder.system(SYSTEM_PROMPT)
     
-    # 2. Session context (conversation history from RAM)
-    if include_session_context:
-        session_block = get_session_context_block()
-        if session_block:
-            builder.system(session_block)
+    # Context blocks follow in order of volatility (session history last) so
+    # consecutive prompts share the longest possible cacheable prefix
     
-    # 3. Promoted memory context (user-approved long-term memory)
+    # 2. Promoted memory context (user-approved long-term memory)
     if include_promoted_memory:
         promoted_block = get_promoted_memory_block()
         if promoted_block:
             builder.system(promoted_block)
     
-    # 4. Redaction block (forgotten facts LLM should not use)
+    # 3. Redaction block (forgotten facts LLM should not use)
     if include_redaction:
         redaction_block = get_redaction_block()
         if redaction_block:
             builder.system(redaction_block)
     
-    # 5. Smart memories block (deterministic: pinned + mention-triggered)
+    # 4. Smart memories block (deterministic: pinned + mention-triggered)
     # This is ALWAYS checked - uses user_input for mention detection
     smart_memories_block = get_smart_memories_block(user_input)
     if smart_memories_block:
         builder.system(smart_memories_block)
     
-    # 6. All memories block (when "use memories" flag is explicitly enabled)
+    # 5. All memories block (when "use memories" flag is explicitly enabled)
     # This adds ALL remaining memories on top of the smart selection
     if include_all_memories:
         all_memories_block = get_all_memories_block()
         if all_memories_block:
             builder.system(all_memories_block)
     
+    # 6. Session context (conversation history from RAM)
+    if include_session_context:
+        session_block = get_session_context_block()
+        if session_block:
+            builder.system(session_block)
+    
     # 7. User message (the actual user input)
     builder.user(user_input)
     
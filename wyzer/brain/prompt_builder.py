@@ -239,6 +239,12 @@ class PromptBuilder:
     Modes:
     - "normal": Full prompt with context and examples
     - "compact": Minimal prompt when budget exceeded
+    
+    Layout is prefix-stable: static text (system prompt, tool manifest,
+    examples) comes first and per-request blocks follow, least volatile
+    first, with the user turn last. Consecutive requests then share a long
+    common prefix that llama.cpp / Ollama can reuse from their KV cache
+    instead of re-evaluating it.
     """
     
     def __init__(
@@ -295,14 +301,8 @@ class PromptBuilder:
         """Build normal mode prompt."""
         components = ["system"]
         
-        # Start with system prompt
-        parts = [NORMAL_SYSTEM_PROMPT]
-        
-        # Add session context (limit to 3 turns in normal mode)
-        session = self._truncate_session_context(self.session_context, max_turns=3)
-        if session:
-            parts.append(f"\n--- Recent conversation ---\n{session}\n---")
-            components.append(f"history({self._count_turns(session)})")
+        # Static prefix: system prompt + tool manifest, then examples
+        parts = [NORMAL_SYSTEM_PROMPT, self._get_minimal_examples()]
         
         # Add promoted context (user-approved memories)
         if self.promoted_context:
@@ -324,6 +324,12 @@ class PromptBuilder:
                 parts.append(memories)
                 components.append(f"memories({self._count_memory_items(memories)})")
         
+        # Add session context (limit to 3 turns in normal mode); changes every turn
+        session = self._truncate_session_context(self.session_context, max_turns=3)
+        if session:
+            parts.append(f"\n--- Recent conversation ---\n{session}\n---")
+            components.append(f"history({self._count_turns(session)})")
+        
         # Phase 9: Add visual context (screen awareness) - always informational, read-only
         if self.visual_context and self.visual_context.strip():
             # Cap to 200 chars to keep prompt lean
@@ -331,9 +337,6 @@ class PromptBuilder:
             parts.append(visual)
             components.append("visual")
         
-        # Add minimal examples (just 2)
-        parts.append(self._get_minimal_examples())
-        
         # Add user input
         parts.append(f"\nUser: {self.user_text}\n\nYour response (JSON only):")
         
@@ -345,6 +348,9 @@ class PromptBuilder:
         
         parts = [COMPACT_SYSTEM_PROMPT]
         
+        # Single format reminder instead of examples (static, so before history)
+        parts.append('\nFormat: {{"reply": "text"}} or {{"intents": [...], "reply": "text"}}')
+        
         # Only last 2 turns of session context
         session = self._truncate_session_context(self.session_context, max_turns=2)
         if session:
@@ -353,9 +359,6 @@ class PromptBuilder:
         
         # Skip promoted/redaction/memories in compact mode
         
-        # Single format reminder instead of examples
-        parts.append('\nFormat: {{"reply": "text"}} or {{"intents": [...], "reply": "text"}}')
-        
         # User input
         parts.append(f"\nUser: {self.user_text}\n\nJSON:")
         
@@ -19,11 +19,13 @@ This module is intentionally simple and deterministic.
 
 from __future__ import annotations
 
+import itertools
 import threading
 import time
 from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Deque, Dict, List, Optional, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from wyzer.policy.autonomy_policy import AutonomyDecision
@@ -191,6 +193,91 @@ class LastAutonomyDecision:
         }
 
 
+# Version stamps of window snapshots (unique and increasing across clears)
+_window_versions = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class WindowStateSnapshot:
+    """
+    Phase 12 - Immutable window watcher state, swapped in as a whole.
+    
+    The watcher publishes a new snapshot per poll instead of mutating the
+    state in place, so readers can keep a reference and iterate it without
+    copying or holding _world_state_lock, and all fields always come from
+    the same poll. Window/event records are shared, not copied: treat them
+    as read-only.
+    
+    Fields:
+        version: Increases with every new snapshot (0 = never published);
+            compare versions to check cheaply whether anything changed
+        open_windows: All open windows
+        windows_by_monitor: Windows grouped by monitor index (1..N)
+        focused_window: Currently focused window record
+        recent_events: Recent window change events (newest last)
+        ts: Timestamp of the watcher poll
+        detected_monitor_count: Number of monitors detected by WindowWatcher
+    """
+    version: int = 0
+    open_windows: Tuple[Dict[str, Any], ...] = ()
+    windows_by_monitor: Mapping[int, Tuple[Dict[str, Any], ...]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    focused_window: Optional[Dict[str, Any]] = None
+    recent_events: Tuple[Dict[str, Any], ...] = ()
+    ts: float = 0.0
+    detected_monitor_count: int = 1
+    
+    @classmethod
+    def build(
+        cls,
+        open_windows: Any = (),
+        windows_by_monitor: Optional[Mapping[int, Any]] = None,
+        focused_window: Optional[Dict[str, Any]] = None,
+        recent_events: Any = (),
+        ts: float = 0.0,
+        detected_monitor_count: int = 1,
+    ) -> "WindowStateSnapshot":
+        """Freeze watcher output into a new snapshot with the next version."""
+        by_monitor = {k: tuple(v) for k, v in (windows_by_monitor or {}).items()}
+        return cls(
+            version=next(_window_versions),
+            open_windows=tuple(open_windows),
+            windows_by_monitor=MappingProxyType(by_monitor),
+            focused_window=focused_window or None,
+            recent_events=tuple(recent_events),
+            ts=ts,
+            detected_monitor_count=max(1, detected_monitor_count),
+        )
+    
+    def replace(self, **changes: Any) -> "WindowStateSnapshot":
+        """New snapshot (next version) with some fields changed."""
+        fields = {
+            "open_windows": self.open_windows,
+            "windows_by_monitor": self.windows_by_monitor,
+            "focused_window": self.focused_window,
+            "recent_events": self.recent_events,
+            "ts": self.ts,
+            "detected_monitor_count": self.detected_monitor_count,
+        }
+        fields.update(changes)
+        return WindowStateSnapshot.build(**fields)
+
+
+def _window_state_field(name: str) -> property:
+    """WorldState attribute reading through to the current window snapshot.
+    
+    Assigning it swaps in a new snapshot (legacy writers and tests).
+    """
+    def _get(self: "WorldState") -> Any:
+        return getattr(self.window_state, name)
+    
+    def _set(self: "WorldState", value: Any) -> None:
+        self.window_state = self.window_state.replace(**{name: value})
+    
+    return property(_get, _set)
+
+
 @dataclass
 class WorldState:
     """
@@ -220,11 +307,10 @@ class WorldState:
         last_autonomy_decision: Last autonomy policy decision for "why" command
         
         # Phase 12 - Window Watcher fields (Multi-Monitor Awareness)
-        open_windows: Snapshot of all open windows
-        windows_by_monitor: Windows grouped by monitor index (1..N)
-        focused_window: Currently focused window record
-        recent_window_events: Ring buffer of recent changes
-        last_window_snapshot_ts: Timestamp of last window snapshot
+        window_state: Immutable WindowStateSnapshot of the last watcher poll;
+            open_windows, windows_by_monitor, focused_window,
+            recent_window_events, last_window_snapshot_ts and
+            detected_monitor_count read through to it
         last_active_window_ts: Timestamp when last_active_window was last updated
     """
     last_tool: Optional[str] = None
@@ -247,13 +333,8 @@ class WorldState:
     pending_confirmation: Optional[PendingConfirmation] = None
     last_autonomy_decision: Optional[LastAutonomyDecision] = None
     
-    # Phase 12 - Window Watcher fields
-    open_windows: List[Dict[str, Any]] = field(default_factory=list)
-    windows_by_monitor: Dict[int, List[Dict[str, Any]]] = field(default_factory=dict)
-    focused_window: Optional[Dict[str, Any]] = None
-    recent_window_events: List[Dict[str, Any]] = field(default_factory=list)
-    last_window_snapshot_ts: float = 0.0
-    detected_monitor_count: int = 1  # Actual number of monitors detected by WindowWatcher
+    # Phase 12 - Window Watcher fields (replaced per poll, never mutated)
+    window_state: WindowStateSnapshot = field(default_factory=WindowStateSnapshot)
     
     # Focus stack for deterministic app switching (switch_app tool)
     # Ordered by actual focus changes, most recent first, no consecutive duplicates
@@ -262,6 +343,14 @@ class WorldState:
     # Current position in focus_stack for "next app" cycling (round-robin)
     focus_stack_index: int = 0
     
+    # Phase 12 - Views of window_state
+    open_windows = _window_state_field("open_windows")
+    windows_by_monitor = _window_state_field("windows_by_monitor")
+    focused_window = _window_state_field("focused_window")
+    recent_window_events = _window_state_field("recent_events")
+    last_window_snapshot_ts = _window_state_field("ts")
+    detected_monitor_count = _window_state_field("detected_monitor_count")
+    
     def clear(self) -> None:
         """Reset all state fields."""
         self.last_tool = None
@@ -280,13 +369,8 @@ class WorldState:
         # Don't reset autonomy_mode on clear (user preference)
         self.pending_confirmation = None
         self.last_autonomy_decision = None
-        # Phase 12: Clear window watcher state
-        self.open_windows = []
-        self.windows_by_monitor = {}
-        self.focused_window = None
-        self.recent_window_events = []
-        self.last_window_snapshot_ts = 0.0
-        self.detected_monitor_count = 1
+        # Phase 12: Clear window watcher state (new version, so cached views go stale)
+        self.window_state = WindowStateSnapshot.build()
         # Clear focus stack
         self.focus_stack = deque(maxlen=10)
         self.focus_stack_index = 0
@@ -1191,7 +1275,8 @@ def update_window_watcher_state(
     """
     Update world state with window watcher data.
     
-    Called by the window watcher after each poll cycle.
+    Called by the window watcher after each poll cycle. The lists are
+    frozen into a new WindowStateSnapshot (records are shared, not copied).
     
     Args:
         open_windows: Snapshot of all open windows
@@ -1202,6 +1287,16 @@ def update_window_watcher_state(
     """
     ws = get_world_state()
     
+    # Freeze the poll outside the lock; readers see either the old or the new snapshot
+    snapshot = WindowStateSnapshot.build(
+        open_windows=open_windows,
+        windows_by_monitor=windows_by_monitor,
+        focused_window=focused_window,
+        recent_events=recent_events,
+        ts=time.time(),
+        detected_monitor_count=detected_monitor_count,
+    )
+    
     # Track if focus changed for focus_stack update (done outside the main lock)
     new_focus_app = None
     new_focus_hwnd = None
@@ -1209,7 +1304,8 @@ def update_window_watcher_state(
     
     with _world_state_lock:
         # Check if focus changed before updating
-        old_focus_hwnd = ws.focused_window.get("hwnd") if ws.focused_window else None
+        old_focus = ws.window_state.focused_window
+        old_focus_hwnd = old_focus.get("hwnd") if old_focus else None
         new_hwnd = focused_window.get("hwnd") if focused_window else None
         
         if new_hwnd and new_hwnd != old_focus_hwnd:
@@ -1218,12 +1314,7 @@ def update_window_watcher_state(
             new_focus_hwnd = new_hwnd
             new_focus_title = focused_window.get("title")
         
-        ws.open_windows = list(open_windows)
-        ws.windows_by_monitor = {k: list(v) for k, v in windows_by_monitor.items()}
-        ws.focused_window = dict(focused_window) if focused_window else None
-        ws.recent_window_events = list(recent_events)
-        ws.last_window_snapshot_ts = time.time()
-        ws.detected_monitor_count = max(1, detected_monitor_count)
+        ws.window_state = snapshot
         
         # Also update active_app and active_window_title for Phase 9 compatibility
         if focused_window:
@@ -1235,6 +1326,19 @@ def update_window_watcher_state(
         push_focus_stack(new_focus_app, new_focus_hwnd, new_focus_title or "")
 
 
+def get_window_state() -> WindowStateSnapshot:
+    """
+    Get the current window watcher snapshot.
+    
+    Lock-free and zero-copy: the snapshot is immutable and swapped as a
+    whole, so the caller can hold on to it and read consistent fields.
+    
+    Returns:
+        The latest WindowStateSnapshot
+    """
+    return get_world_state().window_state
+
+
 def get_windows_on_monitor(monitor: int) -> List[Dict[str, Any]]:
     """
     Get windows on a specific monitor.
@@ -1245,9 +1349,7 @@ def get_windows_on_monitor(monitor: int) -> List[Dict[str, Any]]:
     Returns:
         List of window records on that monitor
     """
-    ws = get_world_state()
-    with _world_state_lock:
-        return list(ws.windows_by_monitor.get(monitor, []))
+    return list(get_window_state().windows_by_monitor.get(monitor, ()))
 
 
 def get_focused_window_info() -> Optional[Dict[str, Any]]:
@@ -1257,9 +1359,8 @@ def get_focused_window_info() -> Optional[Dict[str, Any]]:
     Returns:
         Dict with title, process, monitor, etc. or None
     """
-    ws = get_world_state()
-    with _world_state_lock:
-        return dict(ws.focused_window) if ws.focused_window else None
+    focused = get_window_state().focused_window
+    return dict(focused) if focused else None
 
 
 def get_recent_window_events(event_type: Optional[str] = None, limit: int = 5) -> List[Dict[str, Any]]:
@@ -1273,15 +1374,13 @@ def get_recent_window_events(event_type: Optional[str] = None, limit: int = 5) -
     Returns:
         List of event records (newest last)
     """
-    ws = get_world_state()
-    with _world_state_lock:
-        events = list(ws.recent_window_events)
+    events = get_window_state().recent_events
     
     if event_type:
         events = [e for e in events if e.get("type") == event_type]
     
     # Return last N events (newest)
-    return events[-limit:] if len(events) > limit else events
+    return list(events[-limit:] if len(events) > limit else events)
 
 
 def get_all_open_windows() -> List[Dict[str, Any]]:
@@ -1291,9 +1390,7 @@ def get_all_open_windows() -> List[Dict[str, Any]]:
     Returns:
         List of all window records
     """
-    ws = get_world_state()
-    with _world_state_lock:
-        return list(ws.open_windows)
+    return list(get_window_state().open_windows)
 
 
 def get_monitor_count() -> int:
@@ -1306,9 +1403,7 @@ def get_monitor_count() -> int:
     Returns:
         Number of monitors (at least 1)
     """
-    ws = get_world_state()
-    with _world_state_lock:
-        return max(1, ws.detected_monitor_count)
+    return max(1, get_window_state().detected_monitor_count)
 
 
 # ============================================================================
@@ -15,8 +15,7 @@ import sys
 import random
 import numpy as np
 import threading
-import tempfile
-import wave
+from collections import deque
 from queue import Queue, Empty
 from typing import Optional, List, Any, Dict
 from wyzer.core.config import Config
@@ -27,11 +26,11 @@ from wyzer.audio.mic_stream import MicStream
 from wyzer.audio.vad import VadDetector
 from wyzer.audio.hotword import HotwordDetector
 from wyzer.audio.audio_utils import concat_audio_frames
-from wyzer.audio.audio_utils import audio_to_int16
 from wyzer.stt.stt_router import STTRouter
 from wyzer.brain.llm_engine import LLMEngine
 from wyzer.tts.tts_router import TTSRouter
 from wyzer.core.ipc import new_id, safe_put
+from wyzer.core.audio_shm import AudioRing
 from wyzer.core.process_manager import start_brain_process, stop_brain_process
 
 
@@ -510,6 +509,11 @@ class WyzerAssistant:
             should_stop = True
             stop_reason = "no speech after grace period"
         
+        # 4. Max duration limit (buffered frames are capture ring views)
+        if self.state.total_frames_recorded >= Config.get_max_record_frames():
+            should_stop = True
+            stop_reason = "max duration"
+        
         if should_stop:
             self.logger.info(f"FOLLOWUP stopped: {stop_reason}")
             
@@ -662,7 +666,7 @@ class WyzerAssistant:
                 break
         
         if drained_count > 0:
-            self.logger.debug(f"Drained {drained_count} frames from queue")
+            self.logger.debug("Drained %d frames from queue", drained_count)
         
         self.state.transition_to(AssistantState.IDLE)
         
@@ -975,7 +979,7 @@ class WyzerAssistant:
                 break
         
         if drained_count > 0:
-            self.logger.debug(f"Drained {drained_count} frames from queue")
+            self.logger.debug("Drained %d frames from queue", drained_count)
     
     def _clear_bargein_flags(self) -> None:
         """Clear all barge-in related flags"""
@@ -1044,9 +1048,18 @@ class WyzerAssistantMultiprocess:
         # Audio buffer
         self.audio_buffer: List[np.ndarray] = []
 
+        # Streaming STT: audio_buffer frames already sent to the brain while
+        # the user is speaking. A new buffer list means a new utterance.
+        self._stt_stream_id: Optional[str] = None
+        self._stt_stream_buffer: Optional[List[np.ndarray]] = None
+        self._stt_stream_sent_frames: int = 0
+        self._stt_stream_sent_samples: int = 0
+
         # Audio stream
         self.audio_queue: Queue = Queue(maxsize=Config.AUDIO_QUEUE_MAX_SIZE)
         self.mic_stream = MicStream(audio_queue=self.audio_queue, device=audio_device)
+        # Queued frames already scored by the VAD in one pass (see _take_vad_backlog)
+        self._vad_backlog: deque = deque()
 
         # VAD + hotword
         self.vad = VadDetector()
@@ -1064,6 +1077,7 @@ class WyzerAssistantMultiprocess:
         self._brain_proc = None
         self._core_to_brain_q = None
         self._brain_to_core_q = None
+        self._audio_ring: Optional[AudioRing] = None
 
         # Brain speaking flag (driven by worker LOG events)
         self._brain_speaking: bool = False
@@ -1147,6 +1161,16 @@ class WyzerAssistantMultiprocess:
         self.logger.info("Starting Wyzer Assistant (multiprocess)...")
         self.running = True
 
+        # Shared-memory ring for utterance audio (brain attaches by name)
+        if Config.AUDIO_SHM_ENABLED:
+            try:
+                self._audio_ring = AudioRing.create(int(Config.AUDIO_SHM_SECONDS * Config.SAMPLE_RATE))
+                self._brain_config["audio_shm_name"] = self._audio_ring.name
+                self._brain_config["audio_shm_samples"] = self._audio_ring.capacity
+            except Exception as e:
+                self.logger.warning(f"[AUDIO_SHM] Shared audio ring unavailable, sending PCM in queue: {e}")
+                self._audio_ring = None
+
         self._brain_proc, self._core_to_brain_q, self._brain_to_core_q = start_brain_process(self._brain_config)
         
         # Log Core process info
@@ -1197,6 +1221,10 @@ class WyzerAssistantMultiprocess:
         if self._brain_proc and self._core_to_brain_q:
             stop_brain_process(self._brain_proc, self._core_to_brain_q)
 
+        if self._audio_ring is not None:
+            self._audio_ring.close()
+            self._audio_ring = None
+
         self.logger.info("Wyzer Assistant stopped")
 
     def interrupt_current_process(self) -> None:
@@ -1237,6 +1265,10 @@ class WyzerAssistantMultiprocess:
             # Drain brain->core messages first to keep UI/logging snappy
             self._poll_brain_messages()
 
+            if self._vad_backlog:
+                self._dispatch_frame(self._vad_backlog.popleft())
+                continue
+
             try:
                 audio_frame = self.audio_queue.get(timeout=0.05)
             except Empty:
@@ -1255,15 +1287,39 @@ class WyzerAssistantMultiprocess:
                         self._reset_to_idle()
                 continue
 
-            if self.state.is_in_state(AssistantState.IDLE):
-                self._process_idle(audio_frame)
-            elif self.state.is_in_state(AssistantState.LISTENING):
-                self._process_listening(audio_frame)
-            elif self.state.is_in_state(AssistantState.FOLLOWUP):
-                self._process_followup(audio_frame)
-            else:
-                # In multiprocess mode, treat non-listening states like IDLE for hotword/barge-in.
-                self._process_idle(audio_frame)
+            self._take_vad_backlog(audio_frame)
+            self._dispatch_frame(audio_frame)
+
+    def _take_vad_backlog(self, audio_frame: np.ndarray) -> None:
+        """
+        While recording, move frames already queued behind audio_frame (up
+        to VAD_BATCH_MAX_FRAMES in total) to _vad_backlog and score them all
+        in one VAD pass. The main loop processes the backlog before reading
+        the queue again.
+        """
+        if Config.VAD_BATCH_MAX_FRAMES <= 1 or not (
+            self.state.is_in_state(AssistantState.LISTENING)
+            or self.state.is_in_state(AssistantState.FOLLOWUP)
+        ):
+            return
+        while len(self._vad_backlog) < Config.VAD_BATCH_MAX_FRAMES - 1:
+            try:
+                self._vad_backlog.append(self.audio_queue.get_nowait())
+            except Empty:
+                break
+        if self._vad_backlog:
+            self.vad.prime([audio_frame, *self._vad_backlog])
+
+    def _dispatch_frame(self, audio_frame: np.ndarray) -> None:
+        if self.state.is_in_state(AssistantState.IDLE):
+            self._process_idle(audio_frame)
+        elif self.state.is_in_state(AssistantState.LISTENING):
+            self._process_listening(audio_frame)
+        elif self.state.is_in_state(AssistantState.FOLLOWUP):
+            self._process_followup(audio_frame)
+        else:
+            # In multiprocess mode, treat non-listening states like IDLE for hotword/barge-in.
+            self._process_idle(audio_frame)
 
     def _emit_core_heartbeat(self) -> None:
         """Emit Core process health heartbeat for runtime verification"""
@@ -1279,7 +1335,13 @@ class WyzerAssistantMultiprocess:
             f"q_in={queue_size_in} q_out={queue_size_out} "
             f"time_in_state={self.state.get_time_in_current_state():.1f}s"
         )
-        
+        if self.hotword is not None:
+            stats = self.hotword.get_stats()
+            self.logger.debug(
+                f"[HOTWORD] frames={stats['frames']} gated={stats['gated']} scored={stats['scored']} "
+                f"avg_predict_ms={stats['avg_predict_ms']:.2f} max_predict_ms={stats['max_predict_ms']:.2f}"
+            )
+
         # Phase 11: Passive expiry check for pending confirmations
         # This ensures confirmations expire even if user never speaks again
         from wyzer.policy.pending_confirmation import check_passive_expiry
@@ -1347,18 +1409,20 @@ class WyzerAssistantMultiprocess:
                         self._confirmation_audio_buffer = []
                         self._confirmation_total_frames = 0
                         return
+                
+                # Max duration limit for confirmation, checked after every frame
+                # (continuous speech too): buffered frames are views into the
+                # capture ring, which only covers MAX_RECORD_SECONDS of them
+                if self._confirmation_listening and self._confirmation_total_frames >= Config.get_max_record_frames():
+                    self.logger.info("[CONFIRM] max duration reached, sending to brain")
+                    self._send_confirmation_audio_to_brain()
                     
-                    # Max duration limit for confirmation
-                    if self._confirmation_total_frames >= Config.get_max_record_frames():
-                        self.logger.info("[CONFIRM] max duration reached, sending to brain")
-                        self._send_confirmation_audio_to_brain()
-                        
-                        self._confirmation_listening = False
-                        self._confirmation_speech_detected = False
-                        self._confirmation_silence_frames = 0
-                        self._confirmation_audio_buffer = []
-                        self._confirmation_total_frames = 0
-                        return
+                    self._confirmation_listening = False
+                    self._confirmation_speech_detected = False
+                    self._confirmation_silence_frames = 0
+                    self._confirmation_audio_buffer = []
+                    self._confirmation_total_frames = 0
+                    return
         
         # =====================================================================
         # NORMAL HOTWORD DETECTION
@@ -1461,6 +1525,8 @@ class WyzerAssistantMultiprocess:
             if self.state.speech_detected:
                 self.state.silence_frames += 1
 
+        self._stream_audio_to_brain()
+
         should_stop = False
         stop_reason = ""
         
@@ -1560,6 +1626,8 @@ class WyzerAssistantMultiprocess:
             if self.state.speech_detected:
                 self.state.silence_frames += 1
 
+        self._stream_audio_to_brain()
+
         should_stop = False
         stop_reason = ""
         
@@ -1608,6 +1676,64 @@ class WyzerAssistantMultiprocess:
             # In no-hotword mode, wait for RESULT then exit after TTS completes.
             self.state.transition_to(AssistantState.IDLE)
 
+    def _audio_payload(self, audio_data: np.ndarray) -> Dict[str, Any]:
+        """
+        Build the audio fields of an AUDIO request.
+        
+        Audio goes into the shared-memory ring when available, so only
+        offset/length cross the queue. Otherwise (ring disabled/unavailable,
+        or utterance longer than the ring) the float32 PCM is sent inline.
+        """
+        audio = np.ascontiguousarray(audio_data, dtype=np.float32)
+        if self._audio_ring is not None:
+            slot = self._audio_ring.write(audio)
+            if slot is not None:
+                offset, length = slot
+                return {"wav_path": None, "pcm_bytes": None, "shm_offset": offset, "shm_length": length}
+            self.logger.warning(f"[AUDIO_SHM] {len(audio)} samples exceed ring capacity, sending PCM in queue")
+        return {"wav_path": None, "pcm_bytes": audio.tobytes()}
+
+    def _stream_audio_to_brain(self) -> None:
+        """
+        Send newly captured frames of the current utterance to the brain.
+        
+        Once speech has started, every STT_STREAM_CHUNK_SEC of audio is sent
+        as an AUDIO_STREAM message so the brain can transcribe while the user
+        is still speaking. Chunks are consecutive slices of audio_buffer, so
+        the final AUDIO request (the whole buffer) extends what was streamed.
+        """
+        if not Config.STT_STREAMING or not self._core_to_brain_q or not self.state.speech_detected:
+            return
+        if self._stt_stream_buffer is not self.audio_buffer:
+            self._stt_stream_buffer = self.audio_buffer
+            self._stt_stream_id = new_id()
+            self._stt_stream_sent_frames = 0
+            self._stt_stream_sent_samples = 0
+
+        pending = self.audio_buffer[self._stt_stream_sent_frames:]
+        if sum(len(frame) for frame in pending) < Config.STT_STREAM_CHUNK_SEC * Config.SAMPLE_RATE:
+            return
+        chunk = concat_audio_frames(pending)
+        safe_put(
+            self._core_to_brain_q,
+            {
+                "type": "AUDIO_STREAM",
+                "stream_id": self._stt_stream_id,
+                "offset": self._stt_stream_sent_samples,
+                "sample_rate": Config.SAMPLE_RATE,
+                **self._audio_payload(chunk),
+            },
+        )
+        self._stt_stream_sent_frames += len(pending)
+        self._stt_stream_sent_samples += len(chunk)
+
+    def _take_stt_stream_id(self) -> Optional[str]:
+        """Stream id of the utterance in audio_buffer (if any was streamed)."""
+        stream_id = self._stt_stream_id if self._stt_stream_buffer is self.audio_buffer else None
+        self._stt_stream_buffer = None
+        self._stt_stream_id = None
+        return stream_id
+
     def _send_audio_to_brain_followup(self) -> None:
         """Send audio to brain worker in FOLLOWUP mode"""
         if not self._core_to_brain_q:
@@ -1615,43 +1741,23 @@ class WyzerAssistantMultiprocess:
             return
 
         self._clear_bargein_flags()
+        stream_id = self._take_stt_stream_id()
         audio_data = concat_audio_frames(self.audio_buffer)
         self.audio_buffer = []
 
-        # Save to temp WAV (keeps IPC lightweight on slow PCs)
-        wav_path = None
-        try:
-            fd, wav_path = tempfile.mkstemp(prefix="wyzer_", suffix=".wav")
-            try:
-                os.close(fd)
-            except Exception:
-                pass
-            int16_audio = audio_to_int16(audio_data)
-            with wave.open(wav_path, "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(Config.SAMPLE_RATE)
-                wf.writeframes(int16_audio.tobytes())
-        except Exception as e:
-            self.logger.error(f"Failed to write temp WAV: {e}")
-            try:
-                if wav_path:
-                    os.unlink(wav_path)
-            except Exception:
-                pass
-            return
-
         req_id = new_id()
         # Mark as followup so orchestrator can handle exit phrases
+        meta: Dict[str, Any] = {"is_followup": True, "followup_chain": self.followup_manager.get_chain_count()}
+        if stream_id:
+            meta["stt_stream_id"] = stream_id
         safe_put(
             self._core_to_brain_q,
             {
                 "type": "AUDIO",
                 "id": req_id,
-                "wav_path": wav_path,
-                "pcm_bytes": None,
                 "sample_rate": Config.SAMPLE_RATE,
-                "meta": {"is_followup": True, "followup_chain": self.followup_manager.get_chain_count()},
+                **self._audio_payload(audio_data),
+                "meta": meta,
             },
         )
 
@@ -1661,42 +1767,19 @@ class WyzerAssistantMultiprocess:
             return
 
         self._clear_bargein_flags()
+        stream_id = self._take_stt_stream_id()
         audio_data = concat_audio_frames(self.audio_buffer)
         self.audio_buffer = []
 
-        # Save to temp WAV (keeps IPC lightweight on slow PCs)
-        wav_path = None
-        try:
-            fd, wav_path = tempfile.mkstemp(prefix="wyzer_", suffix=".wav")
-            try:
-                os.close(fd)
-            except Exception:
-                pass
-            int16_audio = audio_to_int16(audio_data)
-            with wave.open(wav_path, "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(Config.SAMPLE_RATE)
-                wf.writeframes(int16_audio.tobytes())
-        except Exception as e:
-            self.logger.error(f"Failed to write temp WAV: {e}")
-            try:
-                if wav_path:
-                    os.unlink(wav_path)
-            except Exception:
-                pass
-            return
-
         req_id = new_id()
         safe_put(
             self._core_to_brain_q,
             {
                 "type": "AUDIO",
                 "id": req_id,
-                "wav_path": wav_path,
-                "pcm_bytes": None,
                 "sample_rate": Config.SAMPLE_RATE,
-                "meta": {},
+                **self._audio_payload(audio_data),
+                "meta": {"stt_stream_id": stream_id} if stream_id else {},
             },
         )
 
@@ -1718,38 +1801,14 @@ class WyzerAssistantMultiprocess:
         audio_data = concat_audio_frames(self._confirmation_audio_buffer)
         self._confirmation_audio_buffer = []
 
-        # Save to temp WAV
-        wav_path = None
-        try:
-            fd, wav_path = tempfile.mkstemp(prefix="wyzer_confirm_", suffix=".wav")
-            try:
-                os.close(fd)
-            except Exception:
-                pass
-            int16_audio = audio_to_int16(audio_data)
-            with wave.open(wav_path, "wb") as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(Config.SAMPLE_RATE)
-                wf.writeframes(int16_audio.tobytes())
-        except Exception as e:
-            self.logger.error(f"[CONFIRM] Failed to write temp WAV: {e}")
-            try:
-                if wav_path:
-                    os.unlink(wav_path)
-            except Exception:
-                pass
-            return
-
         req_id = new_id()
         safe_put(
             self._core_to_brain_q,
             {
                 "type": "AUDIO",
                 "id": req_id,
-                "wav_path": wav_path,
-                "pcm_bytes": None,
                 "sample_rate": Config.SAMPLE_RATE,
+                **self._audio_payload(audio_data),
                 "meta": {
                     "is_confirmation_response": True,  # Flag for brain to prioritize confirmation check
                 },
@@ -1969,12 +2028,15 @@ class WyzerAssistantMultiprocess:
     def _drain_audio_queue(self, duration_sec: float) -> None:
         drain_frames = int(duration_sec * Config.SAMPLE_RATE / Config.CHUNK_SAMPLES)
         for _ in range(drain_frames):
-            try:
-                frame = self.audio_queue.get_nowait()
-                if self.hotword:
-                    self.hotword.detect(frame)
-            except Empty:
-                break
+            if self._vad_backlog:
+                frame = self._vad_backlog.popleft()
+            else:
+                try:
+                    frame = self.audio_queue.get_nowait()
+                except Empty:
+                    break
+            if self.hotword:
+                self.hotword.detect(frame)
 
     def _clear_bargein_flags(self) -> None:
         if self._bargein_pending_speech:
@@ -0,0 +1,120 @@
+"""wyzer.core.audio_shm
+
+Shared-memory ring buffer for handing utterance audio from the realtime
+core to the brain worker.
+
+The core process creates the segment and is its only writer. Each AUDIO
+request carries the absolute sample offset and length of its audio
+(AudioRequest.shm_offset / shm_length) instead of a temp WAV path, so a
+voice turn no longer touches the file system or round-trips through int16.
+
+Layout: a 64-byte header holding the writer's reserve counter (int64,
+absolute samples), followed by `capacity` float32 samples. Chunks are never
+split across the end of the buffer; the writer skips the tail instead.
+"""
+
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+_HEADER_BYTES = 64
+
+
+class AudioRing:
+    """Single-writer float32 PCM ring in a multiprocessing SharedMemory segment."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, capacity: int, owner: bool):
+        self._shm = shm
+        self._owner = owner
+        self.capacity = int(capacity)
+        self._header = np.ndarray((1,), dtype=np.int64, buffer=shm.buf, offset=0)
+        self._samples = np.ndarray((self.capacity,), dtype=np.float32, buffer=shm.buf, offset=_HEADER_BYTES)
+
+    @classmethod
+    def create(cls, capacity: int) -> "AudioRing":
+        """Create a new segment (core process)."""
+        capacity = int(capacity)
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        shm = shared_memory.SharedMemory(create=True, size=_HEADER_BYTES + capacity * 4)
+        ring = cls(shm, capacity, owner=True)
+        ring._header[0] = 0
+        return ring
+
+    @classmethod
+    def attach(cls, name: str, capacity: int) -> "AudioRing":
+        """Attach to a segment created by another process (brain worker)."""
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, capacity, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def write(self, audio: np.ndarray) -> Optional[Tuple[int, int]]:
+        """Copy audio into the ring.
+
+        Returns (offset, length) for the IPC message, or None if the audio
+        doesn't fit in the ring at all (caller should fall back to pcm_bytes).
+        """
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        length = int(audio.shape[0])
+        if length > self.capacity:
+            return None
+
+        start = int(self._header[0])
+        pos = start % self.capacity
+        if pos + length > self.capacity:
+            # Keep chunks contiguous: skip the tail and start at the beginning
+            start += self.capacity - pos
+            pos = 0
+
+        # Reserve before writing so a concurrent reader can detect the overlap
+        self._header[0] = start + length
+        self._samples[pos:pos + length] = audio
+        return start, length
+
+    def read(self, offset: int, length: int) -> Optional[np.ndarray]:
+        """Copy a chunk out of the ring.
+
+        Returns None if the chunk was already overwritten (or is invalid).
+        """
+        offset = int(offset)
+        length = int(length)
+        if offset < 0 or length < 0 or length > self.capacity:
+            return None
+        if length == 0:
+            return np.array([], dtype=np.float32)
+
+        pos = offset % self.capacity
+        if pos + length > self.capacity or self._overwritten(offset):
+            return None
+
+        audio = self._samples[pos:pos + length].copy()
+
+        # The writer reserves before it writes, so check again after copying
+        if self._overwritten(offset):
+            return None
+        return audio
+
+    def _overwritten(self, offset: int) -> bool:
+        return int(self._header[0]) > offset + self.capacity
+
+    def close(self) -> None:
+        """Release the mapping; the creating process also unlinks the segment."""
+        if self._shm is None:
+            return
+        # Views must be dropped before the buffer can be closed
+        self._header = None
+        self._samples = None
+        try:
+            self._shm.close()
+            if self._owner:
+                self._shm.unlink()
+        except (OSError, BufferError):
+            pass
+        self._shm = None
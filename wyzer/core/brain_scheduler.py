@@ -0,0 +1,206 @@
+"""
+Scheduling primitives for the brain worker.
+
+The brain worker used to handle everything in one serial loop, so an
+INTERRUPT (barge-in) was only seen after the current STT/LLM job finished
+and window-watcher / timer ticks stalled for the length of a query. The
+worker now splits its work across:
+
+- the dispatcher (the process main thread): reads the inbound queue and
+  handles INTERRUPT/SHUTDOWN the moment they arrive,
+- JobLane executors: one for STT, one for routing/LLM/tools,
+- a Ticker: periodic background work (heartbeat, window watcher).
+
+Cancellation is cooperative and keyed on the interrupt generation: each job
+holds a CancelToken taken when it was dispatched, and an INTERRUPT bumps the
+generation, which cancels every token taken before it.
+"""
+
+from __future__ import annotations
+
+import itertools
+import queue
+import threading
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from wyzer.core.logger import get_logger
+
+
+class CancelToken:
+    """Cancellation handle of one job (cancelled once an interrupt follows it)."""
+
+    def __init__(self, source: "InterruptGeneration", generation: int):
+        self._source = source
+        self.generation = generation
+
+    @property
+    def cancelled(self) -> bool:
+        return self._source.value != self.generation
+
+    def __call__(self) -> bool:
+        """Allow the token to be passed wherever a cancel_check callable is expected."""
+        return self.cancelled
+
+
+class InterruptGeneration:
+    """Thread-safe interrupt counter shared by the dispatcher and the executors."""
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def bump(self) -> int:
+        """Cancel all outstanding tokens; returns the new generation."""
+        with self._lock:
+            self._value += 1
+            return self._value
+
+    def token(self) -> CancelToken:
+        return CancelToken(self, self._value)
+
+
+class JobLane:
+    """
+    Single-thread executor with two priorities.
+
+    Jobs run one at a time in submission order, except that urgent jobs
+    (confirmation answers) run before any queued normal job.
+    """
+
+    URGENT = 0
+    NORMAL = 1
+
+    def __init__(self, name: str):
+        self.name = name
+        self._queue: "queue.PriorityQueue[Tuple[int, int, Optional[Callable[..., Any]], tuple]]" = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, urgent: bool = False) -> None:
+        priority = self.URGENT if urgent else self.NORMAL
+        self._queue.put((priority, next(self._seq), fn, args))
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def shutdown(self, timeout: float = 2.0) -> None:
+        """Stop after the queued jobs (bounded by timeout)."""
+        self._queue.put((self.NORMAL + 1, next(self._seq), None, ()))
+        self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        logger = get_logger()
+        while True:
+            _, _, fn, args = self._queue.get()
+            if fn is None:
+                return
+            try:
+                fn(*args)
+            except Exception as e:
+                # A failing job must not take the lane down with it
+                logger.error(f"[SCHED] {self.name} job failed: {e}")
+
+
+class Ticker:
+    """Background thread running registered callbacks at fixed intervals."""
+
+    def __init__(self, name: str = "BrainTicks", resolution_sec: float = 0.05):
+        self.name = name
+        self.resolution_sec = resolution_sec
+        self._ticks: List[List[Any]] = []  # [interval_sec, fn, next_due]
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def add(self, interval_sec: float, fn: Callable[[], None]) -> None:
+        """Register fn to run every interval_sec (first run after one interval)."""
+        self._ticks.append([interval_sec, fn, time.monotonic() + interval_sec])
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        logger = get_logger()
+        while not self._stop.wait(self.resolution_sec):
+            now = time.monotonic()
+            for tick in self._ticks:
+                interval_sec, fn, next_due = tick
+                if now < next_due:
+                    continue
+                tick[2] = now + interval_sec
+                try:
+                    fn()
+                except Exception as e:
+                    logger.debug(f"[SCHED] tick {getattr(fn, '__name__', fn)} failed: {e}")
+
+
+def run_preemptible(
+    fn: Callable[[], Any],
+    token: CancelToken,
+    poll_sec: float = 0.02,
+) -> Tuple[bool, Any]:
+    """
+    Run fn on a helper thread and wait for it unless the token is cancelled.
+
+    Blocking calls (an LLM request, a tool) can't be stopped from outside, so
+    a cancelled job is abandoned instead: the caller gets control back right
+    away and the helper thread's result is dropped when it finishes.
+
+    Args:
+        fn: Callable to run
+        token: Cancellation token of the calling job
+        poll_sec: How often the token is checked while waiting
+
+    Returns:
+        (completed, result); result is None when the job was abandoned.
+        Exceptions raised by fn are re-raised in the caller.
+    """
+    done = threading.Event()
+    outcome: List[Any] = [None, None]  # [result, exception]
+
+    def _target() -> None:
+        try:
+            outcome[0] = fn()
+        except BaseException as e:
+            outcome[1] = e
+        finally:
+            done.set()
+
+    threading.Thread(target=_target, name="BrainPreemptible", daemon=True).start()
+    while not done.wait(poll_sec):
+        if token.cancelled:
+            return False, None
+    if outcome[1] is not None:
+        raise outcome[1]
+    return True, outcome[0]
+
+
+def acquire_preemptible(
+    lock: threading.Lock,
+    token: CancelToken,
+    poll_sec: float = 0.02,
+) -> bool:
+    """
+    Acquire lock, giving up once the token is cancelled.
+
+    Used to wait for a job that holds the lock on an abandoned helper thread
+    (see run_preemptible) without making a barge-in wait for it too.
+
+    Returns:
+        True with the lock held, False (lock not held) if cancelled first
+    """
+    while not lock.acquire(timeout=poll_sec):
+        if token.cancelled:
+            return False
+    return True
@@ -6,6 +6,8 @@ Brain Worker process:
 - TTS
 
 Receives requests from core via core_to_brain_q and sends results/logs via brain_to_core_q.
+The main thread only dispatches; STT, routing (LLM + tools) and background
+ticks run on their own threads (see wyzer.core.brain_scheduler).
 """
 
 from __future__ import annotations
@@ -16,24 +18,37 @@ import queue
 import threading
 import time
 import traceback
-from typing import Any, Dict, Optional, Tuple
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple
 
 import numpy as np
 
 from wyzer.core.config import Config
+from wyzer.core.audio_shm import AudioRing
+from wyzer.core.brain_scheduler import (
+    CancelToken,
+    InterruptGeneration,
+    JobLane,
+    Ticker,
+    acquire_preemptible,
+    run_preemptible,
+)
 from wyzer.core.ipc import now_ms, safe_put
 from wyzer.core.logger import get_logger, init_logger
 from wyzer.core.followup_manager import FollowupManager, is_exit_sentinel
+from wyzer.core.speculation import get_speculator
 from wyzer.stt.stt_router import STTRouter
+from wyzer.stt.streaming_stt import StreamingTranscriber
 from wyzer.tts.tts_router import TTSRouter
-from wyzer.tools.timer_tool import check_timer_finished
+from wyzer.tts.tts_cache import DEFAULT_PREWARM_PHRASES
+from wyzer.tools.timer_tool import DEFAULT_TIMER_NAME, get_timer_scheduler
 
 
 def _apply_config(config_dict: Dict[str, Any]) -> None:
     # Logger first - include quiet mode
     log_level = str(config_dict.get("log_level", "INFO")).upper()
     quiet_mode = config_dict.get("quiet_mode", False) or os.environ.get("WYZER_QUIET_MODE", "false").lower() in ("true", "1", "yes")
-    init_logger(log_level, quiet_mode=quiet_mode)
+    init_logger(log_level, quiet_mode=quiet_mode, async_sink=Config.LOG_ASYNC, json_path=Config.LOG_JSON_PATH or None)
 
     # Ensure orchestrator uses the worker's config (it reads Config.*)
     if "ollama_url" in config_dict:
@@ -130,6 +145,69 @@ def _read_wav_to_float32(wav_path: str) -> np.ndarray:
     return audio
 
 
+def _audio_from_msg(msg: Dict[str, Any], audio_ring: Optional[AudioRing]) -> Optional[np.ndarray]:
+    """
+    Decode the audio of an AUDIO / AUDIO_STREAM message.
+    
+    Returns None if the audio was sent through the shared-memory ring but is
+    no longer available (ring not attached or already overwritten).
+    """
+    wav_path = msg.get("wav_path")
+    pcm_bytes = msg.get("pcm_bytes")
+    shm_offset = msg.get("shm_offset")
+
+    if shm_offset is not None:
+        if audio_ring is None:
+            return None
+        return audio_ring.read(shm_offset, msg.get("shm_length") or 0)
+    if wav_path:
+        audio = _read_wav_to_float32(wav_path)
+        try:
+            os.unlink(wav_path)
+        except Exception:
+            pass
+        return audio
+    if pcm_bytes:
+        return np.frombuffer(pcm_bytes, dtype=np.float32)
+    return np.array([], dtype=np.float32)
+
+
+def _take_queued_audio(jobs_q, pending_msgs: Deque[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    """
+    Pull AUDIO requests already waiting behind the current one, for a
+    batched decode.
+    
+    Pulled messages are appended to pending_msgs in order, so the STT lane
+    still handles them one by one. Pulling stops at the first message that
+    can't join the batch (streamed utterance, prompt, no id, or another type).
+    """
+    batch: List[Dict[str, Any]] = []
+    while len(batch) < limit:
+        try:
+            msg = jobs_q.get_nowait()
+        except queue.Empty:
+            break
+        pending_msgs.append(msg)
+        meta = (msg or {}).get("meta") or {}
+        if (
+            (msg or {}).get("type") != "AUDIO"
+            or not msg.get("id")
+            or meta.get("stt_stream_id")
+            or meta.get("is_followup_prompt")
+        ):
+            break
+        batch.append(msg)
+    return batch
+
+
+class _Dispatch(NamedTuple):
+    """Scheduling data the dispatcher attaches to an AUDIO/TEXT request."""
+
+    token: CancelToken  # Cancelled by the next INTERRUPT
+    start_ms: int
+    transcriber: Optional[StreamingTranscriber]  # Streaming STT of this utterance
+
+
 class _TTSController:
     """
     TTS Controller with prefetch support.
@@ -151,7 +229,7 @@ class _TTSController:
         
         # Prefetch state
         self._prefetch_lock = threading.Lock()
-        self._prefetch_wav: Optional[str] = None  # Path to prefetched WAV
+        self._prefetch_pcm: Optional[bytes] = None  # Prefetched PCM (see TTSRouter.synthesize_pcm)
         self._prefetch_meta: Optional[Dict[str, Any]] = None  # Meta for prefetched item
         self._prefetch_text: Optional[str] = None  # Text that was prefetched
         self._prefetch_thread: Optional[threading.Thread] = None
@@ -184,7 +262,7 @@ class _TTSController:
         
         # Check if prefetch is already done or in progress
         with self._prefetch_lock:
-            if self._prefetch_wav is not None:
+            if self._prefetch_pcm is not None:
                 return  # Already have a prefetched item
             if self._prefetch_thread and self._prefetch_thread.is_alive():
                 return  # Prefetch already in progress
@@ -205,12 +283,7 @@ class _TTSController:
         
         # Clear any prefetched audio
         with self._prefetch_lock:
-            if self._prefetch_wav:
-                try:
-                    os.unlink(self._prefetch_wav)
-                except:
-                    pass
-            self._prefetch_wav = None
+            self._prefetch_pcm = None
             self._prefetch_meta = None
             self._prefetch_text = None
 
@@ -230,6 +303,9 @@ class _TTSController:
         # Clean up prefetch thread if running
         if self._prefetch_thread and self._prefetch_thread.is_alive():
             self._prefetch_thread.join(timeout=0.5)
+        # Stop the persistent Piper process
+        if self._tts:
+            self._tts.close()
 
     def _simulate_speak(self, duration_sec: float) -> bool:
         end = time.time() + max(0.0, duration_sec)
@@ -251,10 +327,10 @@ class _TTSController:
         
         try:
             logger.debug(f"[TTS_PREFETCH] Synthesizing ahead: {text[:50]}...")
-            wav_path = self._tts.synthesize(text)
-            if wav_path and not self._stop_event.is_set():
+            pcm = self._tts.synthesize_pcm(text)
+            if pcm and not self._stop_event.is_set():
                 with self._prefetch_lock:
-                    self._prefetch_wav = wav_path
+                    self._prefetch_pcm = pcm
                     self._prefetch_meta = meta
                     self._prefetch_text = text
                 logger.debug(f"[TTS_PREFETCH] Ready: {text[:30]}...")
@@ -285,12 +361,7 @@ class _TTSController:
         
         # Clear any old prefetch
         with self._prefetch_lock:
-            if self._prefetch_wav:
-                try:
-                    os.unlink(self._prefetch_wav)
-                except:
-                    pass
-                self._prefetch_wav = None
+            self._prefetch_pcm = None
         
         # Start prefetch in background thread
         self._prefetch_thread = threading.Thread(
@@ -301,17 +372,17 @@ class _TTSController:
         )
         self._prefetch_thread.start()
     
-    def _get_prefetched(self) -> Optional[Tuple[str, Dict[str, Any], str]]:
-        """Get prefetched WAV if available. Returns (wav_path, meta, text) or None."""
+    def _get_prefetched(self) -> Optional[Tuple[bytes, Dict[str, Any], str]]:
+        """Get prefetched audio if available. Returns (pcm, meta, text) or None."""
         with self._prefetch_lock:
-            if self._prefetch_wav and os.path.exists(self._prefetch_wav):
-                wav = self._prefetch_wav
+            if self._prefetch_pcm:
+                pcm = self._prefetch_pcm
                 meta = self._prefetch_meta or {}
                 text = self._prefetch_text or ""
-                self._prefetch_wav = None
+                self._prefetch_pcm = None
                 self._prefetch_meta = None
                 self._prefetch_text = None
-                return (wav, meta, text)
+                return (pcm, meta, text)
         return None
 
     def _loop(self) -> None:
@@ -321,13 +392,9 @@ class _TTSController:
             prefetched = self._get_prefetched()
             
             if prefetched:
-                wav_path, meta, text = prefetched
+                pcm, meta, text = prefetched
                 
                 if meta.get("_shutdown"):
-                    try:
-                        os.unlink(wav_path)
-                    except:
-                        pass
                     return
                 
                 # Mark as playing BEFORE we start - this allows enqueue() to trigger prefetch
@@ -345,22 +412,16 @@ class _TTSController:
                         ok = self._simulate_speak(2.0)
                     elif self._tts:
                         self.clear_stop()
-                        ok = self._tts.play_wav(wav_path, self._stop_event)
+                        ok = self._tts.play_pcm(pcm, self._stop_event)
                 except Exception as e:
                     logger.error(f"TTS playback error: {e}")
                     ok = False
                 finally:
                     self._is_playing = False
                     
-                    # Clean up WAV file
-                    try:
-                        os.unlink(wav_path)
-                    except:
-                        pass
-                    
                     # Determine show_followup_prompt
                     is_streaming = meta.get("_streaming", False)
-                    if is_streaming and self._queue.empty() and not self._prefetch_wav:
+                    if is_streaming and self._queue.empty() and not self._prefetch_pcm:
                         show_followup = self._pending_followup_prompt
                         self._pending_followup_prompt = False
                     else:
@@ -416,7 +477,7 @@ class _TTSController:
                 # - For non-streaming: use meta directly
                 # - For streaming: use pending flag if this is the last segment (queue empty)
                 is_streaming = meta.get("_streaming", False)
-                if is_streaming and self._queue.empty() and not self._prefetch_wav:
+                if is_streaming and self._queue.empty() and not self._prefetch_pcm:
                     # Last streaming segment - use pending followup flag
                     show_followup = self._pending_followup_prompt
                     self._pending_followup_prompt = False  # Reset for next response
@@ -513,14 +574,34 @@ def run_brain_worker(core_to_brain_q, brain_to_core_q, config_dict: Dict[str, An
         except Exception as e:
             logger.error(f"Failed to init TTS: {e}")
             tts_router = None
+        if tts_router is not None and getattr(Config, "TTS_CACHE_PREWARM", True):
+            tts_router.prewarm(DEFAULT_PREWARM_PHRASES)
 
     simulate_tts = bool(config_dict.get("simulate_tts", False))
     tts_controller = _TTSController(tts_router, brain_to_core_q, simulate=simulate_tts)
 
+    # Shared window snapshot for the tool workers (see wyzer.world.window_snapshot).
+    # Created before the pool so the spawned workers inherit its name.
+    window_snapshots = None
+    if Config.WINDOW_WATCHER_ENABLED and Config.WINDOW_SNAPSHOT_SHARED:
+        try:
+            from wyzer.world.window_snapshot import SNAPSHOT_SHM_ENV, WindowSnapshotPublisher
+            window_snapshots = WindowSnapshotPublisher.create()
+            os.environ[SNAPSHOT_SHM_ENV] = window_snapshots.name
+        except Exception as e:
+            logger.warning(f"[WORLD] Failed to create shared window snapshot: {e}")
+            window_snapshots = None
+
     # Initialize tool worker pool if enabled
     from wyzer.core import orchestrator
     orchestrator.init_tool_pool()
 
+    # Optional library refresh at startup; runs in the background and the
+    # tool workers pick up the new library.json on their next lookup
+    if Config.LOCAL_LIBRARY_REFRESH_ON_STARTUP:
+        from wyzer.local_library.indexer import refresh_index_in_background
+        refresh_index_in_background()
+
     # =========================================================================
     # PHASE 12: Initialize Window Watcher (Multi-Monitor Awareness)
     # =========================================================================
@@ -540,189 +621,212 @@ def run_brain_worker(core_to_brain_q, brain_to_core_q, config_dict: Dict[str, An
     else:
         logger.info("[WORLD] Window Watcher disabled")
     
-    # Track last watcher tick time
-    last_watcher_tick = time.time()
     watcher_poll_sec = getattr(Config, "WINDOW_WATCHER_POLL_MS", 500) / 1000.0
 
-    interrupt_generation = 0
-    last_job_id = "none"
-    last_heartbeat = time.time()
+    # Shared-memory audio ring created by the core process (optional)
+    audio_ring: Optional[AudioRing] = None
+    if config_dict.get("audio_shm_name"):
+        try:
+            audio_ring = AudioRing.attach(
+                str(config_dict["audio_shm_name"]),
+                int(config_dict.get("audio_shm_samples", 0)),
+            )
+        except Exception as e:
+            logger.warning(f"[AUDIO_SHM] Failed to attach shared audio ring: {e}")
 
-    safe_put(brain_to_core_q, {"type": "LOG", "level": "INFO", "msg": "brain_worker_started"})
+    # Streaming STT of the utterance currently being spoken: (stream_id, transcriber)
+    # Only the dispatcher touches it; a finished stream travels with its request.
+    stt_stream: Optional[Tuple[str, StreamingTranscriber]] = None
 
-    while True:
-        # Emit heartbeat every ~10s (configurable)
-        current_time = time.time()
-        if current_time - last_heartbeat >= Config.HEARTBEAT_INTERVAL_SEC:
-            try:
-                q_in_size = core_to_brain_q.qsize() if hasattr(core_to_brain_q, 'qsize') else -1
-                q_out_size = brain_to_core_q.qsize() if hasattr(brain_to_core_q, 'qsize') else -1
-            except Exception:
-                q_in_size = q_out_size = -1
-            
-            # Get tool worker heartbeats
-            worker_hbs = orchestrator.get_tool_pool_heartbeats()
-            workers_str = ""
-            if worker_hbs:
-                workers_str = " workers=[" + ",".join(
-                    f"W{w['id']}:jobs={w['jobs']}" for w in worker_hbs
-                ) + "]"
-            
-            logger.info(
-                f"[HEARTBEAT] role=Brain pid={os.getpid()} "
-                f"q_in={q_in_size} q_out={q_out_size} "
-                f"last_job={last_job_id} interrupt_gen={interrupt_generation}{workers_str}"
-            )
-            last_heartbeat = current_time
+    # Speculative routing/prefetch on partial transcripts (see wyzer.core.speculation)
+    speculator = get_speculator() if Config.SPECULATIVE_ROUTING else None
+
+    def _on_partial_transcript(text: str) -> None:
+        logger.debug(f"[STT_STREAM] partial: {text}")
+        if speculator is not None:
+            speculator.submit(text)
+
+    # =========================================================================
+    # Scheduling (see wyzer.core.brain_scheduler)
+    # =========================================================================
+    # The main thread only dispatches: INTERRUPT/SHUTDOWN take effect as soon
+    # as they arrive. Requests flow STT lane -> route lane (LLM/tools), and
+    # heartbeat / window watcher checks run on a background ticker (timer
+    # alarms come from the timer scheduler's own waiter thread).
+    interrupts = InterruptGeneration()
+    stt_jobs: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue()
+    route_lane = JobLane("BrainRoute")
+    # Held for the whole orchestrator call, including one abandoned after an
+    # interrupt: the next request waits for it (it may still run tools or
+    # touch the pending confirmation) before it starts
+    orchestrator_lock = threading.Lock()
+    ticker = Ticker("BrainTicks")
+    last_job_id = "none"
+
+    def _heartbeat_tick() -> None:
+        try:
+            q_in_size = core_to_brain_q.qsize() if hasattr(core_to_brain_q, 'qsize') else -1
+            q_out_size = brain_to_core_q.qsize() if hasattr(brain_to_core_q, 'qsize') else -1
+        except Exception:
+            q_in_size = q_out_size = -1
         
-        # =====================================================================
-        # PHASE 12: Window Watcher Tick (non-blocking poll)
-        # =====================================================================
-        # Update window state periodically (aligned to poll_ms).
-        # This runs in the main loop to avoid needing a separate thread.
-        if window_watcher and (current_time - last_watcher_tick) >= watcher_poll_sec:
-            try:
-                snapshot, events = window_watcher.tick()
-                
-                # Update world_state with watcher data
-                if snapshot or events:
-                    from wyzer.context.world_state import update_window_watcher_state
-                    update_window_watcher_state(
-                        open_windows=window_watcher.get_latest_snapshot(),
-                        windows_by_monitor=window_watcher.get_windows_by_monitor(),
-                        focused_window=window_watcher.get_focused_window(),
-                        recent_events=window_watcher.get_recent_events(),
-                        detected_monitor_count=window_watcher.get_monitor_count(),
-                    )
-            except Exception as e:
-                # Don't let watcher errors crash the brain
-                pass
-            last_watcher_tick = current_time
+        # Get tool worker heartbeats
+        worker_hbs = orchestrator.get_tool_pool_heartbeats()
+        workers_str = ""
+        if worker_hbs:
+            workers_str = " workers=[" + ",".join(
+                f"W{w['id']}:jobs={w['jobs']}" for w in worker_hbs
+            ) + "]"
         
-        # Check if a timer has finished and announce it
-        if check_timer_finished():
-            logger.info("[TIMER] Timer finished, announcing alarm")
-            tts_controller.enqueue("Your timer is finished.", meta={"_timer_alarm": True})
+        logger.info(
+            f"[HEARTBEAT] role=Brain pid={os.getpid()} "
+            f"q_in={q_in_size} q_out={q_out_size} "
+            f"stt_q={stt_jobs.qsize()} route_q={route_lane.pending()} "
+            f"last_job={last_job_id} interrupt_gen={interrupts.value}{workers_str}"
+        )
+
+    def _window_watcher_tick() -> None:
+        # PHASE 12: Update window state periodically (aligned to poll_ms)
+        snapshot, events = window_watcher.tick()
         
-        # Use timeout so we can poll for timer completion
-        try:
-            msg = core_to_brain_q.get(timeout=0.1)
-        except queue.Empty:
-            continue
-        mtype = (msg or {}).get("type")
+        # Republish every poll: workers judge staleness by the snapshot time.
+        # A failed poll returns no windows; let the snapshot go stale instead.
+        if window_snapshots is not None and snapshot:
+            focused = window_watcher.get_focused_window()
+            if not window_snapshots.publish(snapshot, focused.get("hwnd") if focused else None):
+                logger.debug(f"[WORLD] Window snapshot too large to share ({len(snapshot)} windows)")
+        
+        # Update world_state with watcher data
+        if snapshot or events:
+            from wyzer.context.world_state import update_window_watcher_state
+            update_window_watcher_state(
+                open_windows=window_watcher.get_latest_snapshot(),
+                windows_by_monitor=window_watcher.get_windows_by_monitor(),
+                focused_window=window_watcher.get_focused_window(),
+                recent_events=window_watcher.get_recent_events(),
+                detected_monitor_count=window_watcher.get_monitor_count(),
+            )
 
-        if mtype == "SHUTDOWN":
-            safe_put(brain_to_core_q, {"type": "LOG", "level": "INFO", "msg": "brain_worker_shutdown"})
-            try:
-                tts_controller.shutdown()
-            except Exception:
-                pass
-            orchestrator.shutdown_tool_pool()
-            
-            # Stop llamacpp server if we started it (Phase 8)
-            if llamacpp_base_url:
-                try:
-                    from wyzer.brain.llama_server_manager import stop_server
-                    logger.info("[LLAMACPP] Stopping embedded server...")
-                    stop_server(force=True)  # Force stop any llama-server on Wyzer shutdown
-                except Exception as e:
-                    logger.warning(f"[LLAMACPP] Error stopping server: {e}")
-            
-            # Stop window watcher if running (Phase 12)
-            if window_watcher:
-                try:
-                    from wyzer.world.window_watcher import stop_window_watcher
-                    stop_window_watcher()
-                except Exception:
-                    pass
-            
-            return
+    def _on_timer_fired(name: str) -> None:
+        # Runs on the timer scheduler's thread at the deadline
+        logger.info(f"[TIMER] Timer '{name}' finished, announcing alarm")
+        label = "timer" if name == DEFAULT_TIMER_NAME else f"{name} timer"
+        tts_controller.enqueue(f"Your {label} is finished.", meta={"_timer_alarm": True})
 
-        if mtype == "INTERRUPT":
-            interrupt_generation += 1
-            tts_controller.interrupt()
-            safe_put(brain_to_core_q, {"type": "LOG", "level": "INFO", "msg": "interrupt_ack"})
-            continue
+    ticker.add(Config.HEARTBEAT_INTERVAL_SEC, _heartbeat_tick)
+    if window_watcher:
+        ticker.add(watcher_poll_sec, _window_watcher_tick)
+    get_timer_scheduler().set_on_fire(_on_timer_fired)
 
-        if mtype not in {"AUDIO", "TEXT"}:
-            safe_put(
-                brain_to_core_q,
-                {"type": "LOG", "level": "WARNING", "msg": f"unknown_msg_type:{mtype}"},
-            )
-            continue
+    def _send_error_result(msg: Dict[str, Any], err: str, trace: str, start_ms: int) -> None:
+        meta = msg.get("meta") or {}
+        safe_put(brain_to_core_q, {"type": "LOG", "level": "ERROR", "msg": f"brain_worker_error:{err}", "meta": {"trace": trace}})
+        safe_put(
+            brain_to_core_q,
+            {
+                "type": "RESULT",
+                "id": msg.get("id") or "",
+                "reply": f"(error: {err})",
+                "tool_calls": None,
+                "tts_text": None,
+                "meta": {
+                    "timings": {"total_ms": now_ms() - start_ms},
+                    "error": True,
+                    "is_followup": meta.get("is_followup", False),  # Preserve followup flag
+                    "followup_chain": meta.get("followup_chain"),  # Preserve chain count
+                },
+            },
+        )
+
+    def _send_interrupted_result(
+        msg: Dict[str, Any],
+        user_text: str,
+        stt_ms: int,
+        start_ms: int,
+        llm_ms: int = 0,
+    ) -> None:
+        # Request cancelled by an INTERRUPT: report it without a reply to speak
+        meta = msg.get("meta") or {}
+        safe_put(
+            brain_to_core_q,
+            {
+                "type": "RESULT",
+                "id": msg.get("id") or "",
+                "reply": "",
+                "tool_calls": None,
+                "tts_text": None,
+                "meta": {
+                    "timings": {
+                        "stt_ms": stt_ms,
+                        "llm_ms": llm_ms,
+                        "tool_ms": 0,
+                        "tts_start_ms": None,
+                        "total_ms": now_ms() - start_ms,
+                    },
+                    "tts_interrupted": True,
+                    "cancelled": True,
+                    "user_text": user_text,
+                    "is_followup": meta.get("is_followup", False),
+                    "followup_chain": meta.get("followup_chain"),
+                    "show_followup_prompt": False,
+                    "capture_valid": True,
+                },
+            },
+        )
 
+    def _route_job(
+        msg: Dict[str, Any],
+        user_text: str,
+        stt_ms: int,
+        start_ms: int,
+        token: CancelToken,
+    ) -> None:
+        """Route lane: confirmations, memory commands, LLM + tools, TTS and the RESULT."""
         req_id = msg.get("id") or ""
-        last_job_id = req_id  # Track for heartbeat
-        request_gen = interrupt_generation
-        start_ms = now_ms()
         meta = msg.get("meta") or {}
-        
-        # Check if this is just a TTS prompt (not a user query to process)
-        if meta.get("is_followup_prompt"):
-            # Just TTS the prompt, don't process it through orchestrator
-            prompt_text = str(msg.get("text") or "")
-            if prompt_text:
-                tts_controller.enqueue(prompt_text, meta={"_prompt_only": True})
-            continue
 
         try:
-            user_text: str = ""
-            stt_ms = 0
-
-            if mtype == "AUDIO":
-                stt_start = now_ms()
-
-                wav_path = msg.get("wav_path")
-                pcm_bytes = msg.get("pcm_bytes")
-
-                if wav_path:
-                    audio = _read_wav_to_float32(wav_path)
-                    try:
-                        os.unlink(wav_path)
-                    except Exception:
-                        pass
-                elif pcm_bytes:
-                    audio = np.frombuffer(pcm_bytes, dtype=np.float32)
-                else:
-                    audio = np.array([], dtype=np.float32)
-
-                user_text = stt.transcribe(audio)
-                stt_ms = now_ms() - stt_start
-
-                # Check if transcript is valid (not empty/minimal)
-                # This handles cases where VAD picked up noise or hotword bleed-through
-                # but no real speech was captured. We set capture_valid=False so the
-                # core process knows NOT to enter follow-up mode.
-                capture_valid = _is_capture_valid(user_text)
+            if token.cancelled:
+                # Interrupted while queued or transcribing: don't act on it
+                _send_interrupted_result(msg, user_text, stt_ms, start_ms)
+                return
 
-                if not user_text or not capture_valid:
-                    safe_put(
-                        brain_to_core_q,
-                        {
-                            "type": "RESULT",
-                            "id": req_id,
-                            "reply": "(I didn't catch that.)",
-                            "tool_calls": None,
-                            "tts_text": None,
-                            "meta": {
-                                "timings": {
-                                    "stt_ms": stt_ms,
-                                    "llm_ms": 0,
-                                    "tool_ms": 0,
-                                    "tts_start_ms": None,
-                                    "total_ms": now_ms() - start_ms,
-                                },
-                                "is_followup": meta.get("is_followup", False),  # Preserve followup flag
-                                "followup_chain": meta.get("followup_chain"),  # Preserve chain count
-                                "capture_valid": False,  # Invalid capture - don't enter follow-up
-                                "user_text": user_text,  # Include for debugging even if invalid
+            # Check if transcript is valid (not empty/minimal)
+            # This handles cases where VAD picked up noise or hotword bleed-through
+            # but no real speech was captured. We set capture_valid=False so the
+            # core process knows NOT to enter follow-up mode.
+            if msg.get("type") == "AUDIO" and (not user_text or not _is_capture_valid(user_text)):
+                safe_put(
+                    brain_to_core_q,
+                    {
+                        "type": "RESULT",
+                        "id": req_id,
+                        "reply": "(I didn't catch that.)",
+                        "tool_calls": None,
+                        "tts_text": None,
+                        "meta": {
+                            "timings": {
+                                "stt_ms": stt_ms,
+                                "llm_ms": 0,
+                                "tool_ms": 0,
+                                "tts_start_ms": None,
+                                "total_ms": now_ms() - start_ms,
                             },
+                            "is_followup": meta.get("is_followup", False),  # Preserve followup flag
+                            "followup_chain": meta.get("followup_chain"),  # Preserve chain count
+                            "capture_valid": False,  # Invalid capture - don't enter follow-up
+                            "user_text": user_text,  # Include for debugging even if invalid
                         },
-                    )
-                    continue
+                    },
+                )
+                return
 
-            else:
-                user_text = str(msg.get("text") or "")
+            # An orchestrator call abandoned by an earlier interrupt may still be
+            # finishing; let it settle before reading the pending confirmation
+            if not acquire_preemptible(orchestrator_lock, token):
+                _send_interrupted_result(msg, user_text, stt_ms, start_ms)
+                return
+            orchestrator_lock.release()
 
             # =========================================================================
             # PHASE 11: PENDING CONFIRMATION CHECK (BEFORE exit phrase detection!)
@@ -807,7 +911,7 @@ def run_brain_worker(core_to_brain_q, brain_to_core_q, config_dict: Dict[str, An
                     # TTS the result
                     if tts_enabled and tts_router:
                         tts_controller.enqueue("Done.", meta={"_confirmation": True})
-                    continue
+                    return
                 
                 elif confirmation_result == "cancelled":
                     # User cancelled - "Okay, cancelled" already spoken by resolve_pending
@@ -836,7 +940,7 @@ def run_brain_worker(core_to_brain_q, brain_to_core_q, config_dict: Dict[str, An
                             },
                         },
                     )
-                    continue
+                    return
                 
                 elif confirmation_result == "expired":
                     # Confirmation expired - tell user
@@ -868,7 +972,7 @@ def run_brain_worker(core_to_brain_q, brain_to_core_q, config_dict: Dict[str, An
                     )
                     if tts_enabled and tts_router:
                         tts_controller.enqueue(expired_reply, meta={"_confirmation": True})
-                    continue
+                    return
                 
                 elif confirmation_result == "ignored":
                     # User said something other than yes/no while pending exists
@@ -902,7 +1006,7 @@ def run_brain_worker(core_to_brain_q, brain_to_core_q, config_dict: Dict[str, An
                         )
                         if tts_enabled and tts_router:
                             tts_controller.enqueue(pending_prompt, meta={"_confirmation": True})
-                        continue
+                        return
                 
                 # confirmation_result == "none" - no pending confirmation, continue normal flow
 
@@ -952,7 +1056,7 @@ def run_brain_worker(core_to_brain_q, brain_to_core_q, config_dict: Dict[str, An
                             },
                         },
                     )
-                    continue
+                    return
 
             # Check if this is an explicit memory command (Phase 7)
             # Memory commands bypass tools/LLM entirely
@@ -1001,7 +1105,7 @@ def run_brain_worker(core_to_brain_q, brain_to_core_q, config_dict: Dict[str, An
                         },
                     },
                 )
-                continue
+                return
 
             # Check if this is a "how do you know" source question (Phase 7 polish)
             # These bypass LLM to give truthful deterministic answers
@@ -1048,7 +1152,7 @@ def run_brain_worker(core_to_brain_q, brain_to_core_q, config_dict: Dict[str, An
                         },
                     },
                 )
-                continue
+                return
 
             # LLM + tools via orchestrator
             # Always call orchestrator - it handles NO_OLLAMA mode internally
@@ -1092,8 +1196,6 @@ def run_brain_worker(core_to_brain_q, brain_to_core_q, config_dict: Dict[str, An
                 should_use_streaming_tts(user_text) and 
                 not force_non_streaming
             )
-            result_streamed = False
-            
             if use_streaming_tts:
                 # Use streaming path: tokens flow to TTS as they arrive
                 # The on_segment callback enqueues each segment for TTS
@@ -1101,20 +1203,45 @@ def run_brain_worker(core_to_brain_q, brain_to_core_q, config_dict: Dict[str, An
                 
                 def on_tts_segment(segment: str) -> None:
                     """Callback for streaming TTS segments."""
-                    if segment and not tts_controller.is_cancelled():
+                    if segment and not tts_controller.is_cancelled() and not token.cancelled:
                         tts_controller.enqueue(segment, meta={"_streaming": True})
                 
-                result_dict = handle_user_text_streaming(
-                    user_text,
-                    on_segment=on_tts_segment,
-                    cancel_check=tts_controller.is_cancelled
-                )
-                result_streamed = (result_dict or {}).get("meta", {}).get("streamed", False)
+                def _run_orchestrator() -> Dict[str, Any]:
+                    return handle_user_text_streaming(
+                        user_text,
+                        on_segment=on_tts_segment,
+                        cancel_check=lambda: tts_controller.is_cancelled() or token.cancelled,
+                    )
             else:
                 # Non-streaming path (tools, hybrid router, etc.)
-                result_dict = handle_user_text(user_text)
+                def _run_orchestrator() -> Dict[str, Any]:
+                    return handle_user_text(user_text, cancel_check=token)
+            
+            def _run_serialized() -> Dict[str, Any]:
+                with orchestrator_lock:
+                    result = _run_orchestrator()
+                    meta = (result or {}).get("meta") or {}
+                    if token.cancelled and meta.get("has_pending_confirmation"):
+                        # Interrupted after its last check: the prompt is never
+                        # spoken, so a later "yes" must not run the plan
+                        from wyzer.context.world_state import clear_pending_confirmation
+                        clear_pending_confirmation()
+                        logger.info(f"[CONFIRM] Dropped pending confirmation of interrupted {req_id}")
+                    return result
+            
+            # A barge-in must not wait for a long LLM call: when the token is
+            # cancelled the call is abandoned and its late result dropped
+            if Config.BRAIN_PREEMPTIBLE_JOBS:
+                completed, result_dict = run_preemptible(_run_serialized, token)
+            else:
+                completed, result_dict = True, _run_serialized()
             
             llm_ms = now_ms() - llm_start
+            if not completed:
+                logger.info(f"[SCHED] Abandoned {req_id} after interrupt ({llm_ms}ms into LLM/tools)")
+                _send_interrupted_result(msg, original_user_text, stt_ms, start_ms, llm_ms)
+                return
+            result_streamed = (result_dict or {}).get("meta", {}).get("streamed", False)
 
             reply = (result_dict or {}).get("reply", "")
             exec_summary = (result_dict or {}).get("execution_summary")
@@ -1151,7 +1278,7 @@ def run_brain_worker(core_to_brain_q, brain_to_core_q, config_dict: Dict[str, An
                 show_followup_prompt = True
 
             # If user interrupted while we were processing, do not speak stale reply.
-            if request_gen != interrupt_generation:
+            if token.cancelled:
                 tts_text = None
                 tts_interrupted = True
             elif not tts_enabled or not tts_router:
@@ -1211,21 +1338,205 @@ def run_brain_worker(core_to_brain_q, brain_to_core_q, config_dict: Dict[str, An
             )
 
         except Exception as e:
-            err = str(e)
-            safe_put(brain_to_core_q, {"type": "LOG", "level": "ERROR", "msg": f"brain_worker_error:{err}", "meta": {"trace": traceback.format_exc()}})
+            _send_error_result(msg, str(e), traceback.format_exc(), start_ms)
+
+    def _stt_job(
+        msg: Dict[str, Any],
+        pending_msgs: Deque[Dict[str, Any]],
+        pretranscribed: Dict[str, str],
+    ) -> None:
+        """STT lane: transcribe one request and hand it to the route lane."""
+        token, start_ms, transcriber = msg.pop("_dispatch")
+        req_id = msg.get("id") or ""
+        user_text: str = ""
+        stt_ms = 0
+
+        try:
+            if msg.get("type") == "AUDIO" and token.cancelled:
+                # Interrupted before decoding started: skip the decode
+                if transcriber is not None:
+                    transcriber.cancel()
+                pretranscribed.pop(req_id, None)
+            elif msg.get("type") == "AUDIO":
+                stt_start = now_ms()
+
+                if req_id in pretranscribed:
+                    audio = None  # Decoded with an earlier batch
+                else:
+                    audio = _audio_from_msg(msg, audio_ring)
+                    if audio is None:
+                        logger.warning(f"[AUDIO_SHM] Audio for {req_id} unavailable (ring not attached or overwritten)")
+                        audio = np.array([], dtype=np.float32)
+
+                queued: List[Dict[str, Any]] = []
+                if transcriber is None and audio is not None and Config.STT_BATCH_DECODE and not pending_msgs:
+                    queued = _take_queued_audio(stt_jobs, pending_msgs, limit=3)
+
+                if transcriber is not None:
+                    user_text = transcriber.finish(audio)
+                elif audio is None:
+                    user_text = pretranscribed.pop(req_id)
+                elif queued:
+                    # Utterances waiting behind this one (e.g. a confirmation
+                    # answer and a follow-up): decode them all in one batch
+                    batch_audio = [audio]
+                    for queued_msg in queued:
+                        queued_audio = _audio_from_msg(queued_msg, audio_ring)
+                        batch_audio.append(queued_audio if queued_audio is not None else np.array([], dtype=np.float32))
+                    texts = stt.transcribe_batch(batch_audio)
+                    user_text = texts[0]
+                    for queued_msg, text in zip(queued, texts[1:]):
+                        pretranscribed[queued_msg.get("id") or ""] = text
+                else:
+                    user_text = stt.transcribe(audio)
+                stt_ms = now_ms() - stt_start
+
+                if speculator is not None:
+                    if transcriber is not None and user_text:
+                        speculator.settle(user_text)
+                    else:
+                        speculator.reset()
+            else:
+                user_text = str(msg.get("text") or "")
+                if speculator is not None:
+                    speculator.reset()
+        except Exception as e:
+            # Reported through the route lane so RESULTs keep request order
+            route_lane.submit(_send_error_result, msg, str(e), traceback.format_exc(), start_ms)
+            return
+
+        # PHASE 11: an answer to a pending confirmation jumps ahead of queued requests
+        from wyzer.policy.pending_confirmation import has_active_pending
+        urgent = bool(user_text) and has_active_pending()
+        route_lane.submit(_route_job, msg, user_text, stt_ms, start_ms, token, urgent=urgent)
+
+    def _stt_loop() -> None:
+        # Messages pulled ahead of the lane (batched STT) and their transcripts
+        pending_msgs: Deque[Dict[str, Any]] = deque()
+        pretranscribed: Dict[str, str] = {}
+        while True:
+            msg = pending_msgs.popleft() if pending_msgs else stt_jobs.get()
+            if msg is None:
+                return
+            try:
+                _stt_job(msg, pending_msgs, pretranscribed)
+            except Exception as e:
+                logger.error(f"[SCHED] BrainSTT job failed: {e}")
+
+    stt_thread = threading.Thread(target=_stt_loop, name="BrainSTT", daemon=True)
+    stt_thread.start()
+    ticker.start()
+
+    safe_put(brain_to_core_q, {"type": "LOG", "level": "INFO", "msg": "brain_worker_started"})
+
+    while True:
+        try:
+            msg = core_to_brain_q.get(timeout=0.5)
+        except queue.Empty:
+            continue
+        mtype = (msg or {}).get("type")
+
+        if mtype == "SHUTDOWN":
+            safe_put(brain_to_core_q, {"type": "LOG", "level": "INFO", "msg": "brain_worker_shutdown"})
+            ticker.stop()
+            get_timer_scheduler().set_on_fire(None)
+            # Cancel queued/in-flight requests, then let the lanes drain
+            interrupts.bump()
+            stt_jobs.put(None)
+            stt_thread.join(timeout=2.0)
+            route_lane.shutdown()
+            try:
+                tts_controller.shutdown()
+            except Exception:
+                pass
+            orchestrator.shutdown_tool_pool()
+            # Flush the timer journal once no lane can start/cancel timers
+            get_timer_scheduler().shutdown()
+            
+            # Stop llamacpp server if we started it (Phase 8)
+            if llamacpp_base_url:
+                try:
+                    from wyzer.brain.llama_server_manager import stop_server
+                    logger.info("[LLAMACPP] Stopping embedded server...")
+                    stop_server(force=True)  # Force stop any llama-server on Wyzer shutdown
+                except Exception as e:
+                    logger.warning(f"[LLAMACPP] Error stopping server: {e}")
+            
+            # Stop window watcher if running (Phase 12)
+            if window_watcher:
+                try:
+                    from wyzer.world.window_watcher import stop_window_watcher
+                    stop_window_watcher()
+                except Exception:
+                    pass
+            
+            if window_snapshots is not None:
+                window_snapshots.close()
+            if stt_stream is not None:
+                stt_stream[1].cancel()
+            if audio_ring is not None:
+                audio_ring.close()
+            
+            return
+
+        if mtype == "INTERRUPT":
+            # Handled here, never queued: cancels whatever the lanes are doing
+            interrupts.bump()
+            tts_controller.interrupt()
+            safe_put(brain_to_core_q, {"type": "LOG", "level": "INFO", "msg": "interrupt_ack"})
+            continue
+
+        if mtype == "AUDIO_STREAM":
+            # Audio of an utterance still being spoken: decode partials now so
+            # the final AUDIO request only has to decode the tail
+            stream_id = msg.get("stream_id") or ""
+            if stt_stream is None or stt_stream[0] != stream_id:
+                if stt_stream is not None:
+                    stt_stream[1].cancel()
+                stt_stream = None
+                if speculator is not None:
+                    speculator.reset()
+                transcriber = stt.start_stream(on_partial=_on_partial_transcript)
+                if transcriber is not None:
+                    stt_stream = (stream_id, transcriber)
+            if stt_stream is not None:
+                chunk = _audio_from_msg(msg, audio_ring)
+                if chunk is None:
+                    chunk = np.array([], dtype=np.float32)
+                    offset = -1  # Lost: the final request decodes the whole utterance
+                else:
+                    offset = int(msg.get("offset", 0))
+                stt_stream[1].feed(chunk, offset=offset)
+            continue
+
+        if mtype not in {"AUDIO", "TEXT"}:
             safe_put(
                 brain_to_core_q,
-                {
-                    "type": "RESULT",
-                    "id": req_id,
-                    "reply": f"(error: {err})",
-                    "tool_calls": None,
-                    "tts_text": None,
-                    "meta": {
-                        "timings": {"total_ms": now_ms() - start_ms},
-                        "error": True,
-                        "is_followup": meta.get("is_followup", False),  # Preserve followup flag
-                        "followup_chain": meta.get("followup_chain"),  # Preserve chain count
-                    },
-                },
+                {"type": "LOG", "level": "WARNING", "msg": f"unknown_msg_type:{mtype}"},
             )
+            continue
+
+        meta = msg.get("meta") or {}
+        
+        # Check if this is just a TTS prompt (not a user query to process)
+        if meta.get("is_followup_prompt"):
+            # Just TTS the prompt, don't process it through orchestrator
+            prompt_text = str(msg.get("text") or "")
+            if prompt_text:
+                tts_controller.enqueue(prompt_text, meta={"_prompt_only": True})
+            continue
+
+        last_job_id = msg.get("id") or ""  # Track for heartbeat
+
+        # Hand the utterance's stream (if any) over with the request
+        transcriber = None
+        if mtype == "AUDIO" and stt_stream is not None:
+            stream_id = meta.get("stt_stream_id")
+            if stream_id and stt_stream[0] == stream_id:
+                transcriber = stt_stream[1]
+            else:
+                stt_stream[1].cancel()
+            stt_stream = None
+
+        msg["_dispatch"] = _Dispatch(interrupts.token(), now_ms(), transcriber)
+        stt_jobs.put(msg)
@@ -3,6 +3,7 @@ Configuration module for Wyzer AI Assistant.
 Centralizes all settings with environment variable overrides.
 """
 import os
+from pathlib import Path
 from typing import List, Optional
 
 
@@ -19,6 +20,10 @@ class Config:
     MAX_RECORD_SECONDS: float = float(os.environ.get("WYZER_MAX_RECORD_SECONDS", "10.0"))
     VAD_SILENCE_TIMEOUT: float = float(os.environ.get("WYZER_VAD_SILENCE_TIMEOUT", "1.2"))
     
+    # Core -> Brain audio handoff via a shared-memory ring (falls back to in-queue PCM)
+    AUDIO_SHM_ENABLED: bool = os.environ.get("WYZER_AUDIO_SHM_ENABLED", "true").lower() in ("true", "1", "yes")
+    AUDIO_SHM_SECONDS: float = float(os.environ.get("WYZER_AUDIO_SHM_SECONDS", "60.0"))
+    
     # No-speech-start timeout: abort listening if VAD never detects speech start within this window
     # This provides a fast exit when user triggers hotword but stays silent (instead of waiting for max duration).
     NO_SPEECH_START_TIMEOUT_SEC: float = float(os.environ.get("WYZER_NO_SPEECH_START_TIMEOUT_SEC", "2.5"))
@@ -26,6 +31,10 @@ class Config:
     # VAD settings
     VAD_THRESHOLD: float = float(os.environ.get("WYZER_VAD_THRESHOLD", "0.5"))
     VAD_MIN_SPEECH_DURATION_MS: int = int(os.environ.get("WYZER_VAD_MIN_SPEECH_MS", "250"))
+    # Queued frames scored together when the core falls behind (1 = frame by frame)
+    VAD_BATCH_MAX_FRAMES: int = int(os.environ.get("WYZER_VAD_BATCH_MAX_FRAMES", "8"))
+    # Energy fallback: speech must be this many times louder than the adaptive noise floor
+    VAD_ENERGY_SNR_RATIO: float = float(os.environ.get("WYZER_VAD_ENERGY_SNR_RATIO", "3.0"))
     
     # Hotword settings
     # Legacy single-wakeword settings (still supported for backward compatibility)
@@ -36,6 +45,11 @@ class Config:
     HOTWORD_TRIGGER_STREAK: int = int(os.environ.get("WYZER_HOTWORD_TRIGGER_STREAK", "3"))
     HOTWORD_MODEL_PATH: str = os.environ.get("WYZER_HOTWORD_MODEL_PATH", "hey_Wyzer.onnx")
     HOTWORD_COOLDOWN_SEC: float = float(os.environ.get("WYZER_HOTWORD_COOLDOWN_SEC", "1.5"))
+    # Skip openWakeWord inference on frames quieter than HOTWORD_GATE_RMS (keeps
+    # scoring for HOTWORD_GATE_HANGOVER_SEC after the last loud frame)
+    HOTWORD_ENERGY_GATE: bool = os.environ.get("WYZER_HOTWORD_ENERGY_GATE", "true").lower() in ("true", "1", "yes")
+    HOTWORD_GATE_RMS: float = float(os.environ.get("WYZER_HOTWORD_GATE_RMS", "0.003"))
+    HOTWORD_GATE_HANGOVER_SEC: float = float(os.environ.get("WYZER_HOTWORD_GATE_HANGOVER_SEC", "1.0"))
     POST_IDLE_DRAIN_SEC: float = float(os.environ.get("WYZER_POST_IDLE_DRAIN_SEC", "0.5"))
     
     # Multi-wakeword configuration (list of wakeword model configs)
@@ -76,6 +90,21 @@ class Config:
     WHISPER_MODEL: str = os.environ.get("WYZER_WHISPER_MODEL", "small")
     WHISPER_DEVICE: str = os.environ.get("WYZER_WHISPER_DEVICE", "cpu")
     WHISPER_COMPUTE_TYPE: str = os.environ.get("WYZER_WHISPER_COMPUTE_TYPE", "int8")
+    # Decode a synthetic clip at startup so the first utterance skips lazy init
+    STT_WARMUP: bool = os.environ.get("WYZER_STT_WARMUP", "true").lower() in ("true", "1", "yes")
+    # Utterances up to this long decode greedily ("command" preset); longer ones use beam search
+    STT_COMMAND_MAX_SEC: float = float(os.environ.get("WYZER_STT_COMMAND_MAX_SEC", "4.0"))
+    STT_BEAM_SIZE: int = int(os.environ.get("WYZER_STT_BEAM_SIZE", "5"))
+    # Decode utterances already queued behind the current one in a single batch
+    STT_BATCH_DECODE: bool = os.environ.get("WYZER_STT_BATCH_DECODE", "true").lower() in ("true", "1", "yes")
+    
+    # Streaming STT: transcribe while the user is still speaking
+    STT_STREAMING: bool = os.environ.get("WYZER_STT_STREAMING", "true").lower() in ("true", "1", "yes")
+    STT_STREAM_CHUNK_SEC: float = float(os.environ.get("WYZER_STT_STREAM_CHUNK_SEC", "0.5"))
+    STT_STREAM_STEP_SEC: float = float(os.environ.get("WYZER_STT_STREAM_STEP_SEC", "1.0"))
+    STT_STREAM_MAX_WINDOW_SEC: float = float(os.environ.get("WYZER_STT_STREAM_MAX_WINDOW_SEC", "20.0"))
+    # Route partial transcripts speculatively (resolve open targets, build the LLM prompt)
+    SPECULATIVE_ROUTING: bool = os.environ.get("WYZER_SPECULATIVE_ROUTING", "true").lower() in ("true", "1", "yes")
     
     # Repetition filter (token repeats > this threshold => garbage)
     MAX_TOKEN_REPEATS: int = int(os.environ.get("WYZER_MAX_TOKEN_REPEATS", "6"))
@@ -88,6 +117,10 @@ class Config:
     OLLAMA_BASE_URL: str = os.environ.get("WYZER_OLLAMA_URL", "http://127.0.0.1:11434")
     OLLAMA_MODEL: str = os.environ.get("WYZER_OLLAMA_MODEL", "llama3.1:latest")
     LLM_TIMEOUT: int = int(os.environ.get("WYZER_LLM_TIMEOUT", "30"))
+    # Reuse HTTP/1.1 keep-alive connections to the LLM server across requests
+    LLM_HTTP_KEEPALIVE: bool = os.environ.get("WYZER_LLM_HTTP_KEEPALIVE", "true").lower() in ("true", "1", "yes")
+    LLM_HTTP_POOL_MAXSIZE: int = max(1, int(os.environ.get("WYZER_LLM_HTTP_POOL_MAXSIZE", "4")))  # idle connections per host
+    LLM_HTTP_IDLE_SEC: float = float(os.environ.get("WYZER_LLM_HTTP_IDLE_SEC", "30.0"))
     
     # Llama.cpp server settings (used when LLM_MODE = "llamacpp")
     LLAMACPP_BIN_PATH: str = os.environ.get("WYZER_LLAMACPP_BIN", "./wyzer/llm_bin/llama-server.exe")
@@ -101,6 +134,9 @@ class Config:
     LLAMACPP_GPU_LAYERS: int = int(os.environ.get("WYZER_LLAMACPP_GPU_LAYERS", "-1"))  # -1 = auto (all layers)
     # Safe performance knobs when auto-optimize is OFF
     LLAMACPP_BATCH_SIZE: int = int(os.environ.get("WYZER_LLAMACPP_BATCH_SIZE", "512"))
+    # KV-cache prefix reuse: send cache_prompt, pin prompts with the same opening to one slot
+    LLAMACPP_CACHE_PROMPT: bool = os.environ.get("WYZER_LLAMACPP_CACHE_PROMPT", "true").lower() in ("true", "1", "yes")
+    LLAMACPP_SLOT_AFFINITY: bool = os.environ.get("WYZER_LLAMACPP_SLOT_AFFINITY", "true").lower() in ("true", "1", "yes")
     OLLAMA_STREAM: bool = os.environ.get("WYZER_OLLAMA_STREAM", "true").lower() in ("true", "1", "yes")
     # Stream-to-TTS: progressively feed LLM tokens into TTS for faster perceived response
     # This is separate from OLLAMA_STREAM; when enabled, chunks are spoken as they arrive.
@@ -139,8 +175,19 @@ class Config:
     PIPER_EXE_PATH: str = os.environ.get("WYZER_PIPER_EXE_PATH", "./assets/piper/piper.exe")
     PIPER_MODEL_PATH: str = os.environ.get("WYZER_PIPER_MODEL_PATH", "./assets/piper/en_US-voice.onnx")
     PIPER_SPEAKER_ID: Optional[int] = None if not os.environ.get("WYZER_PIPER_SPEAKER_ID") else int(os.environ.get("WYZER_PIPER_SPEAKER_ID"))
+    # Keep one Piper process loaded and stream raw PCM (no per-sentence process/temp WAV)
+    PIPER_DAEMON: bool = os.environ.get("WYZER_PIPER_DAEMON", "true").lower() in ("true", "1", "yes")
+    # Synthesized speech cache (repeated replies skip synthesis)
+    TTS_CACHE_ENABLED: bool = os.environ.get("WYZER_TTS_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+    TTS_CACHE_DIR: str = os.environ.get("WYZER_TTS_CACHE_DIR", str(Path(__file__).parent.parent / "data" / "tts_cache"))
+    TTS_CACHE_RAM_MB: int = int(os.environ.get("WYZER_TTS_CACHE_RAM_MB", "16"))
+    TTS_CACHE_DISK_MB: int = int(os.environ.get("WYZER_TTS_CACHE_DISK_MB", "128"))
+    TTS_CACHE_MAX_CHARS: int = int(os.environ.get("WYZER_TTS_CACHE_MAX_CHARS", "200"))  # longer texts aren't cached
+    TTS_CACHE_PREWARM: bool = os.environ.get("WYZER_TTS_CACHE_PREWARM", "true").lower() in ("true", "1", "yes")
     TTS_RATE: float = float(os.environ.get("WYZER_TTS_RATE", "1.0"))
     TTS_OUTPUT_DEVICE: Optional[int] = None if not os.environ.get("WYZER_TTS_OUTPUT_DEVICE") else int(os.environ.get("WYZER_TTS_OUTPUT_DEVICE"))
+    # Keep the TTS output stream open between sentences; close after this many idle seconds (0 = never)
+    TTS_OUTPUT_IDLE_CLOSE_SEC: float = float(os.environ.get("WYZER_TTS_OUTPUT_IDLE_CLOSE_SEC", "30"))
     SPEAK_HOTWORD_INTERRUPT: bool = os.environ.get("WYZER_SPEAK_HOTWORD_INTERRUPT", "true").lower() in ("true", "1", "yes")
     POST_SPEAK_DRAIN_SEC: float = float(os.environ.get("WYZER_POST_SPEAK_DRAIN_SEC", "0.35"))
     SPEAK_START_COOLDOWN_SEC: float = float(os.environ.get("WYZER_SPEAK_START_COOLDOWN_SEC", "1.8"))
@@ -150,9 +197,16 @@ class Config:
     
     # Queue settings
     AUDIO_QUEUE_MAX_SIZE: int = int(os.environ.get("WYZER_AUDIO_QUEUE_MAX_SIZE", "100"))
+    # Pre-allocated capture ring; frames are handed out as views of its slots
+    # (never smaller than MAX_RECORD_SECONDS plus the queue backlog)
+    CAPTURE_RING_SECONDS: float = float(os.environ.get("WYZER_CAPTURE_RING_SECONDS", "30.0"))
     
     # Logging
     LOG_LEVEL: str = os.environ.get("WYZER_LOG_LEVEL", "INFO")
+    # Write log output from a background thread so callers never block on the terminal
+    LOG_ASYNC: bool = os.environ.get("WYZER_LOG_ASYNC", "true").lower() in ("true", "1", "yes")
+    # Optional JSON-lines log file (empty = disabled); shared by all processes
+    LOG_JSON_PATH: str = os.environ.get("WYZER_LOG_JSON_PATH", "")
     
     # Quiet Mode - hides debug info like heartbeats for cleaner user experience
     QUIET_MODE: bool = os.environ.get("WYZER_QUIET_MODE", "false").lower() in ("true", "1", "yes")
@@ -172,6 +226,17 @@ class Config:
     # LocalLibrary Auto-Alias (learn spoken phrases -> targets)
     AUTO_ALIAS_ENABLED: bool = os.environ.get("WYZER_AUTO_ALIAS_ENABLED", "true").lower() in ("true", "1", "yes")
     AUTO_ALIAS_MIN_CONFIDENCE: float = float(os.environ.get("WYZER_AUTO_ALIAS_MIN_CONFIDENCE", "0.85"))
+
+    # LocalLibrary Tier 2/Tier 3 scanning
+    LOCAL_LIBRARY_SCAN_WORKERS: int = max(1, int(os.environ.get("WYZER_LOCAL_LIBRARY_SCAN_WORKERS", "8")))  # directory listing threads
+    # Skip directories whose mtime is unchanged since the last scan (reuse their entries)
+    LOCAL_LIBRARY_INCREMENTAL_SCAN: bool = os.environ.get("WYZER_LOCAL_LIBRARY_INCREMENTAL_SCAN", "true").lower() in ("true", "1", "yes")
+    # Game/UWP sources (Steam, Epic, shortcuts, folder scan, Xbox, UWP) run concurrently,
+    # each bounded by this timeout; unchanged sources (same fingerprint) are not re-queried
+    LOCAL_LIBRARY_SOURCE_TIMEOUT_SEC: float = float(os.environ.get("WYZER_LOCAL_LIBRARY_SOURCE_TIMEOUT_SEC", "60"))
+    LOCAL_LIBRARY_SOURCE_CACHE: bool = os.environ.get("WYZER_LOCAL_LIBRARY_SOURCE_CACHE", "true").lower() in ("true", "1", "yes")
+    # Refresh the library in the background when the brain starts
+    LOCAL_LIBRARY_REFRESH_ON_STARTUP: bool = os.environ.get("WYZER_LOCAL_LIBRARY_REFRESH_ON_STARTUP", "false").lower() in ("true", "1", "yes")
     
     # FOLLOWUP listening window settings
     FOLLOWUP_ENABLED: bool = os.environ.get("WYZER_FOLLOWUP_ENABLED", "true").lower() in ("true", "1", "yes")
@@ -182,9 +247,13 @@ class Config:
     TOOL_POOL_ENABLED: bool = os.environ.get("WYZER_TOOL_POOL_ENABLED", "true").lower() in ("true", "1", "yes")
     TOOL_POOL_WORKERS: int = max(1, min(5, int(os.environ.get("WYZER_TOOL_POOL_WORKERS", "3"))))  # 1-5 workers
     TOOL_POOL_TIMEOUT_SEC: int = int(os.environ.get("WYZER_TOOL_POOL_TIMEOUT_SEC", "15"))
+    # Run independent launch/query intents of one plan concurrently
+    TOOL_PARALLEL_INTENTS: bool = os.environ.get("WYZER_TOOL_PARALLEL_INTENTS", "true").lower() in ("true", "1", "yes")
     
     # Heartbeat & verification settings
     HEARTBEAT_INTERVAL_SEC: float = float(os.environ.get("WYZER_HEARTBEAT_INTERVAL_SEC", "10.0"))
+    # Abandon an in-flight LLM/tool call when an INTERRUPT arrives (the brain moves on at once)
+    BRAIN_PREEMPTIBLE_JOBS: bool = os.environ.get("WYZER_BRAIN_PREEMPTIBLE_JOBS", "true").lower() in ("true", "1", "yes")
     VERIFY_MODE: bool = os.environ.get("WYZER_VERIFY_MODE", "false").lower() in ("true", "1", "yes")
     
     # Memory settings (Phase 7)
@@ -265,6 +334,17 @@ class Config:
         "WYZER_WINDOW_WATCHER_MAX_BULK_CLOSE", "10"
     ))
     
+    # Publish each watcher snapshot to the tool workers via shared memory so
+    # window tools resolve targets without re-enumerating every window
+    WINDOW_SNAPSHOT_SHARED: bool = os.environ.get(
+        "WYZER_WINDOW_SNAPSHOT_SHARED", "true"
+    ).lower() in ("true", "1", "yes")
+    
+    # Snapshots older than this are ignored and tools enumerate windows themselves
+    WINDOW_SNAPSHOT_MAX_AGE_MS: int = int(os.environ.get(
+        "WYZER_WINDOW_SNAPSHOT_MAX_AGE_MS", "1500"
+    ))
+    
     @classmethod
     def get_frame_duration_ms(cls) -> float:
         """Get frame duration in milliseconds"""
@@ -13,7 +13,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Literal, TYPE_CHECKING
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Literal, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from wyzer.core.multi_intent_parser import parse_multi_intent_with_fallback
@@ -578,809 +578,666 @@ def _parse_compound_timer_duration(text: str) -> int:
     return total_seconds
 
 
-def _decide_single_clause(text: str) -> HybridDecision:
-    clause = (text or "").strip()
-    if not clause:
-        return HybridDecision(mode="llm", intents=None, reply="", confidence=0.0)
+# ═══════════════════════════════════════════════════════════════════════════
+# Compiled single-clause routing engine
+#
+# Every deterministic rule below is an ordered handler plus a cheap prefilter:
+# - ``leads``: the clause's leading word must be one of these (anchored rules)
+# - ``keywords``: one of these substrings must appear in the lowered clause
+# Rules with neither always run. The prefilter is only ever a NECESSARY
+# condition for the rule's regexes, so filtering never changes a decision;
+# rules still run in their original priority order.
+# ═══════════════════════════════════════════════════════════════════════════
+
+_AMBIGUOUS_TARGETS = {"it", "this", "that", "something", "anything"}
+_TARGET_STOP_VERBS = ["play", "pause", "resume", "then", "and", "also", "plus"]
+
+# Leading word of a clause: first run of letters, ignoring leading punctuation.
+_LEAD_WORD_RE = re.compile(r"[^a-z]*([a-z]+)")
+
+
+@dataclass
+class _Clause:
+    """Pre-normalized views of a clause, computed once per routing call."""
+
+    raw: str             # stripped clause, original casing
+    lower: str           # raw.lower()
+    stripped: str        # trailing punctuation removed, original casing
+    tl: str              # trailing punctuation removed, lowercased
+    tl_normalized: str   # tl with internal , - . ' replaced by spaces
+    lead: str            # leading word used for dispatch ("" if none)
+
+    @classmethod
+    def from_text(cls, clause: str) -> "_Clause":
+        lower = clause.lower()
+        stripped = _strip_trailing_punct(clause)
+        tl = stripped.lower()
+        tl_normalized = re.sub(r'[,\-.\']', ' ', tl).replace('  ', ' ').strip()
+        m = _LEAD_WORD_RE.match(lower)
+        return cls(
+            raw=clause,
+            lower=lower,
+            stripped=stripped,
+            tl=tl,
+            tl_normalized=tl_normalized,
+            lead=m.group(1) if m else "",
+        )
+
+
+@dataclass(frozen=True)
+class _Rule:
+    name: str
+    handler: Callable[[_Clause], Optional[HybridDecision]]
+    leads: FrozenSet[str] = frozenset()
+    keywords: Tuple[str, ...] = ()
+
 
+def _tool_decision(tool: str, args: Dict[str, Any], confidence: float, reply: str = "") -> HybridDecision:
+    return HybridDecision(
+        mode="tool_plan",
+        intents=[{"tool": tool, "args": args, "continue_on_error": False}],
+        reply=reply,
+        confidence=confidence,
+    )
+
+
+def _window_target_decision(
+    target: str, tool: str, args: Dict[str, Any], reply: str, confidence: float
+) -> HybridDecision:
+    """Shared guard for "<verb> <target>" window/app rules."""
+    # If the target is missing or too ambiguous, defer to LLM.
+    if not target or target.lower() in _AMBIGUOUS_TARGETS:
+        return HybridDecision(mode="llm", intents=None, reply="", confidence=0.4)
+
+    # Extra defense: if target includes other action verbs, defer to LLM.
+    target_l = re.sub(r"\s+", " ", target.lower()).strip()
+    if any(v in target_l.split() for v in _TARGET_STOP_VERBS):
+        return HybridDecision(mode="llm", intents=None, reply="", confidence=0.3)
+
+    return _tool_decision(tool, args, confidence, reply)
+
+
+def _rule_url_or_domain(c: _Clause) -> Optional[HybridDecision]:
     # Safety: URLs/domains go to LLM.
-    if _looks_like_url_or_domain(clause):
+    if _looks_like_url_or_domain(c.raw):
         return HybridDecision(mode="llm", intents=None, reply="", confidence=0.8)
+    return None
 
-    # Time queries.
-    if _TIME_RE.match(clause.strip()):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{"tool": "get_time", "args": {}, "continue_on_error": False}],
-            reply="",
-            confidence=0.95,
-        )
 
-    # ═══════════════════════════════════════════════════════════════════════
-    # Google search queries: "google this cats", "google cats", "search google for cats"
-    # ═══════════════════════════════════════════════════════════════════════
-    m = _GOOGLE_SEARCH_RE.match(clause)
+def _rule_time(c: _Clause) -> Optional[HybridDecision]:
+    if _TIME_RE.match(c.raw):
+        return _tool_decision("get_time", {}, 0.95)
+    return None
+
+
+def _rule_google_search(c: _Clause) -> Optional[HybridDecision]:
+    # "google this cats", "google cats"
+    m = _GOOGLE_SEARCH_RE.match(c.raw)
     if m:
         query = (m.group("q") or "").strip()
         if query:
-            return HybridDecision(
-                mode="tool_plan",
-                intents=[{
-                    "tool": "google_search_open",
-                    "args": {"query": query},
-                    "continue_on_error": False
-                }],
-                reply=f"Opening Google for: {query}.",
-                confidence=0.95,
-            )
-    
-    m = _SEARCH_GOOGLE_RE.match(clause)
+            return _tool_decision("google_search_open", {"query": query}, 0.95, f"Opening Google for: {query}.")
+    return None
+
+
+def _rule_search_google(c: _Clause) -> Optional[HybridDecision]:
+    # "search google for cats"
+    m = _SEARCH_GOOGLE_RE.match(c.raw)
     if m:
         query = (m.group("q") or "").strip()
         if query:
-            return HybridDecision(
-                mode="tool_plan",
-                intents=[{
-                    "tool": "google_search_open",
-                    "args": {"query": query},
-                    "continue_on_error": False
-                }],
-                reply=f"Opening Google for: {query}.",
-                confidence=0.95,
-            )
-
-    # ═══════════════════════════════════════════════════════════════════════
-    # Timer queries: start, cancel, or check status
-    # ═══════════════════════════════════════════════════════════════════════
-    
-    # Timer start: "set a timer for 5 minutes" or "set a timer for 4 minutes and 20 seconds"
-    # Try compound pattern first (it handles both compound and simple cases)
-    m = _TIMER_COMPOUND_RE.match(clause)
-    if m:
-        duration_seconds = _parse_compound_timer_duration(clause)
+            return _tool_decision("google_search_open", {"query": query}, 0.95, f"Opening Google for: {query}.")
+    return None
+
+
+def _rule_timer_start(c: _Clause) -> Optional[HybridDecision]:
+    # "set a timer for 5 minutes" or "set a timer for 4 minutes and 20 seconds"
+    # The compound pattern handles both compound and simple cases.
+    if _TIMER_COMPOUND_RE.match(c.raw):
+        duration_seconds = _parse_compound_timer_duration(c.raw)
         if duration_seconds < 1:
             duration_seconds = 1  # Minimum 1 second
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{
-                "tool": "timer",
-                "args": {"action": "start", "duration_seconds": duration_seconds},
-                "continue_on_error": False
-            }],
-            reply="",
-            confidence=0.95,
-        )
-    
-    # Timer cancel: "cancel the timer"
-    if _TIMER_CANCEL_RE.match(clause):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{
-                "tool": "timer",
-                "args": {"action": "cancel"},
-                "continue_on_error": False
-            }],
-            reply="",
-            confidence=0.92,
-        )
-    
-    # Timer status: "how much time is left"
-    if _TIMER_STATUS_RE.match(clause):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{
-                "tool": "timer",
-                "args": {"action": "status"},
-                "continue_on_error": False
-            }],
-            reply="",
-            confidence=0.92,
-        )
+        return _tool_decision("timer", {"action": "start", "duration_seconds": duration_seconds}, 0.95)
+    return None
 
-    # Weather queries - extract location if provided
-    if _WEATHER_RE.search(clause):
-        clause_lower = clause.lower()
-        # Try to extract location from the query
-        location = None
-        
-        # Weekday names for temporal parsing
-        weekday_names = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-        
-        # Pattern: "weather in <location>" / "temperature in <location>" / "forecast for <location>"
-        m = re.search(r"\b(?:in|for|at|near|on)\s+(.+?)(?:\?|!|\.)?$", clause, re.IGNORECASE)
-        if m:
-            location = (m.group(1) or "").strip().rstrip("?!.").strip()
-            # Filter out common non-location words and temporal words
-            location_l = location.lower()
-            temporal_words = {"it", "this", "here", "there", "the area", "outside", "tomorrow", "today", "the week", "this week", "next week", "weather", "the weather", "forecast", "the forecast"}
-            temporal_words.update(weekday_names)
-            if location_l in temporal_words:
-                location = None
-        
-        # Extract temporal reference (tomorrow, this week, weekday names, etc.)
-        day_offset = 0  # 0 = today
-        days = 3  # default forecast days
-        
-        if "tomorrow" in clause_lower:
-            day_offset = 1
-            days = 2  # Include today + tomorrow
-        elif re.search(r"\bnext\s+week\b", clause_lower):
-            days = 14
-            day_offset = 7
-        elif re.search(r"\b(?:this\s+)?week(?:ly)?\b", clause_lower):
-            days = 7
-        else:
-            # Check for weekday names (e.g., "on Thursday", "this Friday", "next Monday")
-            import datetime
-            today = datetime.date.today()
-            today_weekday = today.weekday()  # 0=Monday, 6=Sunday
-            
-            # Check if user said "next <weekday>" (meaning next week's occurrence)
-            next_week_match = re.search(r"\bnext\s+(" + "|".join(weekday_names) + r")\b", clause_lower)
-            
-            for i, day_name in enumerate(weekday_names):
-                if day_name in clause_lower:
-                    # Calculate days until that weekday
-                    target_weekday = i  # 0=Monday, 6=Sunday
-                    days_until = (target_weekday - today_weekday) % 7
-                    
-                    if next_week_match and next_week_match.group(1) == day_name:
-                        # "next Thursday" means next week's Thursday
-                        days_until = days_until + 7 if days_until > 0 else 7
-                    elif days_until == 0:
-                        # Same day of week - could be today or next week
-                        # If they say "this Monday" it's today, otherwise assume next week
-                        if "this" in clause_lower:
-                            days_until = 0
-                        else:
-                            days_until = 7  # Next occurrence
-                    
-                    day_offset = days_until
-                    days = max(day_offset + 1, 7)  # Ensure we fetch enough days
-                    break
-        
-        # Build arguments
-        weather_args = {}
-        if location:
-            weather_args["location"] = location
-        if day_offset > 0:
-            weather_args["day_offset"] = day_offset
-        if days != 3:
-            weather_args["days"] = days
-        
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "get_weather_forecast",
-                    "args": weather_args,
-                    "continue_on_error": False,
-                }
-            ],
-            reply="",
-            confidence=0.92,
-        )
 
-    # System info queries: queries about system specs, CPU, RAM, hardware
-    if _SYSTEM_INFO_RE.match(clause):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{"tool": "get_system_info", "args": {}, "continue_on_error": False}],
-            reply="",
-            confidence=0.9,
-        )
+def _rule_timer_cancel(c: _Clause) -> Optional[HybridDecision]:
+    if _TIMER_CANCEL_RE.match(c.raw):
+        return _tool_decision("timer", {"action": "cancel"}, 0.92)
+    return None
 
-    # Location/IP queries: queries about user's location, IP address, timezone
-    if _LOCATION_RE.match(clause):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{"tool": "get_location", "args": {}, "continue_on_error": False}],
-            reply="",
-            confidence=0.9,
-        )
 
-    # ═══════════════════════════════════════════════════════════════════════
-    # Phase 9: Window context queries - "what am I looking at", "what app is active"
-    # Screen awareness (READ-ONLY) - NO OCR, NO screenshots, NO automation
-    # ═══════════════════════════════════════════════════════════════════════
-    if _WINDOW_CONTEXT_RE.match(clause):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{"tool": "get_window_context", "args": {}, "continue_on_error": False}],
-            reply="",
-            confidence=0.95,
-        )
+def _rule_timer_status(c: _Clause) -> Optional[HybridDecision]:
+    if _TIMER_STATUS_RE.match(c.raw):
+        return _tool_decision("timer", {"action": "status"}, 0.92)
+    return None
 
-    # Get window monitor queries: "what monitor is X on"
-    m = _GET_WINDOW_MONITOR_RE.match(clause)
+
+_WEEKDAY_NAMES = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+
+def _rule_weather(c: _Clause) -> Optional[HybridDecision]:
+    if not _WEATHER_RE.search(c.raw):
+        return None
+
+    clause = c.raw
+    clause_lower = c.lower
+    # Try to extract location from the query
+    location = None
+
+    # Pattern: "weather in <location>" / "temperature in <location>" / "forecast for <location>"
+    m = re.search(r"\b(?:in|for|at|near|on)\s+(.+?)(?:\?|!|\.)?$", clause, re.IGNORECASE)
+    if m:
+        location = (m.group(1) or "").strip().rstrip("?!.").strip()
+        # Filter out common non-location words and temporal words
+        location_l = location.lower()
+        temporal_words = {"it", "this", "here", "there", "the area", "outside", "tomorrow", "today", "the week", "this week", "next week", "weather", "the weather", "forecast", "the forecast"}
+        temporal_words.update(_WEEKDAY_NAMES)
+        if location_l in temporal_words:
+            location = None
+
+    # Extract temporal reference (tomorrow, this week, weekday names, etc.)
+    day_offset = 0  # 0 = today
+    days = 3  # default forecast days
+
+    if "tomorrow" in clause_lower:
+        day_offset = 1
+        days = 2  # Include today + tomorrow
+    elif re.search(r"\bnext\s+week\b", clause_lower):
+        days = 14
+        day_offset = 7
+    elif re.search(r"\b(?:this\s+)?week(?:ly)?\b", clause_lower):
+        days = 7
+    else:
+        # Check for weekday names (e.g., "on Thursday", "this Friday", "next Monday")
+        import datetime
+        today = datetime.date.today()
+        today_weekday = today.weekday()  # 0=Monday, 6=Sunday
+
+        # Check if user said "next <weekday>" (meaning next week's occurrence)
+        next_week_match = re.search(r"\bnext\s+(" + "|".join(_WEEKDAY_NAMES) + r")\b", clause_lower)
+
+        for i, day_name in enumerate(_WEEKDAY_NAMES):
+            if day_name in clause_lower:
+                # Calculate days until that weekday
+                target_weekday = i  # 0=Monday, 6=Sunday
+                days_until = (target_weekday - today_weekday) % 7
+
+                if next_week_match and next_week_match.group(1) == day_name:
+                    # "next Thursday" means next week's Thursday
+                    days_until = days_until + 7 if days_until > 0 else 7
+                elif days_until == 0:
+                    # Same day of week - could be today or next week
+                    # If they say "this Monday" it's today, otherwise assume next week
+                    if "this" in clause_lower:
+                        days_until = 0
+                    else:
+                        days_until = 7  # Next occurrence
+
+                day_offset = days_until
+                days = max(day_offset + 1, 7)  # Ensure we fetch enough days
+                break
+
+    # Build arguments
+    weather_args = {}
+    if location:
+        weather_args["location"] = location
+    if day_offset > 0:
+        weather_args["day_offset"] = day_offset
+    if days != 3:
+        weather_args["days"] = days
+
+    return _tool_decision("get_weather_forecast", weather_args, 0.92)
+
+
+def _rule_system_info(c: _Clause) -> Optional[HybridDecision]:
+    if _SYSTEM_INFO_RE.match(c.raw):
+        return _tool_decision("get_system_info", {}, 0.9)
+    return None
+
+
+def _rule_location(c: _Clause) -> Optional[HybridDecision]:
+    if _LOCATION_RE.match(c.raw):
+        return _tool_decision("get_location", {}, 0.9)
+    return None
+
+
+def _rule_window_context(c: _Clause) -> Optional[HybridDecision]:
+    # Phase 9: "what am I looking at", "what app is active" (READ-ONLY)
+    if _WINDOW_CONTEXT_RE.match(c.raw):
+        return _tool_decision("get_window_context", {}, 0.95)
+    return None
+
+
+def _rule_get_window_monitor(c: _Clause) -> Optional[HybridDecision]:
+    # "what monitor is X on"
+    m = _GET_WINDOW_MONITOR_RE.match(c.raw)
     if m:
         target = (m.group(1) or "").strip().strip('"').strip("'")
-        if target and target.lower() not in {"it", "this", "that", "something", "anything"}:
-            return HybridDecision(
-                mode="tool_plan",
-                intents=[{"tool": "get_window_monitor", "args": {"process": target}, "continue_on_error": False}],
-                reply="",
-                confidence=0.92,
-            )
-
-    # Monitor info queries: queries about connected monitors
-    if _MONITOR_INFO_RE.match(clause):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{"tool": "monitor_info", "args": {}, "continue_on_error": False}],
-            reply="",
-            confidence=0.92,
-        )
+        if target and target.lower() not in _AMBIGUOUS_TARGETS:
+            return _tool_decision("get_window_monitor", {"process": target}, 0.92)
+    return None
 
-    # Local library refresh/scan commands
-    tl_norm = _strip_trailing_punct(clause).lower()
-    
+
+def _rule_monitor_info(c: _Clause) -> Optional[HybridDecision]:
+    if _MONITOR_INFO_RE.match(c.raw):
+        return _tool_decision("monitor_info", {}, 0.92)
+    return None
+
+
+def _rule_library_scan(c: _Clause) -> Optional[HybridDecision]:
     # "scan files", "scan my files", "scan apps", "scan my apps" -> tier 3 (full file system scan)
-    if re.match(r"^scan\s+(?:my\s+)?(?:files|apps?)$", tl_norm):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "local_library_refresh",
-                    "args": {"mode": "tier3"},
-                    "continue_on_error": False,
-                }
-            ],
-            reply="",
-            confidence=0.92,
-        )
-    
+    if re.match(r"^scan\s+(?:my\s+)?(?:files|apps?)$", c.tl):
+        return _tool_decision("local_library_refresh", {"mode": "tier3"}, 0.92)
+    return None
+
+
+def _rule_library_refresh(c: _Clause) -> Optional[HybridDecision]:
     # "refresh library", "rebuild library" -> normal mode
-    if re.match(r"^(?:refresh|rebuild|rescan)\s+library$", tl_norm):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "local_library_refresh",
-                    "args": {},
-                    "continue_on_error": False,
-                }
-            ],
-            reply="",
-            confidence=0.93,
-        )
+    if re.match(r"^(?:refresh|rebuild|rescan)\s+library$", c.tl):
+        return _tool_decision("local_library_refresh", {}, 0.93)
+    return None
 
-    # System storage commands (check before generic open pattern).
-    tl = _strip_trailing_punct(clause).lower()
-    # Remove internal punctuation (commas, hyphens, periods) for more flexible matching
-    tl_normalized = re.sub(r'[,\-.\']', ' ', tl).replace('  ', ' ').strip()
-    
+
+def _rule_storage_scan_devices(c: _Clause) -> Optional[HybridDecision]:
     # "scan devices" -> deep tier (full file system scan)
-    if re.match(r"^scan\s+devices?$", tl_normalized):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "system_storage_scan",
-                    "args": {"tier": "deep"},
-                    "continue_on_error": False,
-                }
-            ],
-            reply="",
-            confidence=0.92,
-        )
-    
+    if re.match(r"^scan\s+devices?$", c.tl_normalized):
+        return _tool_decision("system_storage_scan", {"tier": "deep"}, 0.92)
+    return None
+
+
+def _rule_storage_scan_drive(c: _Clause) -> Optional[HybridDecision]:
     # "scan drive c", "scan d", "scan disc e" etc -> deep tier for specific drive
-    m = re.search(r"\bscan\s*(?:hard\s+)?(?:drive|disc|disk)?\s*([a-z])\b|^scandisk([a-z])$", tl_normalized)
+    m = re.search(r"\bscan\s*(?:hard\s+)?(?:drive|disc|disk)?\s*([a-z])\b|^scandisk([a-z])$", c.tl_normalized)
     if m:
         drive_letter = (m.group(1) or m.group(2) or "").upper()
         if drive_letter:
-            return HybridDecision(
-                mode="tool_plan",
-                intents=[
-                    {
-                        "tool": "system_storage_scan",
-                        "args": {"tier": "deep", "drive": drive_letter},
-                        "continue_on_error": False,
-                    }
-                ],
-                reply="",
-                confidence=0.92,
-            )
-    
+            return _tool_decision("system_storage_scan", {"tier": "deep", "drive": drive_letter}, 0.92)
+    return None
+
+
+def _rule_storage_refresh(c: _Clause) -> Optional[HybridDecision]:
     # "system scan" / "scan my drives" / "refresh drive index" / "scan disc" / "scan discs" / "scan discy"
-    if re.match(r"^(?:system\s+scan|scan\s+(?:my\s+)?drives?|scan\s+dis(?:c|k)[ys]?|refresh\s+drive\s+index)$", tl_normalized):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "system_storage_scan",
-                    "args": {"refresh": True},
-                    "continue_on_error": False,
-                }
-            ],
-            reply="",
-            confidence=0.95,
-        )
+    if re.match(r"^(?:system\s+scan|scan\s+(?:my\s+)?drives?|scan\s+dis(?:c|k)[ys]?|refresh\s+drive\s+index)$", c.tl_normalized):
+        return _tool_decision("system_storage_scan", {"refresh": True}, 0.95)
+    return None
 
+
+def _rule_storage_list(c: _Clause) -> Optional[HybridDecision]:
     # "list drives" / "show drives" / "how much space do i have" / "storage summary"
-    if re.search(r"\b(?:list\s+drives|show\s+drives|how\s+much\s+space\s+do\s+i\s+have|storage\s+summary)\b", tl_normalized):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "system_storage_list",
-                    "args": {},
-                    "continue_on_error": False,
-                }
-            ],
-            reply="",
-            confidence=0.92,
-        )
+    if re.search(r"\b(?:list\s+drives|show\s+drives|how\s+much\s+space\s+do\s+i\s+have|storage\s+summary)\b", c.tl_normalized):
+        return _tool_decision("system_storage_list", {}, 0.92)
+    return None
+
 
+def _rule_storage_drive_space(c: _Clause) -> Optional[HybridDecision]:
     # "how much space does d drive have" / "space on d drive" / "how much storage is on d" / "what on e" / "what does e have" / "how much storage do i have on c" / "what does edrive have"
-    m = re.search(r"(?:what\s+does\s+|what\s+(?:is\s+)?on|how\s+much\s+(?:space|storage)(?:\s+(?:is|do\s+i\s+have))?\s+on|space\s+on|storage\s+on)\s*(?:drive\s+)?([a-z])|(?:what\s+does\s+)?([a-z])drive(?:\s+have)?|(?:space|storage)\s+on\s+([a-z])", tl_normalized)
+    m = re.search(r"(?:what\s+does\s+|what\s+(?:is\s+)?on|how\s+much\s+(?:space|storage)(?:\s+(?:is|do\s+i\s+have))?\s+on|space\s+on|storage\s+on)\s*(?:drive\s+)?([a-z])|(?:what\s+does\s+)?([a-z])drive(?:\s+have)?|(?:space|storage)\s+on\s+([a-z])", c.tl_normalized)
     if m:
         drive_letter = m.group(1) or m.group(2) or m.group(3)
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "system_storage_list",
-                    "args": {"drive": drive_letter},
-                    "continue_on_error": False,
-                }
-            ],
-            reply="",
-            confidence=0.91,
-        )
+        return _tool_decision("system_storage_list", {"drive": drive_letter}, 0.91)
+    return None
+
 
+def _rule_storage_open(c: _Clause) -> Optional[HybridDecision]:
     # "open d drive" / "open drive d" / "open hard drive d" / "open d:" / "open /mnt/storage" / "open d" (single letter)
-    m = re.match(r"^open\s+(?:hard\s+)?(?:drive\s+)?([a-z]|[a-z]:|/[a-z0-9/_\-]+)(?:\s+drive)?$", tl)
+    m = re.match(r"^open\s+(?:hard\s+)?(?:drive\s+)?([a-z]|[a-z]:|/[a-z0-9/_\-]+)(?:\s+drive)?$", c.tl)
     if m:
-        drive_token = m.group(1)
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "system_storage_open",
-                    "args": {"drive": drive_token},
-                    "continue_on_error": False,
-                }
-            ],
-            reply="",
-            confidence=0.93,
-        )
+        return _tool_decision("system_storage_open", {"drive": m.group(1)}, 0.93)
+    return None
 
-    # ═══════════════════════════════════════════════════════════════════════
-    # Switch app patterns: deterministic app switching using focus history
-    # ═══════════════════════════════════════════════════════════════════════
-    clause_stripped = _strip_trailing_punct(clause)
-    
+
+def _rule_switch_previous(c: _Clause) -> Optional[HybridDecision]:
     # "go back" / "switch back" / "previous app" / "last app" -> switch_app mode=previous
-    if _SWITCH_PREVIOUS_RE.match(clause_stripped):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{
-                "tool": "switch_app",
-                "args": {"mode": "previous"},
-                "continue_on_error": False
-            }],
-            reply="",
-            confidence=0.95,
-        )
-    
+    if _SWITCH_PREVIOUS_RE.match(c.stripped):
+        return _tool_decision("switch_app", {"mode": "previous"}, 0.95)
+    return None
+
+
+def _rule_switch_next(c: _Clause) -> Optional[HybridDecision]:
     # "next app" / "cycle apps" -> switch_app mode=next
-    if _SWITCH_NEXT_RE.match(clause_stripped):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{
-                "tool": "switch_app",
-                "args": {"mode": "next"},
-                "continue_on_error": False
-            }],
-            reply="",
-            confidence=0.93,
-        )
-    
+    if _SWITCH_NEXT_RE.match(c.stripped):
+        return _tool_decision("switch_app", {"mode": "next"}, 0.93)
+    return None
+
+
+def _rule_switch_to(c: _Clause) -> Optional[HybridDecision]:
     # "switch to X" / "go to X" -> switch_app mode=named
-    m = _SWITCH_TO_APP_RE.match(clause_stripped)
-    if m:
-        target = (m.group(1) or "").strip().strip('"').strip("'")
-        # If the target is missing or too ambiguous, defer to LLM.
-        if not target or target.lower() in {"it", "this", "that", "something", "anything"}:
-            return HybridDecision(mode="llm", intents=None, reply="", confidence=0.4)
-        
-        # Check for ambiguous targets that could be media commands
-        target_l = target.lower().strip()
-        if target_l in {"the last app", "last app", "previous app", "the previous app"}:
-            # This is actually a "switch back" command
-            return HybridDecision(
-                mode="tool_plan",
-                intents=[{
-                    "tool": "switch_app",
-                    "args": {"mode": "previous"},
-                    "continue_on_error": False
-                }],
-                reply="",
-                confidence=0.95,
-            )
-        
-        if target_l in {"the next app", "next app"}:
-            # This is actually a "next app" command
-            return HybridDecision(
-                mode="tool_plan",
-                intents=[{
-                    "tool": "switch_app",
-                    "args": {"mode": "next"},
-                    "continue_on_error": False
-                }],
-                reply="",
-                confidence=0.93,
-            )
-        
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{
-                "tool": "switch_app",
-                "args": {"mode": "named", "app": target},
-                "continue_on_error": False
-            }],
-            reply=f"Switching to {target}.",
-            confidence=0.92,
-        )
+    m = _SWITCH_TO_APP_RE.match(c.stripped)
+    if not m:
+        return None
+    target = (m.group(1) or "").strip().strip('"').strip("'")
+    # If the target is missing or too ambiguous, defer to LLM.
+    if not target or target.lower() in _AMBIGUOUS_TARGETS:
+        return HybridDecision(mode="llm", intents=None, reply="", confidence=0.4)
 
+    # Check for ambiguous targets that could be media commands
+    target_l = target.lower().strip()
+    if target_l in {"the last app", "last app", "previous app", "the previous app"}:
+        # This is actually a "switch back" command
+        return _tool_decision("switch_app", {"mode": "previous"}, 0.95)
+
+    if target_l in {"the next app", "next app"}:
+        # This is actually a "next app" command
+        return _tool_decision("switch_app", {"mode": "next"}, 0.93)
+
+    return _tool_decision("switch_app", {"mode": "named", "app": target}, 0.92, f"Switching to {target}.")
+
+
+def _rule_open(c: _Clause) -> Optional[HybridDecision]:
     # Open/launch/start X (non-URL) -> open_target.
-    m = _OPEN_RE.match(clause_stripped)
-    if m:
-        target = (m.group(2) or "").strip().strip('"').strip("'")
-        # If the target is missing or too ambiguous, defer to LLM.
-        if not target or target.lower() in {"it", "this", "that", "something", "anything"}:
-            return HybridDecision(mode="llm", intents=None, reply="", confidence=0.4)
-
-        # Double-check: the extracted target itself may look like a URL.
-        if _looks_like_url_or_domain(target):
-            return HybridDecision(mode="llm", intents=None, reply="", confidence=0.8)
-
-        # Extra defense: if target includes other action verbs, defer to LLM.
-        target_l = re.sub(r"\s+", " ", target.lower()).strip()
-        if any(v in target_l.split() for v in ["play", "pause", "resume", "then", "and", "also", "plus"]):
-            return HybridDecision(mode="llm", intents=None, reply="", confidence=0.3)
-
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "open_target",
-                    "args": {"query": target},
-                    "continue_on_error": False,
-                }
-            ],
-            reply=f"Opening {target}.",
-            confidence=0.9,
-        )
+    m = _OPEN_RE.match(c.stripped)
+    if not m:
+        return None
+    target = (m.group(2) or "").strip().strip('"').strip("'")
+    # If the target is missing or too ambiguous, defer to LLM.
+    if not target or target.lower() in _AMBIGUOUS_TARGETS:
+        return HybridDecision(mode="llm", intents=None, reply="", confidence=0.4)
+
+    # Double-check: the extracted target itself may look like a URL.
+    if _looks_like_url_or_domain(target):
+        return HybridDecision(mode="llm", intents=None, reply="", confidence=0.8)
+
+    return _window_target_decision(target, "open_target", {"query": target}, f"Opening {target}.", 0.9)
 
+
+def _rule_close(c: _Clause) -> Optional[HybridDecision]:
     # Close/quit/exit X -> close_window.
-    m = _CLOSE_RE.match(clause_stripped)
-    if m:
-        target = (m.group(2) or "").strip().strip('"').strip("'")
-        # If the target is missing or too ambiguous, defer to LLM.
-        if not target or target.lower() in {"it", "this", "that", "something", "anything"}:
-            return HybridDecision(mode="llm", intents=None, reply="", confidence=0.4)
-
-        # Extra defense: if target includes other action verbs, defer to LLM.
-        target_l = re.sub(r"\s+", " ", target.lower()).strip()
-        if any(v in target_l.split() for v in ["play", "pause", "resume", "then", "and", "also", "plus"]):
-            return HybridDecision(mode="llm", intents=None, reply="", confidence=0.3)
-
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "close_window",
-                    "args": {"title": target},
-                    "continue_on_error": False,
-                }
-            ],
-            reply=f"Closing {target}.",
-            confidence=0.85,
+    m = _CLOSE_RE.match(c.stripped)
+    if not m:
+        return None
+    target = (m.group(2) or "").strip().strip('"').strip("'")
+    return _window_target_decision(target, "close_window", {"title": target}, f"Closing {target}.", 0.85)
 
-        )
 
+def _rule_minimize(c: _Clause) -> Optional[HybridDecision]:
     # Minimize/shrink X -> minimize_window.
-    m = _MINIMIZE_RE.match(clause_stripped)
-    if m:
-        target = (m.group(2) or "").strip().strip('"').strip("'")
-        # If the target is missing or too ambiguous, defer to LLM.
-        if not target or target.lower() in {"it", "this", "that", "something", "anything"}:
-            return HybridDecision(mode="llm", intents=None, reply="", confidence=0.4)
-
-        # Extra defense: if target includes other action verbs, defer to LLM.
-        target_l = re.sub(r"\s+", " ", target.lower()).strip()
-        if any(v in target_l.split() for v in ["play", "pause", "resume", "then", "and", "also", "plus"]):
-            return HybridDecision(mode="llm", intents=None, reply="", confidence=0.3)
-
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "minimize_window",
-                    "args": {"title": target},
-                    "continue_on_error": False,
-                }
-            ],
-            reply=f"Minimizing {target}.",
-            confidence=0.85,
-        )
+    m = _MINIMIZE_RE.match(c.stripped)
+    if not m:
+        return None
+    target = (m.group(2) or "").strip().strip('"').strip("'")
+    return _window_target_decision(target, "minimize_window", {"title": target}, f"Minimizing {target}.", 0.85)
+
 
+def _rule_maximize(c: _Clause) -> Optional[HybridDecision]:
     # Maximize/fullscreen/expand X -> maximize_window.
-    m = _MAXIMIZE_RE.match(clause_stripped)
-    if m:
-        target = (m.group(2) or "").strip().strip('"').strip("'")
-        # If the target is missing or too ambiguous, defer to LLM.
-        if not target or target.lower() in {"it", "this", "that", "something", "anything"}:
-            return HybridDecision(mode="llm", intents=None, reply="", confidence=0.4)
-
-        # Extra defense: if target includes other action verbs, defer to LLM.
-        target_l = re.sub(r"\s+", " ", target.lower()).strip()
-        if any(v in target_l.split() for v in ["play", "pause", "resume", "then", "and", "also", "plus"]):
-            return HybridDecision(mode="llm", intents=None, reply="", confidence=0.3)
-
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "maximize_window",
-                    "args": {"title": target},
-                    "continue_on_error": False,
-                }
-            ],
-            reply=f"Maximizing {target}.",
-            confidence=0.85,
-        )
+    m = _MAXIMIZE_RE.match(c.stripped)
+    if not m:
+        return None
+    target = (m.group(2) or "").strip().strip('"').strip("'")
+    return _window_target_decision(target, "maximize_window", {"title": target}, f"Maximizing {target}.", 0.85)
 
+
+def _rule_move_monitor(c: _Clause) -> Optional[HybridDecision]:
     # Move window to monitor: "move X to monitor 2" / "send chrome to monitor next"
-    m = _MOVE_MONITOR_RE.match(clause_stripped)
-    if m:
-        target = (m.group(1) or "").strip().strip('"').strip("'")
-        monitor = (m.group(2) or "").strip().lower()
-        
-        # Convert word numbers to digits
-        monitor = _WORD_TO_DIGIT.get(monitor, monitor)
-        
-        # If the target is missing or too ambiguous, defer to LLM.
-        if not target or target.lower() in {"it", "this", "that", "something", "anything"}:
-            return HybridDecision(mode="llm", intents=None, reply="", confidence=0.4)
-
-        # Extra defense: if target includes other action verbs, defer to LLM.
-        target_l = re.sub(r"\s+", " ", target.lower()).strip()
-        if any(v in target_l.split() for v in ["play", "pause", "resume", "then", "and", "also", "plus"]):
-            return HybridDecision(mode="llm", intents=None, reply="", confidence=0.3)
-
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "move_window_to_monitor",
-                    "args": {"title": target, "monitor": monitor},
-                    "continue_on_error": False,
-                }
-            ],
-            reply=f"Moving {target} to monitor {monitor}.",
-            confidence=0.85,
-        )
+    m = _MOVE_MONITOR_RE.match(c.stripped)
+    if not m:
+        return None
+    target = (m.group(1) or "").strip().strip('"').strip("'")
+    monitor = (m.group(2) or "").strip().lower()
+
+    # Convert word numbers to digits
+    monitor = _WORD_TO_DIGIT.get(monitor, monitor)
+
+    return _window_target_decision(
+        target,
+        "move_window_to_monitor",
+        {"title": target, "monitor": monitor},
+        f"Moving {target} to monitor {monitor}.",
+        0.85,
+    )
 
-    # Audio device listing: "list audio devices" / "show audio devices"
-    tl_audio = _strip_trailing_punct(clause).lower()
-    if _AUDIO_DEVICE_LIST_RE.match(tl_audio):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "set_audio_output_device",
-                    "args": {"action": "list"},
-                    "continue_on_error": False,
-                }
-            ],
-            reply="",
-            confidence=0.92,
-        )
 
-    # Audio device switching: "switch audio to vizio" / "set audio to headphones"
-    m = _AUDIO_DEVICE_SWITCH_RE.match(clause_stripped)
-    if m:
-        device = (m.group(1) or "").strip().strip('"').strip("'")
-        
-        # If the device is missing or too ambiguous, defer to LLM.
-        if not device or device.lower() in {"it", "this", "that", "something", "anything"}:
-            return HybridDecision(mode="llm", intents=None, reply="", confidence=0.4)
-        
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[
-                {
-                    "tool": "set_audio_output_device",
-                    "args": {"action": "set", "device": device},
-                    "continue_on_error": False,
-                }
-            ],
-            reply=f"Switching audio to {device}.",
-            confidence=0.9,
-        )
+def _rule_audio_device_list(c: _Clause) -> Optional[HybridDecision]:
+    # "list audio devices" / "show audio devices"
+    if _AUDIO_DEVICE_LIST_RE.match(c.tl):
+        return _tool_decision("set_audio_output_device", {"action": "list"}, 0.92)
+    return None
 
-    # Minimal media/volume controls (only if tools exist; existence checked upstream).
-    tl = clause.lower()
 
+def _rule_audio_device_switch(c: _Clause) -> Optional[HybridDecision]:
+    # "switch audio to vizio" / "set audio to headphones"
+    m = _AUDIO_DEVICE_SWITCH_RE.match(c.stripped)
+    if not m:
+        return None
+    device = (m.group(1) or "").strip().strip('"').strip("'")
+
+    # If the device is missing or too ambiguous, defer to LLM.
+    if not device or device.lower() in _AMBIGUOUS_TARGETS:
+        return HybridDecision(mode="llm", intents=None, reply="", confidence=0.4)
+
+    return _tool_decision("set_audio_output_device", {"action": "set", "device": device}, 0.9, f"Switching audio to {device}.")
+
+
+def _rule_volume_control(c: _Clause) -> Optional[HybridDecision]:
     # --- True volume control (pycaw) ---
     # If the command looks like volume/mute and the tool exists, prefer volume_control.
     # We keep this conservative and only match obvious phrases.
     # Match: "turn down X", "turn X down", "turn it up", etc.
-    if re.search(r"\b(?:mute|unmute|volume|sound|audio|louder|quieter|turn\s+(?:it\s+)?(?:up|down)|turn\s+\w+\s+(?:up|down))\b", tl):
-        scope, proc = _parse_volume_scope_and_process(clause)
-
-        # Get volume / what is the volume
-        # Expanded query detection: explicit query words OR "what ... volume" patterns OR bare "<app> volume" queries
-        is_explicit_query = bool(re.search(r"\b(?:get|check|show|tell\s+me|what\s+is|what's|whats|current)\b", tl))
-        is_what_volume = bool(re.search(r"\bwhat\b.*\bvolume\b", tl))  # "what spotify volume at"
-        is_volume_worded = any(k in tl for k in ["volume", "sound", "audio"])
-        has_action_word = bool(re.search(r"\b(?:set|up|down|louder|quieter|increase|decrease|raise|lower|mute|unmute)\b", tl))
-        has_percent = _extract_volume_percent(tl) is not None
-        
-        # Bare volume query: "<app> volume" or "volume" with no action/percent = asking for current level
-        is_bare_volume_query = is_volume_worded and not has_action_word and not has_percent
-        is_query = is_explicit_query or is_what_volume or is_bare_volume_query
-        
-        if is_query and is_volume_worded and not has_percent and not re.search(
-            r"\b(?:up|down|louder|quieter|increase|decrease|raise|lower)\b", tl
-        ):
-            args: Dict[str, Any] = {"scope": scope, "action": "get"}
-            if scope == "app":
-                args["process"] = proc
-            return HybridDecision(
-                mode="tool_plan",
-                intents=[{"tool": "volume_control", "args": args, "continue_on_error": False}],
-                reply="",
-                confidence=0.92,
-            )
-
-        # Mute/unmute
-        if re.search(r"\bunmute\b", tl):
-            args = {"scope": scope, "action": "unmute"}
-            if scope == "app":
-                args["process"] = proc
-            return HybridDecision(
-                mode="tool_plan",
-                intents=[{"tool": "volume_control", "args": args, "continue_on_error": False}],
-                reply="",
-                confidence=0.93,
-            )
-
-        if re.search(r"\bmute\b", tl) and not re.search(r"\bunmute\b", tl):
-            args = {"scope": scope, "action": "mute"}
-            if scope == "app":
-                args["process"] = proc
-            return HybridDecision(
-                mode="tool_plan",
-                intents=[{"tool": "volume_control", "args": args, "continue_on_error": False}],
-                reply="",
-                confidence=0.93,
-            )
-
-        # Absolute set: "volume 35" / "set volume to 35" / "spotify volume 35"
-        if is_volume_worded:
-            percent = _extract_volume_percent(tl)
-            # Avoid interpreting "volume down 10" as set-to.
-            has_direction = bool(re.search(r"\b(?:up|down|increase|decrease|raise|lower|louder|quieter)\b", tl))
-            if percent is not None and not has_direction:
-                args = {"scope": scope, "action": "set", "level": int(percent)}
-                if scope == "app":
-                    args["process"] = proc
-                return HybridDecision(
-                    mode="tool_plan",
-                    intents=[{"tool": "volume_control", "args": args, "continue_on_error": False}],
-                    reply="",
-                    confidence=0.9,
-                )
-
-        # Relative change: up/down/louder/quieter, optional numeric delta.
-        # Match: "volume up", "turn up X", "turn X up", "louder", etc.
-        if re.search(r"\b(?:volume\s+up|turn\s+up|louder|raise|increase|sound\s+up)\b", tl) or re.search(
-            r"\bturn\s+(?:it\s+)?up\b|\bturn\s+\w+\s+up\b", tl
-        ):
-            pct = _extract_volume_percent(tl)
-            delta = int(pct) if pct is not None else _parse_volume_delta_hint(tl)
-            args = {"scope": scope, "action": "change", "delta": int(delta)}
-            if scope == "app":
-                args["process"] = proc
-            return HybridDecision(
-                mode="tool_plan",
-                intents=[{"tool": "volume_control", "args": args, "continue_on_error": False}],
-                reply="",
-                confidence=0.88,
-            )
-
-        # Match: "volume down", "turn down X", "turn X down", "quieter", etc.
-        if re.search(r"\b(?:volume\s+down|turn\s+down|quieter|lower|decrease|sound\s+down)\b", tl) or re.search(
-            r"\bturn\s+(?:it\s+)?down\b|\bturn\s+\w+\s+down\b", tl
-        ):
-            pct = _extract_volume_percent(tl)
-            delta = int(pct) if pct is not None else _parse_volume_delta_hint(tl)
-            args = {"scope": scope, "action": "change", "delta": -int(delta)}
-            if scope == "app":
-                args["process"] = proc
-            return HybridDecision(
-                mode="tool_plan",
-                intents=[{"tool": "volume_control", "args": args, "continue_on_error": False}],
-                reply="",
-                confidence=0.88,
-            )
-
-    if re.search(r"\b(?:mute|unmute)\b", tl):
-        # Fallback for older setups without volume_control.
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{"tool": "volume_mute_toggle", "args": {}, "continue_on_error": False}],
-            reply="",
-            confidence=0.9,
-        )
+    tl = c.lower
+    if not re.search(r"\b(?:mute|unmute|volume|sound|audio|louder|quieter|turn\s+(?:it\s+)?(?:up|down)|turn\s+\w+\s+(?:up|down))\b", tl):
+        return None
 
-    if re.search(r"\b(?:volume\s+up|turn\s+up|louder)\b", tl):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{"tool": "volume_up", "args": {}, "continue_on_error": False}],
-            reply="",
-            confidence=0.85,
-        )
+    scope, proc = _parse_volume_scope_and_process(c.raw)
+
+    def _volume(args: Dict[str, Any], confidence: float) -> HybridDecision:
+        if scope == "app":
+            args["process"] = proc
+        return _tool_decision("volume_control", args, confidence)
+
+    # Get volume / what is the volume
+    # Expanded query detection: explicit query words OR "what ... volume" patterns OR bare "<app> volume" queries
+    is_explicit_query = bool(re.search(r"\b(?:get|check|show|tell\s+me|what\s+is|what's|whats|current)\b", tl))
+    is_what_volume = bool(re.search(r"\bwhat\b.*\bvolume\b", tl))  # "what spotify volume at"
+    is_volume_worded = any(k in tl for k in ["volume", "sound", "audio"])
+    has_action_word = bool(re.search(r"\b(?:set|up|down|louder|quieter|increase|decrease|raise|lower|mute|unmute)\b", tl))
+    has_percent = _extract_volume_percent(tl) is not None
+
+    # Bare volume query: "<app> volume" or "volume" with no action/percent = asking for current level
+    is_bare_volume_query = is_volume_worded and not has_action_word and not has_percent
+    is_query = is_explicit_query or is_what_volume or is_bare_volume_query
+
+    if is_query and is_volume_worded and not has_percent and not re.search(
+        r"\b(?:up|down|louder|quieter|increase|decrease|raise|lower)\b", tl
+    ):
+        return _volume({"scope": scope, "action": "get"}, 0.92)
+
+    # Mute/unmute
+    if re.search(r"\bunmute\b", tl):
+        return _volume({"scope": scope, "action": "unmute"}, 0.93)
+
+    if re.search(r"\bmute\b", tl) and not re.search(r"\bunmute\b", tl):
+        return _volume({"scope": scope, "action": "mute"}, 0.93)
+
+    # Absolute set: "volume 35" / "set volume to 35" / "spotify volume 35"
+    if is_volume_worded:
+        percent = _extract_volume_percent(tl)
+        # Avoid interpreting "volume down 10" as set-to.
+        has_direction = bool(re.search(r"\b(?:up|down|increase|decrease|raise|lower|louder|quieter)\b", tl))
+        if percent is not None and not has_direction:
+            return _volume({"scope": scope, "action": "set", "level": int(percent)}, 0.9)
+
+    # Relative change: up/down/louder/quieter, optional numeric delta.
+    # Match: "volume up", "turn up X", "turn X up", "louder", etc.
+    if re.search(r"\b(?:volume\s+up|turn\s+up|louder|raise|increase|sound\s+up)\b", tl) or re.search(
+        r"\bturn\s+(?:it\s+)?up\b|\bturn\s+\w+\s+up\b", tl
+    ):
+        pct = _extract_volume_percent(tl)
+        delta = int(pct) if pct is not None else _parse_volume_delta_hint(tl)
+        return _volume({"scope": scope, "action": "change", "delta": int(delta)}, 0.88)
+
+    # Match: "volume down", "turn down X", "turn X down", "quieter", etc.
+    if re.search(r"\b(?:volume\s+down|turn\s+down|quieter|lower|decrease|sound\s+down)\b", tl) or re.search(
+        r"\bturn\s+(?:it\s+)?down\b|\bturn\s+\w+\s+down\b", tl
+    ):
+        pct = _extract_volume_percent(tl)
+        delta = int(pct) if pct is not None else _parse_volume_delta_hint(tl)
+        return _volume({"scope": scope, "action": "change", "delta": -int(delta)}, 0.88)
 
-    if re.search(r"\b(?:volume\s+down|turn\s+down|quieter)\b", tl):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{"tool": "volume_down", "args": {}, "continue_on_error": False}],
-            reply="",
-            confidence=0.85,
-        )
+    return None
+
+
+def _rule_mute_toggle(c: _Clause) -> Optional[HybridDecision]:
+    # Fallback for older setups without volume_control.
+    if re.search(r"\b(?:mute|unmute)\b", c.lower):
+        return _tool_decision("volume_mute_toggle", {}, 0.9)
+    return None
 
+
+def _rule_volume_up(c: _Clause) -> Optional[HybridDecision]:
+    if re.search(r"\b(?:volume\s+up|turn\s+up|louder)\b", c.lower):
+        return _tool_decision("volume_up", {}, 0.85)
+    return None
+
+
+def _rule_volume_down(c: _Clause) -> Optional[HybridDecision]:
+    if re.search(r"\b(?:volume\s+down|turn\s+down|quieter)\b", c.lower):
+        return _tool_decision("volume_down", {}, 0.85)
+    return None
+
+
+def _rule_now_playing(c: _Clause) -> Optional[HybridDecision]:
     # "What's playing", "what song is playing", "what is currently playing", "now playing"
-    if re.search(r"\b(?:what(?:'?s|\s+is)\s+(?:currently\s+)?playing|what\s+(?:song|track|music|media)\s+is\s+(?:this|playing)|now\s+playing|current\s+(?:song|track|media)|playing\s+(?:right\s+)?now)\b", tl):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{"tool": "get_now_playing", "args": {}, "continue_on_error": False}],
-            reply="",
-            confidence=0.9,
-        )
+    if re.search(r"\b(?:what(?:'?s|\s+is)\s+(?:currently\s+)?playing|what\s+(?:song|track|music|media)\s+is\s+(?:this|playing)|now\s+playing|current\s+(?:song|track|media)|playing\s+(?:right\s+)?now)\b", c.lower):
+        return _tool_decision("get_now_playing", {}, 0.9)
+    return None
 
+
+def _rule_media_play_pause(c: _Clause) -> Optional[HybridDecision]:
     # High-confidence media play/pause patterns (unambiguous commands)
-    if re.search(r"\b(?:hit\s+play|hit\s+pause|press\s+play|press\s+pause|play\s*pause|play/pause|play\s+(?:the\s+)?music|play\s+(?:the\s+)?media|play\s+(?:the\s+)?video|pause\s+(?:it|this|that|the\s+music|music|media|video)|resume\s+(?:it|this|that|the\s+music|music|media|video|playback)|unpause)\b", tl):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{"tool": "media_play_pause", "args": {}, "continue_on_error": False}],
-            reply="",
-            confidence=0.92,
-        )
+    if re.search(r"\b(?:hit\s+play|hit\s+pause|press\s+play|press\s+pause|play\s*pause|play/pause|play\s+(?:the\s+)?music|play\s+(?:the\s+)?media|play\s+(?:the\s+)?video|pause\s+(?:it|this|that|the\s+music|music|media|video)|resume\s+(?:it|this|that|the\s+music|music|media|video|playback)|unpause)\b", c.lower):
+        return _tool_decision("media_play_pause", {}, 0.92)
+    return None
+
 
+def _rule_media_bare_play_pause(c: _Clause) -> Optional[HybridDecision]:
     # Lower-confidence bare "play"/"pause"/"resume" (could be ambiguous)
-    if re.search(r"\b(?:pause|play|resume)\b", tl):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{"tool": "media_play_pause", "args": {}, "continue_on_error": False}],
-            reply="",
-            confidence=0.8,
-        )
+    if re.search(r"\b(?:pause|play|resume)\b", c.lower):
+        return _tool_decision("media_play_pause", {}, 0.8)
+    return None
 
-    if re.search(r"\b(?:next\s+track|skip|next\s+song|next\s+video|next\s+media)\b", tl):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{"tool": "media_next", "args": {}, "continue_on_error": False}],
-            reply="",
-            confidence=0.85,
-        )
 
-    if re.search(r"\b(?:previous\s+track|back|prior\s+track|last\s+song|previous\s+song|previous\s+video|previous\s+media|go\s+back)\b", tl):
-        return HybridDecision(
-            mode="tool_plan",
-            intents=[{"tool": "media_previous", "args": {}, "continue_on_error": False}],
-            reply="",
-            confidence=0.85,
-        )
+def _rule_media_next(c: _Clause) -> Optional[HybridDecision]:
+    if re.search(r"\b(?:next\s+track|skip|next\s+song|next\s+video|next\s+media)\b", c.lower):
+        return _tool_decision("media_next", {}, 0.85)
+    return None
+
+
+def _rule_media_previous(c: _Clause) -> Optional[HybridDecision]:
+    if re.search(r"\b(?:previous\s+track|back|prior\s+track|last\s+song|previous\s+song|previous\s+video|previous\s+media|go\s+back)\b", c.lower):
+        return _tool_decision("media_previous", {}, 0.85)
+    return None
+
+
+# Priority order matters: the first rule that returns a decision wins.
+# When adding a rule, its leads/keywords must be implied by its patterns.
+_RULES: Tuple[_Rule, ...] = (
+    _Rule("url_or_domain", _rule_url_or_domain, keywords=(".", "://")),
+    _Rule("time", _rule_time, leads=frozenset({"what", "time", "current"})),
+    _Rule("google_search", _rule_google_search, leads=frozenset({"google"})),
+    _Rule("search_google", _rule_search_google, leads=frozenset({"search"})),
+    _Rule("timer_start", _rule_timer_start, leads=frozenset({"set", "start", "create"})),
+    _Rule("timer_cancel", _rule_timer_cancel, leads=frozenset({"cancel", "stop", "clear", "end", "delete", "remove"})),
+    _Rule("timer_status", _rule_timer_status, leads=frozenset({"how", "time", "check", "get", "show", "timer", "what"})),
+    _Rule("weather", _rule_weather, keywords=(
+        "weather", "temp", "forecast", "cold", "hot", "warm", "rain", "snow", "outside",
+        "jacket", "coat", "umbrella", "sweater", "hoodie", "sunglasses", "sunscreen",
+        "hat", "scarf", "gloves", "boots", "dress",
+    )),
+    _Rule("system_info", _rule_system_info, keywords=("system", "ram", "memory", "cpu", "processor", "computer", "hardware")),
+    _Rule("location", _rule_location, keywords=("ip", "location", "address", "time", "country", "city", "coordinates", "where", "am")),
+    _Rule("window_context", _rule_window_context, leads=frozenset({"what", "whats", "which", "tell", "current", "active", "focused"})),
+    _Rule("get_window_monitor", _rule_get_window_monitor, leads=frozenset({"what", "which"})),
+    _Rule("monitor_info", _rule_monitor_info, leads=frozenset({
+        "scan", "check", "list", "show", "display", "how", "get", "tell", "monitor", "screen", "what", "which",
+    })),
+    _Rule("library_scan", _rule_library_scan, leads=frozenset({"scan"})),
+    _Rule("library_refresh", _rule_library_refresh, leads=frozenset({"refresh", "rebuild", "rescan"})),
+    _Rule("storage_scan_devices", _rule_storage_scan_devices, leads=frozenset({"scan"})),
+    _Rule("storage_scan_drive", _rule_storage_scan_drive, keywords=("scan",)),
+    _Rule("storage_refresh", _rule_storage_refresh, leads=frozenset({"system", "scan", "refresh"})),
+    _Rule("storage_list", _rule_storage_list, keywords=("drives", "space", "storage")),
+    _Rule("storage_drive_space", _rule_storage_drive_space, keywords=("what", "space", "storage", "drive")),
+    _Rule("storage_open", _rule_storage_open, leads=frozenset({"open"})),
+    _Rule("switch_previous", _rule_switch_previous, leads=frozenset({"go", "switch", "previous", "last", "back"})),
+    _Rule("switch_next", _rule_switch_next, leads=frozenset({"next", "cycle", "switch"})),
+    _Rule("switch_to", _rule_switch_to, leads=frozenset({"switch", "go"})),
+    _Rule("open", _rule_open, leads=frozenset({"open", "launch", "start"})),
+    _Rule("close", _rule_close, leads=frozenset({"close", "quit", "exit"})),
+    _Rule("minimize", _rule_minimize, leads=frozenset({"minimize", "shrink"})),
+    _Rule("maximize", _rule_maximize, leads=frozenset({"maximize", "fullscreen", "expand", "full"})),
+    _Rule("move_monitor", _rule_move_monitor, leads=frozenset({"move", "send"})),
+    _Rule("audio_device_list", _rule_audio_device_list, leads=frozenset({"list", "show", "display", "what"})),
+    _Rule("audio_device_switch", _rule_audio_device_switch, leads=frozenset({"switch", "set", "change", "swap"})),
+    _Rule("volume_control", _rule_volume_control, keywords=("mute", "volume", "sound", "audio", "louder", "quieter", "turn")),
+    _Rule("mute_toggle", _rule_mute_toggle, keywords=("mute",)),
+    _Rule("volume_up", _rule_volume_up, keywords=("volume", "turn", "louder")),
+    _Rule("volume_down", _rule_volume_down, keywords=("volume", "turn", "quieter")),
+    _Rule("now_playing", _rule_now_playing, keywords=("playing", "current", "what")),
+    _Rule("media_play_pause", _rule_media_play_pause, keywords=("play", "pause", "resume")),
+    _Rule("media_bare_play_pause", _rule_media_bare_play_pause, keywords=("play", "pause", "resume")),
+    _Rule("media_next", _rule_media_next, keywords=("next", "skip")),
+    _Rule("media_previous", _rule_media_previous, keywords=("previous", "back", "prior", "last")),
+)
+
+
+def _compile_dispatch(rules: Tuple[_Rule, ...]) -> Tuple[Dict[str, Tuple[int, ...]], Tuple[int, ...]]:
+    """Build the lead-word dispatch table.
+
+    Returns (by_lead, unanchored) where by_lead maps a leading word to the
+    indices of anchored rules keyed on it, and unanchored lists the indices
+    of keyword-gated / always-on rules. Both are in priority order.
+    """
+    by_lead: Dict[str, List[int]] = {}
+    unanchored: List[int] = []
+    for idx, rule in enumerate(rules):
+        if rule.leads:
+            for word in rule.leads:
+                by_lead.setdefault(word, []).append(idx)
+        else:
+            unanchored.append(idx)
+    return {k: tuple(v) for k, v in by_lead.items()}, tuple(unanchored)
+
+
+_RULES_BY_LEAD, _UNANCHORED_RULES = _compile_dispatch(_RULES)
+_ALL_RULE_INDICES: Tuple[int, ...] = tuple(range(len(_RULES)))
+
+
+def _candidate_rules(c: _Clause) -> Tuple[int, ...]:
+    """Indices of rules whose prefilter passes, in priority order."""
+    # The prefilters reason about ASCII lowercase; anything else (e.g. Unicode
+    # case-folding quirks) takes the full ordered chain to stay exact.
+    if not c.raw.isascii():
+        return _ALL_RULE_INDICES
+
+    lower = c.lower
+    keyword_hits = [
+        idx for idx in _UNANCHORED_RULES
+        if not _RULES[idx].keywords or any(k in lower for k in _RULES[idx].keywords)
+    ]
+    anchored = _RULES_BY_LEAD.get(c.lead, ())
+    if not anchored:
+        return tuple(keyword_hits)
+    return tuple(sorted(keyword_hits + list(anchored)))
+
 
+def _run_rules(c: _Clause, indices: Tuple[int, ...]) -> HybridDecision:
+    for idx in indices:
+        decision = _RULES[idx].handler(c)
+        if decision is not None:
+            return decision
     return HybridDecision(mode="llm", intents=None, reply="", confidence=0.3)
 
 
+def _decide_single_clause(text: str) -> HybridDecision:
+    clause = (text or "").strip()
+    if not clause:
+        return HybridDecision(mode="llm", intents=None, reply="", confidence=0.0)
+
+    c = _Clause.from_text(clause)
+    return _run_rules(c, _candidate_rules(c))
+
+
 def decide(text: str) -> HybridDecision:
     """Decide whether to run tools deterministically or use the LLM.
 
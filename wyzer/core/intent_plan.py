@@ -180,6 +180,80 @@ class ExecutionSummary:
     stopped_early: bool = False
 
 
+# ============================================================================
+# PARALLEL EXECUTION GROUPING
+# ============================================================================
+# Tools that may run concurrently with each other: app/site launches and
+# read-only queries. Anything touching focus, window layout, audio or media
+# state stays strictly ordered.
+PARALLEL_SAFE_TOOLS = frozenset({
+    "open_target",
+    "open_website",
+    "google_search_open",
+    "get_time",
+    "get_system_info",
+    "get_location",
+    "get_weather_forecast",
+    "monitor_info",
+    "get_window_context",
+    "get_window_monitor",
+    "system_storage_list",
+})
+
+# Argument keys that identify what an intent acts on (first match wins).
+_TARGET_ARG_KEYS = ("query", "url", "app", "title", "process", "target", "drive", "location")
+
+
+def intent_target_key(intent: "Intent") -> Tuple[str, str]:
+    """Return a (tool, normalized target) key used to detect conflicting intents."""
+    args = intent.args if isinstance(intent.args, dict) else {}
+    for key in _TARGET_ARG_KEYS:
+        value = args.get(key)
+        if isinstance(value, str) and value.strip():
+            return intent.tool, " ".join(value.lower().split())
+    return intent.tool, ""
+
+
+def group_parallel_intents(intents: List["Intent"], max_group_size: int = MAX_INTENTS) -> List[List[int]]:
+    """
+    Split a plan into ordered execution groups of intent indices.
+    
+    Consecutive parallel-safe intents with distinct targets share a group and
+    may run concurrently; every other intent gets a group of its own, so
+    ordered chains (e.g. focus_window -> maximize_window) keep their order.
+    Groups themselves always run in plan order.
+    
+    Args:
+        intents: List of Intent objects
+        max_group_size: Upper bound on concurrently executed intents
+        
+    Returns:
+        List of groups, each a list of indices into intents
+    """
+    groups: List[List[int]] = []
+    current: List[int] = []
+    current_keys = set()
+    
+    for idx, intent in enumerate(intents):
+        if intent.tool not in PARALLEL_SAFE_TOOLS:
+            if current:
+                groups.append(current)
+                current, current_keys = [], set()
+            groups.append([idx])
+            continue
+        
+        key = intent_target_key(intent)
+        if key in current_keys or len(current) >= max(1, max_group_size):
+            groups.append(current)
+            current, current_keys = [], set()
+        current.append(idx)
+        current_keys.add(key)
+    
+    if current:
+        groups.append(current)
+    return groups
+
+
 def normalize_plan(model_output: Dict[str, Any]) -> IntentPlan:
     """
     Normalize LLM output to standard IntentPlan format.
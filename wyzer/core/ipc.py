@@ -23,7 +23,9 @@ class AudioRequest(TypedDict, total=False):
     type: Literal["AUDIO"]
     id: str
     wav_path: Optional[str]
-    pcm_bytes: Optional[bytes]
+    pcm_bytes: Optional[bytes]  # float32 PCM
+    shm_offset: Optional[int]  # absolute sample offset in the shared audio ring
+    shm_length: Optional[int]  # number of float32 samples in the shared audio ring
     sample_rate: int
     meta: JsonDict
 
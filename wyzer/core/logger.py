@@ -1,12 +1,25 @@
 """
 Logging module for Wyzer AI Assistant.
 Simple, clean logging with optional rich formatting.
+
+Hot paths stay cheap:
+- Level checks are one integer comparison; filtered calls return before
+  any formatting. Pass printf-style args (logger.info("x=%s", x)) or a
+  callable instead of an f-string to defer formatting until it's needed.
+- With async_sink, terminal output (and the optional JSON-lines file) is
+  written by a background thread; the caller only enqueues the message.
+  ERROR/CRITICAL still wait until they're written.
 """
+import atexit
+import json
 import os
+import queue
 import re
 import sys
+import threading
+import time
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Callable, Optional, List, Tuple, Union
 
 try:
     from rich.console import Console
@@ -71,6 +84,7 @@ QUIET_MODE_FILTERS: List[str] = [
 
 # Compiled patterns for efficient matching
 _quiet_mode_patterns: Optional[List[re.Pattern]] = None
+_quiet_mode_regex: Optional[re.Pattern] = None
 
 
 def _get_quiet_filters() -> List[re.Pattern]:
@@ -83,10 +97,11 @@ def _get_quiet_filters() -> List[re.Pattern]:
 
 def _should_filter_quiet(message: str) -> bool:
     """Check if message should be filtered in quiet mode"""
-    for pattern in _get_quiet_filters():
-        if pattern.search(message):
-            return True
-    return False
+    global _quiet_mode_regex
+    if _quiet_mode_regex is None:
+        # One alternation instead of a search per pattern
+        _quiet_mode_regex = re.compile("|".join(f"(?:{p})" for p in QUIET_MODE_FILTERS), re.IGNORECASE)
+    return _quiet_mode_regex.search(message) is not None
 
 
 class LogLevel:
@@ -98,24 +113,68 @@ class LogLevel:
     CRITICAL = "CRITICAL"
 
 
+_LEVEL_PRIORITY = {
+    "DEBUG": 0,
+    "INFO": 1,
+    "WARNING": 2,
+    "ERROR": 3,
+    "CRITICAL": 4
+}
+
+# Levels that are written before the logging call returns, even with async_sink
+_SYNC_PRIORITY = _LEVEL_PRIORITY["ERROR"]
+
+# (level, created, message, thread name or None)
+_Record = Tuple[str, float, str, Optional[str]]
+
+
 class Logger:
     """Simple logger with timestamps and optional rich formatting"""
     
-    def __init__(self, level: str = "INFO", quiet_mode: bool = False):
+    def __init__(
+        self,
+        level: str = "INFO",
+        quiet_mode: bool = False,
+        async_sink: bool = False,
+        json_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            level: Minimum level to log
+            quiet_mode: Filter out noisy messages (see QUIET_MODE_FILTERS)
+            async_sink: Write output from a background thread instead of the caller
+            json_path: Also append every record to this JSON-lines file
+        """
+        self.level_priority = dict(_LEVEL_PRIORITY)
         self.level = level
         self.quiet_mode = quiet_mode
-        self.level_priority = {
-            "DEBUG": 0,
-            "INFO": 1,
-            "WARNING": 2,
-            "ERROR": 3,
-            "CRITICAL": 4
-        }
         self.use_rich = RICH_AVAILABLE
+        self.async_sink = async_sink
+        self.json_path = json_path or None
+        
+        self._json_file = None
+        self._queue: Optional[queue.SimpleQueue] = None
+        self._writer: Optional[threading.Thread] = None
+        self._writer_pid: Optional[int] = None
+        self._writer_lock = threading.Lock()
+        self._emit_lock = threading.Lock()
+    
+    @property
+    def level(self) -> str:
+        return self._level
+    
+    @level.setter
+    def level(self, level: str) -> None:
+        self._level = level
+        self._threshold = _LEVEL_PRIORITY.get(level, 0)
+    
+    def is_enabled(self, level: str) -> bool:
+        """Cheap check for guarding expensive log-only work"""
+        return _LEVEL_PRIORITY.get(level, 0) >= self._threshold
     
     def _should_log(self, level: str) -> bool:
         """Check if message should be logged based on level"""
-        return self.level_priority.get(level, 0) >= self.level_priority.get(self.level, 0)
+        return self.is_enabled(level)
     
     def _should_filter_message(self, message: str) -> bool:
         """Check if message should be filtered (quiet mode)"""
@@ -123,9 +182,10 @@ class Logger:
             return False
         return _should_filter_quiet(message)
     
-    def _format_message(self, level: str, message: str) -> str:
+    def _format_message(self, level: str, message: str, created: Optional[float] = None) -> str:
         """Format log message with timestamp"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        when = datetime.now() if created is None else datetime.fromtimestamp(created)
+        timestamp = when.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
         return f"[{timestamp}] [{level:8}] {message}"
     
     def _get_level_color(self, level: str) -> str:
@@ -139,58 +199,182 @@ class Logger:
         }
         return colors.get(level, "white")
     
-    def log(self, level: str, message: str) -> None:
-        """Log a message at the specified level"""
-        if not self._should_log(level):
+    def log(self, level: str, message: Union[str, Callable[[], str]], *args: Any) -> None:
+        """
+        Log a message at the specified level.
+        
+        Args:
+            level: Log level
+            message: Message, printf-style template (with args), or a callable
+                returning the message. Templates and callables are only
+                evaluated if the message will actually be written.
+            *args: Values for a printf-style template
+        """
+        priority = _LEVEL_PRIORITY.get(level, 0)
+        if priority < self._threshold:
             return
         
+        if self.quiet_mode and isinstance(message, str) and args and _should_filter_quiet(message):
+            # The template alone already marks it as noise; skip formatting
+            return
+        
+        if callable(message):
+            message = message()
+        elif args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = " ".join([message] + [str(a) for a in args])
+        
         # Filter out noisy messages in quiet mode
         if self._should_filter_message(message):
             return
         
-        formatted = self._format_message(level, message)
+        thread_name = threading.current_thread().name if self.json_path else None
+        record = (level, time.time(), message, thread_name)
         
-        if self.use_rich and console:
-            color = self._get_level_color(level)
-            console.print(formatted, style=color)
-        else:
-            print(formatted, flush=True)
+        if not self.async_sink:
+            self._emit(record)
+            return
+        
+        self._enqueue(record)
+        if priority >= _SYNC_PRIORITY:
+            # Don't lose errors to a crash right after logging them
+            self.flush()
     
-    def debug(self, message: str) -> None:
+    def debug(self, message: Union[str, Callable[[], str]], *args: Any) -> None:
         """Log debug message"""
-        self.log(LogLevel.DEBUG, message)
+        self.log(LogLevel.DEBUG, message, *args)
     
-    def info(self, message: str) -> None:
+    def info(self, message: Union[str, Callable[[], str]], *args: Any) -> None:
         """Log info message"""
-        self.log(LogLevel.INFO, message)
+        self.log(LogLevel.INFO, message, *args)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: Union[str, Callable[[], str]], *args: Any) -> None:
         """Log warning message"""
-        self.log(LogLevel.WARNING, message)
+        self.log(LogLevel.WARNING, message, *args)
     
-    def error(self, message: str) -> None:
+    def error(self, message: Union[str, Callable[[], str]], *args: Any) -> None:
         """Log error message"""
-        self.log(LogLevel.ERROR, message)
+        self.log(LogLevel.ERROR, message, *args)
     
-    def critical(self, message: str) -> None:
+    def critical(self, message: Union[str, Callable[[], str]], *args: Any) -> None:
         """Log critical message"""
-        self.log(LogLevel.CRITICAL, message)
+        self.log(LogLevel.CRITICAL, message, *args)
+    
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+    
+    def _emit(self, record: _Record) -> None:
+        """Write one record to the terminal (and JSON-lines file)."""
+        level, created, message, thread_name = record
+        formatted = self._format_message(level, message, created)
+        
+        with self._emit_lock:
+            if self.use_rich and console:
+                color = self._get_level_color(level)
+                console.print(formatted, style=color)
+            else:
+                print(formatted, flush=True)
+            
+            if self.json_path:
+                self._write_json(level, created, message, thread_name)
+    
+    def _write_json(self, level: str, created: float, message: str, thread_name: Optional[str]) -> None:
+        if self._json_file is None:
+            try:
+                directory = os.path.dirname(self.json_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._json_file = open(self.json_path, "a", encoding="utf-8")
+            except OSError as e:
+                self.json_path = None
+                print(f"[LOGGER] JSON log disabled, cannot open file: {e}", file=sys.stderr, flush=True)
+                return
+        line = json.dumps({
+            "ts": datetime.fromtimestamp(created).isoformat(timespec="milliseconds"),
+            "level": level,
+            "pid": os.getpid(),
+            "thread": thread_name,
+            "msg": message,
+        }, ensure_ascii=False)
+        # One write per line so processes sharing the file don't interleave mid-line
+        self._json_file.write(line + "\n")
+        self._json_file.flush()
+    
+    def _enqueue(self, record: _Record) -> None:
+        if self._writer_pid != os.getpid() or self._writer is None:
+            self._start_writer()
+        self._queue.put(record)
+    
+    def _start_writer(self) -> None:
+        with self._writer_lock:
+            pid = os.getpid()
+            if self._writer is not None and self._writer_pid == pid:
+                return
+            # New process (or first use): threads don't survive fork
+            self._queue = queue.SimpleQueue()
+            self._writer = threading.Thread(target=self._writer_loop, args=(self._queue,), name="wyzer-log", daemon=True)
+            self._writer_pid = pid
+            self._writer.start()
+    
+    def _writer_loop(self, records: queue.SimpleQueue) -> None:
+        while True:
+            item = records.get()
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            try:
+                self._emit(item)
+            except Exception:
+                pass
+    
+    def flush(self, timeout: float = 2.0) -> None:
+        """Wait until everything logged so far has been written."""
+        if not self.async_sink or self._writer is None or self._writer_pid != os.getpid():
+            return
+        if threading.current_thread() is self._writer:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+    
+    def close(self) -> None:
+        """Flush pending output and close the JSON-lines file."""
+        self.flush()
+        with self._emit_lock:
+            if self._json_file is not None:
+                try:
+                    self._json_file.close()
+                except OSError:
+                    pass
+                self._json_file = None
 
 
 # Global logger instance
 _global_logger: Optional[Logger] = None
 
 
-def init_logger(level: str = "INFO", quiet_mode: bool = False) -> Logger:
+def init_logger(
+    level: str = "INFO",
+    quiet_mode: bool = False,
+    async_sink: bool = False,
+    json_path: Optional[str] = None,
+) -> Logger:
     """
     Initialize global logger
     
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         quiet_mode: If True, filter out noisy debug messages like heartbeats
+        async_sink: If True, write output from a background thread
+        json_path: Optional JSON-lines file that receives every logged record
     """
     global _global_logger
-    _global_logger = Logger(level, quiet_mode=quiet_mode)
+    if _global_logger is not None:
+        _global_logger.close()
+    _global_logger = Logger(level, quiet_mode=quiet_mode, async_sink=async_sink, json_path=json_path)
     return _global_logger
 
 
@@ -209,3 +393,9 @@ def set_quiet_mode(enabled: bool) -> None:
     global _global_logger
     if _global_logger:
         _global_logger.quiet_mode = enabled
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    if _global_logger is not None:
+        _global_logger.close()
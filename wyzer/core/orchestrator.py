@@ -4,6 +4,10 @@ Coordinates LLM reasoning and tool execution.
 Supports multi-intent commands (Phase 6 enhancement).
 Phase 8: Added llamacpp mode support.
 Phase 11.5: Added LLM behavior governance (speech gating, observability).
+
+Prompt templates keep their static instructions first and per-request
+context (memories, session, results, user text) last, so llama.cpp can reuse
+the KV cache of the shared prefix; each template passes its own cache_key.
 """
 import json
 import time
@@ -14,11 +18,14 @@ import socket
 import shlex
 import uuid
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 from typing import Dict, Any, Optional, List, Tuple, Callable, Union
 from wyzer.core.config import Config
 from wyzer.core.logger import get_logger
 from wyzer.core import hybrid_router
+from wyzer.core.speculation import get_speculator
 from wyzer.tools.registry import build_default_registry
 from wyzer.tools.validation import validate_args
 from wyzer.local_library import resolve_target
@@ -29,7 +36,8 @@ from wyzer.core.intent_plan import (
     filter_unknown_tools,
     normalize_tool_aliases,
     ExecutionResult,
-    ExecutionSummary
+    ExecutionSummary,
+    group_parallel_intents,
 )
 
 # Phase 11.5: LLM behavior governance imports
@@ -194,10 +202,19 @@ def _get_no_ollama_reply() -> str:
     return random.choice(_NO_OLLAMA_FALLBACK_REPLIES)
 
 
+# LLM clients by (mode, base_url, timeout): a client keeps per-server state
+# (llama.cpp slot count and prefix->slot map) that must outlive one turn
+_llm_clients: Dict[Tuple[str, str, int], Any] = {}
+_llm_clients_lock = threading.Lock()
+
+
 def _get_llm_client() -> Optional[Union["OllamaClient", "LlamaCppClient"]]:
     """
     Get the appropriate LLM client based on current Config.LLM_MODE.
     
+    Clients are cached and reused for as long as the mode, URL and timeout
+    stay the same.
+    
     Returns:
         OllamaClient for ollama mode
         LlamaCppClient for llamacpp mode
@@ -211,12 +228,18 @@ def _get_llm_client() -> Optional[Union["OllamaClient", "LlamaCppClient"]]:
     if getattr(Config, "NO_OLLAMA", False) or llm_mode == "off":
         return None
     
-    if llm_mode == "llamacpp":
-        base_url = getattr(Config, "LLAMACPP_BASE_URL", "") or f"http://127.0.0.1:{Config.LLAMACPP_PORT}"
-        return LlamaCppClient(base_url=base_url, timeout=Config.LLM_TIMEOUT)
-    else:
-        # Default: Ollama
-        return OllamaClient(base_url=Config.OLLAMA_BASE_URL, timeout=Config.LLM_TIMEOUT)
+    if llm_mode != "llamacpp":
+        llm_mode = "ollama"  # Default
+    key = (llm_mode, _get_llm_base_url(), Config.LLM_TIMEOUT)
+    with _llm_clients_lock:
+        client = _llm_clients.get(key)
+        if client is None:
+            if llm_mode == "llamacpp":
+                client = LlamaCppClient(base_url=key[1], timeout=Config.LLM_TIMEOUT)
+            else:
+                client = OllamaClient(base_url=key[1], timeout=Config.LLM_TIMEOUT)
+            _llm_clients[key] = client
+        return client
 
 
 def _get_llm_base_url() -> str:
@@ -535,6 +558,30 @@ _FASTPATH_EXPLICIT_TOOL_RE = re.compile(r"^(?:tool|run|execute)\s+(?P<tool>[a-zA
 _tool_pool = None
 _logger = None
 
+# cancel_check of the handle_user_text() call running on this thread (the
+# brain worker runs each call on its own helper thread and may abandon it)
+_cancel_state = threading.local()
+
+
+def _is_cancelled() -> bool:
+    """True if the current handle_user_text() call was cancelled (barge-in)."""
+    cancel_check = getattr(_cancel_state, "check", None)
+    if cancel_check is None:
+        return False
+    try:
+        return bool(cancel_check())
+    except Exception:
+        return False
+
+
+def _cancelled_response(start_time: float) -> Dict[str, Any]:
+    """Response of a call cancelled before it acted; nothing is spoken."""
+    return {
+        "reply": "",
+        "latency_ms": int((time.perf_counter() - start_time) * 1000),
+        "meta": {"cancelled": True},
+    }
+
 
 def _user_explicitly_requested_library_refresh(user_text: str) -> bool:
     tl = (user_text or "").lower()
@@ -729,16 +776,29 @@ def _tool_error_to_speech(
     return "I couldn't complete that. Please try again."
 
 
-def handle_user_text(text: str) -> Dict[str, Any]:
+def handle_user_text(text: str, cancel_check: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
     """
     Handle user text input with optional multi-intent tool execution.
     
     Args:
         text: User's input text
+        cancel_check: Optional callable returning True once the request was
+            interrupted; checked before tools run and before a confirmation
+            is registered, so an abandoned call doesn't act or ask
         
     Returns:
         Dict with "reply", "latency_ms", and optional "execution_summary" keys
     """
+    previous = getattr(_cancel_state, "check", None)
+    _cancel_state.check = cancel_check
+    try:
+        return _handle_user_text(text)
+    finally:
+        _cancel_state.check = previous
+
+
+def _handle_user_text(text: str) -> Dict[str, Any]:
+    """handle_user_text() body, run with the call's cancel_check installed."""
     start_time = time.perf_counter()
     logger = get_logger_instance()
     
@@ -1769,7 +1829,7 @@ def handle_user_text_streaming(
     # Double-check we should actually stream
     if not should_use_streaming_tts(text):
         logger.debug("[STREAM_TTS] Streaming not appropriate, using non-streaming path")
-        result = handle_user_text(text)
+        result = handle_user_text(text, cancel_check=cancel_check)
         # Emit full reply as single TTS segment
         if result.get("reply") and on_segment:
             try:
@@ -1850,9 +1910,9 @@ def handle_user_text_streaming(
             length_instruction = "Reply in 1-2 sentences. Be direct and concise."
         
         prompt = f"""You are Wyzer, a local voice assistant.
-{ctx['session']}{ctx['promoted']}{ctx['redaction']}{ctx['memories']}{smalltalk_directive}
-{length_instruction}
 You ARE allowed to generate stories, poems, jokes, and creative content when asked - keep those spoken-friendly: no markdown, no bullet lists.
+{ctx['promoted']}{ctx['redaction']}{ctx['memories']}{ctx['session']}{smalltalk_directive}
+{length_instruction}
 
 User: {text}
 
@@ -1864,7 +1924,7 @@ Wyzer:"""
         if client is None:
             # LLM unavailable
             logger.warning("[STREAM_TTS] No LLM available, falling back")
-            result = handle_user_text(text)
+            result = handle_user_text(text, cancel_check=cancel_check)
             if result.get("reply") and on_segment:
                 try:
                     on_segment(result["reply"])
@@ -1901,7 +1961,8 @@ Wyzer:"""
         token_stream = client.generate_stream(
             prompt=prompt,
             model=Config.OLLAMA_MODEL,  # Model param is mainly for Ollama; llamacpp uses loaded model
-            options=options
+            options=options,
+            cache_key="stream_reply"
         )
         
         # Process stream using sentence-gated buffer for best UX
@@ -1977,7 +2038,7 @@ Wyzer:"""
         # Streaming failed - fall back to non-streaming
         logger.warning(f"[STREAM_TTS] Streaming failed, falling back: {e}")
         
-        result = handle_user_text(text)
+        result = handle_user_text(text, cancel_check=cancel_check)
         result.setdefault("meta", {})["streamed"] = False
         result["meta"]["stream_fallback"] = True
         
@@ -2162,6 +2223,9 @@ def execute_tool_plan_with_autonomy(
             timeout_sec = getattr(Config, "AUTONOMY_CONFIRM_TIMEOUT_SEC", 20.0)
             prompt = decision["question"] or "Do you want me to proceed?"
             
+            if _is_cancelled():
+                # The prompt would never be heard; a later "yes" must not run this plan
+                return _cancelled_response(start_time)
             set_pending_confirmation(
                 plan=intents,
                 prompt=prompt,
@@ -2189,6 +2253,8 @@ def execute_tool_plan_with_autonomy(
             question = decision["question"] or "Can you clarify what you'd like me to do?"
             timeout_sec = getattr(Config, "AUTONOMY_CONFIRM_TIMEOUT_SEC", 20.0)
             
+            if _is_cancelled():
+                return _cancelled_response(start_time)
             set_pending_confirmation(
                 plan=intents,
                 prompt=question,
@@ -2253,7 +2319,11 @@ def _try_extract_explicit_tool_request(user_text: str, registry) -> Optional[Tup
 
 def _execute_intents(intents, registry) -> ExecutionSummary:
     """
-    Execute multiple intents sequentially and collect results.
+    Execute multiple intents and collect results in plan order.
+    
+    Independent launch/query intents (see group_parallel_intents) run
+    concurrently; everything else runs sequentially. A failing intent without
+    continue_on_error stops the plan after its group.
     
     Args:
         intents: List of Intent objects to execute
@@ -2266,58 +2336,121 @@ def _execute_intents(intents, registry) -> ExecutionSummary:
     results = []
     stopped_early = False
     
-    for idx, intent in enumerate(intents):
-        logger.info(f"[INTENT {idx + 1}/{len(intents)}] Executing: {intent.tool}")
-        
-        # Execute the tool
-        tool_start = time.perf_counter()
-        tool_result = _execute_tool(registry, intent.tool, intent.args)
-        tool_latency = int((time.perf_counter() - tool_start) * 1000)
+    if Config.TOOL_PARALLEL_INTENTS and len(intents) > 1:
+        groups = group_parallel_intents(intents)
+    else:
+        groups = [[idx] for idx in range(len(intents))]
+    
+    for group in groups:
+        if _is_cancelled():
+            # Interrupted: the user won't hear the outcome, don't act on it
+            logger.info(f"[INTENT {group[0] + 1}/{len(intents)}] Cancelled, skipping remaining intents")
+            stopped_early = True
+            break
+        outcomes = _run_intent_group(intents, group, registry)
+        stop_after_group = False
         
-        # Check if execution was successful
-        has_error = "error" in tool_result
+        for idx in group:
+            intent = intents[idx]
+            tool_result, tool_latency = outcomes[idx]
+            
+            # Check if execution was successful
+            has_error = "error" in tool_result
 
-        error_type = None
-        if has_error:
-            try:
-                error_type = (tool_result.get("error") or {}).get("type")
-            except Exception:
-                error_type = None
-        
-        # Phase 11.5: Log tool execution via observability
-        log_tool_execution(
-            tool_name=intent.tool,
-            success=not has_error,
-            latency_ms=tool_latency,
-            error=str(tool_result.get("error", ""))[:50] if has_error else None,
-        )
-        
-        # Create execution result
-        exec_result = ExecutionResult(
-            tool=intent.tool,
-            ok=not has_error,
-            result=tool_result if not has_error else None,
-            error=tool_result.get("error") if has_error else None
-        )
-        
-        results.append(exec_result)
-        
-        # If error occurred and continue_on_error is False, stop execution
-        if has_error and not intent.continue_on_error:
-            # Focus is often an optional first step before window operations.
-            # If it fails to locate the window, still try subsequent actions.
-            if intent.tool == "focus_window" and idx < (len(intents) - 1) and error_type == "window_not_found":
-                logger.info(f"[INTENT {idx + 1}/{len(intents)}] Focus failed (window_not_found), continuing")
+            error_type = None
+            if has_error:
+                try:
+                    error_type = (tool_result.get("error") or {}).get("type")
+                except Exception:
+                    error_type = None
+            
+            # Phase 11.5: Log tool execution via observability
+            log_tool_execution(
+                tool_name=intent.tool,
+                success=not has_error,
+                latency_ms=tool_latency,
+                error=str(tool_result.get("error", ""))[:50] if has_error else None,
+            )
+            
+            # Create execution result
+            exec_result = ExecutionResult(
+                tool=intent.tool,
+                ok=not has_error,
+                result=tool_result if not has_error else None,
+                error=tool_result.get("error") if has_error else None
+            )
+            
+            results.append(exec_result)
+            
+            if stop_after_group:
+                # Ran concurrently with the failed intent; report it but don't re-decide
+                continue
+            
+            # If error occurred and continue_on_error is False, stop execution
+            if has_error and not intent.continue_on_error:
+                # Focus is often an optional first step before window operations.
+                # If it fails to locate the window, still try subsequent actions.
+                if intent.tool == "focus_window" and idx < (len(intents) - 1) and error_type == "window_not_found":
+                    logger.info(f"[INTENT {idx + 1}/{len(intents)}] Focus failed (window_not_found), continuing")
+                    continue
+                logger.info(f"[INTENT {idx + 1}/{len(intents)}] Failed, stopping execution")
+                stop_after_group = True
                 continue
-            logger.info(f"[INTENT {idx + 1}/{len(intents)}] Failed, stopping execution")
+            
+            logger.info(f"[INTENT {idx + 1}/{len(intents)}] {'Success' if not has_error else 'Failed (continuing)'}")
+        
+        if stop_after_group:
             stopped_early = True
             break
-        
-        logger.info(f"[INTENT {idx + 1}/{len(intents)}] {'Success' if not has_error else 'Failed (continuing)'}")
     
     return ExecutionSummary(ran=results, stopped_early=stopped_early)
 
 
+def _run_intent_group(intents, group: List[int], registry) -> Dict[int, Tuple[Dict[str, Any], int]]:
+    """
+    Execute one execution group and return {intent index: (tool_result, latency_ms)}.
+    
+    Multi-intent groups run on threads (each thread submits to the tool pool
+    when it is up). World state updates are deferred and applied in plan
+    order afterwards, so reference resolution sees the same "last target" as
+    a sequential run.
+    """
+    logger = get_logger_instance()
+    total = len(intents)
+    
+    def _run(idx: int, world_state_updates: Optional[List[Tuple[str, Dict[str, Any], Dict[str, Any]]]]):
+        intent = intents[idx]
+        logger.info(f"[INTENT {idx + 1}/{total}] Executing: {intent.tool}")
+        _world_state_deferral.pending = world_state_updates
+        try:
+            tool_start = time.perf_counter()
+            tool_result = _execute_tool(registry, intent.tool, intent.args)
+            return tool_result, int((time.perf_counter() - tool_start) * 1000)
+        finally:
+            _world_state_deferral.pending = None
+    
+    if len(group) == 1:
+        return {group[0]: _run(group[0], None)}
+    
+    logger.info(f"[INTENT] Running {len(group)} independent intents in parallel: {[intents[i].tool for i in group]}")
+    deferred: Dict[int, List[Tuple[str, Dict[str, Any], Dict[str, Any]]]] = {idx: [] for idx in group}
+    outcomes: Dict[int, Tuple[Dict[str, Any], int]] = {}
+    
+    with ThreadPoolExecutor(max_workers=len(group), thread_name_prefix="IntentGroup") as executor:
+        futures = {idx: executor.submit(_run, idx, deferred[idx]) for idx in group}
+        for idx in group:
+            try:
+                outcomes[idx] = futures[idx].result()
+            except Exception as e:
+                outcomes[idx] = ({"error": {"type": "execution_error", "message": str(e)}}, 0)
+    
+    for idx in group:
+        for tool_name, tool_args, result in deferred[idx]:
+            _apply_world_state_update(tool_name, tool_args, result)
+    
+    return outcomes
+
+
 def _normalize_alnum(text: str) -> str:
     return re.sub(r"[^a-z0-9]", "", (text or "").lower())
 
@@ -3266,20 +3399,22 @@ def _format_fastpath_reply(user_text: str, intents: List[Intent], execution_summ
             
             if action == "start" and status == "running":
                 duration = result.get("duration", 0)
+                name = result.get("name") or "timer"
+                label = "Timer" if name == "timer" else f"{name.capitalize()} timer"
                 if duration >= 3600:
                     hours = duration // 3600
                     mins = (duration % 3600) // 60
                     if mins > 0:
-                        return f"Timer set for {hours} hour{'s' if hours != 1 else ''} and {mins} minute{'s' if mins != 1 else ''}."
-                    return f"Timer set for {hours} hour{'s' if hours != 1 else ''}."
+                        return f"{label} set for {hours} hour{'s' if hours != 1 else ''} and {mins} minute{'s' if mins != 1 else ''}."
+                    return f"{label} set for {hours} hour{'s' if hours != 1 else ''}."
                 elif duration >= 60:
                     mins = duration // 60
                     secs = duration % 60
                     if secs > 0:
-                        return f"Timer set for {mins} minute{'s' if mins != 1 else ''} and {secs} second{'s' if secs != 1 else ''}."
-                    return f"Timer set for {mins} minute{'s' if mins != 1 else ''}."
+                        return f"{label} set for {mins} minute{'s' if mins != 1 else ''} and {secs} second{'s' if secs != 1 else ''}."
+                    return f"{label} set for {mins} minute{'s' if mins != 1 else ''}."
                 else:
-                    return f"Timer set for {duration} second{'s' if duration != 1 else ''}."
+                    return f"{label} set for {duration} second{'s' if duration != 1 else ''}."
             
             if action == "cancel" and status == "cancelled":
                 return "Timer cancelled."
@@ -3670,6 +3805,11 @@ def _rewrite_open_website_intents(user_text: str, intents) -> None:
             intent.args = {"query": phrase}
 
 
+# Per-thread sink for WorldState updates; set while a parallel intent group
+# runs so updates can be replayed in plan order afterwards.
+_world_state_deferral = threading.local()
+
+
 def _update_world_state_from_result(tool_name: str, tool_args: Dict[str, Any], result: Dict[str, Any]) -> None:
     """
     Update WorldState after successful tool execution.
@@ -3677,6 +3817,15 @@ def _update_world_state_from_result(tool_name: str, tool_args: Dict[str, Any], r
     Phase 10: Called after ANY tool successfully runs to enable reference resolution.
     Fails silently if update cannot be performed.
     """
+    pending = getattr(_world_state_deferral, "pending", None)
+    if pending is not None:
+        pending.append((tool_name, tool_args, result))
+        return
+    _apply_world_state_update(tool_name, tool_args, result)
+
+
+def _apply_world_state_update(tool_name: str, tool_args: Dict[str, Any], result: Dict[str, Any]) -> None:
+    """Apply a WorldState update immediately (see _update_world_state_from_result)."""
     try:
         # Only update on successful execution (no error in result)
         if "error" in result:
@@ -3947,22 +4096,30 @@ def _execute_tool(registry, tool_name: str, tool_args: Dict[str, Any]) -> Dict[s
     full_args = {**public_args, **internal_args}
     
     # Log BEFORE execution
-    logger.info(f"[TOOLS] Executing {tool_name} args={full_args}")
+    logger.info("[TOOLS] Executing %s args=%s", tool_name, full_args)
+    
+    # Target resolved while the user was still speaking (see wyzer.core.speculation).
+    # Only the tool sees it: logs and world-state replay keep the plain args.
+    run_args = full_args
+    if tool_name == "open_target" and not any(k.startswith("_resolved") for k in internal_args):
+        resolved = get_speculator().lookup("open_target", str(full_args.get("query") or ""))
+        if resolved is not None:
+            run_args = {**full_args, "_resolved": resolved}
     
     # Try to use worker pool if enabled
-    pool = _tool_pool
+    pool = _tool_pool if not getattr(tool, "run_in_process", False) else None
     if pool is not None:
         try:
             job_id = str(uuid.uuid4())
             request_id = str(uuid.uuid4())
             
             # Submit job to pool
-            if pool.submit_job(job_id, request_id, tool_name, full_args):
+            if pool.submit_job(job_id, request_id, tool_name, run_args):
                 # Wait for result with timeout
                 result_obj = pool.wait_for_result(job_id, timeout=Config.TOOL_POOL_TIMEOUT_SEC)
                 if result_obj is not None:
                     result = result_obj.result
-                    logger.info(f"[TOOLS] Pool result {result}")
+                    logger.info("[TOOLS] Pool result %s", result)
                     # Phase 10: Update world state for reference resolution
                     _update_world_state_from_result(tool_name, full_args, result)
                     return result
@@ -3978,10 +4135,10 @@ def _execute_tool(registry, tool_name: str, tool_args: Dict[str, Any]) -> Dict[s
     
     # Fall back to in-process execution
     try:
-        result = tool.run(**full_args)
+        result = tool.run(**run_args)
         
         # Log AFTER execution
-        logger.info(f"[TOOLS] Result {result}")
+        logger.info("[TOOLS] Result %s", result)
         
         # Phase 10: Update world state for reference resolution
         _update_world_state_from_result(tool_name, full_args, result)
@@ -3994,7 +4151,7 @@ def _execute_tool(registry, tool_name: str, tool_args: Dict[str, Any]) -> Dict[s
                 "message": str(e)
             }
         }
-        logger.info(f"[TOOLS] Result {error_result}")
+        logger.info("[TOOLS] Result %s", error_result)
         return error_result
 
 
@@ -4007,8 +4164,28 @@ def _call_llm(user_text: str, registry) -> Dict[str, Any]:
     Returns:
         Dict with either {"reply": "..."} or {"intents": [...]} or legacy formats
     """
+    # Context gathered while the user was still speaking, if the partial
+    # transcript matched; the User: line always comes from the final transcript
+    context = get_speculator().lookup("llm_context", user_text)
+    prompt = _build_llm_prompt(user_text, context)
+    return _ollama_request(prompt, cache_key="normal")
+
+
+def _build_llm_prompt(user_text: str, context: Optional[Dict[str, str]] = None) -> str:
+    """Build the intent-interpretation prompt for _call_llm."""
     from wyzer.brain.prompt_builder import build_llm_prompt
     
+    if context is None:
+        context = _gather_llm_prompt_context(user_text)
+    
+    # Build token-budgeted prompt
+    prompt, mode = build_llm_prompt(user_text=user_text, **context)
+    
+    return prompt
+
+
+def _gather_llm_prompt_context(user_text: str) -> Dict[str, str]:
+    """Gather the context blocks of the intent-interpretation prompt."""
     # Gather context blocks
     session_context = ""
     try:
@@ -4047,17 +4224,13 @@ def _call_llm(user_text: str, registry) -> Dict[str, Any]:
     except Exception:
         pass
     
-    # Build token-budgeted prompt
-    prompt, mode = build_llm_prompt(
-        user_text=user_text,
-        session_context=session_context,
-        promoted_context=promoted_context,
-        redaction_context=redaction_context,
-        memories_context=memories_context,
-        visual_context=visual_context,
-    )
-    
-    return _ollama_request(prompt)
+    return {
+        "session_context": session_context,
+        "promoted_context": promoted_context,
+        "redaction_context": redaction_context,
+        "memories_context": memories_context,
+        "visual_context": visual_context,
+    }
 
 
 def _call_llm_for_explicit_tool(user_text: str, tool_name: str, registry) -> Dict[str, Any]:
@@ -4101,7 +4274,7 @@ User: {user_text}
 
 Your response (JSON only):"""
 
-    return _ollama_request(prompt)
+    return _ollama_request(prompt, cache_key="explicit_tool")
 
 
 def _gather_context_blocks(user_text: str, max_session_turns: int = 2) -> Dict[str, str]:
@@ -4115,6 +4288,16 @@ def _gather_context_blocks(user_text: str, max_session_turns: int = 2) -> Dict[s
     Returns:
         Dict with session_context, promoted_context, redaction_context, memories_context
     """
+    if max_session_turns == 2:
+        # Gathered while the user was still speaking, if the partial transcript matched
+        ctx = get_speculator().lookup("context", user_text)
+        if ctx is not None:
+            return dict(ctx)
+    return _build_context_blocks(user_text, max_session_turns)
+
+
+def _build_context_blocks(user_text: str, max_session_turns: int = 2) -> Dict[str, str]:
+    """Gather context blocks from memory (see _gather_context_blocks)."""
     from wyzer.brain.prompt_builder import should_inject_memories
     
     session_context = ""
@@ -4228,7 +4411,7 @@ def _call_llm_reply_only(user_text: str) -> Dict[str, Any]:
             # Add JSON format instruction (minimal)
             prompt += ' {"reply": "'
             
-            return _ollama_request(prompt, user_text=user_text)
+            return _ollama_request(prompt, user_text=user_text, cache_key="fastlane")
         except Exception as e:
             logger.debug(f"[FASTLANE] fallback to normal prompt: {e}")
     
@@ -4251,7 +4434,6 @@ def _call_llm_reply_only(user_text: str) -> Dict[str, Any]:
         pass
     
     prompt = f"""You are Wyzer, a local voice assistant.
-{ctx['session']}{ctx['promoted']}{ctx['redaction']}{ctx['memories']}{smalltalk_directive}
 Reply naturally. Be direct.
 You ARE allowed to generate stories, poems, jokes, and creative content when asked.
 Keep creative content spoken-friendly: no markdown, no bullet lists.
@@ -4259,11 +4441,11 @@ Keep creative content spoken-friendly: no markdown, no bullet lists.
 NEVER invent or request tools. Respond directly in plain text.
 
 JSON format: {{"reply": "your response"}}
-
+{ctx['promoted']}{ctx['redaction']}{ctx['memories']}{ctx['session']}{smalltalk_directive}
 User: {user_text}
 
 JSON:"""
-    return _ollama_request(prompt, user_text=user_text)
+    return _ollama_request(prompt, user_text=user_text, cache_key="reply_only")
 
 
 def _call_llm_with_execution_summary(
@@ -4302,19 +4484,18 @@ def _call_llm_with_execution_summary(
     summary_text = "\n".join(summary_parts)
     
     prompt = f"""You are Wyzer, a local voice assistant.
-{ctx['session']}{ctx['promoted']}{ctx['redaction']}{ctx['memories']}
+Reply naturally in 1-2 sentences based on the results below.
+
+JSON: {{"reply": "your response"}}
+{ctx['promoted']}{ctx['redaction']}{ctx['memories']}{ctx['session']}
 User asked: {user_text}
 
 Results:
 {summary_text}
 
-Reply naturally in 1-2 sentences based on results.
-
-JSON: {{"reply": "your response"}}
-
 JSON:"""
 
-    return _ollama_request(prompt)
+    return _ollama_request(prompt, cache_key="execution_summary")
 
 
 def _call_llm_with_tool_result(
@@ -4342,28 +4523,28 @@ def _call_llm_with_tool_result(
         args_str = args_str[:100] + "..."
     
     prompt = f"""You are Wyzer, a local voice assistant.
-{ctx['session']}{ctx['promoted']}{ctx['redaction']}{ctx['memories']}
+Reply naturally in 1-2 sentences based on the tool result below.
+
+JSON: {{"reply": "your response"}}
+{ctx['promoted']}{ctx['redaction']}{ctx['memories']}{ctx['session']}
 User asked: {user_text}
 
 Tool: {tool_name}({args_str})
 Result: {result_str}
 
-Reply naturally in 1-2 sentences.
-
-JSON: {{"reply": "your response"}}
-
 JSON:"""
 
-    return _ollama_request(prompt)
+    return _ollama_request(prompt, cache_key="tool_result")
 
 
-def _ollama_request(prompt: str, user_text: str = "") -> Dict[str, Any]:
+def _ollama_request(prompt: str, user_text: str = "", cache_key: Optional[str] = None) -> Dict[str, Any]:
     """
     Make request to LLM (Ollama or llama.cpp).
     
     Args:
         prompt: The full prompt to send to the LLM
         user_text: Original user text (for voice_fast options detection)
+        cache_key: Name of the prompt's static template (llama.cpp slot affinity)
     
     Returns:
         Parsed JSON response or fallback dict
@@ -4421,9 +4602,13 @@ def _ollama_request(prompt: str, user_text: str = "") -> Dict[str, Any]:
             
             # For llama.cpp, add instruction to respond in JSON format
             json_prompt = prompt + "\n\nIMPORTANT: Respond with valid JSON only."
-            reply_text = client.generate(prompt=json_prompt, options=options, stream=False)
+            reply_text = client.generate(prompt=json_prompt, options=options, stream=False, cache_key=cache_key)
             
-            logger.debug(f"[LLAMACPP] est_tokens={est_tokens}")
+            usage = getattr(client, "last_usage", None) or {}
+            logger.debug(
+                f"[LLAMACPP] est_tokens={est_tokens}, prompt_tokens={usage.get('prompt_tokens')}, "
+                f"cached_tokens={usage.get('cached_tokens')}, evaluated_tokens={usage.get('evaluated_tokens')}"
+            )
         else:
             # Use Ollama direct HTTP (default)
             base_url = Config.OLLAMA_BASE_URL.rstrip("/")
@@ -4834,6 +5019,7 @@ def _check_window_watcher_commands(text: str, start_time: float) -> Optional[Dic
     text = text.strip()
     
     from wyzer.context.world_state import (
+        get_window_state,
         get_windows_on_monitor,
         get_focused_window_info,
         get_recent_window_events,
@@ -4914,8 +5100,10 @@ def _check_window_watcher_commands(text: str, start_time: float) -> Optional[Dic
                 },
             }
         
-        windows = get_windows_on_monitor(monitor)
-        focused = get_focused_window_info()
+        # Windows and focus from the same watcher poll (no copies, no lock)
+        window_state = get_window_state()
+        windows = window_state.windows_by_monitor.get(monitor, ())
+        focused = window_state.focused_window
         focused_hwnd = focused.get("hwnd") if focused else None
         
         # Filter out junk windows
@@ -5046,6 +5234,8 @@ def _check_window_watcher_commands(text: str, start_time: float) -> Optional[Dic
         if mode == "off" or risk == "high":
             # Set pending confirmation
             prompt = f"I found {len(closeable)} windows on monitor {monitor}: {titles_preview}. Close them all?"
+            if _is_cancelled():
+                return _cancelled_response(start_time)
             set_pending_confirmation(
                 plan=tool_plan,
                 prompt=prompt,
@@ -229,11 +229,13 @@ def _get_foreground_target(ws: "WorldState") -> tuple:
     STALENESS_THRESHOLD_S = 5.0
     
     # Priority 1: focused_window from Window Watcher (Phase 12)
-    if ws.focused_window:
+    # One snapshot read: focus and its timestamp come from the same poll
+    window_state = ws.window_state
+    if window_state.focused_window:
         # Check if it's fresh enough
-        age = time.time() - ws.last_window_snapshot_ts
+        age = time.time() - window_state.ts
         if age < STALENESS_THRESHOLD_S:
-            process = ws.focused_window.get("process")
+            process = window_state.focused_window.get("process")
             if process:
                 return _format_process_name(process), "active_app"
     
@@ -916,8 +918,9 @@ def resolve_window_action_it(
     
     if not resolved_target:
         # Try to use focused window
-        if ws.focused_window:
-            resolved_target = ws.focused_window.get("process") or ws.focused_window.get("title")
+        focused = ws.window_state.focused_window
+        if focused:
+            resolved_target = focused.get("process") or focused.get("title")
         elif ws.last_active_window:
             resolved_target = ws.last_active_window.get("app_name")
     
@@ -1128,8 +1131,9 @@ def resolve_move_it_to_monitor(
     
     if not resolved_target:
         # Try to use focused window
-        if ws.focused_window:
-            resolved_target = ws.focused_window.get("process") or ws.focused_window.get("title")
+        focused = ws.window_state.focused_window
+        if focused:
+            resolved_target = focused.get("process") or focused.get("title")
         elif ws.last_active_window:
             resolved_target = ws.last_active_window.get("app_name")
     
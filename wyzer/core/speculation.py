@@ -0,0 +1,209 @@
+"""wyzer.core.speculation
+
+Speculative work on partial transcripts.
+
+While the user is still speaking, streaming STT reports partial transcripts.
+The speculator runs the deterministic hybrid router on the latest partial
+(on its own thread, coalescing to the newest partial) and prepares what the
+likely path needs:
+
+- tool plans: open_target queries are resolved against the library index
+- LLM route: the prompt's context blocks (memories, session, screen) are
+  gathered and the LLM server is pinged so a keep-alive connection is ready;
+  the prompt itself is built from the final transcript, so the LLM sees its
+  casing and punctuation
+
+Results are keyed by the normalized text they were computed for. The real
+pipeline looks them up with the final transcript and uses them only on an
+exact match while they are fresh; work done for a partial that differs
+from the final transcript is simply dropped.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from wyzer.core.logger import get_logger
+
+
+_RESULT_TTL_SEC = 30.0
+_SETTLE_TIMEOUT_SEC = 1.0
+
+
+def normalize_text(text: str) -> str:
+    """Case/punctuation-insensitive key ("Open Spotify." == "open spotify")."""
+    return " ".join((text or "").lower().strip().strip(".?!,;:\"'").split())
+
+
+class Speculator:
+    """Runs the likely path's preparation on partial transcripts."""
+
+    def __init__(self, ttl_sec: float = _RESULT_TTL_SEC):
+        self.logger = get_logger()
+        self.ttl_sec = ttl_sec
+        self._cond = threading.Condition()
+        self._pending: Optional[Tuple[str, str]] = None  # (normalized key, text)
+        self._running: Optional[str] = None
+        self._seen: set = set()
+        # (kind, normalized key) -> (created_ts, value, still_valid)
+        self._results: Dict[Tuple[str, str], Tuple[float, Any, Optional[Callable[[], bool]]]] = {}
+        self._generation = 0
+        self._thread: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+
+    def submit(self, text: str) -> None:
+        """Speculate on a partial transcript (newest partial wins)."""
+        key = normalize_text(text)
+        with self._cond:
+            if not key or key in self._seen or (self._pending and self._pending[0] == key):
+                return
+            self._pending = (key, text.strip())
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="Speculator", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def settle(self, final_text: str, timeout: float = _SETTLE_TIMEOUT_SEC) -> bool:
+        """
+        Called with the final transcript before it is handled.
+
+        Drops queued partials that differ from it and waits for a queued or
+        in-flight speculation on the same text (its results are as good as
+        redoing the work).
+
+        Returns:
+            True if the final transcript was speculated on
+        """
+        key = normalize_text(final_text)
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            if self._pending and self._pending[0] != key:
+                self._pending = None
+            while self._running == key or self._pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            hit = key in self._seen
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        self.logger.debug(
+            "[SPECULATE] final transcript %s partial (hits=%d misses=%d)",
+            "matches" if hit else "differs from", self.hits, self.misses,
+        )
+        return hit
+
+    def reset(self) -> None:
+        """Forget all results (new utterance, or one that wasn't streamed)."""
+        with self._cond:
+            self._pending = None
+            self._seen.clear()
+            self._results.clear()
+            self._generation += 1
+
+    def lookup(self, kind: str, key: str) -> Optional[Any]:
+        """
+        Prepared value for (kind, key), or None.
+
+        Args:
+            kind: What was prepared ("open_target", "llm_context", "context")
+            key: Text it was prepared for (compared normalized)
+        """
+        with self._cond:
+            entry = self._results.get((kind, normalize_text(key)))
+        if entry is None:
+            return None
+        created, value, still_valid = entry
+        if time.monotonic() - created > self.ttl_sec:
+            return None
+        if still_valid is not None and not still_valid():
+            return None
+        self.logger.debug("[SPECULATE] using speculative %s for '%s'", kind, key)
+        return value
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                key, text = self._pending
+                self._pending = None
+                self._running = key
+                generation = self._generation
+            start = time.perf_counter()
+            try:
+                self._speculate(text, generation)
+            except Exception as e:
+                self.logger.debug(f"[SPECULATE] '{text}' failed: {e}")
+            finally:
+                with self._cond:
+                    self._running = None
+                    if generation == self._generation:
+                        self._seen.add(key)
+                    self._cond.notify_all()
+            self.logger.debug(f"[SPECULATE] '{text}' prepared in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+    def _store(
+        self,
+        generation: int,
+        kind: str,
+        key: str,
+        value: Any,
+        still_valid: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        with self._cond:
+            if generation == self._generation:  # not reset meanwhile
+                self._results[(kind, normalize_text(key))] = (time.monotonic(), value, still_valid)
+
+    def _speculate(self, text: str, generation: int) -> None:
+        from wyzer.core import hybrid_router
+
+        decision = hybrid_router.decide(text)
+        if decision.mode == "tool_plan" and decision.intents:
+            for intent in decision.intents:
+                query = (intent.get("args") or {}).get("query")
+                if intent.get("tool") != "open_target" or not query:
+                    continue
+                with self._cond:
+                    if ("open_target", normalize_text(query)) in self._results:
+                        continue
+                from wyzer.local_library import resolve_target
+                from wyzer.local_library.library_index import get_library_index
+
+                index = get_library_index()
+                resolved = resolve_target(query)
+                # Only valid until library.json / aliases.json change
+                self._store(generation, "open_target", query, resolved,
+                            still_valid=lambda index=index: get_library_index() is index)
+            return
+
+        if decision.mode != "llm":
+            return
+
+        from wyzer.core import orchestrator
+
+        if orchestrator.should_use_streaming_tts(text):
+            self._store(generation, "context", text, orchestrator._build_context_blocks(text, max_session_turns=2))
+        else:
+            self._store(generation, "llm_context", text, orchestrator._gather_llm_prompt_context(text))
+        client = orchestrator._get_llm_client()
+        if client is not None:
+            client.ping()
+
+
+_speculator: Optional[Speculator] = None
+_speculator_lock = threading.Lock()
+
+
+def get_speculator() -> Speculator:
+    """Get or create the process-wide speculator."""
+    global _speculator
+    with _speculator_lock:
+        if _speculator is None:
+            _speculator = Speculator()
+        return _speculator
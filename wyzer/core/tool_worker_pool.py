@@ -6,6 +6,8 @@ Workers execute tools in background, keeping Brain lightweight and responsive.
 Architecture:
 - Main thread: submits tool jobs to task_q
 - Worker processes: pull jobs, execute tools, return results to result_q
+- Result collector thread: drains result_q and wakes the caller waiting on
+  that specific job (no re-queueing, no polling)
 - All communication is JSON-serializable
 - Each worker is a separate process for true parallelism (no GIL)
 """
@@ -15,10 +17,11 @@ from __future__ import annotations
 import multiprocessing as mp
 import os
 import queue
+import threading
 import time
 import json
 from typing import Any, Dict, Optional, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from wyzer.core.config import Config
 from wyzer.core.logger import get_logger, init_logger
@@ -56,6 +59,15 @@ class ToolResult:
     execution_time_ms: float
 
 
+@dataclass
+class _ResultSlot:
+    """Per-job rendezvous between the result collector and a waiting caller"""
+    event: threading.Event = field(default_factory=threading.Event)
+    result: Optional[ToolResult] = None
+    created: float = field(default_factory=time.monotonic)
+    waiting: bool = False  # A wait_for_result() call owns (and will drop) the slot
+
+
 @dataclass
 class WorkerHeartbeat:
     """Heartbeat from a tool worker process"""
@@ -85,7 +97,7 @@ class ToolWorker(mp.Process):
         # Check environment for quiet mode
         quiet_mode = os.environ.get("WYZER_QUIET_MODE", "false").lower() in ("true", "1", "yes")
         log_level = os.environ.get("WYZER_LOG_LEVEL", "INFO")
-        init_logger(log_level, quiet_mode=quiet_mode)
+        init_logger(log_level, quiet_mode=quiet_mode, async_sink=Config.LOG_ASYNC, json_path=Config.LOG_JSON_PATH or None)
         logger = get_logger()
         registry = build_default_registry()
         pid = os.getpid()
@@ -219,14 +231,17 @@ class ToolWorker(mp.Process):
 class ToolWorkerPool:
     """Pool of worker processes for tool execution"""
     
-    def __init__(self, num_workers: int = 3):
+    def __init__(self, num_workers: int = 3, result_ttl_sec: Optional[float] = None):
         """
         Initialize tool worker pool
         
         Args:
             num_workers: Number of worker processes (default 3, capped 1-5)
+            result_ttl_sec: Age after which a job nobody is waiting on is
+                forgotten (default: twice TOOL_POOL_TIMEOUT_SEC)
         """
         self.num_workers = max(1, min(5, num_workers))
+        self.result_ttl_sec = result_ttl_sec if result_ttl_sec is not None else 2.0 * Config.TOOL_POOL_TIMEOUT_SEC
         # Use multiprocessing queues for inter-process communication
         self.task_q: mp.Queue = mp.Queue(maxsize=50)
         self.result_q: mp.Queue = mp.Queue(maxsize=100)
@@ -236,6 +251,11 @@ class ToolWorkerPool:
         self._running = False
         self._pending_jobs: Dict[str, ToolJob] = {}
         self._worker_heartbeats: Dict[int, WorkerHeartbeat] = {}  # Cache of latest heartbeats
+        # Result routing: job_id -> slot, filled by the collector thread
+        self._results_lock = threading.Lock()
+        self._result_slots: Dict[str, _ResultSlot] = {}
+        self._completed_order: List[str] = []  # Unclaimed completions, oldest first (for poll_results)
+        self._collector_thread: Optional[threading.Thread] = None
     
     def start(self) -> bool:
         """Start the worker pool"""
@@ -251,6 +271,7 @@ class ToolWorkerPool:
                 self.workers.append(worker)
             
             self._running = True
+            self._start_result_collector()
             self.logger.info(f"[POOL] Started pool with {self.num_workers} workers")
             return True
         
@@ -278,44 +299,127 @@ class ToolWorkerPool:
             timestamp=time.time()
         )
         
+        # Register the slot before queueing so a fast result is never orphaned
+        with self._results_lock:
+            self._result_slots[job_id] = _ResultSlot()
+        
         try:
             self.task_q.put(job, timeout=1.0)
             self._pending_jobs[job_id] = job
             return True
         except queue.Full:
+            with self._results_lock:
+                self._result_slots.pop(job_id, None)
             self.logger.warning(f"[POOL] Task queue full, cannot submit job {job_id}")
             return False
     
     def poll_results(self) -> Optional[ToolResult]:
-        """Poll for a completed job result (non-blocking)"""
-        try:
-            result: ToolResult = self.result_q.get_nowait()
-            self._pending_jobs.pop(result.job_id, None)
-            return result
-        except queue.Empty:
-            return None
+        """Poll for a completed job result nobody is waiting on (non-blocking)"""
+        with self._results_lock:
+            if not self._completed_order:
+                return None
+            job_id = self._completed_order.pop(0)
+            slot = self._result_slots.pop(job_id)
+            return slot.result
     
     def wait_for_result(self, job_id: str, timeout: float = 15.0) -> Optional[ToolResult]:
-        """Wait for a specific job result with timeout"""
-        start_time = time.perf_counter()
+        """Wait for a specific job result with timeout
+        
+        Blocks only on this job's slot; the collector thread wakes the caller
+        as soon as the result arrives.
+        """
+        with self._results_lock:
+            slot = self._result_slots.get(job_id)
+            if slot is not None:
+                slot.waiting = True
+        if slot is None:
+            self.logger.warning(f"[POOL] Unknown job {job_id}, nothing to wait for")
+            return None
+        
+        completed = slot.event.wait(timeout)
+        
+        with self._results_lock:
+            # Drop the slot either way; a late result for a timed-out job is discarded
+            self._result_slots.pop(job_id, None)
+            if job_id in self._completed_order:
+                self._completed_order.remove(job_id)
+            result = slot.result
+        self._pending_jobs.pop(job_id, None)
+        
+        if not completed:
+            self.logger.warning(f"[POOL] Timeout waiting for job {job_id}")
+        return result
+    
+    def _start_result_collector(self) -> None:
+        """Start the background thread that routes results to waiting callers"""
+        if self._collector_thread is not None and self._collector_thread.is_alive():
+            return
+        self._collector_thread = threading.Thread(
+            target=self._collect_results,
+            name="ToolPoolResultCollector",
+            daemon=True
+        )
+        self._collector_thread.start()
+    
+    def _collect_results(self) -> None:
+        """Collector loop: blocking get on result_q, dispatch by job_id
         
+        Also ages out slots of jobs nobody waits on (see _expire_slots).
+        Exits on a None sentinel (see shutdown()).
+        """
+        sweep_sec = max(0.05, self.result_ttl_sec / 2.0)
+        next_sweep = time.monotonic() + sweep_sec
         while True:
-            elapsed = time.perf_counter() - start_time
-            if elapsed > timeout:
-                self.logger.warning(f"[POOL] Timeout waiting for job {job_id}")
-                return None
-            
+            now = time.monotonic()
+            if now >= next_sweep:
+                self._expire_slots(now)
+                next_sweep = now + sweep_sec
             try:
-                result: ToolResult = self.result_q.get(timeout=0.5)
-                self._pending_jobs.pop(result.job_id, None)
-                
-                if result.job_id == job_id:
-                    return result
-                # Different job, put it back
-                self.result_q.put(result)
-            
+                result: Optional[ToolResult] = self.result_q.get(timeout=max(0.0, next_sweep - now))
             except queue.Empty:
                 continue
+            except (EOFError, OSError):
+                break  # Queue closed underneath us
+            except Exception as e:
+                self.logger.error(f"[POOL] Result collector error: {e}")
+                continue
+            
+            if result is None:
+                break
+            
+            self._dispatch_result(result)
+    
+    def _dispatch_result(self, result: ToolResult) -> None:
+        """Hand a result to its job's slot and wake the waiter"""
+        self._pending_jobs.pop(result.job_id, None)
+        with self._results_lock:
+            slot = self._result_slots.get(result.job_id)
+            if slot is None:
+                self.logger.debug("[POOL] Dropping late result for job %s (%s)", result.job_id, result.tool_name)
+                return
+            slot.result = result
+            self._completed_order.append(result.job_id)
+        slot.event.set()
+    
+    def _expire_slots(self, now: float) -> None:
+        """Forget jobs older than result_ttl_sec that no caller is waiting on
+        
+        A caller abandoned before wait_for_result() (e.g. a barge-in) or an
+        unclaimed completion would otherwise keep its slot forever.
+        """
+        with self._results_lock:
+            expired = [
+                job_id for job_id, slot in self._result_slots.items()
+                if not slot.waiting and now - slot.created >= self.result_ttl_sec
+            ]
+            for job_id in expired:
+                del self._result_slots[job_id]
+                if job_id in self._completed_order:
+                    self._completed_order.remove(job_id)
+        for job_id in expired:
+            self._pending_jobs.pop(job_id, None)
+        if expired:
+            self.logger.debug("[POOL] Expired %d unclaimed job slot(s)", len(expired))
     
     def get_status(self) -> Dict[str, Any]:
         """Get pool status including worker heartbeats"""
@@ -391,4 +495,17 @@ class ToolWorkerPool:
                 self.logger.warning(f"[POOL] Worker {worker.worker_id} did not stop gracefully")
                 worker.terminate()
         
+        # Stop the result collector and release anyone still waiting
+        try:
+            self.result_q.put(None, timeout=0.5)
+        except queue.Full:
+            pass
+        if self._collector_thread is not None:
+            self._collector_thread.join(timeout=1.0)
+            self._collector_thread = None
+        with self._results_lock:
+            slots = list(self._result_slots.values())
+        for slot in slots:
+            slot.event.set()
+        
         self.logger.info("[POOL] Pool shut down complete")
@@ -0,0 +1,247 @@
+"""
+Parallel, incremental directory scanner for LocalLibrary Tier 2/Tier 3 indexing.
+
+- Directories are listed with os.scandir (file type and, on Windows, stat
+  data come with the listing) by a thread pool working off a shared frontier
+- Each listed directory is recorded in scan_meta["dirs"] as
+  {"mtime_ns", "subdirs", "scan"}. On the next scan a directory whose mtime
+  is unchanged is not listed again: its records are reused from the previous
+  index and its recorded subdirectories are queued directly. A directory's
+  mtime changes when entries are added, removed or renamed in it, so edits
+  to a file's contents alone don't refresh its size/mtime fields
+- Records are yielded as directories complete, so callers can stream them
+  into the index
+"""
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+
+# file_filter(entry, root) -> record dict, or None to skip the file
+FileFilter = Callable[[os.DirEntry, str], Optional[Dict[str, Any]]]
+
+
+class ScanStats:
+    """Counters for one scan_tree() run."""
+
+    def __init__(self):
+        self.dirs_listed = 0
+        self.dirs_reused = 0
+        self.errors = 0
+        self.truncated = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "dirs_listed": self.dirs_listed,
+            "dirs_reused": self.dirs_reused,
+            "errors": self.errors,
+            "truncated": self.truncated,
+        }
+
+
+class _Listing:
+    __slots__ = ("path", "root", "depth", "mtime_ns", "subdirs", "records", "errors", "reused")
+
+    def __init__(self, path: str, root: str, depth: int):
+        self.path = path
+        self.root = root
+        self.depth = depth
+        self.mtime_ns: Optional[int] = None
+        self.subdirs: List[str] = []
+        self.records: List[Dict[str, Any]] = []
+        self.errors = 0
+        self.reused = False
+
+
+def group_by_parent(records: Iterable[Dict[str, Any]], path_field: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Group previously indexed records by the directory that contains them.
+
+    Args:
+        records: Records from the previous index (e.g. tier2_apps)
+        path_field: Key holding the file path ("exe_path" or "path")
+    """
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for record in records:
+        path = record.get(path_field)
+        if path:
+            grouped.setdefault(os.path.dirname(path), []).append(record)
+    return grouped
+
+
+def _is_under(path: str, roots: List[str]) -> bool:
+    for root in roots:
+        if path == root or path.startswith(os.path.join(root, "")):
+            return True
+    return False
+
+
+def _list_directory(
+    path: str,
+    root: str,
+    depth: int,
+    file_filter: FileFilter,
+    scan_kind: str,
+    dir_meta: Dict[str, Any],
+    previous: Dict[str, List[Dict[str, Any]]],
+) -> _Listing:
+    """List one directory (runs on a pool thread; reads shared state only)."""
+    listing = _Listing(path, root, depth)
+    try:
+        listing.mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        listing.errors += 1
+        return listing
+
+    cached = dir_meta.get(path)
+    if (
+        isinstance(cached, dict)
+        and cached.get("scan") == scan_kind
+        and cached.get("mtime_ns") == listing.mtime_ns
+    ):
+        listing.subdirs = list(cached.get("subdirs", []))
+        listing.records = list(previous.get(path, []))
+        listing.reused = True
+        return listing
+
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        listing.subdirs.append(entry.name)
+                    elif entry.is_file():
+                        record = file_filter(entry, root)
+                        if record is not None:
+                            listing.records.append(record)
+                except OSError:
+                    listing.errors += 1
+    except OSError:
+        # Inaccessible directory (permissions, vanished mid-scan, ...)
+        listing.errors += 1
+        listing.mtime_ns = None
+    return listing
+
+
+def scan_tree(
+    roots: Iterable[str],
+    file_filter: FileFilter,
+    *,
+    exclude_dirs: Iterable[str] = (),
+    max_depth: int = 10,
+    max_results: Optional[int] = None,
+    scan_kind: str = "scan",
+    dir_meta: Optional[Dict[str, Any]] = None,
+    previous: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    max_workers: int = 8,
+    reuse: bool = True,
+    stats: Optional[ScanStats] = None,
+    stop_event: Optional[threading.Event] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Walk directory trees in parallel and yield file records as they are found.
+
+    Args:
+        roots: Directories to scan (listed at depth 0)
+        file_filter: Builds a record for a file entry, or returns None to skip it
+        exclude_dirs: Subdirectories whose lowercase name contains any of these are skipped
+        max_depth: Directories at this depth or deeper are not listed
+        max_results: Stop after this many records (None = unlimited); a consumer
+            may also stop iterating once it has this many, keeping the metadata
+        scan_kind: Tag stored with directory metadata; entries of another kind are never reused
+        dir_meta: scan_meta["dirs"]; read for reuse and updated in place when the scan finishes
+        previous: Previous records grouped by parent directory (see group_by_parent)
+        max_workers: Directory listing threads
+        reuse: Reuse unchanged directories (False = list everything, still record metadata)
+        stats: Optional counters, filled in as the scan runs
+        stop_event: Optional event to abandon the scan early
+
+    Yields:
+        Record dicts produced by file_filter (or reused from previous)
+    """
+    roots = [os.path.normpath(str(root)) for root in roots]
+    excludes = tuple(exclude_dirs)
+    # Workers read a snapshot; dir_meta itself is only updated at the end
+    old_meta = dict(dir_meta) if (dir_meta is not None and reuse) else {}
+    previous = previous or {}
+    stats = stats if stats is not None else ScanStats()
+
+    new_meta: Dict[str, Dict[str, Any]] = {}
+    yielded = 0
+    finished = False
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="wyzer-scan")
+    pending: Set = set()
+
+    def _submit(path: str, root: str, depth: int) -> None:
+        pending.add(executor.submit(
+            _list_directory, path, root, depth, file_filter, scan_kind, old_meta, previous
+        ))
+
+    try:
+        for root in roots:
+            _submit(root, root, 0)
+
+        while pending:
+            if stop_event is not None and stop_event.is_set():
+                stats.truncated = True
+                break
+            done, _ = wait(pending, timeout=0.25, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                listing = future.result()
+                stats.errors += listing.errors
+                if listing.mtime_ns is None:
+                    continue
+                if listing.reused:
+                    stats.dirs_reused += 1
+                else:
+                    stats.dirs_listed += 1
+
+                records = listing.records
+                complete = max_results is None or len(records) <= max_results - yielded
+                if complete:
+                    # Only fully consumed directories may be reused next time
+                    # (recorded up front: a consumer may stop at max_results)
+                    new_meta[listing.path] = {
+                        "mtime_ns": listing.mtime_ns,
+                        "subdirs": listing.subdirs,
+                        "scan": scan_kind,
+                    }
+                else:
+                    records = records[:max_results - yielded]
+                for record in records:
+                    yielded += 1
+                    yield record
+
+                if not complete:
+                    stats.truncated = True
+                    break
+
+                if listing.depth + 1 >= max_depth:
+                    continue
+                for name in listing.subdirs:
+                    name_lower = name.lower()
+                    if any(exclude in name_lower for exclude in excludes):
+                        continue
+                    _submit(os.path.join(listing.path, name), listing.root, listing.depth + 1)
+
+            if stats.truncated:
+                break
+        finished = True
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        # The consumer stopped once it had max_results records: same as truncating
+        stopped_at_limit = not finished and max_results is not None and yielded >= max_results
+        if stopped_at_limit:
+            stats.truncated = True
+        if dir_meta is not None:
+            # Replace this kind's entries under the scanned roots. Directories
+            # not reached are dropped so their (absent) records aren't reused;
+            # if the consumer abandoned the scan before max_results records,
+            # nothing is kept at all.
+            for path in [p for p, meta in dir_meta.items()
+                         if (not isinstance(meta, dict) or meta.get("scan") == scan_kind) and _is_under(p, roots)]:
+                del dir_meta[path]
+            if finished or stopped_at_limit:
+                dir_meta.update(new_meta)
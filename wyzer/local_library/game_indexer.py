@@ -8,90 +8,89 @@ import subprocess
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+from wyzer.local_library.index_sources import IndexSource, SourceResult, run_sources, stat_fingerprint
 
-def refresh_games_index() -> Dict[str, Any]:
+# Tie-break between sources with the same confidence (higher wins)
+_SOURCE_PRIORITY = {"steam": 5, "epic": 4, "shortcut": 3, "folder_scan": 2, "xbox": 1}
+
+
+def refresh_games_index(source_cache: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Refresh the games index from all available sources.
     
-    Sources:
+    Sources (queried concurrently, see wyzer.local_library.index_sources):
     - Steam (via registry + VDF parsing)
     - Epic Games (via manifest JSON files)
     - Shortcuts (Start Menu, Desktop)
     - Folder scan (common game directories)
     - Xbox/Microsoft Store (via PowerShell Get-AppxPackage)
     
+    Results are merged through the deduplication as sources finish: each
+    source is merged as soon as it and every source listed before it are
+    done, so ties resolve in the order above on every refresh without
+    waiting for the slowest source.
+    Sources whose fingerprint is unchanged reuse their entry in source_cache,
+    and a source that fails or times out keeps its last cached games. The
+    folder scan has no fingerprint, so it is not cached and has no fallback.
+    
+    Args:
+        source_cache: Per-source fingerprints/results from the last refresh
+            (updated in place; persisted as scan_meta["source_cache"])
+    
     Returns:
         {
             "status": "ok",
             "counts": {"steam": int, "epic": int, ...},
             "sources": {"steam": bool, "epic": bool, ...},
+            "cached_sources": [...],  # sources served from the cache
             "errors": [...]  # optional
         }
     """
+    from wyzer.core.config import Config
+    
     start_time = time.perf_counter()
     
-    games = []
+    games_by_name: Dict[str, Dict[str, Any]] = {}
     counts = {}
     sources = {}
+    cached_sources = []
     errors = []
     
-    # 1) Index Steam games
-    try:
-        steam_games = _index_steam_games()
-        games.extend(steam_games)
-        counts["steam"] = len(steam_games)
-        sources["steam"] = True
-    except Exception as e:
-        counts["steam"] = 0
-        sources["steam"] = False
-        errors.append({"source": "steam", "error": str(e)})
-    
-    # 2) Index Epic Games
-    try:
-        epic_games = _index_epic_games()
-        games.extend(epic_games)
-        counts["epic"] = len(epic_games)
-        sources["epic"] = True
-    except Exception as e:
-        counts["epic"] = 0
-        sources["epic"] = False
-        errors.append({"source": "epic", "error": str(e)})
-    
-    # 3) Index game shortcuts (Start Menu + Desktop)
-    try:
-        shortcut_games = _index_game_shortcuts()
-        games.extend(shortcut_games)
-        counts["shortcuts"] = len(shortcut_games)
-        sources["shortcuts"] = True
-    except Exception as e:
-        counts["shortcuts"] = 0
-        sources["shortcuts"] = False
-        errors.append({"source": "shortcuts", "error": str(e)})
-    
-    # 4) Folder scan fallback
-    try:
-        folder_games = _index_folder_scan()
-        games.extend(folder_games)
-        counts["folder_scan"] = len(folder_games)
-        sources["folder_scan"] = True
-    except Exception as e:
-        counts["folder_scan"] = 0
-        sources["folder_scan"] = False
-        errors.append({"source": "folder_scan", "error": str(e)})
-    
-    # 5) Xbox/Microsoft Store (best effort)
-    try:
-        xbox_games = _index_xbox_games()
-        games.extend(xbox_games)
-        counts["xbox"] = len(xbox_games)
-        sources["xbox"] = True
-    except Exception as e:
-        counts["xbox"] = 0
-        sources["xbox"] = False
-        errors.append({"source": "xbox", "error": str(e)})
-    
-    # Deduplicate games by name (prefer higher confidence sources)
-    games = _deduplicate_games(games)
+    def _merge(result: SourceResult) -> None:
+        source_games = result.value or []
+        for game in source_games:
+            _merge_game(games_by_name, game)
+        counts[result.name] = len(source_games)
+        sources[result.name] = result.ok
+        if result.cached:
+            cached_sources.append(result.name)
+        if result.error:
+            errors.append({"source": result.name, "error": result.error})
+    
+    index_sources = _game_index_sources(Config.LOCAL_LIBRARY_SOURCE_TIMEOUT_SEC)
+    
+    # Sources finish in any order; hold a result back only until the sources
+    # declared before it are merged, so a tie in confidence and priority goes
+    # to the earlier source, as it always has
+    order = {source.name: i for i, source in enumerate(index_sources)}
+    finished: Dict[int, SourceResult] = {}
+    next_index = 0
+    
+    def _on_result(result: SourceResult) -> None:
+        nonlocal next_index
+        finished[order[result.name]] = result
+        while next_index in finished:
+            _merge(finished.pop(next_index))
+            next_index += 1
+    
+    run_sources(
+        index_sources,
+        cache=source_cache,
+        on_result=_on_result,
+        use_cache=Config.LOCAL_LIBRARY_SOURCE_CACHE,
+    )
+    # First-seen order, as _deduplicate_games gives (LibraryIndex lookups: first record wins)
+    games = list(games_by_name.values())
     
     end_time = time.perf_counter()
     latency_ms = int((end_time - start_time) * 1000)
@@ -100,6 +99,7 @@ def refresh_games_index() -> Dict[str, Any]:
         "status": "ok",
         "counts": counts,
         "sources": sources,
+        "cached_sources": sorted(cached_sources),
         "total_games": len(games),
         "games": games,
         "latency_ms": latency_ms
@@ -111,6 +111,20 @@ def refresh_games_index() -> Dict[str, Any]:
     return result
 
 
+def _game_index_sources(timeout_sec: float) -> List[IndexSource]:
+    """The game sources, each with its own timeout and change fingerprint."""
+    from wyzer.local_library.uwp_indexer import appx_packages_fingerprint
+    
+    return [
+        IndexSource("steam", _index_steam_games, _steam_fingerprint, timeout_sec),
+        IndexSource("epic", _index_epic_games, _epic_fingerprint, timeout_sec),
+        IndexSource("shortcuts", _index_game_shortcuts, _shortcuts_fingerprint, timeout_sec),
+        # Walking the folders is the scan itself: no cheap fingerprint, always rescanned
+        IndexSource("folder_scan", _index_folder_scan, None, timeout_sec),
+        IndexSource("xbox", _index_xbox_games, appx_packages_fingerprint, timeout_sec),
+    ]
+
+
 def load_games_index() -> Dict[str, Any]:
     """
     Load cached games index from library.json.
@@ -127,17 +141,23 @@ def load_games_index() -> Dict[str, Any]:
     }
 
 
-def merge_games_into_library(library: Dict[str, Any]) -> Dict[str, Any]:
+def merge_games_into_library(
+    library: Dict[str, Any],
+    games_result: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
     """
     Merge refreshed games index into library data.
     
     Args:
         library: Existing library data dict
+        games_result: Result of refresh_games_index (refreshed now if None)
         
     Returns:
         Updated library data with games merged
     """
-    games_result = refresh_games_index()
+    if games_result is None:
+        source_cache = library.setdefault("scan_meta", {}).setdefault("source_cache", {})
+        games_result = refresh_games_index(source_cache)
     
     # Merge games
     library["games"] = games_result["games"]
@@ -150,6 +170,7 @@ def merge_games_into_library(library: Dict[str, Any]) -> Dict[str, Any]:
     library["games_scan_meta"]["counts"] = games_result["counts"]
     library["games_scan_meta"]["sources"] = games_result["sources"]
     library["games_scan_meta"]["total_games"] = games_result["total_games"]
+    library["games_scan_meta"]["cached_sources"] = games_result.get("cached_sources", [])
     
     if "errors" in games_result:
         library["games_scan_meta"]["errors"] = games_result["errors"]
@@ -219,6 +240,20 @@ def _index_steam_games() -> List[Dict[str, Any]]:
     return games
 
 
+def _steam_fingerprint() -> Optional[str]:
+    """Library folder list plus every appmanifest (added, removed or updated)."""
+    steam_path = _get_steam_install_path()
+    if not steam_path:
+        return None
+    
+    paths: List[Path] = [Path(steam_path) / "steamapps" / "libraryfolders.vdf"]
+    for library_path in _parse_steam_library_folders(steam_path):
+        steamapps_path = Path(library_path) / "steamapps"
+        paths.append(steamapps_path)
+        paths.extend(steamapps_path.glob("appmanifest_*.acf"))
+    return stat_fingerprint(paths)
+
+
 def _get_steam_install_path() -> Optional[str]:
     """Get Steam installation path from Windows registry."""
     try:
@@ -338,7 +373,7 @@ def _index_epic_games() -> List[Dict[str, Any]]:
     """
     games = []
     
-    manifests_path = Path(os.environ.get("PROGRAMDATA", "")) / "Epic" / "EpicGamesLauncher" / "Data" / "Manifests"
+    manifests_path = _epic_manifests_path()
     
     if not manifests_path.exists():
         return games
@@ -379,6 +414,16 @@ def _index_epic_games() -> List[Dict[str, Any]]:
     return games
 
 
+def _epic_manifests_path() -> Path:
+    return Path(os.environ.get("PROGRAMDATA", "")) / "Epic" / "EpicGamesLauncher" / "Data" / "Manifests"
+
+
+def _epic_fingerprint() -> Optional[str]:
+    """Manifest directory plus every .item manifest."""
+    manifests_path = _epic_manifests_path()
+    return stat_fingerprint([manifests_path, *manifests_path.glob("*.item")])
+
+
 # ==============================================================================
 # SHORTCUT INDEXER
 # ==============================================================================
@@ -392,12 +437,7 @@ def _index_game_shortcuts() -> List[Dict[str, Any]]:
     """
     games = []
     
-    # Define scan paths
-    scan_paths = [
-        Path(os.environ.get("APPDATA", "")) / "Microsoft" / "Windows" / "Start Menu" / "Programs",
-        Path(os.environ.get("PROGRAMDATA", "")) / "Microsoft" / "Windows" / "Start Menu" / "Programs",
-        Path(os.environ.get("USERPROFILE", "")) / "Desktop"
-    ]
+    scan_paths = _shortcut_scan_paths()
     
     # Game-related keywords
     game_keywords = [
@@ -455,6 +495,30 @@ def _index_game_shortcuts() -> List[Dict[str, Any]]:
     return games
 
 
+def _shortcut_scan_paths() -> List[Path]:
+    """Start Menu (user + all users) and Desktop."""
+    return [
+        Path(os.environ.get("APPDATA", "")) / "Microsoft" / "Windows" / "Start Menu" / "Programs",
+        Path(os.environ.get("PROGRAMDATA", "")) / "Microsoft" / "Windows" / "Start Menu" / "Programs",
+        Path(os.environ.get("USERPROFILE", "")) / "Desktop"
+    ]
+
+
+def _shortcuts_fingerprint() -> Optional[str]:
+    """
+    Every .lnk under the scan paths (stat only).
+    
+    Skipping an unchanged tree avoids resolving shortcut targets again,
+    which can start a PowerShell per shortcut.
+    """
+    paths: List[Path] = []
+    for scan_path in _shortcut_scan_paths():
+        paths.append(scan_path)
+        if scan_path.exists():
+            paths.extend(_find_shortcuts(scan_path, max_depth=3))
+    return stat_fingerprint(paths)
+
+
 def _find_shortcuts(path: Path, max_depth: int = 3, current_depth: int = 0) -> List[Path]:
     """
     Recursively find .lnk shortcuts in a directory.
@@ -702,13 +766,17 @@ def _index_xbox_games() -> List[Dict[str, Any]]:
     
     Returns:
         List of game dicts
+        
+    Raises:
+        RuntimeError: If the package list could not be read (so the last
+            cached result is kept instead of an empty list)
     """
     games = []
     
+    # Get AppX packages via PowerShell
+    ps_command = "Get-AppxPackage | Select-Object Name, PackageFamilyName | ConvertTo-Json"
+    
     try:
-        # Get AppX packages via PowerShell
-        ps_command = "Get-AppxPackage | Select-Object Name, PackageFamilyName | ConvertTo-Json"
-        
         result = subprocess.run(
             ["powershell", "-NoProfile", "-Command", ps_command],
             capture_output=True,
@@ -716,57 +784,52 @@ def _index_xbox_games() -> List[Dict[str, Any]]:
             timeout=30,
             creationflags=subprocess.CREATE_NO_WINDOW
         )
-        
-        if result.returncode != 0:
-            return games
-        
-        # Parse JSON output
+    except subprocess.TimeoutExpired:
+        raise RuntimeError("Get-AppxPackage timed out after 30 seconds")
+    
+    if result.returncode != 0:
+        raise RuntimeError(f"Get-AppxPackage failed with exit code {result.returncode}")
+    
+    # Parse JSON output
+    try:
         packages_data = json.loads(result.stdout)
+    except json.JSONDecodeError as e:
+        raise RuntimeError(f"Failed to parse Get-AppxPackage output: {e}")
+    
+    # Handle single item (not array)
+    if isinstance(packages_data, dict):
+        packages_data = [packages_data]
+    
+    # Filter for game-related packages
+    game_keywords = [
+        "game", "xbox", "minecraft", "solitaire", "candy", "farm", "mahjong",
+        "casino", "puzzle", "racing", "sports", "action", "adventure", "shooter"
+    ]
+    
+    for package in packages_data:
+        name = package.get("Name", "")
+        family_name = package.get("PackageFamilyName", "")
         
-        # Handle single item (not array)
-        if isinstance(packages_data, dict):
-            packages_data = [packages_data]
-        
-        # Filter for game-related packages
-        game_keywords = [
-            "game", "xbox", "minecraft", "solitaire", "candy", "farm", "mahjong",
-            "casino", "puzzle", "racing", "sports", "action", "adventure", "shooter"
-        ]
+        name_lower = name.lower()
         
-        for package in packages_data:
-            name = package.get("Name", "")
-            family_name = package.get("PackageFamilyName", "")
-            
-            name_lower = name.lower()
+        # Check if package name suggests it's a game
+        if any(keyword in name_lower for keyword in game_keywords):
+            # Clean up name
+            display_name = name.split(".")[-1] if "." in name else name
+            display_name = display_name.replace("_", " ").title()
             
-            # Check if package name suggests it's a game
-            if any(keyword in name_lower for keyword in game_keywords):
-                # Clean up name
-                display_name = name.split(".")[-1] if "." in name else name
-                display_name = display_name.replace("_", " ").title()
-                
-                games.append({
-                    "name": display_name,
-                    "source": "xbox",
-                    "launch": {
-                        "type": "uwp",
-                        "target": f"shell:AppsFolder\\{family_name}!App"
-                    },
-                    "install_path": None,
-                    "app_id": family_name,
-                    "aliases": _generate_game_aliases(display_name),
-                    "confidence": 0.75
-                })
-        
-    except subprocess.TimeoutExpired:
-        # PowerShell took too long
-        pass
-    except json.JSONDecodeError:
-        # Failed to parse output
-        pass
-    except Exception:
-        # Other errors (permissions, etc.)
-        pass
+            games.append({
+                "name": display_name,
+                "source": "xbox",
+                "launch": {
+                    "type": "uwp",
+                    "target": f"shell:AppsFolder\\{family_name}!App"
+                },
+                "install_path": None,
+                "app_id": family_name,
+                "aliases": _generate_game_aliases(display_name),
+                "confidence": 0.75
+            })
     
     return games
 
@@ -822,6 +885,29 @@ def _generate_game_aliases(game_name: str) -> List[str]:
     return list(set(aliases))
 
 
+def _merge_game(games_by_name: Dict[str, Dict[str, Any]], game: Dict[str, Any]) -> None:
+    """
+    Merge one game into games_by_name, preferring higher confidence sources.
+    
+    Args:
+        games_by_name: Games keyed by normalized name (updated in place)
+        game: Game dict to merge
+    """
+    name_key = game["name"].lower().strip()
+    
+    if name_key not in games_by_name:
+        games_by_name[name_key] = game
+    else:
+        # Keep the higher confidence one
+        existing_game = games_by_name[name_key]
+        if game["confidence"] > existing_game["confidence"]:
+            games_by_name[name_key] = game
+        # If same confidence, prefer certain sources
+        elif game["confidence"] == existing_game["confidence"]:
+            if _SOURCE_PRIORITY.get(game["source"], 0) > _SOURCE_PRIORITY.get(existing_game["source"], 0):
+                games_by_name[name_key] = game
+
+
 def _deduplicate_games(games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Deduplicate games by name, preferring higher confidence sources.
@@ -833,22 +919,9 @@ def _deduplicate_games(games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         Deduplicated list
     """
     # Group by normalized name
-    games_by_name = {}
+    games_by_name: Dict[str, Dict[str, Any]] = {}
     
     for game in games:
-        name_key = game["name"].lower().strip()
-        
-        if name_key not in games_by_name:
-            games_by_name[name_key] = game
-        else:
-            # Keep the higher confidence one
-            existing_game = games_by_name[name_key]
-            if game["confidence"] > existing_game["confidence"]:
-                games_by_name[name_key] = game
-            # If same confidence, prefer certain sources
-            elif game["confidence"] == existing_game["confidence"]:
-                source_priority = {"steam": 5, "epic": 4, "shortcut": 3, "folder_scan": 2, "xbox": 1}
-                if source_priority.get(game["source"], 0) > source_priority.get(existing_game["source"], 0):
-                    games_by_name[name_key] = game
+        _merge_game(games_by_name, game)
     
     return list(games_by_name.values())
@@ -0,0 +1,168 @@
+"""
+Concurrent index sources for LocalLibrary.
+
+Game and UWP discovery used to query every source (Steam manifests, Epic
+manifests, shortcut trees, folder scans, PowerShell package lists) one after
+another, so a refresh took the sum of all of them. run_sources() runs each
+source on its own thread with its own timeout; a refresh now takes about as
+long as the slowest source.
+
+Each source may also provide a cheap fingerprint (e.g. manifest mtimes). The
+fingerprint and the source's last result are kept in a cache dict that the
+caller persists (scan_meta["source_cache"] in library.json); when the
+fingerprint is unchanged the source is not queried again. A source that
+fails or times out falls back to its last cached result. Sources without a
+fingerprint are never cached (and so have no fallback).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+
+class IndexSource(NamedTuple):
+    """One independently refreshable index source."""
+    name: str
+    index: Callable[[], Any]  # Returns a JSON-serializable result, raises on failure
+    fingerprint: Optional[Callable[[], Optional[str]]] = None  # None = always query
+    timeout_sec: float = 60.0
+
+
+@dataclass
+class SourceResult:
+    """Outcome of one source in a run."""
+    name: str
+    value: Any = None
+    ok: bool = False
+    cached: bool = False  # value came from the cache (unchanged or fallback)
+    error: Optional[str] = None
+    fingerprint: Optional[str] = None
+    latency_ms: int = 0
+
+
+def stat_fingerprint(paths: Iterable[Any]) -> str:
+    """
+    Fingerprint a set of files/directories by path, mtime and size.
+
+    A directory's mtime changes when entries are added, removed or renamed
+    in it. Missing paths are part of the fingerprint too.
+    """
+    digest = hashlib.sha1()
+    for path in sorted(str(p) for p in paths):
+        try:
+            st = os.stat(path)
+            digest.update(f"{path}|{st.st_mtime_ns}|{st.st_size}\n".encode("utf-8", "replace"))
+        except OSError:
+            digest.update(f"{path}|-\n".encode("utf-8", "replace"))
+    return digest.hexdigest()
+
+
+def _fallback(source: IndexSource, cached: Optional[Dict[str, Any]], error: str, start: float) -> SourceResult:
+    latency_ms = int((time.perf_counter() - start) * 1000)
+    if cached is not None and "value" in cached:
+        return SourceResult(source.name, value=cached["value"], cached=True, error=error, latency_ms=latency_ms)
+    return SourceResult(source.name, error=error, latency_ms=latency_ms)
+
+
+def _run_source(source: IndexSource, cached: Optional[Dict[str, Any]], use_cache: bool) -> SourceResult:
+    start = time.perf_counter()
+    fingerprint = None
+    if source.fingerprint is not None:
+        try:
+            fingerprint = source.fingerprint()
+        except Exception:
+            fingerprint = None
+
+    if (
+        use_cache
+        and fingerprint is not None
+        and cached is not None
+        and cached.get("fingerprint") == fingerprint
+        and "value" in cached
+    ):
+        return SourceResult(
+            source.name, value=cached["value"], ok=True, cached=True, fingerprint=fingerprint,
+            latency_ms=int((time.perf_counter() - start) * 1000),
+        )
+
+    try:
+        value = source.index()
+    except Exception as e:
+        return _fallback(source, cached, str(e), start)
+    return SourceResult(
+        source.name, value=value, ok=True, fingerprint=fingerprint,
+        latency_ms=int((time.perf_counter() - start) * 1000),
+    )
+
+
+def run_sources(
+    sources: List[IndexSource],
+    cache: Optional[Dict[str, Dict[str, Any]]] = None,
+    on_result: Optional[Callable[[SourceResult], None]] = None,
+    use_cache: bool = True,
+) -> Dict[str, SourceResult]:
+    """
+    Run index sources concurrently, each bounded by its own timeout.
+
+    Args:
+        sources: Sources to run
+        cache: {name: {"fingerprint", "value"}} from the last run (updated in
+            place; only sources with a fingerprint are stored)
+        on_result: Called in the caller's thread as each source finishes,
+            in completion order (for incremental merging)
+        use_cache: Skip sources whose fingerprint is unchanged
+
+    Returns:
+        {name: SourceResult}. A source that times out is abandoned (its
+        thread is left to finish on its own) and reported with an error.
+    """
+    from wyzer.core.logger import get_logger
+    logger = get_logger()
+
+    cache = cache if cache is not None else {}
+    results: Dict[str, SourceResult] = {}
+    if not sources:
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="wyzer-index")
+    start = time.perf_counter()
+    futures = {
+        executor.submit(_run_source, source, cache.get(source.name), use_cache): source
+        for source in sources
+    }
+    deadlines = {future: start + source.timeout_sec for future, source in futures.items()}
+    pending = set(futures)
+
+    def _record(result: SourceResult) -> None:
+        results[result.name] = result
+        if result.ok and not result.cached:
+            if result.fingerprint is not None:
+                cache[result.name] = {"fingerprint": result.fingerprint, "value": result.value}
+            else:
+                # Nothing to validate it against next time: don't persist it
+                cache.pop(result.name, None)
+        status = "cached" if result.cached and result.ok else ("ok" if result.ok else f"error={result.error}")
+        logger.info(f"[SCAN] source={result.name} {status} latency_ms={result.latency_ms}")
+        if on_result is not None:
+            on_result(result)
+
+    try:
+        while pending:
+            timeout = max(0.0, min(deadlines[f] for f in pending) - time.perf_counter())
+            done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                _record(future.result())
+            now = time.perf_counter()
+            for future in [f for f in pending if deadlines[f] <= now]:
+                pending.discard(future)
+                source = futures[future]
+                _record(_fallback(source, cache.get(source.name), f"timed out after {source.timeout_sec:g}s", start))
+    finally:
+        executor.shutdown(wait=False)
+
+    return results
@@ -3,14 +3,21 @@ Indexer for LocalLibrary - builds and maintains index of folders, files, and app
 """
 import os
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+
+from wyzer.local_library.fs_scanner import ScanStats, group_by_parent, scan_tree
 
 
 # Path to library.json (generated index)
 LIBRARY_JSON_PATH = Path(__file__).parent / "library.json"
 
+# Path to aliases.json (user-defined aliases, overlaid on every load)
+ALIASES_JSON_PATH = Path(__file__).parent / "aliases.json"
+
 
 def refresh_index(mode: str = "normal") -> Dict[str, Any]:
     """
@@ -23,6 +30,11 @@ def refresh_index(mode: str = "normal") -> Dict[str, Any]:
     - Tier 2 apps (EXEs from Program Files and user install dirs) - if mode="full"
     - Tier 3 files (root drive scan) - if mode="tier3"
     - Games (Steam, Epic, shortcuts, folder scan, Xbox) - always refreshed
+    - UWP apps - always refreshed
+    
+    Game and UWP sources run concurrently in the background while folders
+    and apps are indexed (see wyzer.local_library.index_sources); sources
+    whose fingerprint is unchanged since the last refresh are not re-queried.
     
     Args:
         mode: "normal" (Start Menu only), "full" (includes Tier 2 EXE scanning), 
@@ -47,6 +59,23 @@ def refresh_index(mode: str = "normal") -> Dict[str, Any]:
             "dirs": {}
         })
         
+        # Start game + UWP sources first: they mostly wait on disk/PowerShell
+        from wyzer.core.config import Config
+        from wyzer.local_library.game_indexer import merge_games_into_library, refresh_games_index
+        from wyzer.local_library.index_sources import IndexSource, run_sources
+        from wyzer.local_library.uwp_indexer import appx_packages_fingerprint, index_uwp_apps
+        
+        source_cache = existing_scan_meta.setdefault("source_cache", {})
+        uwp_source = IndexSource(
+            "uwp", index_uwp_apps, appx_packages_fingerprint, Config.LOCAL_LIBRARY_SOURCE_TIMEOUT_SEC,
+        )
+        background = ThreadPoolExecutor(max_workers=2, thread_name_prefix="wyzer-library")
+        games_future = background.submit(refresh_games_index, source_cache)
+        uwp_future = background.submit(
+            run_sources, [uwp_source], source_cache, use_cache=Config.LOCAL_LIBRARY_SOURCE_CACHE,
+        )
+        background.shutdown(wait=False)
+        
         index_data = {
             "version": "1.0",
             "timestamp": time.time(),
@@ -109,7 +138,12 @@ def refresh_index(mode: str = "normal") -> Dict[str, Any]:
             
             if default_drive:
                 logger.info(f"[SCAN] Scanning Tier 3 files on drive {default_drive['letter']}: (this may take several minutes)...")
-                scan_result = scan_tier3_root(default_drive['letter'], max_results=5000)
+                scan_result = scan_tier3_root(
+                    default_drive['letter'],
+                    max_results=5000,
+                    scan_meta=index_data["scan_meta"],
+                    existing_files=existing_index.get("tier3_files", [])
+                )
                 
                 if scan_result.get("status") == "ok":
                     tier3_files = scan_result.get("files", [])
@@ -126,22 +160,24 @@ def refresh_index(mode: str = "normal") -> Dict[str, Any]:
             index_data["tier3_drives"] = tier3_drives
         
         # Index games (always refresh)
-        logger.info("[SCAN] Scanning games...")
-        from wyzer.local_library.game_indexer import merge_games_into_library
-        index_data = merge_games_into_library(index_data)
+        logger.info("[SCAN] Waiting for game sources...")
+        index_data = merge_games_into_library(index_data, games_future.result())
         
         # Index UWP apps (always refresh)
-        logger.info("[SCAN] Scanning UWP apps...")
-        from wyzer.local_library.uwp_indexer import refresh_uwp_index
-        uwp_result = refresh_uwp_index()
-        index_data["uwp_apps"] = uwp_result.get("apps", [])
+        logger.info("[SCAN] Waiting for UWP apps...")
+        uwp_result = uwp_future.result()["uwp"]
+        index_data["uwp_apps"] = uwp_result.value or []
         index_data["uwp_scan_meta"] = {
             "last_refresh": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "count": uwp_result.get("count", 0),
-            "status": uwp_result.get("status", "error")
+            "count": len(index_data["uwp_apps"]),
+            "status": "ok" if uwp_result.ok else "error",
+            "cached": uwp_result.cached,
         }
-        if "error" in uwp_result:
-            index_data["uwp_scan_meta"]["error"] = uwp_result["error"]
+        if uwp_result.error:
+            index_data["uwp_scan_meta"]["error"] = {
+                "type": "uwp_index_error",
+                "message": uwp_result.error
+            }
         
         # Write to library.json
         logger.info("[SCAN] Finalizing scan...")
@@ -347,13 +383,11 @@ def _load_aliases() -> Dict[str, Dict[str, str]]:
     Returns:
         Dict mapping alias name (lowercase) to {"target": "...", "type": "folder|file|app|url"}
     """
-    aliases_path = Path(__file__).parent / "aliases.json"
-    
-    if not aliases_path.exists():
+    if not ALIASES_JSON_PATH.exists():
         return {}
     
     try:
-        with open(aliases_path, 'r', encoding='utf-8') as f:
+        with open(ALIASES_JSON_PATH, 'r', encoding='utf-8') as f:
             aliases_data = json.load(f)
         
         # Normalize keys to lowercase
@@ -469,82 +503,55 @@ def _index_tier2_apps(scan_meta: Dict[str, Any], existing_apps: List[Dict[str, A
     """
     Index user-facing executables from common install locations.
     
-    Uses incremental scanning: only rescans directories that have changed.
-    Preserves apps from unchanged directories.
+    Uses incremental scanning: directories whose mtime is unchanged since the
+    last scan are not listed again, and their apps are carried over.
     
     Args:
-        scan_meta: Existing scan metadata with directory mtimes
+        scan_meta: Existing scan metadata with directory mtimes (updated in place)
         existing_apps: Previously indexed Tier 2 apps to preserve
         
     Returns:
         Tuple of (tier2_apps_list, error_messages)
     """
-    newly_scanned_apps = []
+    from wyzer.core.config import Config
+    from wyzer.core.logger import get_logger
+    
     errors = []
     
     # Define scan locations
     scan_locations = _get_tier2_scan_locations()
+    sources = {os.path.normpath(str(location["path"])): location["source"] for location in scan_locations}
     
-    # Track which directories were rescanned
-    rescanned_dirs = set()
-    updated_dirs = {}
-    
-    for location in scan_locations:
-        if not location["path"].exists():
-            continue
-        
-        try:
-            # Check if directory needs rescanning
-            dir_key = str(location["path"])
-            dir_mtime = location["path"].stat().st_mtime
-            
-            # Skip if unchanged (incremental scan optimization)
-            if dir_key in scan_meta.get("dirs", {}) and scan_meta["dirs"][dir_key] == dir_mtime:
-                # Directory hasn't changed, we'll keep existing apps from it
-                continue
-            
-            # Mark this directory as rescanned
-            rescanned_dirs.add(dir_key)
-            
-            # Scan this location
-            found_apps = _scan_tier2_location(
-                location["path"],
-                location["source"],
-                max_depth=3
-            )
-            
-            newly_scanned_apps.extend(found_apps)
-            updated_dirs[dir_key] = dir_mtime
-            
-        except Exception as e:
-            errors.append(f"Error scanning {location['path']}: {str(e)}")
-    
-    # Merge: Keep existing apps from unchanged directories
-    final_apps = []
-    
-    # Add newly scanned apps
-    final_apps.extend(newly_scanned_apps)
-    
-    # Add existing apps from unchanged directories
-    for app in existing_apps:
-        # Check if this app's root directory was rescanned
-        app_path = app["exe_path"]
-        in_rescanned_dir = any(app_path.startswith(scan_dir) for scan_dir in rescanned_dirs)
-        
-        if not in_rescanned_dir:
-            # This app is from an unchanged directory, keep it
-            final_apps.append(app)
-    
-    # Update scan_meta with new mtimes
-    scan_meta["dirs"].update(updated_dirs)
+    def _file_record(entry: os.DirEntry, root: str) -> Optional[Dict[str, Any]]:
+        return _tier2_app_record(entry, sources.get(root, "program_files"))
     
-    # Deduplicate by exe_path
-    seen_paths = set()
+    stats = ScanStats()
     unique_apps = []
-    for app in final_apps:
-        if app["exe_path"] not in seen_paths:
-            seen_paths.add(app["exe_path"])
-            unique_apps.append(app)
+    seen_paths = set()
+    try:
+        for app in scan_tree(
+            sources.keys(),
+            _file_record,
+            exclude_dirs=EXCLUDE_DIRS,
+            max_depth=3,
+            scan_kind="tier2",
+            dir_meta=scan_meta.setdefault("dirs", {}),
+            previous=group_by_parent(existing_apps, "exe_path"),
+            max_workers=Config.LOCAL_LIBRARY_SCAN_WORKERS,
+            reuse=Config.LOCAL_LIBRARY_INCREMENTAL_SCAN,
+            stats=stats,
+        ):
+            # Deduplicate by exe_path
+            if app["exe_path"] not in seen_paths:
+                seen_paths.add(app["exe_path"])
+                unique_apps.append(app)
+    except Exception as e:
+        errors.append(f"Error scanning Tier 2 locations: {str(e)}")
+    
+    get_logger().info(
+        f"[SCAN] Tier 2: {len(unique_apps)} apps, {stats.dirs_listed} dirs listed, "
+        f"{stats.dirs_reused} unchanged"
+    )
     
     return unique_apps, errors
 
@@ -585,77 +592,40 @@ def _get_tier2_scan_locations() -> List[Dict[str, Any]]:
     return locations
 
 
-def _scan_tier2_location(
-    root_path: Path,
-    source: str,
-    max_depth: int = 3,
-    current_depth: int = 0
-) -> List[Dict[str, Any]]:
+def _tier2_app_record(entry: os.DirEntry, source: str) -> Optional[Dict[str, Any]]:
     """
-    Recursively scan a location for user-facing executables.
+    Build Tier 2 app metadata for a directory entry, if it's a user-facing EXE.
     
     Args:
-        root_path: Root directory to scan
+        entry: File entry from os.scandir
         source: Source type ("program_files" or "user_programs")
-        max_depth: Maximum recursion depth
-        current_depth: Current recursion depth
         
     Returns:
-        List of app metadata dicts
+        App metadata dict, or None to skip the file
     """
-    apps = []
+    if os.path.splitext(entry.name)[1].lower() != ".exe":
+        return None
     
-    if current_depth >= max_depth:
-        return apps
+    # Check if EXE should be excluded
+    exe_name_lower = entry.name.lower()
+    if any(keyword in exe_name_lower for keyword in EXCLUDE_EXE_KEYWORDS):
+        return None
     
+    # Extract metadata
     try:
-        for entry in root_path.iterdir():
-            # Check if directory should be excluded
-            if entry.is_dir():
-                dir_name_lower = entry.name.lower()
-                
-                # Skip excluded directories
-                if any(exclude in dir_name_lower for exclude in EXCLUDE_DIRS):
-                    continue
-                
-                # Recurse into subdirectory
-                apps.extend(_scan_tier2_location(
-                    entry,
-                    source,
-                    max_depth,
-                    current_depth + 1
-                ))
-            
-            elif entry.is_file() and entry.suffix.lower() == ".exe":
-                # Check if EXE should be excluded
-                exe_name_lower = entry.name.lower()
-                
-                if any(keyword in exe_name_lower for keyword in EXCLUDE_EXE_KEYWORDS):
-                    continue
-                
-                # Extract metadata
-                try:
-                    stat_info = entry.stat()
-                    
-                    # Generate friendly name
-                    friendly_name = _generate_friendly_name(entry)
-                    
-                    apps.append({
-                        "name": friendly_name,
-                        "exe_path": str(entry),
-                        "source": source,
-                        "folder": entry.parent.name,
-                        "mtime": stat_info.st_mtime
-                    })
-                except Exception:
-                    # Skip files that can't be accessed
-                    pass
-    
-    except (PermissionError, OSError):
-        # Skip inaccessible directories
-        pass
-    
-    return apps
+        stat_info = entry.stat()
+    except OSError:
+        # Skip files that can't be accessed
+        return None
+    
+    exe_path = Path(entry.path)
+    return {
+        "name": _generate_friendly_name(exe_path),
+        "exe_path": entry.path,
+        "source": source,
+        "folder": exe_path.parent.name,
+        "mtime": stat_info.st_mtime
+    }
 
 
 def _generate_friendly_name(exe_path: Path) -> str:
@@ -771,7 +741,78 @@ def get_available_drives() -> List[Dict[str, Any]]:
     return drives
 
 
-def scan_tier3_root(drive_letter: str = "C", max_results: int = 10000) -> Dict[str, Any]:
+def _tier3_file_record(entry: os.DirEntry, root: str) -> Optional[Dict[str, Any]]:
+    """
+    Build Tier 3 file metadata for a directory entry with a prioritized extension.
+    
+    Raises OSError if the file can't be stat'ed (counted as a scan error).
+    """
+    suffix_lower = os.path.splitext(entry.name)[1].lower()
+    
+    # Only index prioritized extensions
+    if suffix_lower not in PRIORITIZED_EXTENSIONS:
+        return None
+    
+    stat_info = entry.stat()
+    return {
+        "name": entry.name,
+        "path": entry.path,
+        "type": suffix_lower,
+        "size_mb": round(stat_info.st_size / (1024 ** 2), 2),
+        "mtime": stat_info.st_mtime
+    }
+
+
+def _scan_tier3_tree(
+    root: Path,
+    max_results: int,
+    scan_meta: Optional[Dict[str, Any]] = None,
+    existing_files: Optional[List[Dict[str, Any]]] = None
+) -> tuple[List[Dict[str, Any]], ScanStats]:
+    """
+    Scan a directory tree for Tier 3 files (parallel, incremental when scan_meta is given).
+    
+    Args:
+        root: Root directory to scan
+        max_results: Maximum files to index before stopping
+        scan_meta: Scan metadata with directory mtimes (updated in place), or None
+        existing_files: Previously indexed Tier 3 files to carry over for unchanged directories
+        
+    Returns:
+        Tuple of (files, scan stats)
+    """
+    from wyzer.core.config import Config
+    
+    stats = ScanStats()
+    files: List[Dict[str, Any]] = []
+    records = scan_tree(
+        [str(root)],
+        _tier3_file_record,
+        exclude_dirs=EXCLUDE_DIRS_TIER3,
+        max_depth=10,
+        max_results=max_results,
+        scan_kind="tier3",
+        dir_meta=scan_meta.setdefault("dirs", {}) if scan_meta is not None else None,
+        previous=group_by_parent(existing_files or [], "path"),
+        max_workers=Config.LOCAL_LIBRARY_SCAN_WORKERS,
+        reuse=Config.LOCAL_LIBRARY_INCREMENTAL_SCAN,
+        stats=stats,
+    )
+    # Consume records as the walk produces them; stop listing at the cap
+    for record in records:
+        files.append(record)
+        if len(files) >= max_results:
+            records.close()
+            break
+    return files, stats
+
+
+def scan_tier3_root(
+    drive_letter: str = "C",
+    max_results: int = 10000,
+    scan_meta: Optional[Dict[str, Any]] = None,
+    existing_files: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
     """
     Perform a Tier 3 scan on a specific drive root.
     
@@ -784,6 +825,8 @@ def scan_tier3_root(drive_letter: str = "C", max_results: int = 10000) -> Dict[s
     Args:
         drive_letter: Drive letter to scan (e.g., "C", "D")
         max_results: Maximum files to index before stopping
+        scan_meta: Library scan_meta; when given, unchanged directories are skipped
+        existing_files: Previously indexed Tier 3 files (reused for unchanged directories)
         
     Returns:
         {"status": "ok", "count": int, "files": [...], "latency_ms": int}
@@ -804,67 +847,22 @@ def scan_tier3_root(drive_letter: str = "C", max_results: int = 10000) -> Dict[s
         
         logger.info(f"[SCAN] Starting Tier 3 scan on drive {drive_letter}:")
         
-        files = []
-        error_count = 0
-        
-        # Recursively scan the drive
-        def _recursive_tier3_scan(path: Path, depth: int = 0, max_depth: int = 10) -> None:
-            nonlocal files, error_count
-            
-            if len(files) >= max_results or depth >= max_depth:
-                return
-            
-            try:
-                for entry in path.iterdir():
-                    if len(files) >= max_results:
-                        return
-                    
-                    try:
-                        if entry.is_dir():
-                            dir_name_lower = entry.name.lower()
-                            
-                            # Skip excluded directories
-                            if any(exclude in dir_name_lower for exclude in EXCLUDE_DIRS_TIER3):
-                                continue
-                            
-                            # Recurse
-                            _recursive_tier3_scan(entry, depth + 1, max_depth)
-                        
-                        elif entry.is_file():
-                            suffix_lower = entry.suffix.lower()
-                            
-                            # Only index prioritized extensions
-                            if suffix_lower in PRIORITIZED_EXTENSIONS:
-                                try:
-                                    stat_info = entry.stat()
-                                    files.append({
-                                        "name": entry.name,
-                                        "path": str(entry),
-                                        "type": suffix_lower,
-                                        "size_mb": round(stat_info.st_size / (1024 ** 2), 2),
-                                        "mtime": stat_info.st_mtime
-                                    })
-                                except Exception:
-                                    error_count += 1
-                    
-                    except (PermissionError, OSError):
-                        error_count += 1
-            
-            except (PermissionError, OSError):
-                error_count += 1
-        
-        _recursive_tier3_scan(drive_path)
+        files, stats = _scan_tier3_tree(drive_path, max_results, scan_meta, existing_files)
         
         end_time = time.perf_counter()
         latency_ms = int((end_time - start_time) * 1000)
         
-        logger.info(f"[SCAN] Tier 3 scan complete: {len(files)} files indexed in {latency_ms}ms")
+        logger.info(
+            f"[SCAN] Tier 3 scan complete: {len(files)} files indexed in {latency_ms}ms "
+            f"({stats.dirs_listed} dirs listed, {stats.dirs_reused} unchanged)"
+        )
         
         return {
             "status": "ok",
             "count": len(files),
             "files": files,
-            "errors": error_count,
+            "errors": stats.errors,
+            "scan_stats": stats.to_dict(),
             "latency_ms": latency_ms
         }
     
@@ -912,55 +910,8 @@ def scan_specific_drive(drive_path: str, max_results: int = 10000) -> Dict[str,
         
         logger.info(f"[SCAN] Scanning external drive/path: {drive_path}")
         
-        files = []
-        error_count = 0
-        
-        def _recursive_drive_scan(path: Path, depth: int = 0, max_depth: int = 10) -> None:
-            nonlocal files, error_count
-            
-            if len(files) >= max_results or depth >= max_depth:
-                return
-            
-            try:
-                for entry in path.iterdir():
-                    if len(files) >= max_results:
-                        return
-                    
-                    try:
-                        if entry.is_dir():
-                            dir_name_lower = entry.name.lower()
-                            
-                            # Skip excluded directories
-                            if any(exclude in dir_name_lower for exclude in EXCLUDE_DIRS_TIER3):
-                                continue
-                            
-                            # Recurse
-                            _recursive_drive_scan(entry, depth + 1, max_depth)
-                        
-                        elif entry.is_file():
-                            suffix_lower = entry.suffix.lower()
-                            
-                            # Index prioritized extensions
-                            if suffix_lower in PRIORITIZED_EXTENSIONS:
-                                try:
-                                    stat_info = entry.stat()
-                                    files.append({
-                                        "name": entry.name,
-                                        "path": str(entry),
-                                        "type": suffix_lower,
-                                        "size_mb": round(stat_info.st_size / (1024 ** 2), 2),
-                                        "mtime": stat_info.st_mtime
-                                    })
-                                except Exception:
-                                    error_count += 1
-                    
-                    except (PermissionError, OSError):
-                        error_count += 1
-            
-            except (PermissionError, OSError):
-                error_count += 1
-        
-        _recursive_drive_scan(target_path)
+        # Not persisted in library.json, so there's no scan_meta to reuse
+        files, stats = _scan_tier3_tree(target_path, max_results)
         
         end_time = time.perf_counter()
         latency_ms = int((end_time - start_time) * 1000)
@@ -972,7 +923,8 @@ def scan_specific_drive(drive_path: str, max_results: int = 10000) -> Dict[str,
             "count": len(files),
             "path": drive_path,
             "files": files,
-            "errors": error_count,
+            "errors": stats.errors,
+            "scan_stats": stats.to_dict(),
             "latency_ms": latency_ms
         }
     
@@ -987,6 +939,31 @@ def scan_specific_drive(drive_path: str, max_results: int = 10000) -> Dict[str,
         }
 
 
+def refresh_index_in_background(mode: str = "normal") -> threading.Thread:
+    """
+    Run refresh_index on a daemon thread (e.g. at startup) and log the outcome.
+    
+    Args:
+        mode: Refresh mode (see refresh_index)
+        
+    Returns:
+        The started thread
+    """
+    def _run() -> None:
+        from wyzer.core.logger import get_logger
+        result = refresh_index(mode=mode)
+        if "error" in result:
+            get_logger().warning(f"[SCAN] Background refresh failed: {result['error'].get('message')}")
+        else:
+            get_logger().info(
+                f"[SCAN] Background refresh done in {result.get('latency_ms')}ms: {result.get('counts')}"
+            )
+    
+    thread = threading.Thread(target=_run, name="LibraryRefresh", daemon=True)
+    thread.start()
+    return thread
+
+
 def ensure_library_exists() -> None:
     """
     Ensure library.json exists. Create empty structure if not.
@@ -1022,3 +999,6 @@ def save_library(library: Dict[str, Any]) -> None:
     """
     with open(LIBRARY_JSON_PATH, 'w', encoding='utf-8') as f:
         json.dump(library, f, indent=2)
+    
+    from wyzer.local_library.library_index import invalidate_library_index
+    invalidate_library_index()
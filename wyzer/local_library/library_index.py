@@ -0,0 +1,212 @@
+"""
+In-memory lookup index for LocalLibrary resolution.
+
+resolve_target() used to re-read library.json (including up to 10,000
+tier3_files) and re-normalize every game, UWP app and Tier 2 app name on
+each lookup. LibraryIndex is built once per library.json / aliases.json
+version and shared process-wide:
+
+- Exact lookups are dict hits on pre-normalized names and aliases
+- Fuzzy lookups only score entries that share a bigram/trigram with a
+  query keyword, so their cost tracks the number of matches rather than
+  the size of the library
+- get_library_index() stats both files and rebuilds when either changes
+"""
+import os
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# Fuzzy entry categories, in the order the resolver ranks ties
+GAME = "game"
+UWP = "uwp"
+FOLDER = "folder"
+APP = "app"
+TIER2 = "tier2"
+
+_SYMBOLS_RE = re.compile(r'[®™©]')
+
+
+def _normalize_game_name(name: str) -> str:
+    """
+    Normalize game name for matching by removing special characters and symbols.
+
+    Args:
+        name: Game name
+
+    Returns:
+        Normalized name (lowercase, no special chars)
+    """
+    # Remove trademark symbols and other special characters
+    normalized = _SYMBOLS_RE.sub('', name)
+    # Remove extra spaces
+    normalized = ' '.join(normalized.split())
+    return normalized.lower()
+
+
+def _grams(text: str, n: int) -> Set[str]:
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+class LibraryEntry:
+    """One fuzzy-matchable target with its match strings pre-normalized."""
+
+    __slots__ = ("category", "name", "targets", "record")
+
+    def __init__(self, category: str, name: str, targets: Tuple[str, ...], record: Any):
+        self.category = category
+        self.name = name          # name_lower used for exact-keyword boosts
+        self.targets = targets    # primary name first, then aliases
+        self.record = record      # game/uwp/tier2 dict, folder path or app dict
+
+
+class LibraryIndex:
+    """Read-only view of a library.json snapshot with exact and n-gram lookups."""
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Args:
+            data: Library dict as returned by indexer.get_cached_index()
+        """
+        self.data = data
+        self.aliases: Dict[str, Dict[str, Any]] = data.get("aliases", {}) or {}
+        self.folders: Dict[str, str] = data.get("folders", {}) or {}
+        self.apps: Dict[str, Dict[str, Any]] = data.get("apps", {}) or {}
+
+        # Exact lookups: key -> (record, matched via alias). First record wins,
+        # and a record's own name beats its aliases, as in a linear scan.
+        self.exact_games: Dict[str, Tuple[Dict[str, Any], bool]] = {}
+        self.exact_uwp: Dict[str, Tuple[Dict[str, Any], bool]] = {}
+        self.exact_tier2: Dict[str, Dict[str, Any]] = {}
+
+        self.entries: List[LibraryEntry] = []
+        self.game_count = 0
+
+        for game in data.get("games", []):
+            name = _normalize_game_name(game["name"])
+            aliases = tuple(game.get("aliases", []))
+            self.exact_games.setdefault(name, (game, False))
+            for alias in aliases:
+                self.exact_games.setdefault(alias, (game, True))
+            self.entries.append(LibraryEntry(GAME, name, (name,) + aliases, game))
+        self.game_count = len(self.entries)
+
+        for uwp_app in data.get("uwp_apps", []):
+            name = uwp_app["name"].lower()
+            aliases = tuple(uwp_app.get("aliases", []))
+            self.exact_uwp.setdefault(name, (uwp_app, False))
+            for alias in aliases:
+                self.exact_uwp.setdefault(alias, (uwp_app, True))
+            self.entries.append(LibraryEntry(UWP, name, (name,) + aliases, uwp_app))
+
+        for folder_name, folder_path in self.folders.items():
+            self.entries.append(LibraryEntry(FOLDER, folder_name, (folder_name,), folder_path))
+
+        for app_name, app_data in self.apps.items():
+            self.entries.append(LibraryEntry(APP, app_name, (app_name,), app_data))
+
+        for app in data.get("tier2_apps", []):
+            name = app["name"].lower()
+            self.exact_tier2.setdefault(name, app)
+            self.entries.append(LibraryEntry(TIER2, name, (name,), app))
+
+        # n-gram postings (ascending entry positions). Keywords are always at
+        # least two characters, so bigrams answer 2-char keywords exactly and
+        # trigrams narrow longer ones before the substring check.
+        self._bigrams: Dict[str, List[int]] = {}
+        self._trigrams: Dict[str, List[int]] = {}
+        for pos, entry in enumerate(self.entries):
+            bigrams: Set[str] = set()
+            trigrams: Set[str] = set()
+            for target in entry.targets:
+                bigrams |= _grams(target, 2)
+                trigrams |= _grams(target, 3)
+            for gram in bigrams:
+                self._bigrams.setdefault(gram, []).append(pos)
+            for gram in trigrams:
+                self._trigrams.setdefault(gram, []).append(pos)
+
+    def fuzzy_candidates(self, keywords: Iterable[str], games_only: bool = False) -> List[int]:
+        """
+        Positions (in resolver order) of entries where some keyword is a
+        substring of the name or an alias.
+
+        Args:
+            keywords: Query keywords (each at least two characters)
+            games_only: Restrict to game entries
+        """
+        limit = self.game_count if games_only else len(self.entries)
+        found: Set[int] = set()
+        for keyword in set(keywords):
+            for pos in self._keyword_positions(keyword):
+                if pos < limit and any(keyword in target for target in self.entries[pos].targets):
+                    found.add(pos)
+        return sorted(found)
+
+    def _keyword_positions(self, keyword: str) -> Iterable[int]:
+        if len(keyword) < 2:
+            return range(len(self.entries))
+        if len(keyword) == 2:
+            return self._bigrams.get(keyword, ())
+        postings = []
+        for gram in _grams(keyword, 3):
+            posting = self._trigrams.get(gram)
+            if posting is None:
+                return ()
+            postings.append(posting)
+        postings.sort(key=len)
+        positions = set(postings[0])
+        for posting in postings[1:]:
+            positions.intersection_update(posting)
+            if not positions:
+                break
+        return positions
+
+
+_index: Optional[LibraryIndex] = None
+_index_stamp: Optional[Tuple] = None
+_index_lock = threading.Lock()
+
+
+def _file_stamp(path) -> Optional[Tuple[int, int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _library_stamp() -> Tuple:
+    from wyzer.local_library.indexer import LIBRARY_JSON_PATH, ALIASES_JSON_PATH
+    return (str(LIBRARY_JSON_PATH), _file_stamp(LIBRARY_JSON_PATH), _file_stamp(ALIASES_JSON_PATH))
+
+
+def get_library_index() -> LibraryIndex:
+    """
+    Get the process-wide LibraryIndex, rebuilding it if library.json or
+    aliases.json changed since it was built.
+    """
+    global _index, _index_stamp
+    stamp = _library_stamp()
+    with _index_lock:
+        if _index is not None and stamp == _index_stamp:
+            return _index
+
+    # Stamp is taken before reading, so a write that races the load just
+    # triggers another rebuild on the next lookup
+    from wyzer.local_library.indexer import get_cached_index
+    index = LibraryIndex(get_cached_index())
+
+    with _index_lock:
+        _index = index
+        _index_stamp = stamp
+    return index
+
+
+def invalidate_library_index() -> None:
+    """Drop the cached index (called after library.json is rewritten)."""
+    global _index, _index_stamp
+    with _index_lock:
+        _index = None
+        _index_stamp = None
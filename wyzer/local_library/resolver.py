@@ -1,9 +1,13 @@
 """
 Resolver for LocalLibrary - matches user queries to indexed targets.
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 from pathlib import Path
-from wyzer.local_library.indexer import get_cached_index
+from wyzer.local_library.library_index import (
+    APP, FOLDER, GAME, TIER2, UWP,
+    LibraryIndex,
+    get_library_index,
+)
 
 
 def resolve_target(query: str) -> Dict[str, Any]:
@@ -28,8 +32,8 @@ def resolve_target(query: str) -> Dict[str, Any]:
     game_intent_keywords = ["play", "launch", "start game", "open game"]
     has_game_intent = any(keyword in query_lower for keyword in game_intent_keywords)
     
-    # Get cached index
-    index = get_cached_index()
+    # Get in-memory index (reloaded only when library.json/aliases.json change)
+    index = get_library_index()
     
     # Try exact matches first
     result = _try_exact_match(query_lower, index, has_game_intent)
@@ -59,7 +63,12 @@ def resolve_target(query: str) -> Dict[str, Any]:
     }
 
 
-def _try_exact_match(query: str, index: Dict[str, Any], has_game_intent: bool = False) -> Dict[str, Any]:
+def _as_library_index(index: Union[LibraryIndex, Dict[str, Any]]) -> LibraryIndex:
+    """Accept a raw library dict as well as a prebuilt LibraryIndex."""
+    return index if isinstance(index, LibraryIndex) else LibraryIndex(index)
+
+
+def _try_exact_match(query: str, index: Union[LibraryIndex, Dict[str, Any]], has_game_intent: bool = False) -> Dict[str, Any]:
     """
     Try to find an exact match in the index.
     
@@ -71,8 +80,10 @@ def _try_exact_match(query: str, index: Dict[str, Any], has_game_intent: bool =
     Returns:
         Result dict or None if no match
     """
+    index = _as_library_index(index)
+    
     # Check aliases first (highest priority)
-    aliases = index.get("aliases", {})
+    aliases = index.aliases
     if query in aliases:
         alias_data = aliases[query]
         return {
@@ -83,69 +94,41 @@ def _try_exact_match(query: str, index: Dict[str, Any], has_game_intent: bool =
             "candidates": []
         }
     
-    # Check games (high priority if game intent)
-    games = index.get("games", [])
-    for game in games:
-        # Normalize game name for comparison
-        game_name_normalized = _normalize_game_name(game["name"])
-        
-        # Check exact name match
-        if query == game_name_normalized:
-            return {
-                "type": "game",
-                "path": game["launch"]["target"],
-                "launch": game["launch"],
-                "game_name": game["name"],
-                "matched_name": game["name"],
-                "confidence": game["confidence"],
-                "candidates": []
-            }
-        
-        # Check aliases
-        if query in game.get("aliases", []):
-            return {
-                "type": "game",
-                "path": game["launch"]["target"],
-                "launch": game["launch"],
-                "game_name": game["name"],
-                "matched_name": game["name"],
-                "confidence": game["confidence"] * 0.95,  # Slightly lower for alias match
-                "candidates": []
-            }
+    # Check games (high priority if game intent), by normalized name or alias
+    if query in index.exact_games:
+        game, via_alias = index.exact_games[query]
+        confidence = game["confidence"]
+        if via_alias:
+            confidence *= 0.95  # Slightly lower for alias match
+        return {
+            "type": "game",
+            "path": game["launch"]["target"],
+            "launch": game["launch"],
+            "game_name": game["name"],
+            "matched_name": game["name"],
+            "confidence": confidence,
+            "candidates": []
+        }
     
     # If game intent is strong, don't check non-game targets
     if has_game_intent:
         return None
     
-    # Check UWP apps
-    uwp_apps = index.get("uwp_apps", [])
-    for uwp_app in uwp_apps:
-        # Check exact name match
-        if query == uwp_app["name"].lower():
-            return {
-                "type": "uwp",
-                "path": uwp_app["app_id"],
-                "confidence": 0.95,
-                "launch": {"type": "uwp", "target": uwp_app["app_id"]},
-                "app_name": uwp_app["name"],
-                "matched_name": uwp_app["name"],
-                "candidates": []
-            }
-        
-        # Check aliases
-        if query in uwp_app.get("aliases", []):
-            return {
-                "type": "uwp",
-                "path": uwp_app["app_id"],
-                "confidence": 0.90,
-                "launch": {"type": "uwp", "target": uwp_app["app_id"]},
-                "app_name": uwp_app["name"],
-                "matched_name": uwp_app["name"],
-                "candidates": []
-            }
+    # Check UWP apps, by name or alias
+    if query in index.exact_uwp:
+        uwp_app, via_alias = index.exact_uwp[query]
+        return {
+            "type": "uwp",
+            "path": uwp_app["app_id"],
+            "confidence": 0.90 if via_alias else 0.95,
+            "launch": {"type": "uwp", "target": uwp_app["app_id"]},
+            "app_name": uwp_app["name"],
+            "matched_name": uwp_app["name"],
+            "candidates": []
+        }
     
     # Check folders
-    folders = index.get("folders", {})
+    folders = index.folders
     if query in folders:
         return {
             "type": "folder",
@@ -156,7 +139,7 @@ def _try_exact_match(query: str, index: Dict[str, Any], has_game_intent: bool =
         }
     
     # Check apps (Start Menu - higher priority)
-    apps = index.get("apps", {})
+    apps = index.apps
     if query in apps:
         app_data = apps[query]
         return {
@@ -168,28 +151,27 @@ def _try_exact_match(query: str, index: Dict[str, Any], has_game_intent: bool =
         }
     
     # Check tier2_apps (lower priority)
-    tier2_apps = index.get("tier2_apps", [])
-    for app in tier2_apps:
-        app_name_lower = app["name"].lower()
-        if query == app_name_lower:
-            return {
-                "type": "app",
-                "path": app["exe_path"],
-                "matched_name": app["name"],
-                "confidence": 0.90,  # Tier 2 exact match
-                "candidates": []
-            }
+    if query in index.exact_tier2:
+        app = index.exact_tier2[query]
+        return {
+            "type": "app",
+            "path": app["exe_path"],
+            "matched_name": app["name"],
+            "confidence": 0.90,  # Tier 2 exact match
+            "candidates": []
+        }
     
     return None
 
 
-def _try_fuzzy_match(query: str, index: Dict[str, Any], has_game_intent: bool = False) -> Dict[str, Any]:
+def _try_fuzzy_match(query: str, index: Union[LibraryIndex, Dict[str, Any]], has_game_intent: bool = False) -> Dict[str, Any]:
     """
     Try to find a fuzzy match in the index.
     
     Uses simple substring and word matching.
     Merges Start Menu apps with Tier 2 apps, preferring Start Menu.
     Prioritizes games when game intent is detected.
+    Only entries sharing an n-gram with a keyword are scored.
     
     Args:
         query: Normalized query
@@ -199,23 +181,22 @@ def _try_fuzzy_match(query: str, index: Dict[str, Any], has_game_intent: bool =
     Returns:
         Result dict or None if no match
     """
+    index = _as_library_index(index)
     candidates = []
     
     # Extract keywords from query
     keywords = _extract_keywords(query)
     
-    # Search games (high priority if game intent)
-    games = index.get("games", [])
-    for game in games:
-        game_name_normalized = _normalize_game_name(game["name"])
-        score = _match_score(keywords, game_name_normalized)
+    # If game intent, only games are searched; otherwise games, UWP apps,
+    # folders, Start Menu apps and Tier 2 apps, in that order
+    for pos in index.fuzzy_candidates(keywords, games_only=has_game_intent):
+        entry = index.entries[pos]
+        score = max(_match_score(keywords, target) for target in entry.targets)
+        if score <= 0.3:
+            continue
         
-        # Also check aliases
-        for alias in game.get("aliases", []):
-            alias_score = _match_score(keywords, alias)
-            score = max(score, alias_score)
-        
-        if score > 0.3:
+        if entry.category == GAME:
+            game = entry.record
             # Boost confidence if game intent detected
             confidence = game["confidence"] * score
             if has_game_intent:
@@ -230,92 +211,67 @@ def _try_fuzzy_match(query: str, index: Dict[str, Any], has_game_intent: bool =
                 "name": game["name"],
                 "source": "game"
             })
-    
-    # If no game intent, search other targets
-    if not has_game_intent:
-        # Search UWP apps
-        uwp_apps = index.get("uwp_apps", [])
-        for uwp_app in uwp_apps:
-            app_name_lower = uwp_app["name"].lower()
-            score = _match_score(keywords, app_name_lower)
+        
+        elif entry.category == UWP:
+            uwp_app = entry.record
+            # Base confidence for UWP
+            confidence = score * 0.85
             
-            # Also check aliases
-            for alias in uwp_app.get("aliases", []):
-                alias_score = _match_score(keywords, alias)
-                score = max(score, alias_score)
+            # Boost for exact keyword match
+            if any(kw == entry.name for kw in keywords):
+                confidence = min(confidence * 1.1, 0.95)
             
-            if score > 0.3:
-                # Base confidence for UWP
-                confidence = score * 0.85
-                
-                # Boost for exact keyword match
-                if any(kw == app_name_lower for kw in keywords):
-                    confidence = min(confidence * 1.1, 0.95)
-                
-                candidates.append({
-                    "type": "uwp",
-                    "path": uwp_app["app_id"],
-                    "confidence": confidence,
-                    "launch": {"type": "uwp", "target": uwp_app["app_id"]},
-                    "app_name": uwp_app["name"],
-                    "name": uwp_app["name"],
-                    "source": "uwp"
-                })
+            candidates.append({
+                "type": "uwp",
+                "path": uwp_app["app_id"],
+                "confidence": confidence,
+                "launch": {"type": "uwp", "target": uwp_app["app_id"]},
+                "app_name": uwp_app["name"],
+                "name": uwp_app["name"],
+                "source": "uwp"
+            })
         
-        # Search folders
-        folders = index.get("folders", {})
-        for folder_name, folder_path in folders.items():
-            score = _match_score(keywords, folder_name)
-            if score > 0.3:
-                candidates.append({
-                    "type": "folder",
-                    "path": folder_path,
-                    "confidence": score,
-                    "name": folder_name,
-                    "source": "folder"
-                })
+        elif entry.category == FOLDER:
+            candidates.append({
+                "type": "folder",
+                "path": entry.record,
+                "confidence": score,
+                "name": entry.name,
+                "source": "folder"
+            })
         
-        # Search Start Menu apps (higher priority)
-        apps = index.get("apps", {})
-        for app_name, app_data in apps.items():
-            score = _match_score(keywords, app_name)
-            if score > 0.3:
-                # Boost confidence for Start Menu apps
-                confidence = min(score * 1.05, 0.95)
-                candidates.append({
-                    "type": "app",
-                    "path": app_data.get("path", ""),
-                    "confidence": confidence,
-                    "name": app_name,
-                    "source": "start_menu"
-                })
+        elif entry.category == APP:
+            # Boost confidence for Start Menu apps
+            confidence = min(score * 1.05, 0.95)
+            candidates.append({
+                "type": "app",
+                "path": entry.record.get("path", ""),
+                "confidence": confidence,
+                "name": entry.name,
+                "source": "start_menu"
+            })
         
-        # Search Tier 2 apps
-        tier2_apps = index.get("tier2_apps", [])
-        for app in tier2_apps:
-            app_name_lower = app["name"].lower()
-            score = _match_score(keywords, app_name_lower)
+        elif entry.category == TIER2:
+            app = entry.record
+            # Base confidence for Tier 2
+            confidence = score * 0.85
+            
+            # Boost confidence for exact keyword matches
+            if any(kw == entry.name for kw in keywords):
+                confidence = min(confidence * 1.1, 0.90)
+            
+            # Prefer shorter paths (likely more direct installs)
+            path_depth = app["exe_path"].count("\\")
+            if path_depth <= 4:
+                confidence = min(confidence * 1.05, 0.90)
             
-            if score > 0.3:
-                # Base confidence for Tier 2
-                confidence = score * 0.85
-                
-                # Boost confidence for exact keyword matches
-                if any(kw == app_name_lower for kw in keywords):
-                    confidence = min(confidence * 1.1, 0.90)
-                
-                # Prefer shorter paths (likely more direct installs)
-                path_depth = app["exe_path"].count("\\")
-                if path_depth <= 4:
-                    confidence = min(confidence * 1.05, 0.90)
-                
-                candidates.append({
-                    "type": "app",
-                    "path": app["exe_path"],
-                    "confidence": confidence,
-                    "name": app["name"],
-                    "source": "tier2"
-                })
+            candidates.append({
+                "type": "app",
+                "path": app["exe_path"],
+                "confidence": confidence,
+                "name": app["name"],
+                "source": "tier2"
+            })
     
     # Deduplicate: prefer Start Menu over Tier 2 for same app
     seen_names = {}
@@ -433,20 +389,3 @@ def _looks_like_url(query: str) -> bool:
     
     return False
 
-
-def _normalize_game_name(name: str) -> str:
-    """
-    Normalize game name for matching by removing special characters and symbols.
-    
-    Args:
-        name: Game name
-        
-    Returns:
-        Normalized name (lowercase, no special chars)
-    """
-    import re
-    # Remove trademark symbols and other special characters
-    normalized = re.sub(r'[®™©]', '', name)
-    # Remove extra spaces
-    normalized = ' '.join(normalized.split())
-    return normalized.lower()
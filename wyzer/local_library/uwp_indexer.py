@@ -2,9 +2,13 @@
 UWP app indexer for LocalLibrary - discovers Windows Store/UWP applications.
 """
 import json
+import os
 import subprocess
+from pathlib import Path
 from typing import Dict, Any, List
 
+from wyzer.local_library.index_sources import stat_fingerprint
+
 
 def refresh_uwp_index() -> Dict[str, Any]:
     """
@@ -130,6 +134,37 @@ def refresh_uwp_index() -> Dict[str, Any]:
         }
 
 
+def index_uwp_apps() -> List[Dict[str, Any]]:
+    """
+    refresh_uwp_index() for the index source pipeline.
+    
+    Returns:
+        List of UWP app dicts
+        
+    Raises:
+        RuntimeError: If the app list could not be read (so the last cached
+            result is kept instead of an empty list)
+    """
+    result = refresh_uwp_index()
+    if "error" in result:
+        raise RuntimeError(f"{result['error']['type']}: {result['error']['message']}")
+    return result["apps"]
+
+
+def appx_packages_fingerprint() -> str:
+    """
+    Change fingerprint of the installed AppX packages.
+    
+    Hashing the package list itself would mean running the PowerShell query
+    we want to skip; installing or removing a package adds or removes its
+    per-user data folder, which changes the Packages directory's mtime.
+    """
+    return stat_fingerprint([
+        Path(os.environ.get("LOCALAPPDATA", "")) / "Packages",
+        Path(os.environ.get("PROGRAMFILES", r"C:\Program Files")) / "WindowsApps",
+    ])
+
+
 def _generate_uwp_aliases(name: str) -> List[str]:
     """
     Generate simple aliases for a UWP app name.
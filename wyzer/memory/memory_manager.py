@@ -31,7 +31,7 @@ import uuid
 from datetime import datetime
 from pathlib import Path
 from threading import RLock
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from wyzer.core.config import Config
 from wyzer.core.logger import get_logger
@@ -406,10 +406,11 @@ def _migrate_legacy_entry(entry: Any) -> Dict[str, Any]:
         text = text.strip() if text else ""
         
         # Build record ensuring all fields exist
+        # (derived defaults are only computed when the field is missing)
         return {
-            "id": entry.get("id", str(uuid.uuid4())),
-            "type": entry.get("type", _derive_type(text)),
-            "key": entry.get("key", _derive_key(text)),
+            "id": entry["id"] if "id" in entry else str(uuid.uuid4()),
+            "type": entry["type"] if "type" in entry else _derive_type(text),
+            "key": entry["key"] if "key" in entry else _derive_key(text),
             "value": text,
             "tags": entry.get("tags", []),
             "pinned": entry.get("pinned", False),
@@ -419,7 +420,7 @@ def _migrate_legacy_entry(entry: Any) -> Dict[str, Any]:
             "source": entry.get("source", DEFAULT_SOURCE),
             # Keep for backward compat
             "text": text,
-            "index_text": entry.get("index_text", _normalize_for_matching(text)),
+            "index_text": entry["index_text"] if "index_text" in entry else _normalize_for_matching(text),
         }
     
     # Unknown format - wrap as string
@@ -478,6 +479,157 @@ def _normalize_for_matching(text: str) -> str:
     return result.strip()
 
 
+def _copy_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a record so callers can mutate it (and its lists) without touching the cache."""
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in record.items()}
+
+
+def _serialize_record(record: Dict[str, Any]) -> str:
+    """
+    Serialize one record as it appears inside the memory.json list.
+    
+    Joining these fragments with ",\n" inside "[\n...\n]" produces exactly
+    what json.dump(memories, indent=2, ensure_ascii=False) would write.
+    """
+    text = json.dumps(record, indent=2, ensure_ascii=False)
+    return "  " + text.replace("\n", "\n  ")
+
+
+class _RecordFeatures:
+    """
+    Pre-tokenized matching fields of one memory record.
+    
+    Mirrors exactly what MemoryManager._is_mentioned() and
+    MemoryManager._score_record() derive from a record on each query.
+    """
+    
+    __slots__ = ("key_raw", "key_spaced", "key_tokens", "aliases", "value_tokens", "tag_tokens")
+    
+    def __init__(self, record: Dict[str, Any], tokenize: Callable[[str], set]):
+        key = record.get("key")
+        self.key_raw = key.lower() if key else ""
+        self.key_spaced = self.key_raw.replace("_", " ")
+        self.key_tokens = frozenset(tokenize(self.key_spaced)) if key else frozenset()
+        self.aliases = [alias.lower() for alias in record.get("aliases", [])]
+        value = record.get("value") or record.get("text") or ""
+        # Only tokens of 4+ chars count as value overlap
+        self.value_tokens = frozenset(t for t in tokenize(value) if len(t) >= 4)
+        tag_tokens = set()
+        for tag in record.get("tags", []):
+            tag_tokens.update(tokenize(tag))
+        self.tag_tokens = frozenset(tag_tokens)
+    
+    def is_mentioned(self, user_text: str, user_tokens: set) -> bool:
+        """See MemoryManager._is_mentioned()."""
+        if self.key_raw:
+            if self.key_tokens & user_tokens:
+                return True
+            if self.key_spaced in user_text or self.key_raw in user_text:
+                return True
+        for alias in self.aliases:
+            if alias in user_tokens or alias in user_text:
+                return True
+        return bool(self.value_tokens & user_tokens)
+    
+    def score(self, user_tokens: set) -> int:
+        """See MemoryManager._score_record()."""
+        score = 0
+        if self.key_tokens & user_tokens:
+            score += 10
+        if any(alias in user_tokens for alias in self.aliases):
+            score += 6
+        score += 4 * len(self.value_tokens & user_tokens)
+        return score
+
+
+def _trigrams(text: str) -> set:
+    """Get the set of 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class _MemoryIndex:
+    """
+    Inverted index over a cached memory record list.
+    
+    Candidate lookups return record positions (ascending, i.e. in store
+    order) that *may* match a query; callers still apply the exact
+    predicate, so results are identical to a full scan.
+    """
+    
+    def __init__(self, records: List[Dict[str, Any]], tokenize: Callable[[str], set]):
+        self.records = records
+        self.features = [_RecordFeatures(record, tokenize) for record in records]
+        self.pinned = [i for i, record in enumerate(records) if record.get("pinned", False)]
+        
+        # token -> positions whose key tokens, aliases or value tokens contain it
+        self._tokens: Dict[str, List[int]] = {}
+        # pattern length -> pattern -> positions, for key/alias substring matches
+        self._substrings: Dict[int, Dict[str, List[int]]] = {}
+        for i, f in enumerate(self.features):
+            terms = set(f.key_tokens) | set(f.aliases) | f.value_tokens
+            for term in terms:
+                self._tokens.setdefault(term, []).append(i)
+            patterns = set(f.aliases)
+            if f.key_raw:
+                patterns.update((f.key_raw, f.key_spaced))
+            for pattern in patterns:
+                self._substrings.setdefault(len(pattern), {}).setdefault(pattern, []).append(i)
+        
+        # recall(): index_text per position, its words and its trigrams
+        self.recall_texts: List[str] = []
+        self._recall_words: Dict[str, List[int]] = {}
+        self._recall_trigrams: Dict[str, List[int]] = {}
+        for i, record in enumerate(records):
+            index_text = record.get("index_text") or _normalize_for_matching(record.get("text", ""))
+            self.recall_texts.append(index_text)
+            for word in set(index_text.split()):
+                self._recall_words.setdefault(word, []).append(i)
+            for trigram in _trigrams(index_text):
+                self._recall_trigrams.setdefault(trigram, []).append(i)
+    
+    def token_candidates(self, user_tokens: set) -> List[int]:
+        """Positions that can have a non-zero _score_record() for user_tokens."""
+        hits = set()
+        for token in user_tokens:
+            hits.update(self._tokens.get(token, ()))
+        return sorted(hits)
+    
+    def mention_candidates(self, user_text: str, user_tokens: set) -> List[int]:
+        """Positions that can satisfy _is_mentioned() for user_text/user_tokens."""
+        hits = set(self.token_candidates(user_tokens))
+        # Key/alias substring matches: look up every substring of user_text
+        # with a length that some pattern has
+        for length, patterns in self._substrings.items():
+            if length == 0:
+                for positions in patterns.values():
+                    hits.update(positions)
+                continue
+            for start in range(len(user_text) - length + 1):
+                positions = patterns.get(user_text[start:start + length])
+                if positions:
+                    hits.update(positions)
+        return sorted(hits)
+    
+    def recall_candidates(self, query_normalized: str, query_words: set) -> List[int]:
+        """Positions that can get a non-zero recall() score for the query."""
+        hits = set()
+        for word in query_words:
+            hits.update(self._recall_words.get(word, ()))
+        
+        # Exact/substring matches must contain every trigram of the query
+        query_trigrams = _trigrams(query_normalized)
+        if not query_trigrams:
+            return list(range(len(self.records)))
+        postings = sorted((self._recall_trigrams.get(t, ()) for t in query_trigrams), key=len)
+        substring_hits = set(postings[0])
+        for positions in postings[1:]:
+            if not substring_hits:
+                break
+            substring_hits.intersection_update(positions)
+        hits.update(substring_hits)
+        return sorted(hits)
+
+
 class MemoryManager:
     """
     Manages session and long-term memory for Wyzer.
@@ -523,6 +675,18 @@ class MemoryManager:
         # Memory file path
         self._memory_file = _get_memory_file_path()
         
+        # Migrated records from the last read/write of memory.json, reused
+        # while the file's (path, mtime, size, inode) stamp is unchanged
+        self._cache_records: Optional[List[Dict[str, Any]]] = None
+        self._cache_stamp: Optional[Tuple[str, int, int, int]] = None
+        
+        # Serialized JSON fragment per record id, reused on save for
+        # records that have not changed since they were last written
+        self._write_fragments: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        
+        # Token index over the cached records, rebuilt when they change
+        self._index: Optional[_MemoryIndex] = None
+        
         # Session flag: inject all long-term memories into LLM prompts
         # Default from Config (which respects CLI > env var > config default)
         # Can be toggled via voice commands during session
@@ -601,35 +765,132 @@ class MemoryManager:
     # Long-Term Memory (disk, explicit only)
     # =========================================================================
     
+    def _file_stamp(self, st: Optional[os.stat_result] = None) -> Optional[Tuple[str, int, int, int]]:
+        """
+        Get the cache validation stamp for the memory file.
+        
+        Args:
+            st: Existing stat result to use instead of stat'ing the path
+        
+        Returns:
+            (path, mtime_ns, size, inode) or None if the file doesn't exist
+        """
+        if st is None:
+            try:
+                st = os.stat(self._memory_file)
+            except OSError:
+                return None
+        return (str(self._memory_file), st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    def _invalidate_cache(self) -> None:
+        """Drop the cached records so the next load re-reads memory.json."""
+        with self._lock:
+            self._cache_records = None
+            self._cache_stamp = None
+    
+    def _cached_memories(self) -> List[Dict[str, Any]]:
+        """
+        Get the migrated memory records, re-reading disk only when needed.
+        
+        The returned list is shared with the cache and must be treated as
+        read-only. Use _load_memories() to get records that can be modified.
+        
+        Returns:
+            List of migrated memory records (empty list if file doesn't exist)
+        """
+        with self._lock:
+            stamp = self._file_stamp()
+            if stamp is None:
+                self._invalidate_cache()
+                return []
+            if self._cache_records is not None and stamp == self._cache_stamp:
+                return self._cache_records
+            
+            self._invalidate_cache()
+            try:
+                with open(self._memory_file, 'r', encoding='utf-8') as f:
+                    # Stamp the handle we actually read, so a replace between
+                    # stat and open can't pair old content with a new stamp
+                    stamp = self._file_stamp(os.fstat(f.fileno()))
+                    data = json.load(f)
+            except (json.JSONDecodeError, IOError, OSError) as e:
+                logger = get_logger()
+                logger.warning(f"[MEMORY] Failed to load memories: {e}")
+                return []
+            
+            if not isinstance(data, list):
+                return []
+            
+            # Apply Phase 11 migration to each entry
+            self._cache_records = [_migrate_legacy_entry(entry) for entry in data]
+            self._cache_stamp = stamp
+            return self._cache_records
+    
     def _load_memories(self, migrate: bool = True) -> List[Dict[str, Any]]:
         """
         Load memories from disk with optional Phase 11 migration.
         
+        Migrated records are served from an in-memory cache that is
+        validated against the file's mtime/size on every call, so external
+        edits to memory.json are still picked up.
+        
         Args:
             migrate: If True, migrate legacy entries to Phase 11 format
         
         Returns:
-            List of memory records (empty list if file doesn't exist)
+            List of memory records (empty list if file doesn't exist).
+            Records are copies and may be modified by the caller.
         """
+        if migrate:
+            return [_copy_record(m) for m in self._cached_memories()]
+        
         try:
             if self._memory_file.exists():
                 with open(self._memory_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     if isinstance(data, list):
-                        if migrate:
-                            # Apply Phase 11 migration to each entry
-                            return [_migrate_legacy_entry(entry) for entry in data]
                         return data
         except (json.JSONDecodeError, IOError, OSError) as e:
             logger = get_logger()
             logger.warning(f"[MEMORY] Failed to load memories: {e}")
         return []
     
+    def _serialize_memories(self, memories: List[Dict[str, Any]]) -> Tuple[str, Dict[str, Tuple[Dict[str, Any], str]]]:
+        """
+        Serialize memories for memory.json, reusing fragments of unchanged records.
+        
+        Args:
+            memories: List of memory entries to serialize
+            
+        Returns:
+            (file text, fragment table for the records just serialized)
+        """
+        if not memories:
+            return "[]", {}
+        
+        fragments: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        parts = []
+        for record in memories:
+            record_id = record.get("id") if isinstance(record, dict) else None
+            cached = self._write_fragments.get(record_id) if isinstance(record_id, str) else None
+            if cached is not None and cached[0] == record:
+                snapshot, text = cached
+            else:
+                snapshot = _copy_record(record) if isinstance(record, dict) else record
+                text = _serialize_record(record)
+            if isinstance(record_id, str):
+                fragments[record_id] = (snapshot, text)
+            parts.append(text)
+        
+        return "[\n" + ",\n".join(parts) + "\n]", fragments
+    
     def _save_memories(self, memories: List[Dict[str, Any]]) -> bool:
         """
         Save memories to disk atomically.
         
         Uses write-to-temp-then-rename for atomic writes on Windows.
+        Only records that changed since the last save are re-serialized,
+        and the load cache is refreshed from the saved records.
         
         Args:
             memories: List of memory entries to save
@@ -638,35 +899,50 @@ class MemoryManager:
             True if save succeeded, False otherwise
         """
         logger = get_logger()
-        try:
-            # Ensure parent directory exists
-            self._memory_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write to temp file first (atomic write pattern)
-            temp_fd, temp_path = tempfile.mkstemp(
-                suffix='.json',
-                prefix='memory_tmp_',
-                dir=str(self._memory_file.parent)
-            )
+        with self._lock:
             try:
-                with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                    json.dump(memories, f, indent=2, ensure_ascii=False)
+                text, fragments = self._serialize_memories(memories)
                 
-                # Atomic rename (Windows: need to remove target first)
-                if os.name == 'nt' and self._memory_file.exists():
-                    os.remove(self._memory_file)
-                os.rename(temp_path, self._memory_file)
-                return True
-            except Exception:
-                # Clean up temp file on failure
+                # Ensure parent directory exists
+                self._memory_file.parent.mkdir(parents=True, exist_ok=True)
+                
+                # Write to temp file first (atomic write pattern)
+                temp_fd, temp_path = tempfile.mkstemp(
+                    suffix='.json',
+                    prefix='memory_tmp_',
+                    dir=str(self._memory_file.parent)
+                )
                 try:
-                    os.unlink(temp_path)
+                    with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                        f.write(text)
+                    
+                    # Atomic rename (Windows: need to remove target first)
+                    if os.name == 'nt' and self._memory_file.exists():
+                        os.remove(self._memory_file)
+                    os.rename(temp_path, self._memory_file)
                 except Exception:
-                    pass
-                raise
-        except (IOError, OSError) as e:
-            logger.error(f"[MEMORY] Failed to save memories: {e}")
-            return False
+                    # Clean up temp file on failure
+                    try:
+                        os.unlink(temp_path)
+                    except Exception:
+                        pass
+                    raise
+            except (IOError, OSError) as e:
+                self._invalidate_cache()
+                logger.error(f"[MEMORY] Failed to save memories: {e}")
+                return False
+            
+            self._write_fragments = fragments
+            stamp = self._file_stamp()
+            if stamp is None:
+                self._invalidate_cache()
+            else:
+                self._cache_records = [
+                    _migrate_legacy_entry(_copy_record(m) if isinstance(m, dict) else m)
+                    for m in memories
+                ]
+                self._cache_stamp = stamp
+            return True
     
     def remember(self, text: str, tags: Optional[List[str]] = None) -> Dict[str, Any]:
         """
@@ -837,7 +1113,7 @@ class MemoryManager:
     def has_memories(self) -> bool:
         """Check if there are any saved memories."""
         with self._lock:
-            return len(self._load_memories()) > 0
+            return len(self._cached_memories()) > 0
 
     # =========================================================================
     # Phase 11: Structured Memory API
@@ -875,7 +1151,7 @@ class MemoryManager:
             if not query_lower:
                 return []
             
-            memories = self._load_memories()
+            memories = self._cached_memories()
             matches = []
             
             for mem in memories:
@@ -898,7 +1174,7 @@ class MemoryManager:
                     continue
             
             logger.debug(f"[MEMORY] search '{query}': {len(matches)} matches")
-            return matches
+            return [_copy_record(m) for m in matches]
     
     def add_explicit(
         self,
@@ -1373,40 +1649,7 @@ class MemoryManager:
         Returns:
             True if mentioned, False otherwise
         """
-        # A) Key match
-        key = record.get("key")
-        if key:
-            key_lower = key.lower().replace("_", " ")
-            key_tokens = self._tokenize_for_matching(key_lower)
-            if key_tokens & user_tokens:
-                return True
-            # Also check if key appears as substring
-            if key_lower in user_text or key.lower() in user_text:
-                return True
-        
-        # B) Alias match
-        aliases = record.get("aliases", [])
-        for alias in aliases:
-            alias_lower = alias.lower()
-            # Token match
-            if alias_lower in user_tokens:
-                return True
-            # Substring match
-            if alias_lower in user_text:
-                return True
-        
-        # C) Value token match (fallback - be more conservative)
-        value = record.get("value") or record.get("text") or ""
-        value_tokens = self._tokenize_for_matching(value)
-        # Require at least one meaningful overlap
-        overlap = value_tokens & user_tokens
-        if overlap:
-            # Filter out very common tokens that might cause false positives
-            meaningful = [t for t in overlap if len(t) >= 4]
-            if meaningful:
-                return True
-        
-        return False
+        return _RecordFeatures(record, self._tokenize_for_matching).is_mentioned(user_text, user_tokens)
     
     def _score_record(self, record: Dict[str, Any], user_tokens: set) -> int:
         """
@@ -1425,30 +1668,18 @@ class MemoryManager:
         Returns:
             Integer score (0 if no relevance)
         """
-        score = 0
-        
-        # Key match
-        key = record.get("key")
-        if key:
-            key_tokens = self._tokenize_for_matching(key.lower().replace("_", " "))
-            if key_tokens & user_tokens:
-                score += 10
-        
-        # Alias match
-        aliases = record.get("aliases", [])
-        for alias in aliases:
-            if alias.lower() in user_tokens:
-                score += 6
-                break  # Only count once
-        
-        # Value token overlap
-        value = record.get("value") or record.get("text") or ""
-        value_tokens = self._tokenize_for_matching(value)
-        overlap = value_tokens & user_tokens
-        meaningful_overlap = [t for t in overlap if len(t) >= 4]
-        score += 4 * len(meaningful_overlap)
+        return _RecordFeatures(record, self._tokenize_for_matching).score(user_tokens)
+    
+    def _memory_index(self, memories: List[Dict[str, Any]]) -> _MemoryIndex:
+        """
+        Get the token index for a record list from _cached_memories().
         
-        return score
+        The index is kept until the cached list is replaced (reload or save).
+        """
+        with self._lock:
+            if self._index is None or self._index.records is not memories:
+                self._index = _MemoryIndex(memories, self._tokenize_for_matching)
+            return self._index
     
     def select_for_injection(
         self,
@@ -1494,7 +1725,7 @@ class MemoryManager:
                 logger.debug(f"[MEMORY] Smalltalk detected: '{user_text[:50]}' → injecting NO memories")
                 return ""
             
-            memories = self._load_memories()
+            memories = self._cached_memories()
             if not memories:
                 return ""
             
@@ -1502,6 +1733,10 @@ class MemoryManager:
             user_text_lower = user_text.lower() if user_text else ""
             user_tokens = self._tokenize_for_matching(user_text)
             
+            # Pre-tokenized records + inverted index (rebuilt only when memories change)
+            index = self._memory_index(memories)
+            features = index.features
+            
             # Check for identity-specific queries (only inject directly relevant memories)
             identity_query_keys = _get_identity_query_keys(user_text)
             
@@ -1513,10 +1748,11 @@ class MemoryManager:
             # 1. MENTION-TRIGGERED memories FIRST (most relevant to current query)
             mention_count = 0
             mentioned_keys = []
-            for record in memories:
+            for pos in index.mention_candidates(user_text_lower, user_tokens):
                 if mention_count >= mention_max:
                     break
-                if self._is_mentioned(record, user_text_lower, user_tokens):
+                record = memories[pos]
+                if features[pos].is_mentioned(user_text_lower, user_tokens):
                     key = record.get("key")
                     # Filter out likes/preferences for identity-specific queries
                     if identity_query_keys and _is_likes_preference_key(key):
@@ -1539,11 +1775,12 @@ class MemoryManager:
             #   A) Query is personal AND key is a global/core fact, OR
             #   B) Pinned memory matches the query (key/alias/tag overlap)
             is_personal = _is_personal_query(user_text)
-            pinned_records = [m for m in memories if m.get("pinned", False) and m.get("id") not in selected_ids]
+            pinned_positions = [i for i in index.pinned if memories[i].get("id") not in selected_ids]
             
             # Filter pinned records based on relevance
             relevant_pinned = []
-            for record in pinned_records:
+            for pos in pinned_positions:
+                record = memories[pos]
                 key = record.get("key")
                 
                 # Topic-gating: check if this memory passes its topic gate
@@ -1570,15 +1807,11 @@ class MemoryManager:
                     relevant_pinned.append(record)
                     continue
                 # B) Pinned but matches query (treat like mention-triggered)
-                if self._is_mentioned(record, user_text_lower, user_tokens):
+                if features[pos].is_mentioned(user_text_lower, user_tokens):
                     relevant_pinned.append(record)
                     continue
                 # C) Check tags for relevance
-                tags = record.get("tags", [])
-                tag_tokens = set()
-                for tag in tags:
-                    tag_tokens.update(self._tokenize_for_matching(tag))
-                if tag_tokens & user_tokens:
+                if features[pos].tag_tokens & user_tokens:
                     relevant_pinned.append(record)
             
             # Sort by created_at descending for determinism
@@ -1593,10 +1826,10 @@ class MemoryManager:
             pinned_added = len([s for s in selected if s[0] == "static"])
             if pinned_added > 0:
                 pinned_keys = [r.get("key") or r.get("text", "")[:30] for label, r in selected if label == "static"]
-                logger.info(f"[MEMORY] Injecting {pinned_added} pinned (of {len(pinned_records)} total): {pinned_keys}")
+                logger.info(f"[MEMORY] Injecting {pinned_added} pinned (of {len(pinned_positions)} total): {pinned_keys}")
                 logger.debug(f"[MEMORY] Pinned details: {[r.get('text', '')[:50] for label, r in selected if label == 'static']}")
-            elif pinned_records:
-                logger.debug(f"[MEMORY] Skipped {len(pinned_records)} pinned (not relevant to query)")
+            elif pinned_positions:
+                logger.debug(f"[MEMORY] Skipped {len(pinned_positions)} pinned (not relevant to query)")
             
             # Log filtered likes/preferences for identity queries
             if filtered_likes_keys:
@@ -1609,9 +1842,10 @@ class MemoryManager:
             # 3. TOP-K FALLBACK (fill remaining slots)
             remaining_slots = k_total - len(selected)
             if remaining_slots > 0:
-                # Score remaining records
+                # Score remaining records (only those sharing a token can score > 0)
                 scored = []
-                for record in memories:
+                for pos in index.token_candidates(user_tokens):
+                    record = memories[pos]
                     if record.get("id") in selected_ids:
                         continue
                     key = record.get("key")
@@ -1620,7 +1854,7 @@ class MemoryManager:
                         if key and key not in topic_gated_keys:
                             topic_gated_keys.append(key)
                         continue
-                    score = self._score_record(record, user_tokens)
+                    score = features[pos].score(user_tokens)
                     if score > 0:
                         scored.append((score, record.get("created_at", ""), record))
                 
@@ -1706,7 +1940,7 @@ class MemoryManager:
                 logger.info(f"[MEMORY_FASTLANE] no relevant key found for identity query")
                 return ""
             
-            memories = self._load_memories()
+            memories = self._cached_memories()
             if not memories:
                 logger.info(
                     f"[MEMORY_FASTLANE] keys={list(identity_keys)} selected=None "
@@ -1830,7 +2064,7 @@ class MemoryManager:
             if not self._use_memories:
                 return ""
             
-            memories = self._load_memories()
+            memories = self._cached_memories()
             if not memories:
                 return ""
             
@@ -1899,7 +2133,7 @@ class MemoryManager:
             if not query_normalized:
                 return []
             
-            memories = self._load_memories()
+            memories = self._cached_memories()
             if not memories:
                 return []
             
@@ -1907,9 +2141,11 @@ class MemoryManager:
             
             scored: List[Tuple[int, str, Dict[str, Any]]] = []
             
-            for mem in memories:
-                # Use index_text if available, else normalize on-the-fly
-                index_text = mem.get("index_text") or _normalize_for_matching(mem.get("text", ""))
+            # index_text (or normalized text) is precomputed per record
+            index = self._memory_index(memories)
+            for pos in index.recall_candidates(query_normalized, query_words):
+                mem = memories[pos]
+                index_text = index.recall_texts[pos]
                 if not index_text:
                     continue
                 
@@ -1946,7 +2182,7 @@ class MemoryManager:
             # Let's do it step by step:
             scored_final = sorted(scored, key=lambda x: (x[0], x[1]), reverse=True)
             
-            results = [entry for (_, _, entry) in scored_final[:limit]]
+            results = [_copy_record(entry) for (_, _, entry) in scored_final[:limit]]
             
             logger.debug(f"[MEMORY] recall '{query}': {len(results)} matches (searched {len(memories)})")
             
@@ -0,0 +1,242 @@
+"""
+Incremental (streaming) transcription of one utterance.
+
+Audio is fed while the user is still speaking. A background thread decodes
+the uncommitted part of the utterance (a sliding window starting at the
+commit point) with a cheap greedy pass and commits the words that two
+consecutive hypotheses agree on; the commit point moves to the end of the
+last committed word. After end-of-speech only the uncommitted tail is
+decoded (with the full beam), so the final decode no longer grows with
+utterance length.
+"""
+import string
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+from wyzer.core.config import Config
+from wyzer.core.logger import get_logger
+
+
+Word = Tuple[float, float, str]  # (start_sec, end_sec, text) relative to the utterance start
+
+_PUNCT = string.punctuation + "…"
+_PROMPT_CHARS = 200
+
+
+def _norm(word: str) -> str:
+    return word.strip().strip(_PUNCT).lower()
+
+
+class StreamingTranscriber:
+    """Decodes one utterance incrementally and commits stable word prefixes."""
+
+    def __init__(
+        self,
+        engine,
+        sample_rate: int = Config.SAMPLE_RATE,
+        language: str = "en",
+        step_sec: float = Config.STT_STREAM_STEP_SEC,
+        max_window_sec: float = Config.STT_STREAM_MAX_WINDOW_SEC,
+        partial_beam_size: int = 1,
+        final_beam_size: Optional[int] = 5,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ):
+        """
+        Args:
+            engine: WhisperEngine (transcribe_words / filter_transcript)
+            sample_rate: Sample rate of the fed audio
+            language: Language code
+            step_sec: Minimum new audio between partial decodes
+            max_window_sec: Force a commit when the uncommitted window grows past this
+            partial_beam_size: Beam size of partial decodes
+            final_beam_size: Beam size of the final tail decode (None: the
+                             engine's preset for the utterance length)
+            on_partial: Called with committed + tentative text after each partial decode
+        """
+        self.logger = get_logger()
+        self.engine = engine
+        self.sample_rate = sample_rate
+        self.language = language
+        self.step_samples = max(1, int(step_sec * sample_rate))
+        self.max_window_samples = max(self.step_samples, int(max_window_sec * sample_rate))
+        self.partial_beam_size = partial_beam_size
+        self.final_beam_size = final_beam_size
+        self.on_partial = on_partial
+
+        self._cond = threading.Condition()
+        self._audio = np.zeros(0, dtype=np.float32)
+        self._decoded_upto = 0      # samples covered by the last partial decode
+        self._commit_sample = 0     # audio before this is final
+        self._committed: List[Word] = []
+        self._tentative: List[Word] = []  # previous hypothesis after the commit point
+        self._broken = False        # a chunk went missing; finish() decodes everything
+        self._closed = False
+        self._busy = False
+        self._thread: Optional[threading.Thread] = None
+        self.partial_decodes = 0
+
+    @property
+    def fed_samples(self) -> int:
+        return len(self._audio)
+
+    @property
+    def committed_text(self) -> str:
+        with self._cond:
+            return "".join(w[2] for w in self._committed).strip()
+
+    def start(self) -> "StreamingTranscriber":
+        """Decode partials on a background thread as audio arrives."""
+        self._thread = threading.Thread(target=self._run, name="STTStream", daemon=True)
+        self._thread.start()
+        return self
+
+    def feed(self, audio: np.ndarray, offset: Optional[int] = None) -> None:
+        """
+        Append audio.
+
+        Args:
+            audio: float32 mono chunk
+            offset: Sample offset of the chunk in the utterance; a mismatch
+                    (dropped chunk) disables incremental results
+        """
+        chunk = np.asarray(audio, dtype=np.float32).reshape(-1)
+        with self._cond:
+            if self._closed:
+                return
+            if offset is not None and offset != len(self._audio):
+                if not self._broken:
+                    self.logger.debug(
+                        f"[STT_STREAM] Gap in stream (offset {offset}, have {len(self._audio)}); "
+                        "final decode will cover the whole utterance"
+                    )
+                self._broken = True
+                return
+            self._audio = np.concatenate([self._audio, chunk])
+            self._cond.notify_all()
+
+    def step(self) -> bool:
+        """
+        Run one partial decode over the uncommitted window.
+
+        Returns:
+            True if a decode ran
+        """
+        with self._cond:
+            if self._broken or len(self._audio) - self._commit_sample < self.step_samples:
+                return False
+            commit = self._commit_sample
+            end = len(self._audio)
+            window = self._audio[commit:end]
+            prompt = self._prompt_locked()
+
+        words = self.engine.transcribe_words(
+            window, self.language, beam_size=self.partial_beam_size, initial_prompt=prompt
+        )
+        offset = commit / self.sample_rate
+        hypothesis = [(offset + s, offset + e, w) for s, e, w in words]
+
+        with self._cond:
+            self.partial_decodes += 1
+            self._decoded_upto = end
+            agreed = 0
+            for prev, cur in zip(self._tentative, hypothesis):
+                if _norm(prev[2]) != _norm(cur[2]):
+                    break
+                agreed += 1
+            if agreed == 0 and len(window) > self.max_window_samples and len(hypothesis) > 1:
+                # No agreement over a long window: keep all but the last word
+                agreed = len(hypothesis) - 1
+            if agreed:
+                self._committed.extend(hypothesis[:agreed])
+                self._commit_sample = min(end, int(hypothesis[agreed - 1][1] * self.sample_rate))
+            self._tentative = hypothesis[agreed:]
+            partial = "".join(w[2] for w in self._committed + self._tentative).strip()
+
+        if self.on_partial is not None and partial:
+            try:
+                self.on_partial(partial)
+            except Exception as e:
+                self.logger.debug(f"[STT_STREAM] on_partial failed: {e}")
+        return True
+
+    def finish(self, audio: Optional[np.ndarray] = None) -> str:
+        """
+        Stop partial decoding and decode the uncommitted tail.
+
+        Args:
+            audio: The complete utterance as sent with the final request
+                   (authoritative); defaults to the fed audio
+
+        Returns:
+            Transcript, or empty string if no speech/garbage
+        """
+        self._stop()
+        with self._cond:
+            fed = self._audio
+            commit = self._commit_sample
+            committed = list(self._committed)
+            prompt = self._prompt_locked()
+            broken = self._broken
+
+        if audio is None:
+            audio = fed
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        if broken or len(audio) < commit or not np.array_equal(audio[:commit], fed[:commit]):
+            commit, committed, prompt = 0, [], None
+
+        start = time.perf_counter()
+        tail = audio[commit:]
+        beam_size = self.final_beam_size
+        if beam_size is None:
+            beam_size = self.engine.beam_size_for(len(audio) / self.sample_rate)
+        words = self.engine.transcribe_words(
+            tail, self.language, beam_size=beam_size, initial_prompt=prompt
+        )
+        text = "".join(w[2] for w in committed + words).strip()
+        self.logger.debug(
+            f"[STT_STREAM] final: committed_words={len(committed)} tail={len(tail) / self.sample_rate:.2f}s "
+            f"of {len(audio) / self.sample_rate:.2f}s partial_decodes={self.partial_decodes} "
+            f"tail_ms={(time.perf_counter() - start) * 1000:.0f}"
+        )
+        return self.engine.filter_transcript(text)
+
+    def cancel(self) -> None:
+        """Stop partial decoding without a final decode."""
+        self._stop()
+
+    def _prompt_locked(self) -> Optional[str]:
+        if not self._committed:
+            return None
+        return "".join(w[2] for w in self._committed).strip()[-_PROMPT_CHARS:]
+
+    def _stop(self) -> None:
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            # Let an in-flight partial finish: it may move the commit point
+            while self._busy:
+                self._cond.wait()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and (
+                    self._broken or len(self._audio) - self._decoded_upto < self.step_samples
+                ):
+                    self._cond.wait()
+                if self._closed:
+                    return
+                self._busy = True
+            try:
+                self.step()
+            except Exception as e:
+                self.logger.debug(f"[STT_STREAM] Partial decode failed: {e}")
+                with self._cond:
+                    self._broken = True
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
@@ -3,10 +3,12 @@ STT router module.
 Routes transcription requests to appropriate STT engine.
 Currently only supports Whisper, but designed for future expansion.
 """
-from typing import Optional
+from typing import Callable, List, Optional
 import numpy as np
+from wyzer.core.config import Config
 from wyzer.core.logger import get_logger
 from wyzer.stt.whisper_engine import WhisperEngine
+from wyzer.stt.streaming_stt import StreamingTranscriber
 
 
 class STTRouter:
@@ -46,6 +48,8 @@ class STTRouter:
                 compute_type=compute_type
             )
             self.logger.info("STT Router: Whisper engine initialized")
+            if Config.STT_WARMUP:
+                self.whisper_engine.warm_up()
         except Exception as e:
             self.logger.error(f"Failed to initialize Whisper engine: {e}")
             raise
@@ -80,6 +84,46 @@ class STTRouter:
             self.logger.error(f"Unknown STT engine: {engine}")
             return ""
     
+    def transcribe_batch(self, audios: List[np.ndarray], language: str = "en") -> List[str]:
+        """
+        Transcribe several utterances in one batched decode (when supported)
+        
+        Args:
+            audios: Utterances as float32 mono at 16kHz
+            language: Language code
+            
+        Returns:
+            Transcript per utterance (empty string if no speech)
+        """
+        if self.whisper_engine is None:
+            self.logger.error("Whisper engine not initialized")
+            return [""] * len(audios)
+        return self.whisper_engine.transcribe_batch(audios, language)
+    
+    def start_stream(
+        self,
+        language: str = "en",
+        on_partial: Optional[Callable[[str], None]] = None
+    ) -> Optional[StreamingTranscriber]:
+        """
+        Start incremental transcription of an utterance that is still being spoken
+        
+        Args:
+            language: Language code
+            on_partial: Called with the current partial transcript
+            
+        Returns:
+            Running StreamingTranscriber, or None if no engine supports streaming
+        """
+        if self.whisper_engine is None:
+            return None
+        return StreamingTranscriber(
+            self.whisper_engine,
+            language=language,
+            final_beam_size=None,  # Engine preset by utterance length
+            on_partial=on_partial
+        ).start()
+    
     def get_available_engines(self) -> list:
         """Get list of available STT engines"""
         engines = []
@@ -1,9 +1,15 @@
 """
 Whisper STT engine using faster-whisper.
 Transcribes audio with repetition/garbage filtering.
+
+Decoding uses a latency preset picked by utterance length: greedy for short
+voice commands, beam search for longer dictation. The model is warmed up on
+a synthetic clip at load so the first real utterance doesn't pay for lazy
+kernel initialization, and every decode records its real-time factor.
 """
+import time
 import numpy as np
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 from collections import Counter
 from wyzer.core.config import Config
 from wyzer.core.logger import get_logger
@@ -15,6 +21,38 @@ except ImportError:
     FASTER_WHISPER_AVAILABLE = False
     WhisperModel = None
 
+try:
+    # faster-whisper >= 1.1: decodes several clips in one batch
+    from faster_whisper import BatchedInferencePipeline
+    from faster_whisper import __version__ as _FASTER_WHISPER_VERSION
+except ImportError:
+    BatchedInferencePipeline = None
+    _FASTER_WHISPER_VERSION = ""
+
+SAMPLE_RATE = 16000
+
+# Whisper's input window. Batched clips each get a full window: from 1.2 the
+# batched pipeline merges adjacent clip_timestamps into chunks of up to this
+# length, which would decode several utterances as one.
+WINDOW_SAMPLES = 30 * SAMPLE_RATE
+
+
+def _clip_timestamps_in_seconds(version: str) -> bool:
+    """Batched clip_timestamps are sample offsets in faster-whisper 1.1, seconds from 1.2."""
+    try:
+        return tuple(int(part) for part in version.split(".")[:2]) >= (1, 2)
+    except ValueError:
+        return False
+
+
+CLIP_TIMESTAMPS_IN_SECONDS = _clip_timestamps_in_seconds(_FASTER_WHISPER_VERSION)
+
+# Decoding presets: name -> faster-whisper transcribe() options
+DECODE_PRESETS: Dict[str, Dict[str, Any]] = {
+    "command": {"beam_size": 1, "best_of": 1},
+    "dictation": {"beam_size": Config.STT_BEAM_SIZE},
+}
+
 
 class WhisperEngine:
     """Faster-Whisper STT engine"""
@@ -38,6 +76,13 @@ class WhisperEngine:
         self.device = device
         self.compute_type = compute_type
         self.model: Optional[WhisperModel] = None
+        self._batched = None  # BatchedInferencePipeline, created on first batch
+        
+        # RTF metrics (decode time / audio duration)
+        self.calls = 0
+        self.audio_sec_total = 0.0
+        self.decode_sec_total = 0.0
+        self.last_rtf: Optional[float] = None
         
         if not FASTER_WHISPER_AVAILABLE:
             raise RuntimeError(
@@ -66,13 +111,55 @@ class WhisperEngine:
             self.logger.error(f"Failed to load Whisper model: {e}")
             raise
     
-    def transcribe(self, audio: np.ndarray, language: str = "en") -> str:
+    def warm_up(self, seconds: float = 1.0) -> None:
+        """
+        Decode a synthetic clip once per preset.
+        
+        The first decode initializes kernels and allocates buffers; doing it
+        at startup keeps that cost off the first real utterance.
+        
+        Args:
+            seconds: Length of the synthetic clip
+        """
+        if self.model is None:
+            return
+        start = time.perf_counter()
+        t = np.arange(int(seconds * SAMPLE_RATE), dtype=np.float32) / SAMPLE_RATE
+        rng = np.random.default_rng(0)
+        clip = (0.05 * np.sin(2 * np.pi * 220.0 * t) + 0.005 * rng.standard_normal(len(t))).astype(np.float32)
+        try:
+            for options in DECODE_PRESETS.values():
+                segments, _ = self.model.transcribe(clip, language="en", vad_filter=False, **options)
+                for _ in segments:
+                    pass
+            self.logger.info(f"[STT] Whisper warm-up done in {(time.perf_counter() - start) * 1000:.0f}ms")
+        except Exception as e:
+            self.logger.warning(f"[STT] Whisper warm-up failed: {e}")
+    
+    def preset_for(self, duration_sec: float) -> str:
+        """
+        Decoding preset for an utterance of this length.
+        
+        Args:
+            duration_sec: Utterance duration in seconds
+            
+        Returns:
+            "command" (greedy) up to STT_COMMAND_MAX_SEC, else "dictation" (beam search)
+        """
+        return "command" if duration_sec <= Config.STT_COMMAND_MAX_SEC else "dictation"
+    
+    def beam_size_for(self, duration_sec: float) -> int:
+        """Beam size of the preset for an utterance of this length"""
+        return int(DECODE_PRESETS[self.preset_for(duration_sec)].get("beam_size", 5))
+    
+    def transcribe(self, audio: np.ndarray, language: str = "en", preset: Optional[str] = None) -> str:
         """
         Transcribe audio to text
         
         Args:
             audio: Audio data as float32 mono at 16kHz
             language: Language code (default: en)
+            preset: Decoding preset (default: by utterance length)
             
         Returns:
             Transcribed text, or empty string if no speech/garbage
@@ -84,33 +171,185 @@ class WhisperEngine:
         if len(audio) == 0:
             return ""
         
+        duration = len(audio) / SAMPLE_RATE
+        preset = preset or self.preset_for(duration)
         try:
+            start = time.perf_counter()
             # Transcribe
             segments, info = self.model.transcribe(
                 audio,
                 language=language,
-                beam_size=5,
                 vad_filter=False,  # We already did VAD
-                word_timestamps=False
+                word_timestamps=False,
+                **DECODE_PRESETS[preset]
             )
             
-            # Collect all segment texts
+            # Collect all segment texts (decoding happens while iterating)
             texts = []
             for segment in segments:
                 texts.append(segment.text.strip())
+            self._record(preset, duration, time.perf_counter() - start)
             
             # Combine segments
             full_text = " ".join(texts).strip()
             
-            # Apply filters
-            if not self._is_valid_transcript(full_text):
-                return ""
+            return self.filter_transcript(full_text)
             
-            return full_text
+        except Exception as e:
+            self.logger.error(f"Transcription error: {e}")
+            return ""
+    
+    def transcribe_batch(self, audios: List[np.ndarray], language: str = "en") -> List[str]:
+        """
+        Transcribe several utterances, in one batched decode when supported.
+        
+        Needs faster-whisper's BatchedInferencePipeline (>= 1.1; requirements.txt
+        pins 1.1.1): each clip is zero-padded to its own 30s window (what
+        Whisper does with a single short clip anyway) and the windows are
+        passed as clip_timestamps, so each one is decoded as its own item of a
+        single batch. Older versions decode one by one.
+        
+        Args:
+            audios: Utterances as float32 mono at 16kHz (each under 30s)
+            language: Language code (default: en)
+            
+        Returns:
+            Transcript per utterance (empty string if no speech/garbage)
+        """
+        clips = [(i, a) for i, a in enumerate(audios) if len(a)]
+        if (
+            self.model is None
+            or BatchedInferencePipeline is None
+            or len(clips) < 2
+            or any(len(a) > WINDOW_SAMPLES for _, a in clips)
+        ):
+            return [self.transcribe(a, language) for a in audios]
+        
+        windows = np.zeros(len(clips) * WINDOW_SAMPLES, dtype=np.float32)
+        for n, (_, a) in enumerate(clips):
+            windows[n * WINDOW_SAMPLES:n * WINDOW_SAMPLES + len(a)] = a
+        durations = [len(a) / SAMPLE_RATE for _, a in clips]
+        preset = self.preset_for(max(durations))
+        try:
+            if self._batched is None:
+                self._batched = BatchedInferencePipeline(model=self.model)
+            start = time.perf_counter()
+            # One full window per clip, in the unit this faster-whisper expects
+            unit = SAMPLE_RATE if CLIP_TIMESTAMPS_IN_SECONDS else 1
+            segments, info = self._batched.transcribe(
+                windows,
+                language=language,
+                clip_timestamps=[
+                    {"start": n * WINDOW_SAMPLES // unit, "end": (n + 1) * WINDOW_SAMPLES // unit}
+                    for n in range(len(clips))
+                ],
+                batch_size=len(clips),
+                **DECODE_PRESETS[preset]
+            )
+            texts: List[List[str]] = [[] for _ in clips]
+            window_sec = WINDOW_SAMPLES / SAMPLE_RATE
+            for segment in segments:
+                # Segment times (seconds) fall inside the window of their clip
+                index = min(len(clips) - 1, max(0, int(segment.start // window_sec)))
+                texts[index].append(segment.text.strip())
+            self._record(f"{preset} batch={len(clips)}", sum(durations), time.perf_counter() - start)
+        except Exception as e:
+            self.logger.warning(f"[STT] Batched decode failed ({e}), decoding one by one")
+            return [self.transcribe(a, language) for a in audios]
+        
+        results = [""] * len(audios)
+        for (i, _), parts in zip(clips, texts):
+            results[i] = self.filter_transcript(" ".join(parts))
+        return results
+    
+    def transcribe_words(
+        self,
+        audio: np.ndarray,
+        language: str = "en",
+        beam_size: int = 5,
+        initial_prompt: Optional[str] = None
+    ) -> List[Tuple[float, float, str]]:
+        """
+        Transcribe audio to timestamped words (no garbage filtering).
+        
+        Used by streaming transcription, which commits words by their end time.
+        
+        Args:
+            audio: Audio data as float32 mono at 16kHz
+            language: Language code (default: en)
+            beam_size: Beam size (1 = greedy, for cheap partial decodes)
+            initial_prompt: Text preceding this audio, for context
+            
+        Returns:
+            List of (start_sec, end_sec, word) relative to the start of audio;
+            words keep Whisper's leading space
+        """
+        if self.model is None or len(audio) == 0:
+            return []
+        
+        try:
+            start = time.perf_counter()
+            segments, info = self.model.transcribe(
+                audio,
+                language=language,
+                beam_size=beam_size,
+                vad_filter=False,  # We already did VAD
+                word_timestamps=True,
+                initial_prompt=initial_prompt or None,
+                condition_on_previous_text=False
+            )
+            
+            words = []
+            for segment in segments:
+                for word in segment.words or ():
+                    words.append((float(word.start), float(word.end), word.word))
+            self._record(f"words beam={beam_size}", len(audio) / SAMPLE_RATE, time.perf_counter() - start)
+            return words
             
         except Exception as e:
             self.logger.error(f"Transcription error: {e}")
+            return []
+    
+    def _record(self, kind: str, audio_sec: float, decode_sec: float) -> None:
+        """Record one decode's real-time factor"""
+        self.calls += 1
+        self.audio_sec_total += audio_sec
+        self.decode_sec_total += decode_sec
+        self.last_rtf = decode_sec / audio_sec if audio_sec > 0 else None
+        self.logger.debug(
+            "[STT] %s audio=%.2fs decode=%.0fms rtf=%.2f",
+            kind, audio_sec, decode_sec * 1000, self.last_rtf or 0.0,
+        )
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Decode metrics since startup.
+        
+        Returns:
+            Dict with calls, audio_sec, decode_sec, rtf (overall) and last_rtf
+        """
+        return {
+            "calls": self.calls,
+            "audio_sec": self.audio_sec_total,
+            "decode_sec": self.decode_sec_total,
+            "rtf": (self.decode_sec_total / self.audio_sec_total) if self.audio_sec_total else None,
+            "last_rtf": self.last_rtf,
+        }
+    
+    def filter_transcript(self, text: str) -> str:
+        """
+        Return text if it passes the garbage filters, else empty string
+        
+        Args:
+            text: Transcript text
+            
+        Returns:
+            Stripped text, or empty string if filtered
+        """
+        text = (text or "").strip()
+        if not self._is_valid_transcript(text):
             return ""
+        return text
     
     def _is_valid_transcript(self, text: str) -> bool:
         """
@@ -46,6 +46,8 @@ class OpenTargetTool(ToolBase):
             _resolved_uwp_path: (Internal) Phase 10.1 - Pre-resolved UWP app ID for stable replay
             _resolved_launch: (Internal) Phase 10.1 - Pre-resolved launch info for stable replay
             _resolved_path: (Internal) Phase 10.1 - Pre-resolved path for stable replay
+            _resolved: (Internal) resolve_target() result computed speculatively
+                       while the user was still speaking
             
         Returns:
             Dict with status and resolved info, or error
@@ -77,8 +79,10 @@ class OpenTargetTool(ToolBase):
             }
         
         try:
-            # Resolve target
-            resolved = resolve_target(query)
+            # Resolve target (unless the brain already did, speculatively)
+            resolved = kwargs.get("_resolved")
+            if not isinstance(resolved, dict):
+                resolved = resolve_target(query)
             
             if resolved.get("type") == "unknown":
                 end_time = time.perf_counter()
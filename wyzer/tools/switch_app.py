@@ -255,11 +255,11 @@ class SwitchAppTool(ToolBase):
         # Not in focus stack or focus failed - use window_manager's proven window finding
         # This handles LocalLibrary resolution, process name matching, etc.
         try:
-            from wyzer.tools.window_manager import _resolve_window_handle, _get_window_info, _enumerate_windows
+            from wyzer.tools.window_manager import _resolve_window_handle, _get_window_info, _enumerate_windows, _list_windows
             
-            # Debug: log available windows for troubleshooting
+            # Debug: log available windows for troubleshooting (shared snapshot when fresh)
             if logger:
-                all_windows = _enumerate_windows()
+                all_windows = _list_windows()
                 procs = [w.get("process", "?") for w in all_windows[:10]]
                 logger.debug(f"[APP_SWITCH] Enumerated {len(all_windows)} windows, top procs: {procs}")
             
@@ -345,8 +345,8 @@ class SwitchAppTool(ToolBase):
                 logger.warning(f"[APP_SWITCH] window_manager fallback failed: {e}")
         
         # Still not found - try open_windows as last resort
-        from wyzer.context.world_state import get_all_open_windows
-        open_windows = get_all_open_windows()
+        from wyzer.context.world_state import get_window_state
+        open_windows = get_window_state().open_windows
         
         app_lower = app.lower().strip()
         if app_lower.endswith(".exe"):
@@ -1,97 +1,228 @@
 """
-Timer tool - Set, cancel, or check a countdown timer with alarm.
-
-Uses file-based state persistence to work across the multiprocess architecture.
-The brain worker polls check_timer_finished() to detect when timers complete.
+Timer tool - Set, cancel, or check named countdown timers with alarm.
 
 Architecture:
-- Tools execute in ToolWorkerPool worker processes
-- Timer state is saved to a JSON file
-- Brain worker polls check_timer_finished() every ~100ms
-- When end_time is reached, brain worker triggers TTS
+- Timers live in a TimerScheduler in the brain process: a heap of deadlines
+  and one waiter thread that sleeps until the earliest one and fires the
+  alarm callback exactly at expiry (no polling while no timer is set)
+- The timer tool runs in-process (run_in_process) so it can reach the
+  scheduler instead of going through the ToolWorkerPool
+- timer_state.json is only a write-behind journal: written after changes
+  (atomically, via a temp file + os.replace), flushed on shutdown, and read
+  once at startup so timers survive a crash/restart
 """
 
+import heapq
+import itertools
 import json
+import os
 import time
 import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from wyzer.tools.tool_base import ToolBase
 
 
-# ═══════════════════════════════════════════════════════════════════════════
-# File-based timer state (works across processes)
-# ═══════════════════════════════════════════════════════════════════════════
+# Name used when the user doesn't name the timer
+DEFAULT_TIMER_NAME = "timer"
 
 _TIMER_STATE_FILE = Path(__file__).parent.parent / "data" / "timer_state.json"
-_file_lock = threading.Lock()
 
 
-def _load_state() -> Dict[str, Any]:
-    """Load timer state from file."""
+def _log_warning(message: str) -> None:
+    # Lazy import logger
     try:
-        if _TIMER_STATE_FILE.exists():
-            with open(_TIMER_STATE_FILE, "r") as f:
-                return json.load(f)
+        from wyzer.core.logger import get_logger
+        get_logger().warning(message)
     except Exception:
         pass
-    return {
-        "running": False,
-        "start_time": 0.0,
-        "duration": 0,
-        "end_time": 0.0,
-    }
 
 
-def _save_state(state: Dict[str, Any]) -> None:
-    """Save timer state to file."""
+def _load_journal(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load journaled timers ({name: {start_time, duration, end_time}})."""
+    if not path.exists():
+        return {}
     try:
-        _TIMER_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(_TIMER_STATE_FILE, "w") as f:
-            json.dump(state, f)
-    except Exception:
-        pass
+        with open(path, "r") as f:
+            state = json.load(f)
+        if "timers" in state:
+            return dict(state["timers"])
+        # Single-timer journal written by older versions
+        if state.get("running") and state.get("end_time", 0) > 0:
+            return {DEFAULT_TIMER_NAME: {
+                "start_time": state.get("start_time", 0.0),
+                "duration": state.get("duration", 0),
+                "end_time": state["end_time"],
+            }}
+    except Exception as e:
+        _log_warning(f"[TIMER] Could not restore timers from {path.name} ({e}); pending timers were lost")
+    return {}
+
+
+def _save_journal(path: Path, timers: Dict[str, Dict[str, Any]]) -> None:
+    """Write the journal atomically (a crash mid-write leaves the old one intact)."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump({"timers": timers}, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        _log_warning(f"[TIMER] Could not write {path.name}: {e}")
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
 
 
-def check_timer_finished() -> bool:
+class TimerScheduler:
     """
-    Check if a timer has finished and clear it. Returns True once when timer completes.
-    
-    This is called by the brain worker every ~100ms to detect timer completion.
-    Safe to call from any process since it uses file-based state.
+    Deadline scheduler for named countdown timers.
     
-    Returns:
-        True if a timer just finished (one-shot), False otherwise
+    Deadlines sit in a heap (cancelled/replaced entries are skipped lazily);
+    a single waiter thread blocks on a condition until the earliest deadline
+    or the next change, so there are no wakeups while no timer is set.
     """
-    with _file_lock:
-        try:
-            state = _load_state()
-            
-            # Check if a running timer has expired
-            if state.get("running", False):
-                end_time = state.get("end_time", 0)
-                if end_time > 0 and time.time() >= end_time:
-                    # Timer finished! Clear the state and return True
-                    state["running"] = False
-                    state["end_time"] = 0.0
-                    _save_state(state)
-                    return True
+    
+    def __init__(self, journal_path: Path = _TIMER_STATE_FILE):
+        self._journal_path = journal_path
+        self._cond = threading.Condition()
+        self._timers: Dict[str, Dict[str, Any]] = {}
+        self._heap: List[Tuple[float, int, str]] = []  # (end_time, seq, name)
+        self._seq = itertools.count()
+        self._live_seq: Dict[str, int] = {}  # name -> seq of its heap entry
+        self._on_fire: Optional[Callable[[str], None]] = None
+        self._journal_dirty = False
+        self._journal_lock = threading.Lock()  # serializes journal writes
+        self._running = True
+        
+        for name, timer in _load_journal(journal_path).items():
+            self._push(name, timer)
+        
+        self._thread = threading.Thread(target=self._run, name="TimerScheduler", daemon=True)
+        self._thread.start()
+    
+    def set_on_fire(self, callback: Optional[Callable[[str], None]]) -> None:
+        """Set the alarm callback (called with the timer name on the waiter thread)."""
+        with self._cond:
+            self._on_fire = callback
+            self._cond.notify()
+    
+    def start(self, name: str, duration_seconds: int) -> Dict[str, Any]:
+        """Start (or restart) a named timer; returns its entry."""
+        now = time.time()
+        timer = {"start_time": now, "duration": duration_seconds, "end_time": now + duration_seconds}
+        with self._cond:
+            self._push(name, timer)
+            self._journal_dirty = True
+            self._cond.notify()
+        return dict(timer)
+    
+    def cancel(self, name: Optional[str] = None) -> List[str]:
+        """Cancel one timer (or all if name is None); returns the cancelled names."""
+        with self._cond:
+            names = list(self._timers) if name is None else [name] if name in self._timers else []
+            for n in names:
+                del self._timers[n]
+                del self._live_seq[n]
+            if names:
+                self._journal_dirty = True
+                self._cond.notify()
+        return names
+    
+    def status(self) -> List[Dict[str, Any]]:
+        """Running timers, soonest first."""
+        with self._cond:
+            timers = [{"name": n, **t} for n, t in self._timers.items()]
+        return sorted(timers, key=lambda t: t["end_time"])
+    
+    def shutdown(self, timeout: float = 1.0) -> None:
+        """Stop the waiter thread and flush any unwritten journal changes."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join(timeout=timeout)
+        with self._journal_lock:
+            with self._cond:
+                if not self._journal_dirty:
+                    return
+                journal = {n: dict(t) for n, t in self._timers.items()}
+                self._journal_dirty = False
+            _save_journal(self._journal_path, journal)
+    
+    def _push(self, name: str, timer: Dict[str, Any]) -> None:
+        seq = next(self._seq)
+        self._timers[name] = timer
+        self._live_seq[name] = seq
+        heapq.heappush(self._heap, (timer["end_time"], seq, name))
+    
+    def _run(self) -> None:
+        while True:
+            fired: List[str] = []
+            journal: Optional[Dict[str, Dict[str, Any]]] = None
+            with self._cond:
+                # Drop cancelled/replaced entries from the top of the heap
+                while self._heap and self._live_seq.get(self._heap[0][2]) != self._heap[0][1]:
+                    heapq.heappop(self._heap)
+                if not self._running:
+                    return
+                now = time.time()
+                # Keep due timers until an alarm callback is set (startup)
+                while self._on_fire is not None and self._heap and self._heap[0][0] <= now:
+                    _, seq, name = heapq.heappop(self._heap)
+                    if self._live_seq.get(name) == seq:
+                        del self._timers[name]
+                        del self._live_seq[name]
+                        fired.append(name)
+                        self._journal_dirty = True
+                if self._journal_dirty:
+                    journal = {n: dict(t) for n, t in self._timers.items()}
+                    self._journal_dirty = False
+                if not fired and journal is None:
+                    if self._heap and self._on_fire is not None:
+                        self._cond.wait(timeout=self._heap[0][0] - now)
+                    else:
+                        self._cond.wait()
+                    continue
+                on_fire = self._on_fire
             
-            return False
-        except Exception:
-            return False
+            # Outside the lock: alarms first, then the journal
+            for name in fired:
+                try:
+                    on_fire(name)
+                except Exception:
+                    pass
+            if journal is not None:
+                with self._journal_lock:
+                    _save_journal(self._journal_path, journal)
+
+
+_scheduler: Optional[TimerScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_timer_scheduler() -> TimerScheduler:
+    """Process-wide timer scheduler (created on first use, restoring the journal)."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = TimerScheduler()
+        return _scheduler
 
 
 class TimerTool(ToolBase):
-    """Tool to set, cancel, or check a countdown timer with alarm."""
+    """Tool to set, cancel, or check named countdown timers with alarm."""
+    
+    # Deadlines live in this process's TimerScheduler
+    run_in_process = True
     
     def __init__(self):
         """Initialize the timer tool with metadata."""
         super().__init__()
         
         self._name = "timer"
-        self._description = "Set, cancel, or check a countdown timer with alarm"
+        self._description = "Set, cancel, or check countdown timers with alarm (several can run at once if named)"
         self._args_schema = {
             "type": "object",
             "properties": {
@@ -104,6 +235,10 @@ class TimerTool(ToolBase):
                     "type": "integer",
                     "minimum": 1,
                     "description": "Duration in seconds (required for start action)"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Optional timer name (e.g. 'pasta'); cancel/status without a name apply to all timers"
                 }
             },
             "required": ["action"],
@@ -117,6 +252,7 @@ class TimerTool(ToolBase):
         Args:
             action: One of "start", "cancel", or "status"
             duration_seconds: Duration in seconds (required for "start")
+            name: Optional timer name (default: "timer")
             
         Returns:
             Dict with timer status or error
@@ -132,6 +268,8 @@ class TimerTool(ToolBase):
                     }
                 }
             
+            name = str(kwargs.get("name") or "").strip().lower() or None
+            
             if action not in {"start", "cancel", "status"}:
                 return {
                     "error": {
@@ -180,43 +318,22 @@ class TimerTool(ToolBase):
                         }
                     }
                 
-                # Save timer state to file (works across processes)
-                now = time.time()
-                _save_state({
-                    "running": True,
-                    "start_time": now,
-                    "duration": duration_seconds,
-                    "end_time": now + duration_seconds,
-                })
+                get_timer_scheduler().start(name or DEFAULT_TIMER_NAME, duration_seconds)
                 
                 return {
                     "status": "running",
-                    "duration": duration_seconds
+                    "duration": duration_seconds,
+                    "name": name or DEFAULT_TIMER_NAME,
                 }
             
             # ═══════════════════════════════════════════════════════════════
             # ACTION: cancel
             # ═══════════════════════════════════════════════════════════════
             if action == "cancel":
-                state = _load_state()
-                was_running = state.get("running", False)
-                
-                # Also check if end_time hasn't passed yet
-                if not was_running:
-                    end_time = state.get("end_time", 0)
-                    if end_time > 0 and time.time() < end_time:
-                        was_running = True
+                cancelled = get_timer_scheduler().cancel(name)
                 
-                # Clear timer state
-                _save_state({
-                    "running": False,
-                    "start_time": 0.0,
-                    "duration": 0,
-                    "end_time": 0.0,
-                })
-                
-                if was_running:
-                    return {"status": "cancelled"}
+                if cancelled:
+                    return {"status": "cancelled", "cancelled": cancelled}
                 else:
                     return {
                         "error": {
@@ -229,25 +346,35 @@ class TimerTool(ToolBase):
             # ACTION: status
             # ═══════════════════════════════════════════════════════════════
             if action == "status":
-                state = _load_state()
+                timers = get_timer_scheduler().status()
+                if name:
+                    timers = [t for t in timers if t["name"] == name]
                 
-                if not state.get("running", False):
+                if not timers:
                     return {"status": "idle"}
                 
-                end_time = state.get("end_time", 0)
-                remaining = max(0, int(end_time - time.time()))
-                
-                if remaining <= 0:
+                # Soonest timer first; all running timers listed when several
+                now = time.time()
+                if timers[0]["end_time"] <= now:
+                    # Expired, alarm not fired yet
                     return {
                         "status": "finished",
-                        "remaining_seconds": 0
+                        "remaining_seconds": 0,
+                        "name": timers[0]["name"],
                     }
                 
-                return {
+                result = {
                     "status": "running",
-                    "remaining_seconds": remaining,
-                    "duration": state.get("duration", 0)
+                    "remaining_seconds": max(0, int(timers[0]["end_time"] - now)),
+                    "duration": timers[0]["duration"],
+                    "name": timers[0]["name"],
                 }
+                if len(timers) > 1:
+                    result["timers"] = [
+                        {"name": t["name"], "remaining_seconds": max(0, int(t["end_time"] - now))}
+                        for t in timers
+                    ]
+                return result
             
             # Should never reach here
             return {
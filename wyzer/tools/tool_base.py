@@ -9,6 +9,10 @@ from typing import Dict, Any
 class ToolBase(ABC):
     """Base class for all tools"""
     
+    # Tools that keep in-process state (e.g. timer deadlines) set this to run
+    # in the calling process instead of the ToolWorkerPool
+    run_in_process: bool = False
+    
     def __init__(self):
         """Initialize tool with metadata"""
         self._name: str = ""
@@ -6,6 +6,7 @@ import time
 import ctypes
 from typing import Dict, Any, List, Optional, Tuple
 from wyzer.tools.tool_base import ToolBase
+from wyzer.world.window_snapshot import fresh_snapshot, match_window
 
 # Windows API constants
 SW_MINIMIZE = 6
@@ -155,12 +156,12 @@ def _maybe_learn_alias(spoken_phrase: str, resolved: Dict[str, Any]) -> Optional
         return None
 
     try:
-        from wyzer.local_library.indexer import get_cached_index
-        index = get_cached_index()
-        if phrase_norm in (index.get("aliases", {}) or {}):
+        from wyzer.local_library.library_index import get_library_index
+        index = get_library_index()
+        if phrase_norm in index.aliases:
             return None
         # Avoid writing aliases that are already canonical app keys.
-        if target_type == "app" and phrase_norm in (index.get("apps", {}) or {}):
+        if target_type == "app" and phrase_norm in index.apps:
             return None
     except Exception:
         # If index lookup fails, still allow saving the alias.
@@ -353,10 +354,31 @@ def _get_process_name_ctypes(pid: int) -> str:
     return ""
 
 
+def _is_window(hwnd: int) -> bool:
+    try:
+        if HAS_PYWIN32:
+            return bool(win32gui.IsWindow(hwnd))
+        return bool(user32.IsWindow(hwnd))
+    except Exception:
+        return False
+
+
+def _list_windows() -> List[Dict[str, Any]]:
+    """Windows from the brain's shared snapshot, or a fresh enumeration if it is stale."""
+    snapshot = fresh_snapshot()
+    if snapshot is not None:
+        return snapshot.windows
+    return _enumerate_windows()
+
+
 def _find_window(title: Optional[str] = None, process: Optional[str] = None) -> Optional[int]:
     """
     Find window by title or process name.
     
+    Resolves against the shared window snapshot first; windows are only
+    enumerated when the snapshot is stale, has no match (e.g. the window
+    opened since the last watcher poll) or the match has since closed.
+    
     Args:
         title: Window title (substring match, case-insensitive)
         process: Process name (substring match, case-insensitive)
@@ -364,59 +386,23 @@ def _find_window(title: Optional[str] = None, process: Optional[str] = None) ->
     Returns:
         Window handle (hwnd) or None if not found
     """
-    windows = _enumerate_windows()
-
-    title_norm = (title or "").strip().lower()
-    process_norm = (process or "").strip().lower()
-
-    # Many apps (e.g., Spotify) show dynamic titles (song names) that don't include
-    # the app name. If the caller provided only a title, treat it as a process hint too.
-    process_hints: List[str] = []
-    if title_norm and not process_norm:
-        base = title_norm
-        if base.endswith(".exe"):
-            base = base[:-4]
-        compact = base.replace(" ", "")
-        process_hints = [
-            base,
-            compact,
-            f"{base}.exe",
-            f"{compact}.exe",
-        ]
-        # Deduplicate while preserving order.
-        seen = set()
-        process_hints = [h for h in process_hints if h and not (h in seen or seen.add(h))]
-
-    best_hwnd: Optional[int] = None
-    best_score = -1
-
-    for window in windows:
-        window_title = (window.get("title") or "").lower()
-        window_process = (window.get("process") or "").lower()
-
-        score = -1
-
-        if title_norm and title_norm in window_title:
-            # Strongest signal: explicit title match.
-            score = 100
-
-        if process_norm and process_norm in window_process:
-            # Strong signal: explicit process match.
-            score = max(score, 90)
-
-        if process_hints and any(h in window_process for h in process_hints):
-            # Heuristic fallback: treat title phrase as process hint.
-            score = max(score, 80)
-
-        if score > best_score:
-            best_score = score
-            best_hwnd = window.get("hwnd")
+    snapshot = fresh_snapshot()
+    if snapshot is not None:
+        hwnd = match_window(snapshot.windows, title, process)
+        if hwnd and _is_window(hwnd):
+            return hwnd
 
-    return best_hwnd if best_score >= 0 else None
+    return match_window(_enumerate_windows(), title, process)
 
 
 def _get_window_info(hwnd: int) -> Dict[str, Any]:
     """Get window information"""
+    snapshot = fresh_snapshot()
+    if snapshot is not None:
+        window = snapshot.get(hwnd)
+        if window is not None:
+            # Same shape as an enumerated record; rect/monitor may predate a move
+            return {key: window.get(key) for key in ("hwnd", "title", "pid", "process")}
     windows = _enumerate_windows()
     for window in windows:
         if window["hwnd"] == hwnd:
@@ -1,29 +1,206 @@
 """
 Audio player for TTS output.
 Supports interruptible playback with stop events.
+
+One output stream stays open between segments (closed after an idle
+period) and a sounddevice callback pulls audio from a segment deque:
+- Playback starts with the first queued chunk, while a segment is still
+  being synthesized or read
+- Consecutive segments are queued back to back, so there is no gap and no
+  device open/close between sentences
+- The callback checks the active stop_event on every block, so a stop is
+  honored within one buffer period even if the producer is blocked
 """
 import wave
 import numpy as np
 import sounddevice as sd
 import threading
-from typing import Optional
+from collections import deque
+from typing import Iterable, Iterator, Optional, Tuple
 from wyzer.core.logger import get_logger
 
 
+# Callback block length; bounds stop latency and the gap-free handover lead
+BLOCK_SEC = 0.02
+
+
 class AudioPlayer:
     """Interruptible audio player for TTS output"""
     
-    def __init__(self, device: Optional[int] = None):
+    def __init__(self, device: Optional[int] = None, idle_close_sec: float = 30.0):
         """
         Initialize audio player
         
         Args:
             device: Optional sounddevice output device index
+            idle_close_sec: Close the output stream after this long without playback
         """
         self.logger = get_logger()
         self.device = device
+        self.idle_close_sec = idle_close_sec
         self.current_stream: Optional[sd.OutputStream] = None
         self.stream_lock = threading.Lock()
+        self._stream_format: Optional[Tuple[int, int]] = None  # (sample_rate, channels)
+        self._blocksize = 0
+        self._idle_timer: Optional[threading.Timer] = None
+        
+        # Segment queue: producers append float32 (n, channels) arrays, the
+        # callback pops them. deque append/popleft are atomic, so neither
+        # side takes a lock. Each counter has a single writer.
+        self._segments: deque = deque()
+        self._head: Optional[np.ndarray] = None
+        self._head_pos = 0
+        self._queued_frames = 0   # written by producers
+        self._played_frames = 0   # written by the callback
+        self._active_stop: Optional[threading.Event] = None
+        self._flush = False
+    
+    def _callback(self, outdata: np.ndarray, frames: int, time_info, status) -> None:
+        """Fill one output block from the segment queue (silence when empty)."""
+        stop = self._active_stop
+        if self._flush or (stop is not None and stop.is_set()):
+            self._segments.clear()
+            self._head = None
+            self._played_frames = self._queued_frames
+            self._flush = False
+            outdata.fill(0)
+            return
+        
+        filled = 0
+        while filled < frames:
+            if self._head is None:
+                try:
+                    self._head = self._segments.popleft()
+                except IndexError:
+                    break
+                self._head_pos = 0
+            head = self._head
+            n = min(frames - filled, len(head) - self._head_pos)
+            outdata[filled:filled + n] = head[self._head_pos:self._head_pos + n]
+            filled += n
+            self._head_pos += n
+            if self._head_pos >= len(head):
+                self._head = None
+        
+        if filled < frames:
+            outdata[filled:] = 0
+        self._played_frames += filled
+    
+    def _ensure_stream(self, sample_rate: int, channels: int) -> None:
+        """Open (or reuse) the output stream for this format."""
+        with self.stream_lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            if self.current_stream is not None and self._stream_format == (sample_rate, channels):
+                return
+            self._close_stream_locked()
+            
+            self._blocksize = max(1, int(sample_rate * BLOCK_SEC))
+            self.current_stream = sd.OutputStream(
+                samplerate=sample_rate,
+                channels=channels,
+                dtype='float32',
+                blocksize=self._blocksize,
+                device=self.device,
+                callback=self._callback
+            )
+            self.current_stream.start()
+            self._stream_format = (sample_rate, channels)
+            self.logger.debug(f"Audio output stream opened: {sample_rate}Hz, {channels}ch")
+    
+    def _close_stream_locked(self) -> None:
+        if self.current_stream is not None:
+            try:
+                self.current_stream.stop()
+                self.current_stream.close()
+            except Exception:
+                pass
+        self.current_stream = None
+        self._stream_format = None
+        self._segments.clear()
+        self._head = None
+        self._played_frames = self._queued_frames
+        self._flush = False
+    
+    def _schedule_idle_close(self) -> None:
+        if self.idle_close_sec <= 0:
+            return
+        with self.stream_lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+            timer = threading.Timer(self.idle_close_sec, self._close_if_idle)
+            timer.args = (timer,)
+            timer.daemon = True
+            self._idle_timer = timer
+            timer.start()
+    
+    def _close_if_idle(self, timer: threading.Timer) -> None:
+        with self.stream_lock:
+            # A newer playback cancelled/replaced this timer
+            if self._idle_timer is not timer:
+                return
+            self._idle_timer = None
+            self._close_stream_locked()
+            self.logger.debug("Audio output stream closed (idle)")
+    
+    def _play_frames(
+        self,
+        blocks: Iterable[np.ndarray],
+        sample_rate: int,
+        channels: int,
+        stop_event: threading.Event
+    ) -> bool:
+        """
+        Queue float32 (n, channels) blocks for playback as they arrive.
+        
+        Returns once the segment is (almost) fully played: the last two
+        callback blocks are left queued, so the next segment can be appended
+        before the device runs dry.
+        """
+        started = False
+        try:
+            for block in blocks:
+                if stop_event.is_set():
+                    self.logger.debug("Audio playback interrupted")
+                    return False
+                if not len(block):
+                    continue
+                if not started:
+                    self._active_stop = stop_event
+                    self._ensure_stream(sample_rate, channels)
+                    started = True
+                self._segments.append(block)
+                self._queued_frames += len(block)
+            
+            if not started:
+                self.logger.error("No audio produced for playback")
+                return False
+            
+            lead = 2 * self._blocksize
+            while self._queued_frames - self._played_frames > lead:
+                if stop_event.wait(BLOCK_SEC / 2):
+                    self.logger.debug("Audio playback interrupted")
+                    return False
+                stream = self.current_stream
+                if stream is None or not stream.active:
+                    self.logger.error("Audio output stream stopped during playback")
+                    return False
+            
+            self.logger.debug("Audio playback completed")
+            return True
+        
+        except Exception as e:
+            self.logger.error(f"Audio playback error: {e}")
+            return False
+        
+        finally:
+            close = getattr(blocks, "close", None)
+            if close is not None:
+                # Abandon a still-running generator (synthesis finishes on its own)
+                close()
+            if started:
+                self._schedule_idle_close()
     
     def play_wav(self, wav_path: str, stop_event: threading.Event) -> bool:
         """
@@ -32,99 +209,103 @@ class AudioPlayer:
         Args:
             wav_path: Path to WAV file
             stop_event: Event to signal stop
-            
+        
         Returns:
             True if played to completion, False if interrupted or error
         """
         try:
-            # Open WAV file
-            with wave.open(wav_path, 'rb') as wf:
-                sample_rate = wf.getframerate()
-                channels = wf.getnchannels()
-                sample_width = wf.getsampwidth()
-                
-                # Read all audio data
-                frames = wf.readframes(wf.getnframes())
-                
-                # Convert to numpy array
-                if sample_width == 2:
-                    # 16-bit PCM
-                    audio_data = np.frombuffer(frames, dtype=np.int16)
-                elif sample_width == 1:
-                    # 8-bit PCM
-                    audio_data = np.frombuffer(frames, dtype=np.uint8).astype(np.int16) - 128
-                    audio_data = audio_data * 256  # Scale to 16-bit range
-                elif sample_width == 4:
-                    # 32-bit PCM
-                    audio_data = np.frombuffer(frames, dtype=np.int32).astype(np.float32) / 2147483648.0
-                else:
-                    self.logger.error(f"Unsupported sample width: {sample_width}")
-                    return False
-                
-                # Convert to float32 in range [-1.0, 1.0]
-                if sample_width != 4:
-                    audio_data = audio_data.astype(np.float32) / 32768.0
-                
-                # Reshape for channels
-                if channels > 1:
-                    audio_data = audio_data.reshape(-1, channels)
-            
-            # Play in chunks with stop checking
-            chunk_size = int(sample_rate * 0.05)  # 50ms chunks
-            total_samples = len(audio_data)
-            position = 0
-            
-            with self.stream_lock:
-                self.current_stream = sd.OutputStream(
-                    samplerate=sample_rate,
-                    channels=channels,
-                    dtype='float32',
-                    device=self.device
-                )
-                self.current_stream.start()
-            
-            try:
-                while position < total_samples:
-                    # Check stop event
-                    if stop_event.is_set():
-                        self.logger.debug("Audio playback interrupted")
-                        return False
-                    
-                    # Get next chunk
-                    end_pos = min(position + chunk_size, total_samples)
-                    chunk = audio_data[position:end_pos]
-                    
-                    # Write chunk
-                    self.current_stream.write(chunk)
-                    
-                    position = end_pos
-                
-                # Finished successfully
-                self.logger.debug("Audio playback completed")
-                return True
-                
-            finally:
-                with self.stream_lock:
-                    if self.current_stream:
-                        self.current_stream.stop()
-                        self.current_stream.close()
-                        self.current_stream = None
-        
+            wf = wave.open(wav_path, 'rb')
         except FileNotFoundError:
             self.logger.error(f"WAV file not found: {wav_path}")
             return False
-        
         except Exception as e:
             self.logger.error(f"Audio playback error: {e}")
             return False
+        
+        with wf:
+            sample_rate = wf.getframerate()
+            channels = wf.getnchannels()
+            sample_width = wf.getsampwidth()
+            if sample_width not in (1, 2, 4):
+                self.logger.error(f"Unsupported sample width: {sample_width}")
+                return False
+            
+            def _blocks() -> Iterator[np.ndarray]:
+                # Decode 50ms at a time; playback starts with the first block
+                chunk_frames = max(1, int(sample_rate * 0.05))
+                while True:
+                    frames = wf.readframes(chunk_frames)
+                    if not frames:
+                        return
+                    yield _decode_frames(frames, sample_width).reshape(-1, channels)
+            
+            return self._play_frames(_blocks(), sample_rate, channels, stop_event)
+    
+    def play_pcm_stream(
+        self,
+        chunks: Iterable[bytes],
+        sample_rate: int,
+        stop_event: threading.Event
+    ) -> bool:
+        """
+        Play 16-bit mono PCM as it arrives (e.g. straight from Piper).
+        
+        Args:
+            chunks: Iterable of PCM byte chunks (whole samples)
+            sample_rate: Sample rate of the PCM data
+            stop_event: Event to signal stop
+        
+        Returns:
+            True if played to completion, False if interrupted or error
+        """
+        blocks = (_decode_frames(pcm, 2).reshape(-1, 1) for pcm in chunks)
+        try:
+            return self._play_frames(blocks, sample_rate, 1, stop_event)
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+    
+    def play_pcm(self, pcm: bytes, sample_rate: int, stop_event: threading.Event) -> bool:
+        """
+        Play a 16-bit mono PCM buffer with interruptible streaming.
+        
+        Args:
+            pcm: PCM bytes
+            sample_rate: Sample rate of the PCM data
+            stop_event: Event to signal stop
+        
+        Returns:
+            True if played to completion, False if interrupted or error
+        """
+        return self.play_pcm_stream([pcm], sample_rate, stop_event)
     
     def stop(self) -> None:
-        """Stop current playback immediately"""
+        """Stop current playback immediately (the stream stays open)"""
         with self.stream_lock:
-            if self.current_stream:
-                try:
-                    self.current_stream.stop()
-                    self.current_stream.close()
-                except:
-                    pass
-                self.current_stream = None
+            if self.current_stream is not None:
+                # The callback drops queued audio on its next block
+                self._flush = True
+            else:
+                self._segments.clear()
+                self._head = None
+    
+    def close(self) -> None:
+        """Close the output stream"""
+        with self.stream_lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            self._close_stream_locked()
+
+
+def _decode_frames(frames: bytes, sample_width: int) -> np.ndarray:
+    """Convert PCM bytes to float32 in [-1.0, 1.0]."""
+    if sample_width == 2:
+        # 16-bit PCM
+        return np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+    if sample_width == 1:
+        # 8-bit PCM (unsigned)
+        return (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    # 32-bit PCM
+    return np.frombuffer(frames, dtype=np.int32).astype(np.float32) / 2147483648.0
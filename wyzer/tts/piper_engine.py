@@ -1,14 +1,215 @@
 """
 Piper TTS engine for local, fast speech synthesis.
 Uses Piper executable via subprocess for text-to-speech conversion.
+
+By default one Piper process is kept running with the voice loaded
+(--output-raw): sentences go in over stdin, 16-bit mono PCM comes back on
+stdout and is streamed straight to playback. Piper logs a "Real-time factor"
+line on stderr after all audio for an input line has been written, which
+marks the end of each utterance. synthesize_to_wav() (one process per call)
+remains as the fallback.
 """
+import json
 import os
+import queue
+import select
 import subprocess
 import tempfile
+import threading
+import wave
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional
+from wyzer.core.config import Config
 from wyzer.core.logger import get_logger
 
+try:
+    import array
+    import fcntl
+    import termios
+except ImportError:  # Windows
+    fcntl = None
+
+
+# Piper prints this (stderr, info level) once an input line is fully written
+_END_MARKER = "real-time factor"
+
+# Queue items that end an utterance
+_END = object()
+
+
+class _Failed:
+    """Queue item: the utterance failed (Piper exited, timed out, ...)."""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+
+
+def _pipe_available(fd: int) -> int:
+    """Bytes that can be read from a pipe without blocking."""
+    if os.name == "nt":
+        import msvcrt
+        import _winapi
+        return _winapi.PeekNamedPipe(msvcrt.get_osfhandle(fd), 0)[0]
+    buf = array.array("i", [0])
+    fcntl.ioctl(fd, termios.FIONREAD, buf, True)
+    return buf[0]
+
+
+class _PiperDaemon:
+    """
+    Long-lived Piper process serving one utterance at a time.
+    
+    stdout is drained by a pump thread as fast as Piper writes it, so the
+    process is free for the next sentence (e.g. a prefetch) as soon as
+    synthesis finishes, regardless of playback speed.
+    """
+
+    def __init__(self, cmd: List[str]):
+        self.logger = get_logger()
+        self.cmd = cmd
+        self._proc: Optional[subprocess.Popen] = None
+        self._slot = threading.Semaphore(1)       # one utterance in flight
+        self._lock = threading.Lock()             # guards stdout reads + _current
+        self._current: Optional[queue.Queue] = None
+        self._stderr_tail: List[str] = []
+
+    def is_running(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _start(self) -> None:
+        creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0) if os.name == "nt" else 0
+        proc = subprocess.Popen(
+            self.cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=0,
+            creationflags=creationflags,
+        )
+        self._proc = proc
+        self._stderr_tail = []
+        threading.Thread(target=self._pump_stdout, args=(proc,), name="PiperStdout", daemon=True).start()
+        threading.Thread(target=self._read_stderr, args=(proc,), name="PiperStderr", daemon=True).start()
+        self.logger.info(f"[TTS] Piper daemon started (pid={proc.pid})")
+
+    def request(self, line: str, timeout: float) -> queue.Queue:
+        """
+        Send one line of text. Returns a queue of PCM chunks ending in _END or _Failed.
+        
+        Raises:
+            TimeoutError: Previous utterance didn't finish in time (daemon is restarted)
+            OSError: Piper couldn't be started or written to
+        """
+        if not self._slot.acquire(timeout=timeout):
+            self.logger.warning("[TTS] Piper daemon stuck on previous utterance, restarting")
+            self.restart()
+            if not self._slot.acquire(timeout=timeout):
+                raise TimeoutError("Piper daemon busy")
+
+        chunks: queue.Queue = queue.Queue()
+        proc = None
+        try:
+            with self._lock:
+                if not self.is_running():
+                    self._start()
+                proc = self._proc
+                self._current = chunks
+            proc.stdin.write((line + "\n").encode("utf-8"))
+            proc.stdin.flush()
+        except BaseException:
+            if proc is not None:
+                # No-op if the stderr reader already failed this utterance
+                self._finish(proc, _Failed("could not write to Piper"))
+            else:
+                self._slot.release()
+            raise
+        return chunks
+
+    def _drain_locked(self, proc: subprocess.Popen) -> int:
+        """Move whatever is readable on stdout to the current utterance (lock held)."""
+        fd = proc.stdout.fileno()
+        total = 0
+        while True:
+            try:
+                available = _pipe_available(fd)
+            except (OSError, ValueError):
+                return total
+            if available <= 0:
+                return total
+            data = os.read(fd, available)
+            if not data:
+                return total
+            total += len(data)
+            if self._current is not None:
+                self._current.put(data)
+
+    def _pump_stdout(self, proc: subprocess.Popen) -> None:
+        fd = proc.stdout.fileno()
+        while proc.poll() is None:
+            if os.name == "nt":
+                # select() doesn't work on Windows pipes; peek at a short interval
+                threading.Event().wait(0.005)
+            else:
+                try:
+                    readable, _, _ = select.select([fd], [], [], 0.1)
+                except (OSError, ValueError):
+                    return
+                if not readable:
+                    continue
+            with self._lock:
+                if proc is not self._proc:
+                    return
+                drained = self._drain_locked(proc)
+            if not drained and os.name != "nt":
+                # Already drained by _finish(), or EOF while Piper exits
+                threading.Event().wait(0.005)
+
+    def _read_stderr(self, proc: subprocess.Popen) -> None:
+        for raw in iter(proc.stderr.readline, b""):
+            text = raw.decode("utf-8", errors="ignore").strip()
+            if _END_MARKER in text.lower():
+                # Everything for this line is already in the stdout pipe
+                self._finish(proc, _END)
+            elif text:
+                self._stderr_tail = (self._stderr_tail + [text])[-5:]
+        self._finish(proc, _Failed("Piper exited: " + " | ".join(self._stderr_tail)))
+
+    def _finish(self, proc: Optional[subprocess.Popen], result) -> None:
+        """End the in-flight utterance (if it belongs to proc) and free the slot."""
+        with self._lock:
+            if proc is not self._proc or self._current is None:
+                return
+            if proc is not None:
+                self._drain_locked(proc)
+            self._current.put(result)
+            self._current = None
+        self._slot.release()
+
+    def restart(self) -> None:
+        """Kill the process; the next request starts a fresh one."""
+        proc = self._proc
+        self._finish(proc, _Failed("Piper restarted"))
+        with self._lock:
+            self._proc = None
+        self._kill(proc)
+
+    def close(self) -> None:
+        self.restart()
+
+    @staticmethod
+    def _kill(proc: Optional[subprocess.Popen]) -> None:
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+        except Exception:
+            pass
+        try:
+            proc.kill()
+            proc.wait(timeout=2.0)
+        except Exception:
+            pass
+
 
 class PiperTTSEngine:
     """Piper TTS engine for local speech synthesis"""
@@ -31,9 +232,20 @@ class PiperTTSEngine:
         self.exe_path = exe_path
         self.model_path = model_path
         self.speaker_id = speaker_id
+        self.sample_rate: Optional[int] = None
         
         # Validate paths
         self._validate_setup()
+        
+        # Persistent Piper process (raw PCM); None = per-call WAV synthesis only
+        self._daemon: Optional[_PiperDaemon] = None
+        self._daemon_failures = 0
+        if getattr(Config, "PIPER_DAEMON", True):
+            self.sample_rate = self._read_sample_rate()
+            if self.sample_rate:
+                self._daemon = _PiperDaemon(self._build_command(["--output-raw"]))
+            else:
+                self.logger.warning("[TTS] Piper voice config has no sample rate, streaming disabled")
     
     def _validate_setup(self) -> None:
         """Validate that Piper executable and model exist"""
@@ -55,6 +267,151 @@ class PiperTTSEngine:
         
         self.logger.info(f"Piper TTS initialized with model: {self.model_path}")
     
+    def _read_sample_rate(self) -> Optional[int]:
+        """Read the voice's sample rate from <model>.onnx.json (needed for raw PCM)."""
+        for config_path in (self.model_path + ".json", str(Path(self.model_path).with_suffix(".json"))):
+            try:
+                with open(config_path, "r", encoding="utf-8") as f:
+                    return int(json.load(f)["audio"]["sample_rate"])
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+        return None
+    
+    def _build_command(self, output_args: List[str]) -> List[str]:
+        cmd = [self.exe_path, "-m", self.model_path] + output_args
+        if self.speaker_id is not None:
+            cmd.extend(["--speaker", str(self.speaker_id)])
+        return cmd
+    
+    @property
+    def voice_id(self) -> str:
+        """
+        Identity of the voice for caching synthesized audio: model file
+        (path, size, mtime), speaker and sample rate.
+        """
+        try:
+            st = os.stat(self.model_path)
+            model = f"{os.path.realpath(self.model_path)}:{st.st_size}:{st.st_mtime_ns}"
+        except OSError:
+            model = os.path.realpath(self.model_path)
+        return f"piper|{model}|speaker={self.speaker_id}|rate={self.sample_rate}"
+    
+    @property
+    def streaming_available(self) -> bool:
+        """True if synthesize_stream() uses the persistent raw-PCM process."""
+        return self._daemon is not None
+    
+    def synthesize_stream(
+        self,
+        text: str,
+        timeout: float = 10.0,
+        status: Optional[Dict[str, Any]] = None
+    ) -> Iterator[bytes]:
+        """
+        Synthesize text as a stream of 16-bit mono PCM chunks (at self.sample_rate).
+        
+        Falls back to per-call WAV synthesis if the daemon fails before any
+        audio was produced.
+        
+        Args:
+            text: Text to synthesize
+            timeout: Max seconds for the utterance
+            status: Optional dict; status["complete"] is set True once the
+                whole utterance was produced (False after a mid-stream failure)
+            
+        Yields:
+            PCM byte chunks (always a whole number of samples)
+        """
+        if not text or not text.strip():
+            self.logger.warning("Empty text provided for synthesis")
+            return
+        
+        if status is None:
+            status = {}
+        status["complete"] = False
+        
+        daemon = self._daemon
+        if daemon is None:
+            pcm = self._synthesize_pcm_via_wav(text)
+            if pcm:
+                status["complete"] = True
+                yield pcm
+            return
+        
+        # Piper reads one utterance per line
+        line = " ".join(text.split())
+        produced = False
+        try:
+            chunks = daemon.request(line, timeout)
+            leftover = b""
+            while True:
+                item = chunks.get(timeout=timeout)
+                if item is _END:
+                    break
+                if isinstance(item, _Failed):
+                    raise RuntimeError(item.reason)
+                data = leftover + item
+                whole = len(data) - (len(data) % 2)
+                leftover = data[whole:]
+                if whole:
+                    produced = True
+                    yield data[:whole]
+            self._daemon_failures = 0
+            status["complete"] = produced
+            return
+        except queue.Empty:
+            self.logger.error("[TTS] Piper daemon timed out, restarting")
+            daemon.restart()
+        except (OSError, RuntimeError, TimeoutError) as e:
+            self.logger.error(f"[TTS] Piper daemon error: {e}")
+        
+        self._daemon_failures += 1
+        if self._daemon_failures >= 2:
+            self.logger.warning("[TTS] Piper daemon keeps failing, using per-sentence synthesis")
+            self._daemon = None
+            daemon.close()
+        if not produced:
+            pcm = self._synthesize_pcm_via_wav(text)
+            if pcm:
+                status["complete"] = True
+                yield pcm
+    
+    def synthesize_pcm(self, text: str) -> bytes:
+        """
+        Synthesize text to a single 16-bit mono PCM buffer (at self.sample_rate).
+        
+        Returns:
+            PCM bytes, or b"" on error
+        """
+        return b"".join(self.synthesize_stream(text))
+    
+    def _synthesize_pcm_via_wav(self, text: str) -> bytes:
+        """Per-call synthesis through a temp WAV, returned as PCM bytes."""
+        wav_path = self.synthesize_to_wav(text)
+        if not wav_path:
+            return b""
+        try:
+            with wave.open(wav_path, "rb") as wf:
+                if self.sample_rate is None:
+                    self.sample_rate = wf.getframerate()
+                if wf.getsampwidth() != 2 or wf.getnchannels() != 1 or wf.getframerate() != self.sample_rate:
+                    self.logger.error("Unexpected Piper WAV format")
+                    return b""
+                return wf.readframes(wf.getnframes())
+        except (OSError, wave.Error) as e:
+            self.logger.error(f"Could not read Piper output: {e}")
+            return b""
+        finally:
+            try:
+                os.unlink(wav_path)
+            except OSError:
+                pass
+    
+    def close(self) -> None:
+        """Stop the persistent Piper process, if any."""
+        if self._daemon is not None:
+            self._daemon.close()
+    
     def synthesize_to_wav(self, text: str) -> str:
         """
         Synthesize text to WAV file
@@ -80,10 +437,7 @@ class PiperTTSEngine:
             output_path = temp_wav.name
             
             # Build Piper command
-            cmd = [self.exe_path, "-m", self.model_path, "-f", output_path]
-            
-            if self.speaker_id is not None:
-                cmd.extend(["--speaker", str(self.speaker_id)])
+            cmd = self._build_command(["-f", output_path])
             
             self.logger.debug(f"Running Piper: {' '.join(cmd)}")
             
@@ -0,0 +1,221 @@
+"""
+Content-addressed cache of synthesized speech.
+
+Many replies repeat word for word ("Done.", "Opening.", follow-up and
+confirmation questions, tool error speech). Their 16-bit PCM is cached
+under a hash of (normalized text, voice identity) so repeats skip synthesis:
+
+- RAM: most recently used clips, bounded by bytes
+- Disk: one <sha256>.pcm file per clip, bounded by bytes; a file's mtime is
+  bumped on every hit so LRU order survives restarts
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+from wyzer.core.logger import get_logger
+
+
+# Short replies worth synthesizing at startup (silence_is_success
+# confirmations, autonomy/clarification questions, timer alarm)
+DEFAULT_PREWARM_PHRASES = (
+    "OK.",
+    "Done.",
+    "Opening.",
+    "Closed.",
+    "Moved.",
+    "Failed.",
+    "Your timer is finished.",
+    "What would you like me to do?",
+    "What did you want me to open?",
+    "Which window should I close?",
+    "Which window?",
+    "Are you sure you want me to proceed?",
+    "Can you clarify what you'd like me to do?",
+    "I can't find that window. Is it open?",
+)
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace (the only difference Piper can't hear)."""
+    return " ".join((text or "").split())
+
+
+class TTSCache:
+    """Two-level (RAM + disk) LRU cache of PCM clips, bounded by bytes."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str],
+        ram_max_bytes: int = 16 * 1024 * 1024,
+        disk_max_bytes: int = 128 * 1024 * 1024,
+        max_chars: int = 200,
+    ):
+        """
+        Args:
+            cache_dir: Directory for .pcm files (None/"" = RAM only)
+            ram_max_bytes: RAM budget for cached PCM
+            disk_max_bytes: Disk budget for cached PCM (0 = RAM only)
+            max_chars: Longer texts are not cached (one-off LLM prose)
+        """
+        self.logger = get_logger()
+        self.cache_dir = Path(cache_dir) if cache_dir and disk_max_bytes > 0 else None
+        self.ram_max_bytes = ram_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.max_chars = max_chars
+
+        self._lock = threading.Lock()
+        self._ram: "OrderedDict[str, bytes]" = OrderedDict()
+        self._ram_bytes = 0
+        self._disk: Optional["OrderedDict[str, int]"] = None  # key -> size, loaded lazily
+        self._disk_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, text: str, voice_id: str) -> Optional[str]:
+        """
+        Cache key for text spoken by a voice, or None if the text isn't cacheable.
+
+        Args:
+            text: Text to speak
+            voice_id: Voice identity (model, speaker, sample rate)
+        """
+        normalized = normalize_text(text)
+        if not normalized or len(normalized) > self.max_chars:
+            return None
+        return hashlib.sha256(f"{voice_id}\0{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Cached PCM for key, or None."""
+        with self._lock:
+            pcm = self._ram.get(key)
+            if pcm is not None:
+                self._ram.move_to_end(key)
+                self.hits += 1
+                return pcm
+            on_disk = self._disk_index().get(key) is not None
+
+        if on_disk:
+            path = self._path(key)
+            try:
+                pcm = path.read_bytes()
+                os.utime(path)
+            except OSError:
+                pcm = None
+            with self._lock:
+                if pcm:
+                    self._disk.move_to_end(key)
+                    self._put_ram(key, pcm)
+                    self.hits += 1
+                    return pcm
+                # Deleted behind our back
+                self._forget_disk(key)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, pcm: bytes) -> None:
+        """Store a complete clip in RAM and on disk."""
+        if not pcm:
+            return
+        with self._lock:
+            self._put_ram(key, pcm)
+            if self.cache_dir is None or len(pcm) > self.disk_max_bytes:
+                return
+            disk = self._disk_index()
+            if key in disk:
+                disk.move_to_end(key)
+                return
+
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(pcm)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.debug(f"[TTS_CACHE] Could not write {path.name}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            disk = self._disk_index()
+            if key not in disk:
+                disk[key] = len(pcm)
+                self._disk_bytes += len(pcm)
+            disk.move_to_end(key)
+            evicted = []
+            while self._disk_bytes > self.disk_max_bytes and len(disk) > 1:
+                old_key, _ = next(iter(disk.items()))
+                self._forget_disk(old_key)
+                evicted.append(old_key)
+        for old_key in evicted:
+            try:
+                self._path(old_key).unlink()
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "ram_items": len(self._ram),
+                "ram_bytes": self._ram_bytes,
+                "disk_items": len(self._disk or ()),
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pcm"
+
+    def _put_ram(self, key: str, pcm: bytes) -> None:
+        """Insert into the RAM tier (lock held)."""
+        if len(pcm) > self.ram_max_bytes:
+            return
+        old = self._ram.pop(key, None)
+        if old is not None:
+            self._ram_bytes -= len(old)
+        self._ram[key] = pcm
+        self._ram_bytes += len(pcm)
+        while self._ram_bytes > self.ram_max_bytes:
+            _, evicted = self._ram.popitem(last=False)
+            self._ram_bytes -= len(evicted)
+
+    def _forget_disk(self, key: str) -> None:
+        """Drop a key from the disk index (lock held)."""
+        size = self._disk.pop(key, None)
+        if size is not None:
+            self._disk_bytes -= size
+
+    def _disk_index(self) -> "OrderedDict[str, int]":
+        """Disk tier index, oldest first; scanned on first use (lock held)."""
+        if self._disk is not None:
+            return self._disk
+        self._disk = OrderedDict()
+        self._disk_bytes = 0
+        if self.cache_dir is None:
+            return self._disk
+        files = []
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".pcm"):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    files.append((st.st_mtime_ns, entry.name[:-4], st.st_size))
+        except OSError:
+            return self._disk
+        for _, key, size in sorted(files):
+            self._disk[key] = size
+            self._disk_bytes += size
+        return self._disk
@@ -4,10 +4,12 @@ Routes TTS requests to appropriate engine (currently Piper).
 """
 import os
 import threading
-from typing import Optional
+from typing import Iterable, Iterator, Optional
+from wyzer.core.config import Config
 from wyzer.core.logger import get_logger
 from wyzer.tts.piper_engine import PiperTTSEngine
 from wyzer.tts.audio_player import AudioPlayer
+from wyzer.tts.tts_cache import TTSCache
 
 
 class TTSRouter:
@@ -36,6 +38,7 @@ class TTSRouter:
         self.logger = get_logger()
         self.engine_name = engine
         self.enabled = enabled
+        self.cache: Optional[TTSCache] = None
         
         if not self.enabled:
             self.logger.info("TTS disabled")
@@ -67,7 +70,36 @@ class TTSRouter:
             return
         
         # Initialize audio player
-        self.player = AudioPlayer(device=output_device)
+        self.player = AudioPlayer(
+            device=output_device,
+            idle_close_sec=getattr(Config, "TTS_OUTPUT_IDLE_CLOSE_SEC", 30.0)
+        )
+        
+        # Synthesized speech cache
+        if getattr(Config, "TTS_CACHE_ENABLED", True):
+            self.cache = TTSCache(
+                cache_dir=Config.TTS_CACHE_DIR,
+                ram_max_bytes=Config.TTS_CACHE_RAM_MB * 1024 * 1024,
+                disk_max_bytes=Config.TTS_CACHE_DISK_MB * 1024 * 1024,
+                max_chars=Config.TTS_CACHE_MAX_CHARS,
+            )
+    
+    def _cache_key(self, text: str) -> Optional[str]:
+        """Cache key for text in the current voice, or None if not cacheable."""
+        if self.cache is None or not self.engine or not self.engine.sample_rate:
+            return None
+        return self.cache.key(text, self.engine.voice_id)
+    
+    def _stream_and_cache(self, text: str, key: Optional[str]) -> Iterator[bytes]:
+        """Stream PCM from the engine; store it if the whole clip was produced and consumed."""
+        status = {}
+        chunks = []
+        for chunk in self.engine.synthesize_stream(text, status=status):
+            if key:
+                chunks.append(chunk)
+            yield chunk
+        if key and chunks and status.get("complete"):
+            self.cache.put(key, b"".join(chunks))
     
     def synthesize(self, text: str) -> Optional[str]:
         """
@@ -96,6 +128,71 @@ class TTSRouter:
         
         return wav_path
     
+    def synthesize_pcm(self, text: str) -> Optional[bytes]:
+        """
+        Synthesize text to 16-bit mono PCM without playing (no temp files
+        when the Piper daemon is running).
+        
+        Args:
+            text: Text to synthesize
+            
+        Returns:
+            PCM bytes at self.sample_rate, or None on error
+        """
+        if not self.enabled or not self.engine:
+            self.logger.debug("TTS not available for synthesis")
+            return None
+        
+        if not text or not text.strip():
+            self.logger.debug("Empty text for synthesis")
+            return None
+        
+        key = self._cache_key(text)
+        if key:
+            pcm = self.cache.get(key)
+            if pcm:
+                self.logger.debug(f"[TTS_CACHE] Hit: {text[:50]}")
+                return pcm
+        
+        self.logger.debug(f"Synthesizing: {text[:50]}...")
+        status = {}
+        pcm = b"".join(self.engine.synthesize_stream(text, status=status))
+        
+        if not pcm:
+            self.logger.error("Synthesis failed")
+            return None
+        
+        # Key again: the sample rate may only be known after the first synthesis
+        key = key or self._cache_key(text)
+        if key and status.get("complete"):
+            self.cache.put(key, pcm)
+        return pcm
+    
+    @property
+    def sample_rate(self) -> Optional[int]:
+        """Sample rate of PCM returned by synthesize_pcm()."""
+        return self.engine.sample_rate if self.engine else None
+    
+    def play_pcm(self, pcm: bytes, stop_event: threading.Event) -> bool:
+        """
+        Play PCM returned by synthesize_pcm().
+        
+        Args:
+            pcm: 16-bit mono PCM bytes
+            stop_event: Event to signal stop
+            
+        Returns:
+            True if completed, False if interrupted or error
+        """
+        if not self.enabled or not self.player or not self.sample_rate:
+            return False
+        
+        try:
+            return self.player.play_pcm(pcm, self.sample_rate, stop_event)
+        except Exception as e:
+            self.logger.error(f"Playback error: {e}")
+            return False
+    
     def play_wav(self, wav_path: str, stop_event: threading.Event) -> bool:
         """
         Play a WAV file.
@@ -135,8 +232,24 @@ class TTSRouter:
             self.logger.debug("Empty text for TTS")
             return False
         
-        # Synthesize to WAV
+        key = self._cache_key(text)
+        if key:
+            pcm = self.cache.get(key)
+            if pcm:
+                self.logger.debug(f"[TTS_CACHE] Hit: {text[:50]}")
+                return self.player.play_pcm(pcm, self.engine.sample_rate, stop_event)
+        
         self.logger.debug(f"Synthesizing: {text[:50]}...")
+        
+        # Stream PCM from the persistent Piper process into playback
+        if self.engine.streaming_available:
+            return self.player.play_pcm_stream(
+                self._stream_and_cache(text, key),
+                self.engine.sample_rate,
+                stop_event
+            )
+        
+        # Synthesize to WAV
         wav_path = self.engine.synthesize_to_wav(text)
         
         if not wav_path:
@@ -153,3 +266,48 @@ class TTSRouter:
                 os.unlink(wav_path)
             except:
                 pass
+    
+    def prewarm(self, phrases: Iterable[str]) -> Optional[threading.Thread]:
+        """
+        Synthesize phrases into the cache in the background.
+        
+        Only runs with the persistent Piper process, where each phrase costs
+        one short request rather than a process start.
+        
+        Args:
+            phrases: Texts to cache (already cached ones are skipped)
+            
+        Returns:
+            The background thread, or None if nothing was started
+        """
+        if not self.enabled or not self.engine or self.cache is None:
+            return None
+        if not self.engine.streaming_available:
+            return None
+        
+        phrases = list(phrases)
+        
+        def _run() -> None:
+            warmed = 0
+            for phrase in phrases:
+                key = self._cache_key(phrase)
+                if not key or self.cache.get(key) is not None:
+                    continue
+                status = {}
+                pcm = b"".join(self.engine.synthesize_stream(phrase, status=status))
+                if not status.get("complete"):
+                    return
+                self.cache.put(key, pcm)
+                warmed += 1
+            self.logger.debug(f"[TTS_CACHE] Prewarmed {warmed}/{len(phrases)} phrases")
+        
+        thread = threading.Thread(target=_run, name="TTSPrewarm", daemon=True)
+        thread.start()
+        return thread
+    
+    def close(self) -> None:
+        """Release engine resources (stops the Piper daemon, closes the output stream)."""
+        if self.engine:
+            self.engine.close()
+        if self.player:
+            self.player.close()
@@ -7,6 +7,7 @@ across monitors. NO OCR, NO screenshot analysis.
 Modules:
 - window_diff: Pure diff logic for window snapshots (testable without OS calls)
 - window_watcher: Background watcher that polls windows and updates world_state
+- window_snapshot: Versioned window snapshot shared with tool workers (shared memory)
 """
 
 from wyzer.world.window_diff import diff_snapshots
@@ -0,0 +1,313 @@
+"""
+wyzer.world.window_snapshot
+
+Window snapshot shared by the brain process with the tool workers.
+
+Window tools run in ToolWorker processes and used to enumerate every
+top-level window (and resolve every process name) on each call, while the
+brain's WindowWatcher already holds a fresh snapshot. The brain now
+publishes each watcher snapshot into a small shared-memory segment and the
+workers resolve targets against it; they only enumerate windows themselves
+when the snapshot is missing or stale.
+
+Layout: a 64-byte header holding the write sequence (int64, odd while a
+write is in progress) and the payload length (int64), followed by a compact
+JSON payload. Readers copy the payload and re-check the sequence afterwards
+(seqlock), so a torn read is retried instead of decoded.
+
+Where the snapshot comes from is pluggable: tools read through
+get_snapshot_source(), and tests (or other platforms) can install any
+object with a read() -> Optional[WindowSnapshot] method via
+set_snapshot_source().
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional
+
+# Environment variable carrying the segment name to the (spawned) tool workers
+SNAPSHOT_SHM_ENV = "WYZER_WINDOW_SNAPSHOT_SHM"
+
+DEFAULT_CAPACITY_BYTES = 256 * 1024
+
+_HEADER_BYTES = 64
+_SEQ_OFFSET = 0
+_LENGTH_OFFSET = 8
+_READ_RETRIES = 5
+
+# Fields of a watcher record that tools need (is_visible etc. are dropped)
+_RECORD_FIELDS = ("hwnd", "title", "process", "pid", "rect", "monitor")
+
+
+@dataclass
+class WindowSnapshot:
+    """One published window list (version increases with every publish)."""
+    version: int
+    ts: float
+    focus_hwnd: Optional[int]
+    windows: List[Dict[str, Any]] = field(default_factory=list)
+
+    def age_ms(self, now: Optional[float] = None) -> float:
+        return ((now if now is not None else time.time()) - self.ts) * 1000.0
+
+    def get(self, hwnd: int) -> Optional[Dict[str, Any]]:
+        for window in self.windows:
+            if window.get("hwnd") == hwnd:
+                return window
+        return None
+
+
+def match_window(
+    windows: List[Dict[str, Any]],
+    title: Optional[str] = None,
+    process: Optional[str] = None,
+) -> Optional[int]:
+    """
+    Pick the best window for a title and/or process name.
+
+    Args:
+        windows: Window records (hwnd/title/process)
+        title: Window title (substring match, case-insensitive)
+        process: Process name (substring match, case-insensitive)
+
+    Returns:
+        Window handle (hwnd) or None if nothing matches
+    """
+    title_norm = (title or "").strip().lower()
+    process_norm = (process or "").strip().lower()
+
+    # Many apps (e.g., Spotify) show dynamic titles (song names) that don't include
+    # the app name. If the caller provided only a title, treat it as a process hint too.
+    process_hints: List[str] = []
+    if title_norm and not process_norm:
+        base = title_norm
+        if base.endswith(".exe"):
+            base = base[:-4]
+        compact = base.replace(" ", "")
+        process_hints = [
+            base,
+            compact,
+            f"{base}.exe",
+            f"{compact}.exe",
+        ]
+        # Deduplicate while preserving order.
+        seen = set()
+        process_hints = [h for h in process_hints if h and not (h in seen or seen.add(h))]
+
+    best_hwnd: Optional[int] = None
+    best_score = -1
+
+    for window in windows:
+        window_title = (window.get("title") or "").lower()
+        window_process = (window.get("process") or "").lower()
+
+        score = -1
+
+        if title_norm and title_norm in window_title:
+            # Strongest signal: explicit title match.
+            score = 100
+
+        if process_norm and process_norm in window_process:
+            # Strong signal: explicit process match.
+            score = max(score, 90)
+
+        if process_hints and any(h in window_process for h in process_hints):
+            # Heuristic fallback: treat title phrase as process hint.
+            score = max(score, 80)
+
+        if score > best_score:
+            best_score = score
+            best_hwnd = window.get("hwnd")
+
+    return best_hwnd if best_score >= 0 else None
+
+
+class WindowSnapshotPublisher:
+    """Single writer of the shared snapshot segment (brain process)."""
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self._shm = shm
+        self.capacity = shm.size - _HEADER_BYTES
+        self._seq = 0
+
+    @classmethod
+    def create(cls, capacity_bytes: int = DEFAULT_CAPACITY_BYTES) -> "WindowSnapshotPublisher":
+        capacity_bytes = int(capacity_bytes)
+        if capacity_bytes <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity_bytes}")
+        shm = shared_memory.SharedMemory(create=True, size=_HEADER_BYTES + capacity_bytes)
+        struct.pack_into("<qq", shm.buf, _SEQ_OFFSET, 0, 0)
+        return cls(shm)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def version(self) -> int:
+        return self._seq // 2
+
+    def publish(
+        self,
+        windows: List[Dict[str, Any]],
+        focus_hwnd: Optional[int] = None,
+        ts: Optional[float] = None,
+    ) -> bool:
+        """Publish a window list.
+
+        Returns False if the payload doesn't fit; readers then see no
+        snapshot (and enumerate windows themselves) until the next publish.
+        """
+        records = []
+        for window in windows:
+            record = {key: window.get(key) for key in _RECORD_FIELDS}
+            # Tools compare lowercase process names (as window_manager reports them)
+            record["process"] = (record.get("process") or "").lower()
+            records.append(record)
+        payload = json.dumps(
+            {"ts": ts if ts is not None else time.time(), "focus": focus_hwnd, "windows": records},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        fits = len(payload) <= self.capacity
+
+        buf = self._shm.buf
+        struct.pack_into("<q", buf, _SEQ_OFFSET, self._seq + 1)
+        if fits:
+            buf[_HEADER_BYTES:_HEADER_BYTES + len(payload)] = payload
+        struct.pack_into("<q", buf, _LENGTH_OFFSET, len(payload) if fits else 0)
+        self._seq += 2
+        struct.pack_into("<q", buf, _SEQ_OFFSET, self._seq)
+        return fits
+
+    def close(self) -> None:
+        """Release and unlink the segment."""
+        if self._shm is None:
+            return
+        try:
+            self._shm.close()
+            self._shm.unlink()
+        except (OSError, BufferError):
+            pass
+        self._shm = None
+
+
+class SharedWindowSnapshotReader:
+    """Snapshot source reading the brain's segment (tool worker processes)."""
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self._shm = shm
+        self.capacity = shm.size - _HEADER_BYTES
+        # Decoded snapshot of the last sequence seen (decode once per publish)
+        self._cached_seq = -1
+        self._cached: Optional[WindowSnapshot] = None
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedWindowSnapshotReader":
+        return cls(shared_memory.SharedMemory(name=name))
+
+    def read(self) -> Optional[WindowSnapshot]:
+        """Latest complete snapshot, or None if none is available."""
+        if self._shm is None:
+            return None
+        buf = self._shm.buf
+        for _ in range(_READ_RETRIES):
+            seq, length = struct.unpack_from("<qq", buf, _SEQ_OFFSET)
+            if seq & 1:
+                # Writer is mid-publish
+                time.sleep(0)
+                continue
+            if seq == self._cached_seq:
+                return self._cached
+            snapshot = None
+            if 0 < length <= self.capacity:
+                data = bytes(buf[_HEADER_BYTES:_HEADER_BYTES + length])
+                if struct.unpack_from("<q", buf, _SEQ_OFFSET)[0] != seq:
+                    continue
+                try:
+                    raw = json.loads(data.decode("utf-8"))
+                    snapshot = WindowSnapshot(
+                        version=seq // 2,
+                        ts=float(raw["ts"]),
+                        focus_hwnd=raw.get("focus"),
+                        windows=list(raw.get("windows") or []),
+                    )
+                except (ValueError, KeyError, TypeError):
+                    snapshot = None
+            self._cached_seq = seq
+            self._cached = snapshot
+            return snapshot
+        return None
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        try:
+            self._shm.close()
+        except (OSError, BufferError):
+            pass
+        self._shm = None
+
+
+# ============================================================================
+# Process-wide snapshot source (used by the window tools)
+# ============================================================================
+_source: Optional[Any] = None
+_source_checked = False
+_source_lock = threading.Lock()
+
+
+def set_snapshot_source(source: Optional[Any]) -> None:
+    """Install a snapshot source (anything with read() -> Optional[WindowSnapshot])."""
+    global _source, _source_checked
+    with _source_lock:
+        _source = source
+        _source_checked = True
+
+
+def get_snapshot_source() -> Optional[Any]:
+    """The installed source, attaching to the brain's segment on first use."""
+    global _source, _source_checked
+    with _source_lock:
+        if not _source_checked:
+            _source_checked = True
+            name = os.environ.get(SNAPSHOT_SHM_ENV, "")
+            if name:
+                try:
+                    _source = SharedWindowSnapshotReader.attach(name)
+                except (OSError, ValueError):
+                    _source = None
+        return _source
+
+
+def fresh_snapshot(max_age_ms: Optional[float] = None) -> Optional[WindowSnapshot]:
+    """
+    Latest snapshot if it is recent enough to resolve windows against.
+
+    Args:
+        max_age_ms: Maximum age (default Config.WINDOW_SNAPSHOT_MAX_AGE_MS)
+
+    Returns:
+        The snapshot, or None when there is no source/snapshot or it is stale
+    """
+    source = get_snapshot_source()
+    if source is None:
+        return None
+    try:
+        snapshot = source.read()
+    except Exception:
+        return None
+    if snapshot is None:
+        return None
+    if max_age_ms is None:
+        from wyzer.core.config import Config
+        max_age_ms = Config.WINDOW_SNAPSHOT_MAX_AGE_MS
+    if snapshot.age_ms() > max_age_ms:
+        return None
+    return snapshot